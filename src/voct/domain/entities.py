@@ -1,4 +1,6 @@
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
+from datetime import datetime
 from enum import Enum
 from pathlib import Path
 
@@ -6,6 +8,23 @@ import numpy as np
 from numpy.typing import NDArray
 
 
+@dataclass(frozen=True)
+class CpuPartition:
+    """録音・キー監視スレッドと推論スレッドに割り当てる CPU コアの分割。
+
+    capture_cores が空なら固定しない。capture_nice はキャプチャ系スレッドに設定する nice 値（Linux のみ）。
+    """
+
+    capture_cores: frozenset[int] = frozenset()
+    inference_cores: frozenset[int] = frozenset()
+    capture_nice: int | None = None
+
+    @property
+    def inference_threads(self) -> int:
+        """推論に使うスレッド数。コアを分割しない場合は 0（CTranslate2 の既定値）。"""
+        return len(self.inference_cores) if self.capture_cores else 0
+
+
 @dataclass(frozen=True)
 class RecordingConfig:
     """録音設定。"""
@@ -14,6 +33,18 @@ class RecordingConfig:
     channels: int = 1
     timeout_seconds: float = 5.0
     block_size: int = 1024
+    adaptive_block_size: bool = False
+    max_block_size: int = 8192
+    clean_recordings_before_shrink: int = 3
+    spill_to_disk: bool = False
+    spill_directory: Path | None = None
+    long_recording_timeout_seconds: float = 4 * 60 * 60
+    cpu_partition: CpuPartition | None = None
+
+    @property
+    def effective_timeout_seconds(self) -> float:
+        """録音の上限秒数。ディスク退避モードでは long_recording_timeout_seconds を使う。"""
+        return self.long_recording_timeout_seconds if self.spill_to_disk else self.timeout_seconds
 
 
 @dataclass(frozen=True)
@@ -23,6 +54,74 @@ class AudioData:
     data: NDArray[np.float32]
     sample_rate: int
     duration_seconds: float
+    overflow_count: int = 0
+
+    @property
+    def num_samples(self) -> int:
+        """サンプル数（フレーム数）。"""
+        return len(self.data)
+
+    def iter_blocks(self, block_size: int) -> Iterator[NDArray[np.float32]]:
+        """block_size サンプルずつ音声データを返す。"""
+        for start in range(0, self.num_samples, block_size):
+            yield self.data[start : start + block_size]
+
+
+class LazyAudioData(AudioData):
+    """ファイル上の音声を必要な範囲だけ読み込む AudioData。
+
+    reader(start, frames) は start サンプル目から最大 frames サンプルを float32 モノラルで返す。
+    data にアクセスすると全体を展開するため、長時間音声は iter_blocks() で扱う。
+    source_path は読み込み元のファイルで、そのまま文字起こしに渡せる。
+    owned_temp_path は録音を退避するために作った一時ファイルで、使い終わったら削除してよい。利用者のファイルでは None。
+    """
+
+    def __init__(
+        self,
+        reader: Callable[[int, int], NDArray[np.float32]],
+        num_samples: int,
+        sample_rate: int,
+        overflow_count: int = 0,
+        source_path: Path | None = None,
+        owned_temp_path: Path | None = None,
+    ) -> None:
+        object.__setattr__(self, "source_path", source_path)
+        object.__setattr__(self, "owned_temp_path", owned_temp_path)
+        object.__setattr__(self, "_reader", reader)
+        object.__setattr__(self, "_num_samples", num_samples)
+        object.__setattr__(self, "sample_rate", sample_rate)
+        object.__setattr__(self, "duration_seconds", num_samples / sample_rate if sample_rate > 0 else 0.0)
+        object.__setattr__(self, "overflow_count", overflow_count)
+
+    @property
+    def data(self) -> NDArray[np.float32]:
+        """全サンプルを展開して返す。"""
+        return self.read(0, self._num_samples)
+
+    @property
+    def num_samples(self) -> int:
+        """サンプル数（フレーム数）。"""
+        return self._num_samples
+
+    def read(self, start: int, frames: int) -> NDArray[np.float32]:
+        """start サンプル目から最大 frames サンプルを読み込む。"""
+        return self._reader(start, frames)
+
+    def iter_blocks(self, block_size: int) -> Iterator[NDArray[np.float32]]:
+        """block_size サンプルずつファイルから読み込んで返す。"""
+        for start in range(0, self._num_samples, block_size):
+            yield self.read(start, block_size)
+
+    def __eq__(self, other: object) -> bool:
+        return self is other
+
+    __hash__ = object.__hash__
+
+    def __repr__(self) -> str:
+        return (
+            f"LazyAudioData(num_samples={self._num_samples}, sample_rate={self.sample_rate}, "
+            f"duration_seconds={self.duration_seconds:.3f})"
+        )
 
 
 @dataclass(frozen=True)
@@ -33,6 +132,35 @@ class NotificationConfig:
     stop_sound_path: str | None = None
 
 
+@dataclass(frozen=True)
+class TranscriptionSegment:
+    """文字起こし結果の 1 セグメント。"""
+
+    text: str
+    start: float
+    end: float
+    avg_logprob: float
+
+
+@dataclass(frozen=True)
+class DecodeOptions:
+    """デコード設定。beam_size と best_of を小さくすると精度と引き換えに速くなる。
+
+    temperature は失敗したセグメントを再デコードする温度の列で、1 要素にすると再デコードしない。
+    圧縮率が compression_ratio_threshold を超えたセグメント（繰り返しの幻覚など）は失敗とみなす。
+    deadline_seconds を過ぎると、デコード中のセグメントを最後に打ち切って途中までの結果を返す。
+    vad_filter が True なら無音区間を除いてからデコードする（バッチ推論では常に無効）。
+    """
+
+    beam_size: int = 5
+    best_of: int = 5
+    temperature: tuple[float, ...] = (0.0, 0.2, 0.4, 0.6, 0.8, 1.0)
+    compression_ratio_threshold: float | None = 2.4
+    condition_on_previous_text: bool = True
+    deadline_seconds: float | None = None
+    vad_filter: bool = True
+
+
 @dataclass(frozen=True)
 class TranscriptionResult:
     """文字起こし結果。"""
@@ -43,6 +171,9 @@ class TranscriptionResult:
     duration_seconds: float
     model_load_time_seconds: float
     transcription_time_seconds: float
+    time_to_first_segment_seconds: float | None = None
+    segments: tuple[TranscriptionSegment, ...] = ()
+    partial: bool = False
 
 
 class TriggerKey(Enum):
@@ -64,13 +195,90 @@ class PushToTalkConfig:
     trigger_key: TriggerKey = TriggerKey.ENTER
     model_size: str = "base"
     language: str | None = None
+    language_pin_threshold: float = 0.8
+    language_recheck_interval: int = 20
     output_dir: Path | None = None
     filename_format: str = "%Y%m%d-%H%M%S"
     min_recording_seconds: float = 0.5
+    clipboard_per_segment: bool = False
+    decode_options: DecodeOptions | None = None
+    async_output: bool = False
+    output_timeout_seconds: float = 2.0
+    history_size: int = 0
+    history_max_bytes: int = 64 * 1024 * 1024
+    retranscribe_key: TriggerKey | None = None
+    retranscribe_model_size: str = "large-v3"
+    retranscribe_language: str | None = None
     recording_config: RecordingConfig = field(default_factory=RecordingConfig)
     notification_config: NotificationConfig = field(default_factory=NotificationConfig)
 
 
+@dataclass(frozen=True)
+class UtteranceRecord:
+    """履歴に残した発話。音声は int16 で保持し、language は文字起こしに指定した言語（None は自動判定）。"""
+
+    id: int
+    samples: NDArray[np.int16]
+    sample_rate: int
+    created_at: datetime
+    text: str
+    model_size: str
+    language: str | None = None
+
+    @property
+    def nbytes(self) -> int:
+        return self.samples.nbytes
+
+    def to_audio(self) -> AudioData:
+        """float32 の AudioData に戻す。"""
+        data = self.samples.astype(np.float32) / 32767.0
+        return AudioData(data=data, sample_rate=self.sample_rate, duration_seconds=len(data) / self.sample_rate)
+
+
+@dataclass(frozen=True)
+class TranscriptOutput:
+    """出力ステージに渡す文字起こし結果。created_at は結果が確定した時刻。"""
+
+    text: str
+    created_at: datetime
+    result: TranscriptionResult | None = None
+
+
+@dataclass(frozen=True)
+class TranscriptHit:
+    """文字起こし履歴の検索結果。rank は小さいほど関連度が高い（FTS5 の bm25）。"""
+
+    id: int
+    created_at: datetime
+    text: str
+    snippet: str
+    rank: float
+
+
+@dataclass(frozen=True)
+class OutputSinkStats:
+    """出力先ごとの書き出し統計。レイテンシは出力ステージへの投入から書き出し完了までの秒数。"""
+
+    name: str
+    outputs: int
+    writes: int
+    timeouts: int
+    failures: int
+    mean_latency_seconds: float
+    max_latency_seconds: float
+    pending: int = 0
+
+
+@dataclass(frozen=True)
+class ClipboardStats:
+    """クリップボード更新の統計。fallbacks は常駐ヘルパーを使えず代替手段でコピーした回数。"""
+
+    copies: int
+    fallbacks: int
+    mean_latency_seconds: float
+    max_latency_seconds: float
+
+
 @dataclass(frozen=True)
 class PushToTalkResult:
     """Push-to-Talk の 1 サイクル結果。"""
@@ -79,3 +287,308 @@ class PushToTalkResult:
     recording_duration_seconds: float
     transcription_result: TranscriptionResult | None
     saved_file: Path | None
+
+
+@dataclass(frozen=True)
+class VoxConfig:
+    """音声起動（VOX）トリガーの設定。
+
+    ブロックのエネルギーが energy_threshold_db を超え、かつスペクトル平坦度が flatness_threshold 未満なら
+    音声とみなす。音声が attack_seconds 続くと押下、無音が hangover_seconds 続くと解放として扱う。
+    """
+
+    energy_threshold_db: float = -45.0
+    flatness_threshold: float = 0.4
+    attack_seconds: float = 0.15
+    hangover_seconds: float = 0.8
+    pre_roll_seconds: float = 0.3
+    block_size: int = 1024
+
+
+@dataclass(frozen=True)
+class LiveCaptionConfig:
+    """ライブ字幕モードの設定。window_seconds の窓を overlap_seconds ずつ重ねて文字起こしする。"""
+
+    window_seconds: float = 10.0
+    overlap_seconds: float = 2.0
+    min_window_seconds: float = 3.0
+    max_lag_seconds: float = 15.0
+    model_size: str = "base"
+    language: str | None = None
+    output_path: Path | None = None
+    recording_config: RecordingConfig = field(default_factory=RecordingConfig)
+
+
+@dataclass(frozen=True)
+class CaptionLine:
+    """ライブ字幕の確定行。時刻はセッション開始からの秒数、lag_seconds は窓の録音終了から確定までの遅延。"""
+
+    text: str
+    start_seconds: float
+    end_seconds: float
+    lag_seconds: float
+
+
+@dataclass(frozen=True)
+class LatencyReport:
+    """リプレイベンチマークの集計結果。レイテンシはキー解放からクリップボード更新までの秒数。"""
+
+    cycles: int
+    completed: int
+    dropped: int
+    p50_seconds: float
+    p95_seconds: float
+    p99_seconds: float
+    wall_time_seconds: float
+    throughput_cycles_per_second: float
+
+
+@dataclass(frozen=True)
+class BatchingConfig:
+    """マイクロバッチ文字起こしの設定。
+
+    最初の要求から max_wait_seconds 待つか max_batch_size 件集まった時点で 1 回のバッチ推論にまとめる。
+    max_wait_seconds を延ばすとバッチが大きくなりスループットは上がるが、1 件あたりの待ち時間も延びる。
+    """
+
+    max_batch_size: int = 8
+    max_wait_seconds: float = 0.05
+
+
+@dataclass(frozen=True)
+class BatchingStats:
+    """マイクロバッチ文字起こしの累計統計。"""
+
+    batches: int
+    clips: int
+    mean_batch_size: float
+    mean_wait_seconds: float
+    audio_seconds: float
+    busy_seconds: float
+
+    @property
+    def audio_seconds_per_second(self) -> float:
+        """推論 1 秒あたりに処理した音声の秒数。"""
+        return self.audio_seconds / self.busy_seconds if self.busy_seconds > 0 else 0.0
+
+
+@dataclass(frozen=True)
+class BatchThroughputReport:
+    """逐次推論とマイクロバッチ推論のスループット比較結果。"""
+
+    clips: int
+    audio_seconds: float
+    sequential_seconds: float
+    batched_seconds: float
+
+    @property
+    def speedup(self) -> float:
+        """逐次推論に対するマイクロバッチ推論の速度比。"""
+        return self.sequential_seconds / self.batched_seconds if self.batched_seconds > 0 else 0.0
+
+
+@dataclass(frozen=True)
+class CaptureStressResult:
+    """推論相当の CPU 負荷をかけながら録音したときの入力オーバーフロー回数。"""
+
+    partitioned: bool
+    seconds: float
+    blocks: int
+    overflow_count: int
+
+
+@dataclass(frozen=True)
+class ModelArtifact:
+    """ローカルに固定した CTranslate2 変換済みモデル。load_seconds は最後に計測したロード時間。"""
+
+    name: str
+    path: Path
+    sha256: str
+    size_bytes: int
+    load_seconds: float | None = None
+
+
+@dataclass(frozen=True)
+class ModelResidencyStats:
+    """セッション中のモデル解放・再読み込みの集計。"""
+
+    evictions: int
+    released_bytes: int
+    reloads: int
+    mean_reload_seconds: float
+    max_reload_seconds: float
+
+
+@dataclass(frozen=True)
+class RoutingConfig:
+    """モデルルーティングの設定。
+
+    model_sizes は小さい順に並べ、キー解放から文字起こし完了までの予測時間が
+    latency_target_seconds に収まる最大のモデルとデコード設定を選ぶ。
+    モデルごとの実時間比（RTF）は ewma_alpha の指数移動平均で更新する。
+    """
+
+    latency_target_seconds: float = 1.5
+    model_sizes: tuple[str, ...] = ("tiny", "base", "small", "medium")
+    ewma_alpha: float = 0.3
+
+
+@dataclass(frozen=True)
+class RoutingDecision:
+    """1 発話に対して選んだモデルとデコード設定、および予測した処理時間。"""
+
+    model_size: str
+    options: DecodeOptions
+    predicted_seconds: float
+
+
+@dataclass(frozen=True)
+class WatchConfig:
+    """監視フォルダーの設定。
+
+    extensions の拡張子を持つファイルを workers 個のワーカーで文字起こしする。
+    文字起こし待ちが max_backlog 件に達したら、空きができるまで新しいファイルの受け付けを待たせる。
+    include_existing なら開始時にすでにあるファイルも文字起こしする。
+    """
+
+    directory: Path
+    output_dir: Path
+    filename_format: str = "%Y%m%d-%H%M%S-%f"
+    model_size: str = "base"
+    language: str | None = None
+    workers: int = 2
+    max_backlog: int = 64
+    include_existing: bool = False
+    extensions: tuple[str, ...] = (".wav", ".flac", ".ogg", ".mp3", ".m4a", ".opus")
+
+
+@dataclass(frozen=True)
+class WatchStats:
+    """監視フォルダーの累計統計。lag はファイルの検出から文字起こし完了までの秒数。"""
+
+    detected: int
+    duplicates: int
+    processed: int
+    failures: int
+    backlog: int
+    mean_lag_seconds: float
+    max_lag_seconds: float
+    audio_seconds: float
+
+
+class ManifestStatus(Enum):
+    """バッチ文字起こしの 1 件の状態。"""
+
+    PENDING = "pending"
+    DONE = "done"
+    FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class ManifestItem:
+    """バッチ文字起こしのマニフェストの 1 件。
+
+    sha256 が変わった入力は別の内容とみなしてやり直す。attempts は失敗も含めた文字起こしの試行回数。
+    """
+
+    input_path: Path
+    sha256: str
+    status: ManifestStatus = ManifestStatus.PENDING
+    output_path: Path | None = None
+    duration_seconds: float | None = None
+    transcription_seconds: float | None = None
+    attempts: int = 0
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class BatchConfig:
+    """バッチ文字起こしの設定。失敗した入力は backoff_seconds から倍々に待ちながら max_attempts 回まで試す。"""
+
+    output_dir: Path
+    model_size: str = "base"
+    language: str | None = None
+    workers: int = 2
+    max_attempts: int = 3
+    backoff_seconds: float = 1.0
+
+
+@dataclass(frozen=True)
+class BatchReport:
+    """バッチ文字起こしの結果。skipped は前回までに完了していた件数。"""
+
+    total: int
+    completed: int
+    skipped: int
+    failed: int
+    audio_seconds: float
+    wall_seconds: float
+
+
+@dataclass(frozen=True)
+class DecodeStats:
+    """音声ファイルのデコードの累計統計（形式ごと）。decode_seconds はデコードとリサンプリングにかかった秒数。"""
+
+    format: str
+    backend: str
+    files: int
+    audio_seconds: float
+    decode_seconds: float
+
+    @property
+    def speed(self) -> float:
+        """実時間の何倍の速さでデコードできたか。"""
+        return self.audio_seconds / self.decode_seconds if self.decode_seconds > 0 else 0.0
+
+
+@dataclass(frozen=True)
+class StreamConfig:
+    """標準入力ストリーミングモードの設定。
+
+    sample_format・sample_rate・channels は入力の生 PCM の形式。発話区間は vox_config の発話検出で区切り、
+    max_segment_seconds を超える発話はその長さで区切る。文字起こし待ちは max_backlog 区間までで、
+    満杯なら入力の読み込みを止めて上流を待たせる。
+    """
+
+    sample_format: str = "s16le"
+    sample_rate: int = 16000
+    channels: int = 1
+    model_size: str = "base"
+    language: str | None = None
+    max_segment_seconds: float = 30.0
+    max_backlog: int = 4
+    vox_config: VoxConfig = field(default_factory=VoxConfig)
+
+
+@dataclass(frozen=True)
+class StreamSegment:
+    """ストリーミングモードで確定した 1 区間。
+
+    start_seconds と end_seconds は入力の先頭からの秒数。queue_seconds は区間の確定から文字起こし開始まで、
+    latency_seconds は区間の確定から書き出しまでの秒数。
+    """
+
+    index: int
+    start_seconds: float
+    end_seconds: float
+    text: str
+    language: str
+    queue_seconds: float
+    transcription_seconds: float
+    latency_seconds: float
+
+
+@dataclass(frozen=True)
+class StreamReport:
+    """ストリーミングモードの結果。
+
+    speech_seconds は文字起こしに回した区間（前後の余白を含む）の合計秒数。
+    backpressure_seconds は文字起こし待ちが満杯で入力の読み込みを止めていた秒数。
+    """
+
+    segments: int
+    failures: int
+    audio_seconds: float
+    speech_seconds: float
+    wall_seconds: float
+    backpressure_seconds: float
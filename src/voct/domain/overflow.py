@@ -0,0 +1,4 @@
+def warn_overflow(count: int) -> None:
+    """入力オーバーフローが発生していれば、音声が欠落した可能性を警告する。"""
+    if count > 0:
+        print(f"[Voct] 警告: 入力オーバーフローが {count} 回発生しました（音声が欠落した可能性があります）")
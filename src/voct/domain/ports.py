@@ -1,12 +1,21 @@
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from datetime import datetime
 from pathlib import Path
 
+import numpy as np
+from numpy.typing import NDArray
+
 from voct.domain.entities import (
     AudioData,
+    DecodeOptions,
+    ManifestItem,
     NotificationConfig,
     RecordingConfig,
+    StreamSegment,
     TranscriptionResult,
+    TranscriptionSegment,
+    TranscriptOutput,
     TriggerKey,
 )
 
@@ -36,6 +45,31 @@ class AudioFilePort(ABC):
         """ファイルから音声データを読み込む。"""
         ...
 
+    @abstractmethod
+    def load_lazy(self, file_path: Path) -> AudioData:
+        """ファイルから音声データを遅延読み込みする。メモリ使用量はファイル長に依存しない。"""
+        ...
+
+
+class AudioDecoderPort(ABC):
+    """音声デコーダーポート。圧縮音声を 16kHz モノラルのブロック列として読み出す処理を抽象化する。"""
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """デコーダーの名前（統計の表示に使う）。"""
+        ...
+
+    @abstractmethod
+    def iter_blocks(self, file_path: Path, block_samples: int) -> Iterator[NDArray[np.float32]]:
+        """16kHz モノラル float32 を block_samples サンプルずつ返す。最後のブロックだけは短くてよい。"""
+        ...
+
+    @abstractmethod
+    def probe_seconds(self, file_path: Path) -> float | None:
+        """全体をデコードせずに音声の長さ（秒）を調べる。分からなければ None、読めなければ例外を送出する。"""
+        ...
+
 
 class TranscriberPort(ABC):
     """文字起こしポート。音声→テキスト変換を抽象化する。"""
@@ -46,8 +80,26 @@ class TranscriberPort(ABC):
         audio_path: Path,
         model_size: str = "base",
         language: str | None = None,
+        on_segment: Callable[[TranscriptionSegment], None] | None = None,
+        options: DecodeOptions | None = None,
+    ) -> TranscriptionResult:
+        """音声ファイルを文字起こしする。
+
+        on_segment を指定すると、セグメントが得られるたびに逐次呼び出される。
+        options を省略した場合は実装のデフォルトのデコード設定を使う。
+        """
+        ...
+
+    @abstractmethod
+    def transcribe_audio(
+        self,
+        audio: AudioData,
+        model_size: str = "base",
+        language: str | None = None,
+        on_segment: Callable[[TranscriptionSegment], None] | None = None,
+        options: DecodeOptions | None = None,
     ) -> TranscriptionResult:
-        """音声ファイルを文字起こしする。"""
+        """メモリ上の 16kHz モノラル音声データを文字起こしする。"""
         ...
 
 
@@ -79,6 +131,20 @@ class PushToTalkRecorderPort(ABC):
         ...
 
 
+class ContinuousRecorderPort(ABC):
+    """連続録音ポート。停止されるまで録音ブロックを逐次コールバックに渡す。"""
+
+    @abstractmethod
+    def start(self, config: RecordingConfig, on_block: Callable[[NDArray[np.float32]], None]) -> None:
+        """連続録音を開始する（非ブロッキング）。on_block には 1 次元の float32 ブロックが渡される。"""
+        ...
+
+    @abstractmethod
+    def stop(self) -> int:
+        """連続録音を停止し、発生した入力オーバーフロー回数を返す。"""
+        ...
+
+
 class HotkeyListenerPort(ABC):
     """ホットキーリスナーポート。グローバルキーイベント監視を抽象化する。"""
 
@@ -92,6 +158,10 @@ class HotkeyListenerPort(ABC):
         """キーリスナーをバックグラウンドで開始する（非ブロッキング）。"""
         ...
 
+    def add_hotkey(self, key: TriggerKey, on_press: Callable[[], None]) -> bool:
+        """トリガーキーとは別のキーの押下に処理を割り当てる。start より前に呼ぶ。対応しない実装は False を返す。"""
+        return False
+
     @abstractmethod
     def join(self) -> None:
         """リスナースレッドの終了を待機する（ブロッキング）。"""
@@ -103,6 +173,53 @@ class HotkeyListenerPort(ABC):
         ...
 
 
+class DirectoryWatcherPort(ABC):
+    """ディレクトリ監視ポート。書き込みが終わったファイルの検出を抽象化する。"""
+
+    @abstractmethod
+    def start(self, directory: Path, on_file: Callable[[Path], None]) -> None:
+        """監視をバックグラウンドで開始する（非ブロッキング）。書き込みが終わったファイルごとに on_file を呼ぶ。"""
+        ...
+
+    @abstractmethod
+    def stop(self) -> None:
+        """監視を停止する。"""
+        ...
+
+
+class VoiceActivityPort(ABC):
+    """発話検出ポート。ブロック単位の発話区間の判定を抽象化する。"""
+
+    @property
+    @abstractmethod
+    def active(self) -> bool:
+        """発話区間中かどうか。"""
+        ...
+
+    @abstractmethod
+    def update(self, block: NDArray[np.float32]) -> bool:
+        """ブロックを 1 つ取り込み、更新後の発話状態を返す。"""
+        ...
+
+
+class PcmSourcePort(ABC):
+    """PCM 入力ポート。マイク以外（パイプなど）からの音声の読み込みを抽象化する。"""
+
+    @abstractmethod
+    def iter_blocks(self, block_samples: int) -> Iterator[NDArray[np.float32]]:
+        """16kHz モノラル float32 を block_samples サンプルずつ、入力が終わるまで返す。最後のブロックは短くてよい。"""
+        ...
+
+
+class SegmentWriterPort(ABC):
+    """区間出力ポート。ストリーミングモードで確定した区間の書き出しを抽象化する。"""
+
+    @abstractmethod
+    def write(self, segment: StreamSegment) -> None:
+        """区間を 1 件書き出す。書き出し先が閉じられていれば例外を送出する。"""
+        ...
+
+
 class ClipboardPort(ABC):
     """クリップボードポート。システムクリップボード操作を抽象化する。"""
 
@@ -112,10 +229,113 @@ class ClipboardPort(ABC):
         ...
 
 
+class TextPostProcessorPort(ABC):
+    """後処理ポート。文字起こし結果のテキストを出力前に書き換える。"""
+
+    @abstractmethod
+    def process(self, text: str) -> str:
+        """書き換えたテキストを返す。書き換えるものがなければそのまま返す。"""
+        ...
+
+
 class TranscriptFilePort(ABC):
     """文字起こしファイルポート。Markdown ファイル保存を抽象化する。"""
 
     @abstractmethod
-    def save(self, text: str, directory: Path, filename_format: str) -> Path:
-        """文字起こし結果を Markdown ファイルとして保存し、パスを返す。"""
+    def save(
+        self,
+        text: str,
+        directory: Path,
+        filename_format: str,
+        timestamp: datetime | None = None,
+        result: TranscriptionResult | None = None,
+        key: str | None = None,
+    ) -> Path:
+        """文字起こし結果を保存し、保存先のパスを返す。
+
+        timestamp は結果が確定した時刻（未指定時は現在時刻）。result は言語や処理時間を記録する実装で使う。
+        key を渡すと同じ key で保存済みの結果を置き換える。
+        ファイル名で保存する実装は filename_format で区別するため key を使わない。
+        """
+        ...
+
+    def save_many(self, outputs: list[TranscriptOutput], directory: Path, filename_format: str) -> None:
+        """複数の結果を古い順に保存する。まとめて書ける実装はオーバーライドする。"""
+        for output in outputs:
+            self.save(output.text, directory, filename_format, output.created_at, output.result)
+
+
+class OutputSinkPort(ABC):
+    """出力先ポート。出力ステージから文字起こし結果をまとめて受け取り書き出す。"""
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """統計やログに表示する出力先の名前。"""
+        ...
+
+    @abstractmethod
+    def write(self, outputs: list[TranscriptOutput]) -> None:
+        """前回の書き出し以降に届いた結果を古い順に書き出す。"""
+        ...
+
+
+class TranscriptLogPort(ABC):
+    """文字起こしログポート。1 つのファイルへの追記を抽象化する。"""
+
+    @abstractmethod
+    def append(self, text: str, file_path: Path) -> None:
+        """テキストを 1 行としてファイル末尾に追記する。"""
+        ...
+
+
+class ModelResidencyPort(ABC):
+    """モデル常駐ポート。文字起こしモデルの事前読み込みとメモリからの解放を抽象化する。"""
+
+    @abstractmethod
+    def warm(self, model_size: str) -> float:
+        """モデルを読み込んで常駐させ、ロードにかかった秒数を返す。常駐済みなら 0 を返す。"""
+        ...
+
+    @abstractmethod
+    def evict(self) -> int | None:
+        """常駐中のモデルをすべて解放し、解放できたメモリのバイト数を返す。計測できなければ None。"""
+        ...
+
+    @abstractmethod
+    def is_resident(self, model_size: str) -> bool:
+        """モデルが読み込み済みで常駐しているかを返す。"""
+        ...
+
+
+class RoutingHistoryPort(ABC):
+    """ルーティング履歴ポート。過去の実行で計測したモデルごとの処理速度の保存を抽象化する。"""
+
+    @abstractmethod
+    def load(self) -> dict[str, float]:
+        """保存済みの計測値を返す。未保存なら空の dict を返す。"""
+        ...
+
+    @abstractmethod
+    def save(self, values: dict[str, float]) -> None:
+        """計測値を保存する。"""
+        ...
+
+
+class BatchManifestPort(ABC):
+    """バッチマニフェストポート。バッチ文字起こしの進捗の記録と再開を抽象化する。"""
+
+    @abstractmethod
+    def load(self) -> list[ManifestItem]:
+        """記録済みの各入力の最新の状態を返す。未作成なら空のリストを返す。"""
+        ...
+
+    @abstractmethod
+    def append(self, item: ManifestItem) -> None:
+        """1 件の状態を記録する。戻った時点で強制終了されても失われない。"""
+        ...
+
+    @abstractmethod
+    def compact(self, items: list[ManifestItem]) -> None:
+        """記録を items だけに置き換える。途中で中断しても元の記録は壊れない。"""
         ...
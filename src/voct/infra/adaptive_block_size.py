@@ -0,0 +1,73 @@
+from voct.domain.entities import RecordingConfig
+
+
+class AdaptiveBlockSizePolicy:
+    """入力オーバーフロー（xrun）の発生状況に応じて録音ブロックサイズを調整するポリシー。
+
+    オーバーフローが起きた録音の後はブロックサイズと PortAudio のレイテンシを倍にし、
+    オーバーフローのない録音が clean_recordings_before_shrink 回続くと半分に戻す。
+    ブロックサイズは config.block_size から config.max_block_size の範囲に収まる。
+    """
+
+    def __init__(self, config: RecordingConfig) -> None:
+        self._config = config
+        self._block_size = config.block_size
+        self._clean_streak = 0
+
+    @property
+    def config(self) -> RecordingConfig:
+        return self._config
+
+    @property
+    def block_size(self) -> int:
+        """次の録音で使用するブロックサイズ。"""
+        return self._block_size
+
+    @property
+    def latency_seconds(self) -> float:
+        """次の録音で PortAudio に要求する入力レイテンシ（2 ブロック分）。"""
+        return 2 * self._block_size / self._config.sample_rate
+
+    def record_result(self, overflow_count: int) -> None:
+        """1 回の録音で発生したオーバーフロー回数を反映する。"""
+        if overflow_count > 0:
+            self._clean_streak = 0
+            self._block_size = min(self._block_size * 2, self._config.max_block_size)
+            return
+        self._clean_streak += 1
+        if self._clean_streak >= self._config.clean_recordings_before_shrink:
+            self._clean_streak = 0
+            self._block_size = max(self._block_size // 2, self._config.block_size)
+
+    def stream_kwargs(self) -> dict:
+        """sd.InputStream に渡すストリーム引数を返す。"""
+        return {
+            "samplerate": self._config.sample_rate,
+            "channels": self._config.channels,
+            "blocksize": self._block_size,
+            "dtype": "float32",
+            "latency": self.latency_seconds,
+        }
+
+
+def stream_settings(
+    config: RecordingConfig, policy: AdaptiveBlockSizePolicy | None
+) -> tuple[AdaptiveBlockSizePolicy | None, int, dict]:
+    """録音設定に合わせたポリシー・ブロックサイズ・ストリーム引数を返す。
+
+    設定が変わっていなければ既存のポリシーを引き継ぎ、適応制御が無効なら None を返す。
+    """
+    if not config.adaptive_block_size:
+        return (
+            None,
+            config.block_size,
+            {
+                "samplerate": config.sample_rate,
+                "channels": config.channels,
+                "blocksize": config.block_size,
+                "dtype": "float32",
+            },
+        )
+    if policy is None or policy.config != config:
+        policy = AdaptiveBlockSizePolicy(config)
+    return policy, policy.block_size, policy.stream_kwargs()
@@ -0,0 +1,143 @@
+from collections import deque
+from pathlib import Path
+
+from voct.domain.ports import TextPostProcessorPort
+
+
+def parse_dictionary(source: str) -> dict[str, str]:
+    """「誤<TAB>正」形式の辞書を読む。空行と # で始まる行は無視し、同じ語が複数あれば後の行を使う。"""
+    entries: dict[str, str] = {}
+    for lineno, line in enumerate(source.splitlines(), start=1):
+        if not line.strip() or line.startswith("#"):
+            continue
+        wrong, sep, right = line.partition("\t")
+        if not sep or not wrong:
+            raise ValueError(f"line {lineno}: expected '<wrong>\\t<right>': {line!r}")
+        entries[wrong] = right
+    return entries
+
+
+class AhoCorasickAutomaton:
+    """置換辞書を 1 つのオートマトンにまとめ、テキストを 1 回走査するだけで置換する。
+
+    重なる候補は先に始まるものを、同じ位置から始まるものは長いものを優先する（正規表現の長い順の選択と同じ）。
+    走査はテキスト長と一致数に比例し、辞書の語数には依存しない。
+    """
+
+    def __init__(self, entries: dict[str, str]) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._depth = [0]
+        self._replacement: list[str | None] = [None]
+        for wrong, right in entries.items():
+            self._add(wrong, right)
+        self._fail = [0] * len(self._goto)
+        # 失敗リンクをたどって最初に見つかる語の終端（出力リンク）。0 はなし
+        self._output = [0] * len(self._goto)
+        self._link()
+
+    def __len__(self) -> int:
+        return sum(replacement is not None for replacement in self._replacement)
+
+    def _add(self, wrong: str, right: str) -> None:
+        node = 0
+        for ch in wrong:
+            child = self._goto[node].get(ch)
+            if child is None:
+                child = len(self._goto)
+                self._goto.append({})
+                self._depth.append(self._depth[node] + 1)
+                self._replacement.append(None)
+                self._goto[node][ch] = child
+            node = child
+        self._replacement[node] = right
+
+    def _link(self) -> None:
+        """幅優先で失敗リンクと出力リンクを張る。"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                fail_node = self._fail[child]
+                self._output[child] = fail_node if self._replacement[fail_node] is not None else self._output[fail_node]
+                queue.append(child)
+
+    def replace(self, text: str) -> tuple[str, int]:
+        """置換後のテキストと置換した箇所の数を返す。"""
+        goto, fail, depth, output, replacement = self._goto, self._fail, self._depth, self._output, self._replacement
+        # 開始位置ごとに、そこから始まる最も長い一致の (長さ, 終端ノード)
+        longest: dict[int, tuple[int, int]] = {}
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            node = state if replacement[state] is not None else output[state]
+            while node:
+                start = i - depth[node] + 1
+                if start not in longest or longest[start][0] < depth[node]:
+                    longest[start] = (depth[node], node)
+                node = output[node]
+        if not longest:
+            return text, 0
+
+        pieces: list[str] = []
+        last = 0
+        count = 0
+        for start in sorted(longest):
+            if start < last:
+                continue
+            length, node = longest[start]
+            pieces.append(text[last:start])
+            pieces.append(replacement[node])
+            last = start + length
+            count += 1
+        pieces.append(text[last:])
+        return "".join(pieces), count
+
+
+class AhoCorasickDictionary(TextPostProcessorPort):
+    """ユーザー辞書ファイルで誤変換を置き換える後処理。
+
+    辞書は読み込み時に Aho-Corasick オートマトンへ変換し、process のたびにファイルの更新を確認して読み直す。
+    読み直しに失敗したら警告し、直前の辞書を使い続ける。
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._signature = self._stat()
+        self._automaton = AhoCorasickAutomaton(parse_dictionary(path.read_text(encoding="utf-8")))
+        self.last_replacements = 0
+
+    @property
+    def entry_count(self) -> int:
+        return len(self._automaton)
+
+    def process(self, text: str) -> str:
+        self._reload_if_changed()
+        text, self.last_replacements = self._automaton.replace(text)
+        return text
+
+    def _stat(self) -> tuple[int, int] | None:
+        try:
+            stat = self._path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _reload_if_changed(self) -> None:
+        signature = self._stat()
+        if signature == self._signature:
+            return
+        self._signature = signature
+        try:
+            automaton = AhoCorasickAutomaton(parse_dictionary(self._path.read_text(encoding="utf-8")))
+        except (OSError, UnicodeDecodeError, ValueError) as e:
+            print(f"[Voct] 警告: 辞書 {self._path} を読み直せません。前の辞書を使います ({e})")
+            return
+        self._automaton = automaton
+        print(f"[Voct] 辞書を読み直しました ({len(automaton)}語)")
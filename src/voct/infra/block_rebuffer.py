@@ -0,0 +1,28 @@
+from collections.abc import Iterable, Iterator
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+def rebuffer(chunks: Iterable[NDArray[np.float32]], block_samples: int) -> Iterator[NDArray[np.float32]]:
+    """長さがまちまちの 1 次元配列の列を、block_samples サンプルずつのブロックに詰め直す。最後のブロックだけは短い。
+
+    デコーダーが返すフレームの長さはコーデックごとに違うため、下流には決まった大きさで渡す。
+    """
+    pending: list[NDArray[np.float32]] = []
+    pending_samples = 0
+    for chunk in chunks:
+        if len(chunk) == 0:
+            continue
+        pending.append(chunk)
+        pending_samples += len(chunk)
+        if pending_samples < block_samples:
+            continue
+        joined = np.concatenate(pending) if len(pending) > 1 else pending[0]
+        full = len(joined) - len(joined) % block_samples
+        for start in range(0, full, block_samples):
+            yield joined[start : start + block_samples]
+        pending = [joined[full:]] if full < len(joined) else []
+        pending_samples = len(joined) - full
+    if pending_samples:
+        yield np.concatenate(pending) if len(pending) > 1 else pending[0]
@@ -0,0 +1,136 @@
+import multiprocessing
+import time
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+
+import numpy as np
+import sounddevice as sd
+
+from voct.domain.entities import AudioData, RecordingConfig
+from voct.domain.ports import PushToTalkRecorderPort
+from voct.infra.cpu_affinity import apply_capture_partition
+from voct.infra.shared_memory_ring_buffer import SharedMemoryRingBuffer
+
+_READY_TIMEOUT_SECONDS = 10.0
+_STOP_TIMEOUT_SECONDS = 2.0
+
+
+def _capture_main(shm_name: str, capacity: int, config: RecordingConfig, conn: Connection) -> None:
+    """録音プロセスの本体。停止を指示されるまで入力ブロックをリングバッファに書き込み続ける。"""
+    ring = SharedMemoryRingBuffer.attach(shm_name, capacity)
+    # PortAudio のスレッドはこのスレッドから作られるため、先に固定しておけば設定が引き継がれる
+    apply_capture_partition(config.cpu_partition)
+
+    def _callback(indata: np.ndarray, frames: int, time_info, status) -> None:
+        block = indata.mean(axis=1) if indata.shape[1] > 1 else indata[:, 0]
+        ring.write(block, time.monotonic_ns(), bool(status.input_overflow))
+
+    try:
+        with sd.InputStream(
+            samplerate=config.sample_rate,
+            channels=config.channels,
+            blocksize=config.block_size,
+            dtype="float32",
+            callback=_callback,
+        ):
+            conn.send(("ready", None))
+            conn.recv()
+    except Exception as e:
+        conn.send(("error", repr(e)))
+    finally:
+        ring.close()
+
+
+def _spawn_capture(shm_name: str, capacity: int, config: RecordingConfig) -> tuple[BaseProcess, Connection]:
+    """録音プロセスを起動し、制御用パイプの親側を返す。スレッドを持つ親を fork しないよう spawn を使う。"""
+    context = multiprocessing.get_context("spawn")
+    parent_conn, child_conn = context.Pipe()
+    process = context.Process(
+        target=_capture_main,
+        args=(shm_name, capacity, config, child_conn),
+        name="voct-capture",
+        daemon=True,
+    )
+    process.start()
+    child_conn.close()
+    return process, parent_conn
+
+
+class CaptureProcessRecorder(PushToTalkRecorderPort):
+    """録音を別プロセスで続け、共有メモリのリングバッファからキー押下〜解放の範囲を読み出す Push-to-Talk 録音実装。
+
+    録音プロセスは GIL を共有しないため、推論や後処理の Python コードに録音が待たされない。
+    押下・解放の位置はリングバッファのシーケンス番号で記録し、制御用パイプは起動と停止だけに使う。
+    stop_recording が返す音声は折り返していなければ共有メモリのビューで、ring_seconds 秒後に上書きされる。
+    """
+
+    def __init__(self, ring_seconds: float = 120.0) -> None:
+        self._ring_seconds = ring_seconds
+        self._ring: SharedMemoryRingBuffer | None = None
+        self._process: BaseProcess | None = None
+        self._conn: Connection | None = None
+        self._config = RecordingConfig()
+        self._start_seq = 0
+        self._start_overflows = 0
+
+    @property
+    def max_write_gap_seconds(self) -> float:
+        """録音プロセスがリングバッファに書き込んだ間隔の最大値。"""
+        return self._ring.max_write_gap_seconds if self._ring is not None else 0.0
+
+    def open(self, config: RecordingConfig) -> None:
+        """録音プロセスを起動し、入力ストリームが開くまで待つ。"""
+        capacity = int(config.sample_rate * self._ring_seconds)
+        self._ring = SharedMemoryRingBuffer.create(capacity)
+        self._process, self._conn = _spawn_capture(self._ring.name, capacity, config)
+        self._config = config
+        try:
+            if not self._conn.poll(_READY_TIMEOUT_SECONDS):
+                raise EOFError("timed out")
+            status, detail = self._conn.recv()
+        except EOFError as e:
+            self.close()
+            raise RuntimeError(f"capture process did not start: {e}") from e
+        if status != "ready":
+            self.close()
+            raise RuntimeError(f"capture process failed: {detail}")
+
+    def start_recording(self, config: RecordingConfig) -> None:
+        """押下位置として現在のシーケンス番号を記録する。録音プロセスが未起動なら起動する。"""
+        if self._ring is None:
+            self.open(config)
+        self._start_seq = self._ring.write_seq
+        self._start_overflows = self._ring.overflow_count
+
+    def stop_recording(self) -> AudioData:
+        """押下位置から現在までのサンプルを返す。録音の上限秒数を超えた分は切り捨てる。"""
+        sample_rate = self._config.sample_rate
+        if self._ring is None:
+            return AudioData(data=np.array([], dtype=np.float32), sample_rate=sample_rate, duration_seconds=0.0)
+        max_samples = int(sample_rate * self._config.effective_timeout_seconds)
+        end_seq = min(self._ring.write_seq, self._start_seq + max_samples)
+        data = self._ring.read(self._start_seq, end_seq)
+        return AudioData(
+            data=data,
+            sample_rate=sample_rate,
+            duration_seconds=len(data) / sample_rate,
+            overflow_count=self._ring.overflow_count - self._start_overflows,
+        )
+
+    def close(self) -> None:
+        """録音プロセスを停止し、共有メモリを解放する。"""
+        if self._conn is not None:
+            try:
+                self._conn.send(("stop", None))
+            except (BrokenPipeError, OSError):
+                pass
+            self._conn.close()
+            self._conn = None
+        if self._process is not None:
+            self._process.join(_STOP_TIMEOUT_SECONDS)
+            if self._process.is_alive():
+                self._process.terminate()
+            self._process = None
+        if self._ring is not None:
+            self._ring.close()
+            self._ring = None
@@ -0,0 +1,90 @@
+import os
+import threading
+
+from voct.domain.entities import CpuPartition
+
+_warned_nice = False
+_warn_lock = threading.Lock()
+
+
+def available_cores() -> frozenset[int]:
+    """このプロセスが使える CPU コア番号。"""
+    try:
+        return frozenset(os.sched_getaffinity(0))
+    except AttributeError:
+        return frozenset(range(os.cpu_count() or 1))
+
+
+def plan_cpu_partition(
+    reserved_cores: int,
+    capture_nice: int | None = None,
+    cores: frozenset[int] | None = None,
+) -> CpuPartition:
+    """番号の大きい reserved_cores 個のコアをキャプチャ系に予約し、残りを推論に割り当てる。
+
+    推論用のコアが 1 つも残らない場合は分割しない。
+    """
+    cores = cores if cores is not None else available_cores()
+    ordered = sorted(cores)
+    if reserved_cores <= 0 or reserved_cores >= len(ordered):
+        return CpuPartition(inference_cores=frozenset(ordered), capture_nice=capture_nice)
+    return CpuPartition(
+        capture_cores=frozenset(ordered[-reserved_cores:]),
+        inference_cores=frozenset(ordered[:-reserved_cores]),
+        capture_nice=capture_nice,
+    )
+
+
+def pin_current_thread(cores: frozenset[int]) -> bool:
+    """呼び出したスレッドだけを cores に固定する。以降にこのスレッドが作るスレッドにも引き継がれる。"""
+    if not cores:
+        return False
+    try:
+        os.sched_setaffinity(threading.get_native_id(), cores)
+    except (AttributeError, OSError):
+        return False
+    return True
+
+
+def set_current_thread_nice(nice: int) -> bool:
+    """呼び出したスレッドの nice 値を設定する。Linux では nice 値がスレッド単位で効く。"""
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), nice)
+    except (AttributeError, OSError):
+        return False
+    return True
+
+
+def apply_capture_partition(partition: CpuPartition | None) -> None:
+    """キャプチャ系スレッドを予約コアに固定し、指定があれば優先度を上げる。"""
+    global _warned_nice
+    if partition is None:
+        return
+    pin_current_thread(partition.capture_cores)
+    if partition.capture_nice is None or set_current_thread_nice(partition.capture_nice):
+        return
+    with _warn_lock:
+        if _warned_nice:
+            return
+        _warned_nice = True
+    print(
+        f"[Voct] 警告: 録音スレッドの nice 値を {partition.capture_nice} にできませんでした"
+        "（CAP_SYS_NICE か RLIMIT_NICE の設定が必要です）"
+    )
+
+
+class CaptureThreadPinner:
+    """呼び出されたスレッドごとに一度だけ apply_capture_partition を適用する。
+
+    PortAudio やキーボードリスナーのように自分で作らないスレッドを、そのコールバックの中から固定するために使う。
+    """
+
+    def __init__(self, partition: CpuPartition | None) -> None:
+        self._partition = partition
+        self._local = threading.local()
+
+    def __call__(self) -> None:
+        if self._partition is None or getattr(self._local, "applied", False):
+            return
+        self._local.applied = True
+        apply_capture_partition(self._partition)
@@ -0,0 +1,96 @@
+import shutil
+import subprocess
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import NDArray
+
+from voct.domain.ports import AudioDecoderPort
+
+_TARGET_SAMPLE_RATE = 16000
+_BYTES_PER_SAMPLE = 4  # f32le
+
+
+def ffmpeg_available() -> bool:
+    """ffmpeg コマンドが PATH にあるか。"""
+    return shutil.which("ffmpeg") is not None
+
+
+class FfmpegDecoder(AudioDecoderPort):
+    """ffmpeg コマンドに 16kHz モノラル float32 の生 PCM を標準出力へ書かせ、ブロックずつ読む実装。
+
+    PyAV を入れられない環境向け。変換は別プロセスで進むため、読み出し側の GIL とも競合しない。
+    長さは ffprobe があればそれで調べ、なければ分からないものとして扱う。
+    """
+
+    def __init__(self, executable: str = "ffmpeg", probe_executable: str = "ffprobe") -> None:
+        self._executable = executable
+        self._probe_executable = probe_executable
+
+    @property
+    def name(self) -> str:
+        return "ffmpeg"
+
+    def iter_blocks(self, file_path: Path, block_samples: int) -> Iterator[NDArray[np.float32]]:
+        command = [
+            self._executable,
+            "-nostdin",
+            "-v",
+            "error",
+            "-i",
+            str(file_path),
+            "-f",
+            "f32le",
+            "-ac",
+            "1",
+            "-ar",
+            str(_TARGET_SAMPLE_RATE),
+            "-",
+        ]
+        # 壊れたファイルでエラーが大量に出てもパイプが詰まらないよう、標準エラーは一時ファイルに受ける
+        with tempfile.TemporaryFile() as errors:
+            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=errors)
+            try:
+                while True:
+                    data = process.stdout.read(block_samples * _BYTES_PER_SAMPLE)
+                    if not data:
+                        break
+                    usable = len(data) - len(data) % _BYTES_PER_SAMPLE
+                    yield np.frombuffer(data[:usable], dtype="<f4")
+                if process.wait() != 0:
+                    errors.seek(0)
+                    message = errors.read().decode(errors="replace").strip()
+                    raise RuntimeError(f"ffmpeg が失敗しました ({process.returncode}): {message}")
+            finally:
+                # 途中で読むのをやめた場合もプロセスを残さない
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+                process.stdout.close()
+
+    def probe_seconds(self, file_path: Path) -> float | None:
+        if shutil.which(self._probe_executable) is None:
+            return None
+        completed = subprocess.run(
+            [
+                self._probe_executable,
+                "-v",
+                "error",
+                "-show_entries",
+                "format=duration",
+                "-of",
+                "csv=p=0",
+                str(file_path),
+            ],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if completed.returncode != 0:
+            raise RuntimeError(f"ffprobe が失敗しました ({completed.returncode}): {completed.stderr.strip()}")
+        try:
+            return float(completed.stdout.strip())
+        except ValueError:
+            return None
@@ -0,0 +1,105 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+from voct.domain.ports import DirectoryWatcherPort
+
+# <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_Q_OVERFLOW = 0x00004000
+IN_ISDIR = 0x40000000
+_WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+_READ_BYTES = 64 * 1024
+
+
+def _load_libc() -> ctypes.CDLL:
+    libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    libc.inotify_init1.argtypes = [ctypes.c_int]
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    return libc
+
+
+def inotify_available() -> bool:
+    """この環境で inotify を使えるか。"""
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        return hasattr(_load_libc(), "inotify_init1")
+    except OSError:
+        return False
+
+
+def parse_events(data: bytes) -> list[tuple[int, str]]:
+    """read で得た inotify_event の列を (mask, 名前) の列にする。名前は NUL で埋められている。"""
+    events = []
+    offset = 0
+    while offset + _EVENT_HEADER.size <= len(data):
+        _, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+        offset += _EVENT_HEADER.size
+        name = data[offset : offset + length].rstrip(b"\0")
+        offset += length
+        events.append((mask, os.fsdecode(name)))
+    return events
+
+
+class InotifyDirectoryWatcher(DirectoryWatcherPort):
+    """inotify でディレクトリを監視し、書き込みを閉じたファイルと移動してきたファイルを報告する実装（Linux のみ）。
+
+    書き込み中のファイルは閉じるまで報告しない。ネットワーク共有など、
+    他のマシンでの書き込みがイベントとして届かない場所では PollingDirectoryWatcher を使う。
+    """
+
+    def __init__(self) -> None:
+        self._fd: int | None = None
+        self._wake_r: int | None = None
+        self._wake_w: int | None = None
+        self._thread: threading.Thread | None = None
+
+    def start(self, directory: Path, on_file: Callable[[Path], None]) -> None:
+        """inotify を初期化してディレクトリを登録する。失敗したら OSError を送出する。"""
+        libc = _load_libc()
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_init1: {os.strerror(errno)}")
+        if libc.inotify_add_watch(fd, os.fsencode(directory), _WATCH_MASK) < 0:
+            errno = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(errno, f"inotify_add_watch: {os.strerror(errno)}", str(directory))
+        self._fd = fd
+        self._wake_r, self._wake_w = os.pipe()
+        self._thread = threading.Thread(target=self._run, args=(directory, on_file), name="voct-inotify", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            os.write(self._wake_w, b"\0")
+            self._thread.join()
+            self._thread = None
+        for fd in (self._fd, self._wake_r, self._wake_w):
+            if fd is not None:
+                os.close(fd)
+        self._fd = self._wake_r = self._wake_w = None
+
+    def _run(self, directory: Path, on_file: Callable[[Path], None]) -> None:
+        while True:
+            readable, _, _ = select.select([self._fd, self._wake_r], [], [])
+            if self._wake_r in readable:
+                return
+            try:
+                data = os.read(self._fd, _READ_BYTES)
+            except BlockingIOError:
+                continue
+            for mask, name in parse_events(data):
+                if mask & IN_Q_OVERFLOW:
+                    print("[Voct] 警告: inotify のイベントがあふれたため、一部のファイルを見落とした可能性があります")
+                elif name and not mask & IN_ISDIR:
+                    on_file(directory / name)
@@ -0,0 +1,33 @@
+import json
+from typing import TextIO
+
+from voct.domain.entities import StreamSegment
+from voct.domain.ports import SegmentWriterPort
+
+
+def segment_to_json(segment: StreamSegment) -> str:
+    """区間を 1 行の JSON にする。時刻は秒（ミリ秒単位に丸める）。"""
+    return json.dumps(
+        {
+            "index": segment.index,
+            "start": round(segment.start_seconds, 3),
+            "end": round(segment.end_seconds, 3),
+            "text": segment.text,
+            "language": segment.language,
+            "queue_seconds": round(segment.queue_seconds, 3),
+            "transcription_seconds": round(segment.transcription_seconds, 3),
+            "latency_seconds": round(segment.latency_seconds, 3),
+        },
+        ensure_ascii=False,
+    )
+
+
+class JsonLinesSegmentWriter(SegmentWriterPort):
+    """区間を 1 行 1 件の JSON としてテキストストリーム（標準出力など）に書き、行ごとにフラッシュする実装。"""
+
+    def __init__(self, stream: TextIO) -> None:
+        self._stream = stream
+
+    def write(self, segment: StreamSegment) -> None:
+        self._stream.write(segment_to_json(segment) + "\n")
+        self._stream.flush()
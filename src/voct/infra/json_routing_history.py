@@ -0,0 +1,33 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from voct.domain.ports import RoutingHistoryPort
+
+
+def default_routing_history_path() -> Path:
+    """ルーティング履歴の保存先。"""
+    return Path.home() / ".local" / "state" / "voct" / "routing.json"
+
+
+class JsonRoutingHistory(RoutingHistoryPort):
+    """モデルごとの処理速度の計測値を JSON ファイルに保存する実装。"""
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+
+    def load(self) -> dict[str, float]:
+        try:
+            values = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return {key: float(value) for key, value in values.items()}
+
+    def save(self, values: dict[str, float]) -> None:
+        """一時ファイルに書いてから置き換え、途中で中断しても壊れないようにする。"""
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self._path.parent, prefix=".routing-", suffix=".json")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(values, f, indent=2, sort_keys=True)
+        os.replace(tmp, self._path)
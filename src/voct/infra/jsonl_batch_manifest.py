@@ -0,0 +1,84 @@
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from voct.domain.entities import ManifestItem, ManifestStatus
+from voct.domain.ports import BatchManifestPort
+
+
+def _to_json(item: ManifestItem) -> str:
+    return json.dumps(
+        {
+            "input_path": str(item.input_path),
+            "sha256": item.sha256,
+            "status": item.status.value,
+            "output_path": str(item.output_path) if item.output_path is not None else None,
+            "duration_seconds": item.duration_seconds,
+            "transcription_seconds": item.transcription_seconds,
+            "attempts": item.attempts,
+            "error": item.error,
+        },
+        ensure_ascii=False,
+    )
+
+
+def _from_json(line: str) -> ManifestItem:
+    values = json.loads(line)
+    return ManifestItem(
+        input_path=Path(values["input_path"]),
+        sha256=values["sha256"],
+        status=ManifestStatus(values["status"]),
+        output_path=Path(values["output_path"]) if values.get("output_path") is not None else None,
+        duration_seconds=values.get("duration_seconds"),
+        transcription_seconds=values.get("transcription_seconds"),
+        attempts=values.get("attempts", 0),
+        error=values.get("error"),
+    )
+
+
+class JsonlBatchManifest(BatchManifestPort):
+    """マニフェストを 1 行 1 件の JSON Lines に保存する実装。
+
+    状態が変わるたびに 1 行追記して fsync するため、1 件あたりの書き込み量は入力の総数に依存しない。
+    同じ入力の行は後のものを使い、強制終了で欠けた最後の行は読み飛ばす。
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+
+    def load(self) -> list[ManifestItem]:
+        try:
+            lines = self._path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return []
+        items: dict[Path, ManifestItem] = {}
+        for line in lines:
+            try:
+                item = _from_json(line)
+            except (ValueError, KeyError, TypeError):
+                continue
+            items[item.input_path] = item
+        return list(items.values())
+
+    def append(self, item: ManifestItem) -> None:
+        with self._lock:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with self._path.open("a", encoding="utf-8") as f:
+                f.write(_to_json(item) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def compact(self, items: list[ManifestItem]) -> None:
+        """一時ファイルに書いてから置き換え、途中で中断しても壊れないようにする。"""
+        with self._lock:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self._path.parent, prefix=".manifest-", suffix=".jsonl")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                for item in items:
+                    f.write(_to_json(item) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self._path)
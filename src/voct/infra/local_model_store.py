@@ -0,0 +1,145 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+
+from faster_whisper import download_model
+
+from voct.domain.entities import ModelArtifact
+
+_MANIFEST_NAME = "manifest.json"
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def default_model_dir() -> Path:
+    """モデルの保存先。環境変数 VOCT_MODEL_DIR があればそれを使う。"""
+    env = os.environ.get("VOCT_MODEL_DIR")
+    if env:
+        return Path(env).expanduser()
+    return Path.home() / ".local" / "share" / "voct" / "models"
+
+
+def hash_model_dir(path: Path) -> tuple[str, int]:
+    """ディレクトリ内の全ファイルの相対パスと内容から sha256 と合計バイト数を求める。"""
+    digest = hashlib.sha256()
+    total = 0
+    for file in sorted(p for p in path.rglob("*") if p.is_file()):
+        digest.update(file.relative_to(path).as_posix().encode("utf-8") + b"\0")
+        with open(file, "rb") as f:
+            while chunk := f.read(_HASH_CHUNK_BYTES):
+                digest.update(chunk)
+                total += len(chunk)
+    return digest.hexdigest(), total
+
+
+class LocalModelStore:
+    """CTranslate2 変換済みモデルをローカルディレクトリに固定し、manifest.json で管理するモデル置き場。
+
+    固定したモデルはパスで解決されるため、ロード時に Hugging Face Hub を参照しない。
+    manifest.json は一時ファイルに書いてから置き換えるため、書き込み途中で壊れない。
+    """
+
+    def __init__(self, root: Path) -> None:
+        self._root = root
+        self._lock = threading.Lock()
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    def _read_manifest(self) -> dict:
+        manifest_path = self._root / _MANIFEST_NAME
+        if not manifest_path.exists():
+            return {"models": {}}
+        return json.loads(manifest_path.read_text(encoding="utf-8"))
+
+    def _write_manifest(self, manifest: dict) -> None:
+        self._root.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self._root, prefix=".manifest-", suffix=".json")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, self._root / _MANIFEST_NAME)
+
+    def _to_artifact(self, name: str, entry: dict) -> ModelArtifact:
+        return ModelArtifact(
+            name=name,
+            path=self._root / entry["path"],
+            sha256=entry["sha256"],
+            size_bytes=entry["size_bytes"],
+            load_seconds=entry.get("load_seconds"),
+        )
+
+    def _model_dir(self, name: str) -> Path:
+        """name のモデルディレクトリを返す。モデル置き場の直下を指さない名前は拒否する。"""
+        if name in ("", ".", "..") or "/" in name or "\\" in name or name == _MANIFEST_NAME:
+            raise ValueError(f"invalid model name: {name!r}")
+        destination = self._root / name
+        if destination.resolve().parent != self._root.resolve():
+            raise ValueError(f"invalid model name: {name!r}")
+        return destination
+
+    def _register(self, name: str) -> ModelArtifact:
+        sha256, size_bytes = hash_model_dir(self._model_dir(name))
+        with self._lock:
+            manifest = self._read_manifest()
+            manifest["models"][name] = {"path": name, "sha256": sha256, "size_bytes": size_bytes}
+            self._write_manifest(manifest)
+            return self._to_artifact(name, manifest["models"][name])
+
+    def list_models(self) -> list[ModelArtifact]:
+        """固定済みのモデルを名前順に返す。"""
+        models = self._read_manifest()["models"]
+        return [self._to_artifact(name, models[name]) for name in sorted(models)]
+
+    def get(self, name: str) -> ModelArtifact | None:
+        entry = self._read_manifest()["models"].get(name)
+        return self._to_artifact(name, entry) if entry is not None else None
+
+    def resolve(self, name: str) -> Path | None:
+        """固定済みならモデルディレクトリのパスを返す。未固定なら None。"""
+        artifact = self.get(name)
+        return artifact.path if artifact is not None and artifact.path.is_dir() else None
+
+    def fetch(self, name: str) -> ModelArtifact:
+        """faster-whisper のモデルをダウンロードして固定する。ネットワークに接続できる環境で事前に実行する。"""
+        download_model(name, output_dir=str(self._model_dir(name)))
+        return self._register(name)
+
+    def import_model(self, name: str, source: Path) -> ModelArtifact:
+        """変換済みモデルのディレクトリをコピーして固定する。"""
+        destination = self._model_dir(name)
+        if not (source / "model.bin").is_file():
+            raise ValueError(f"{source} is not a CTranslate2 model directory (model.bin not found)")
+        if destination.exists():
+            shutil.rmtree(destination)
+        shutil.copytree(source, destination)
+        return self._register(name)
+
+    def verify(self, name: str) -> bool:
+        """モデルディレクトリの sha256 が固定時と一致するかを返す。"""
+        artifact = self.get(name)
+        if artifact is None or not artifact.path.is_dir():
+            return False
+        return hash_model_dir(artifact.path)[0] == artifact.sha256
+
+    def remove(self, name: str) -> None:
+        """固定を解除し、モデルディレクトリを削除する。"""
+        with self._lock:
+            manifest = self._read_manifest()
+            entry = manifest["models"].pop(name, None)
+            self._write_manifest(manifest)
+        if entry is not None:
+            shutil.rmtree(self._root / entry["path"], ignore_errors=True)
+
+    def record_load_time(self, name: str, seconds: float) -> None:
+        """固定済みモデルのロード時間を記録する。"""
+        with self._lock:
+            manifest = self._read_manifest()
+            entry = manifest["models"].get(name)
+            if entry is None:
+                return
+            entry["load_seconds"] = seconds
+            self._write_manifest(manifest)
@@ -1,16 +1,123 @@
+import os
+import threading
 from datetime import datetime
 from pathlib import Path
+from typing import IO, Literal
 
-from voct.domain.ports import TranscriptFilePort
+from voct.domain.entities import TranscriptionResult, TranscriptOutput
+from voct.domain.ports import TranscriptFilePort, TranscriptLogPort
 
+JournalMode = Literal["daily", "session"]
 
-class MarkdownTranscriptFile(TranscriptFilePort):
-    """Markdown ファイルに文字起こし結果を保存する実装。"""
 
-    def save(self, text: str, directory: Path, filename_format: str) -> Path:
-        """文字起こし結果を Markdown ファイルとして保存し、パスを返す。"""
+def journal_entry(text: str, timestamp: datetime) -> str:
+    """ジャーナルに追記する 1 件分の Markdown。見出しの時刻で grep できる。"""
+    return f"## {timestamp:%Y-%m-%d %H:%M:%S}\n\n{text}\n\n"
+
+
+class MarkdownTranscriptFile(TranscriptFilePort, TranscriptLogPort):
+    """Markdown ファイルに文字起こし結果を保存する実装。
+
+    journal を指定すると、発話ごとにファイルを作る代わりに 1 日（daily）または 1 回の起動（session）ごとの
+    ファイルへ時刻付きの見出しで追記する。ファイルは開いたまま書き込みをバッファし、
+    fsync_interval_seconds ごとにまとめてディスクへ書き出す（0 なら追記のたび）。使い終わったら close を呼ぶ。
+    """
+
+    def __init__(self, journal: JournalMode | None = None, fsync_interval_seconds: float = 1.0) -> None:
+        self._journal = journal
+        self._fsync_interval_seconds = fsync_interval_seconds
+        self._lock = threading.Lock()
+        self._file: IO[str] | None = None
+        self._path: Path | None = None
+        self._session_started: datetime | None = None
+        self._dirty = False
+        self._stop = threading.Event()
+        self._syncer: threading.Thread | None = None
+
+    def save(
+        self,
+        text: str,
+        directory: Path,
+        filename_format: str,
+        timestamp: datetime | None = None,
+        result: TranscriptionResult | None = None,
+        key: str | None = None,
+    ) -> Path:
+        """文字起こし結果を Markdown ファイルとして保存し、パスを返す。key は使わない。"""
+        timestamp = timestamp or datetime.now()
+        if self._journal is not None:
+            return self._append_entries([(text, timestamp)], directory)
         directory.mkdir(parents=True, exist_ok=True)
-        filename = datetime.now().strftime(filename_format) + ".md"
+        filename = timestamp.strftime(filename_format) + ".md"
         file_path = directory / filename
         file_path.write_text(text, encoding="utf-8")
         return file_path
+
+    def save_many(self, outputs: list[TranscriptOutput], directory: Path, filename_format: str) -> None:
+        if self._journal is None:
+            super().save_many(outputs, directory, filename_format)
+            return
+        self._append_entries([(output.text, output.created_at) for output in outputs], directory)
+
+    def append(self, text: str, file_path: Path) -> None:
+        """テキストを 1 行として Markdown ファイルの末尾に追記する。"""
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with file_path.open("a", encoding="utf-8") as f:
+            f.write(text + "\n")
+
+    def close(self) -> None:
+        """ジャーナルをディスクへ書き出して閉じる。"""
+        self._stop.set()
+        if self._syncer is not None:
+            self._syncer.join()
+            self._syncer = None
+        with self._lock:
+            if self._file is not None:
+                self._sync()
+                self._file.close()
+                self._file = None
+                self._path = None
+
+    def _journal_path(self, directory: Path, timestamp: datetime) -> Path:
+        if self._journal == "daily":
+            return directory / f"{timestamp:%Y-%m-%d}.md"
+        if self._session_started is None:
+            self._session_started = timestamp
+        return directory / f"session-{self._session_started:%Y%m%d-%H%M%S}.md"
+
+    def _append_entries(self, entries: list[tuple[str, datetime]], directory: Path) -> Path:
+        with self._lock:
+            for text, timestamp in entries:
+                self._open_journal(self._journal_path(directory, timestamp))
+                self._file.write(journal_entry(text, timestamp))
+                self._dirty = True
+            if self._fsync_interval_seconds <= 0:
+                self._sync()
+            elif self._syncer is None:
+                self._stop.clear()
+                self._syncer = threading.Thread(target=self._sync_loop, name="voct-journal-sync", daemon=True)
+                self._syncer.start()
+            return self._path
+
+    def _open_journal(self, path: Path) -> None:
+        """書き込み先が変わったとき（日付の切り替わりや保存先の変更）だけ開き直す。"""
+        if path == self._path:
+            return
+        if self._file is not None:
+            self._sync()
+            self._file.close()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = path.open("a", encoding="utf-8")
+        self._path = path
+
+    def _sync(self) -> None:
+        if self._file is None or not self._dirty:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._dirty = False
+
+    def _sync_loop(self) -> None:
+        while not self._stop.wait(self._fsync_interval_seconds):
+            with self._lock:
+                self._sync()
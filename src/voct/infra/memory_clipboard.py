@@ -0,0 +1,11 @@
+from voct.domain.ports import ClipboardPort
+
+
+class InMemoryClipboard(ClipboardPort):
+    """システムクリップボードを使わず、最後にコピーされたテキストを保持するだけの実装。ヘッドレス環境用。"""
+
+    def __init__(self) -> None:
+        self.text: str = ""
+
+    def copy(self, text: str) -> None:
+        self.text = text
@@ -0,0 +1,168 @@
+import queue
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+from voct.domain.entities import (
+    AudioData,
+    BatchingConfig,
+    BatchingStats,
+    DecodeOptions,
+    TranscriptionResult,
+    TranscriptionSegment,
+)
+from voct.domain.ports import TranscriberPort
+from voct.infra.whisper_transcriber import WHISPER_SAMPLE_RATE, WhisperTranscriber
+
+
+@dataclass
+class _Request:
+    samples: np.ndarray
+    model_size: str
+    language: str | None
+    options: DecodeOptions | None = None
+    enqueued_at: float = field(default_factory=time.perf_counter)
+    future: Future = field(default_factory=Future)
+
+
+class MicroBatchingTranscriber(TranscriberPort):
+    """複数の呼び出し元から届いた文字起こし要求を束ね、1 回のバッチ推論で処理する TranscriberPort 実装。
+
+    最初の要求から config.max_wait_seconds 待つか config.max_batch_size 件集まった時点でバッチを確定し、
+    モデルサイズ・言語・デコード設定が同じ要求ごとに WhisperTranscriber.transcribe_batch を呼び出す。
+    呼び出し元は自分の結果が出るまでブロックし、on_segment にはバッチ完了後にまとめてセグメントが渡される。
+    """
+
+    def __init__(self, transcriber: WhisperTranscriber, config: BatchingConfig | None = None) -> None:
+        self._transcriber = transcriber
+        self._config = config or BatchingConfig()
+        self._queue: queue.Queue[_Request | None] = queue.Queue()
+        self._stats_lock = threading.Lock()
+        self._batches = 0
+        self._clips = 0
+        self._wait_seconds = 0.0
+        self._audio_seconds = 0.0
+        self._busy_seconds = 0.0
+        self._worker = threading.Thread(target=self._work, daemon=True)
+        self._worker.start()
+
+    @property
+    def stats(self) -> BatchingStats:
+        """これまでに処理したバッチの累計統計。"""
+        with self._stats_lock:
+            return BatchingStats(
+                batches=self._batches,
+                clips=self._clips,
+                mean_batch_size=self._clips / self._batches if self._batches else 0.0,
+                mean_wait_seconds=self._wait_seconds / self._clips if self._clips else 0.0,
+                audio_seconds=self._audio_seconds,
+                busy_seconds=self._busy_seconds,
+            )
+
+    def transcribe(
+        self,
+        audio_path: Path,
+        model_size: str = "base",
+        language: str | None = None,
+        on_segment: Callable[[TranscriptionSegment], None] | None = None,
+        options: DecodeOptions | None = None,
+    ) -> TranscriptionResult:
+        samples = self._transcriber.load_audio(audio_path)
+        return self._submit(samples, model_size, language, on_segment, options)
+
+    def transcribe_audio(
+        self,
+        audio: AudioData,
+        model_size: str = "base",
+        language: str | None = None,
+        on_segment: Callable[[TranscriptionSegment], None] | None = None,
+        options: DecodeOptions | None = None,
+    ) -> TranscriptionResult:
+        if audio.sample_rate != WHISPER_SAMPLE_RATE:
+            raise ValueError(f"audio must be {WHISPER_SAMPLE_RATE} Hz, got {audio.sample_rate} Hz")
+        samples = np.asarray(audio.data, dtype=np.float32)
+        return self._submit(samples, model_size, language, on_segment, options)
+
+    def close(self) -> None:
+        """待機中の要求を処理し終えてからワーカーを停止する。"""
+        self._queue.put(None)
+        self._worker.join()
+
+    def _submit(
+        self,
+        samples: np.ndarray,
+        model_size: str,
+        language: str | None,
+        on_segment: Callable[[TranscriptionSegment], None] | None,
+        options: DecodeOptions | None,
+    ) -> TranscriptionResult:
+        request = _Request(samples=samples, model_size=model_size, language=language, options=options)
+        self._queue.put(request)
+        result: TranscriptionResult = request.future.result()
+        if on_segment is not None:
+            for segment in result.segments:
+                on_segment(segment)
+        return result
+
+    def _collect(self, first: _Request) -> tuple[list[_Request], bool]:
+        """最初の要求から max_wait_seconds 以内に届いた要求を max_batch_size 件まで集める。
+
+        停止要求を受け取った場合は 2 番目の戻り値が True になる。
+        """
+        batch = [first]
+        deadline = first.enqueued_at + self._config.max_wait_seconds
+        while len(batch) < self._config.max_batch_size:
+            timeout = deadline - time.perf_counter()
+            try:
+                request = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if request is None:
+                return batch, True
+            batch.append(request)
+        return batch, False
+
+    def _work(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch, closing = self._collect(first)
+            self._run_batch(batch)
+            if closing:
+                return
+
+    def _run_batch(self, batch: list[_Request]) -> None:
+        started = time.perf_counter()
+        groups: dict[tuple[str, str | None, DecodeOptions | None], list[_Request]] = {}
+        for request in batch:
+            groups.setdefault((request.model_size, request.language, request.options), []).append(request)
+
+        for (model_size, language, options), requests in groups.items():
+            try:
+                results = self._transcriber.transcribe_batch(
+                    [request.samples for request in requests],
+                    model_size,
+                    language,
+                    batch_size=self._config.max_batch_size,
+                    options=options,
+                )
+            except Exception as e:
+                for request in requests:
+                    request.future.set_exception(e)
+                continue
+            for request, result in zip(requests, results, strict=True):
+                request.future.set_result(result)
+
+        finished = time.perf_counter()
+        with self._stats_lock:
+            self._batches += 1
+            self._clips += len(batch)
+            self._wait_seconds += sum(started - request.enqueued_at for request in batch)
+            self._audio_seconds += sum(len(request.samples) for request in batch) / WHISPER_SAMPLE_RATE
+            self._busy_seconds += finished - started
@@ -0,0 +1,162 @@
+import multiprocessing
+import threading
+import time
+from collections.abc import Callable
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+
+from voct.domain.entities import ClipboardStats
+from voct.domain.ports import ClipboardPort
+
+_READY_TIMEOUT_SECONDS = 5.0
+_STOP_TIMEOUT_SECONDS = 1.0
+
+# ヘルパープロセスで動かすサーバー。("ready", None) か ("error", 詳細) を送ってから、
+# ("set", text) / ("get", None) / ("stop", None) を受け取り ("ok", 値) か ("error", 詳細) で応答する。
+ClipboardServer = Callable[[Connection], None]
+
+
+def serve_in_memory(conn: Connection) -> None:
+    """システムクリップボードの代わりにテキストを保持するだけのサーバー。テストやヘッドレス環境用。"""
+    text = ""
+    conn.send(("ready", None))
+    while True:
+        try:
+            command, value = conn.recv()
+        except EOFError:
+            return
+        if command == "stop":
+            return
+        if command == "set":
+            text = value
+        conn.send(("ok", text))
+
+
+class PersistentClipboard(ClipboardPort):
+    """常駐するヘルパープロセスへパイプでテキストを送り、クリップボードを更新する実装。
+
+    コピーのたびに xclip や pbcopy を起動する代わりに、ヘルパーが選択範囲を持ち続けて貼り付け要求に応える。
+    ヘルパーを起動できない・応答しない場合は fallback でコピーし、以降も fallback を使う。
+    ヘルパーが終了すると選択範囲も消えるため、close() ではヘルパーが持っていたテキストを fallback に引き継ぐ。
+    """
+
+    def __init__(
+        self,
+        server: ClipboardServer,
+        fallback: ClipboardPort | None = None,
+        timeout_seconds: float = 1.0,
+    ) -> None:
+        self._server = server
+        self._fallback = fallback
+        self._timeout_seconds = timeout_seconds
+        self._lock = threading.Lock()
+        self._process: BaseProcess | None = None
+        self._conn: Connection | None = None
+        self._failed = False
+        self._held_text: str | None = None
+        self._copies = 0
+        self._fallbacks = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+
+    @property
+    def stats(self) -> ClipboardStats:
+        with self._lock:
+            return ClipboardStats(
+                copies=self._copies,
+                fallbacks=self._fallbacks,
+                mean_latency_seconds=self._latency_total / self._copies if self._copies else 0.0,
+                max_latency_seconds=self._latency_max,
+            )
+
+    def open(self) -> None:
+        """ヘルパープロセスを起動し、準備ができるまで待つ。失敗したら RuntimeError を送出する。"""
+        context = multiprocessing.get_context("spawn")
+        parent_conn, child_conn = context.Pipe()
+        self._process = context.Process(target=self._server, args=(child_conn,), name="voct-clipboard", daemon=True)
+        self._process.start()
+        child_conn.close()
+        self._conn = parent_conn
+        try:
+            status, detail = self._receive(_READY_TIMEOUT_SECONDS)
+        except (EOFError, TimeoutError) as e:
+            self._stop_helper()
+            raise RuntimeError(f"clipboard helper did not start: {e!r}") from e
+        if status != "ready":
+            self._stop_helper()
+            raise RuntimeError(f"clipboard helper failed: {detail}")
+
+    def copy(self, text: str) -> None:
+        t0 = time.perf_counter()
+        with self._lock:
+            used_fallback = not self._copy_via_helper(text)
+            self._held_text = None if used_fallback else text
+        if used_fallback:
+            if self._fallback is None:
+                raise RuntimeError("clipboard helper is not available")
+            self._fallback.copy(text)
+        elapsed = time.perf_counter() - t0
+        with self._lock:
+            self._copies += 1
+            self._fallbacks += int(used_fallback)
+            self._latency_total += elapsed
+            self._latency_max = max(self._latency_max, elapsed)
+
+    def paste(self) -> str:
+        """ヘルパーが保持しているテキストを返す。"""
+        with self._lock:
+            self._ensure_open()
+            self._conn.send(("get", None))
+            status, value = self._receive(self._timeout_seconds)
+        if status != "ok":
+            raise RuntimeError(f"clipboard helper failed: {value}")
+        return value
+
+    def close(self) -> None:
+        """ヘルパーが持っていたテキストを fallback にコピーしてから、ヘルパープロセスを停止する。"""
+        text, self._held_text = self._held_text, None
+        if text is not None and self._fallback is not None:
+            try:
+                self._fallback.copy(text)
+            except Exception as e:
+                print(f"[Voct] 警告: 最後にコピーしたテキストを終了後も残せませんでした: {e}")
+        self._stop_helper()
+
+    def _stop_helper(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.send(("stop", None))
+            except OSError:
+                pass
+            self._conn.close()
+            self._conn = None
+        if self._process is not None:
+            self._process.join(_STOP_TIMEOUT_SECONDS)
+            if self._process.is_alive():
+                self._process.terminate()
+            self._process = None
+
+    def _ensure_open(self) -> None:
+        if self._conn is None:
+            self.open()
+
+    def _receive(self, timeout: float) -> tuple[str, object]:
+        if not self._conn.poll(timeout):
+            raise TimeoutError(f"no response within {timeout:g}s")
+        return self._conn.recv()
+
+    def _copy_via_helper(self, text: str) -> bool:
+        """ヘルパーでコピーできたら True。ヘルパーが使えなくなったら警告して以降は使わない。"""
+        if self._failed:
+            return False
+        try:
+            self._ensure_open()
+            self._conn.send(("set", text))
+            status, detail = self._receive(self._timeout_seconds)
+        except (RuntimeError, OSError, EOFError, TimeoutError) as e:
+            self._failed = True
+            self._stop_helper()
+            print(f"[Voct] 警告: クリップボードのヘルパーを使えないため、コピーのたびにコマンドを起動します ({e})")
+            return False
+        # 大きすぎるテキストなど、この 1 回だけ扱えない場合はヘルパーを残したまま代替手段を使う
+        return status == "ok"
@@ -0,0 +1,81 @@
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from voct.domain.ports import DirectoryWatcherPort
+
+# (バイト数, 更新時刻 ns)
+_Signature = tuple[int, int]
+
+
+class PollingDirectoryWatcher(DirectoryWatcherPort):
+    """一定間隔でディレクトリを走査し、大きさと更新時刻が settle_seconds 変わらなくなったファイルを報告する実装。
+
+    inotify を使えない環境や、他のマシンからの書き込みがイベントとして届かないネットワーク共有向け。
+    開始時にあったファイルは報告せず、報告後に書き換えられたファイルは再び報告する。
+    """
+
+    def __init__(self, interval_seconds: float = 1.0, settle_seconds: float = 2.0) -> None:
+        self._interval_seconds = interval_seconds
+        self._settle_seconds = settle_seconds
+        self._directory = Path()
+        self._on_file: Callable[[Path], None] = lambda path: None
+        self._reported: dict[Path, _Signature] = {}
+        self._pending: dict[Path, tuple[_Signature, float]] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self, directory: Path, on_file: Callable[[Path], None]) -> None:
+        self._directory = directory
+        self._on_file = on_file
+        self._reported = self._scan()
+        self._pending = {}
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="voct-poll", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _scan(self) -> dict[Path, _Signature]:
+        signatures = {}
+        try:
+            entries = list(self._directory.iterdir())
+        except OSError:
+            return signatures
+        for path in entries:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            if path.is_file():
+                signatures[path] = (stat.st_size, stat.st_mtime_ns)
+        return signatures
+
+    def poll(self, now: float) -> None:
+        """1 回走査し、変化しなくなってから settle_seconds 経ったファイルを報告する。"""
+        current = self._scan()
+        for path, signature in current.items():
+            if self._reported.get(path) == signature:
+                continue
+            pending = self._pending.get(path)
+            if pending is None or pending[0] != signature:
+                self._pending[path] = (signature, now)
+            elif now - pending[1] >= self._settle_seconds:
+                del self._pending[path]
+                self._reported[path] = signature
+                self._on_file(path)
+        for path in list(self._reported):
+            if path not in current:
+                del self._reported[path]
+        for path in list(self._pending):
+            if path not in current:
+                del self._pending[path]
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval_seconds):
+            self.poll(time.monotonic())
@@ -0,0 +1,11 @@
+import os
+
+
+def current_rss_bytes() -> int | None:
+    """現在のプロセスの常駐メモリ（RSS）をバイト数で返す。/proc がない環境では None を返す。"""
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
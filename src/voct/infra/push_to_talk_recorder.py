@@ -5,6 +5,10 @@ import sounddevice as sd
 
 from voct.domain.entities import AudioData, RecordingConfig
 from voct.domain.ports import PushToTalkRecorderPort
+from voct.infra.adaptive_block_size import AdaptiveBlockSizePolicy, stream_settings
+from voct.infra.cpu_affinity import apply_capture_partition
+from voct.infra.spill_buffer import SpillToDiskBuffer
+from voct.infra.wav_file_repository import open_lazy_wav
 
 
 class PushToTalkSoundDeviceRecorder(PushToTalkRecorderPort):
@@ -15,40 +19,58 @@ class PushToTalkSoundDeviceRecorder(PushToTalkRecorderPort):
         self._recording_thread: threading.Thread | None = None
         self._chunks: list[np.ndarray] = []
         self._sample_rate: int = 16000
+        self._overflow_count: int = 0
+        self._block_policy: AdaptiveBlockSizePolicy | None = None
+        self._spill: SpillToDiskBuffer | None = None
 
     def start_recording(self, config: RecordingConfig) -> None:
         """バックグラウンドスレッドでオーディオストリームを開始する（非ブロッキング）。"""
         self._stop_event.clear()
         self._chunks = []
+        self._overflow_count = 0
         self._sample_rate = config.sample_rate
+        self._spill = None
+        if config.spill_to_disk:
+            self._spill = SpillToDiskBuffer(config.sample_rate, config.channels, config.spill_directory)
+        self._block_policy, block_size, stream_kwargs = stream_settings(config, self._block_policy)
         self._recording_thread = threading.Thread(
             target=self._record_loop,
-            args=(config,),
+            args=(config, block_size, stream_kwargs),
             daemon=True,
         )
         self._recording_thread.start()
 
-    def _record_loop(self, config: RecordingConfig) -> None:
+    def _record_loop(self, config: RecordingConfig, block_size: int, stream_kwargs: dict) -> None:
         """バックグラウンドスレッドで録音を継続する。stop_event またはタイムアウトで停止。"""
-        max_chunks = int(config.sample_rate * config.timeout_seconds / config.block_size)
-        with sd.InputStream(
-            samplerate=config.sample_rate,
-            channels=config.channels,
-            blocksize=config.block_size,
-            dtype="float32",
-        ) as stream:
+        apply_capture_partition(config.cpu_partition)
+        max_chunks = int(config.sample_rate * config.effective_timeout_seconds / block_size)
+        with sd.InputStream(**stream_kwargs) as stream:
             for _ in range(max_chunks):
                 if self._stop_event.is_set():
                     break
-                data, _ = stream.read(config.block_size)
-                self._chunks.append(data.copy())
+                data, overflowed = stream.read(block_size)
+                if overflowed:
+                    self._overflow_count += 1
+                if self._spill is not None:
+                    self._spill.append(data)
+                else:
+                    self._chunks.append(data.copy())
 
     def stop_recording(self) -> AudioData:
-        """stop_event で録音ループを停止し AudioData を返す。"""
+        """stop_event で録音ループを停止し AudioData を返す。
+
+        ディスク退避モードでは退避ファイルを遅延読み込みする LazyAudioData を返す。
+        """
         self._stop_event.set()
         if self._recording_thread is not None:
             self._recording_thread.join()
 
+        if self._block_policy is not None:
+            self._block_policy.record_result(self._overflow_count)
+
+        if self._spill is not None:
+            return open_lazy_wav(self._spill.close(), overflow_count=self._overflow_count, temporary=True)
+
         if not self._chunks:
             audio_data = np.array([], dtype=np.float32)
         else:
@@ -60,4 +82,5 @@ class PushToTalkSoundDeviceRecorder(PushToTalkRecorderPort):
             data=audio_data,
             sample_rate=self._sample_rate,
             duration_seconds=duration_seconds,
+            overflow_count=self._overflow_count,
         )
@@ -0,0 +1,46 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import av
+import numpy as np
+from numpy.typing import NDArray
+
+from voct.domain.ports import AudioDecoderPort
+from voct.infra.block_rebuffer import rebuffer
+
+_TARGET_SAMPLE_RATE = 16000
+
+
+def _resampled_frames(file_path: Path) -> Iterator[NDArray[np.float32]]:
+    with av.open(str(file_path)) as container:
+        stream = container.streams.audio[0]
+        resampler = av.AudioResampler(format="flt", layout="mono", rate=_TARGET_SAMPLE_RATE)
+        for frame in container.decode(stream):
+            for resampled in resampler.resample(frame):
+                yield resampled.to_ndarray().reshape(-1)
+        # リサンプラー内部に残ったサンプルを吐き出させる
+        for resampled in resampler.resample(None):
+            yield resampled.to_ndarray().reshape(-1)
+
+
+class PyAvDecoder(AudioDecoderPort):
+    """PyAV（FFmpeg のライブラリ）でデコードし、libswresample で 16kHz モノラルに変換する実装。
+
+    MP3・M4A(AAC)・Opus・FLAC など FFmpeg が読めるすべての形式を、フレーム単位でメモリに展開せずに読む。
+    """
+
+    @property
+    def name(self) -> str:
+        return "pyav"
+
+    def iter_blocks(self, file_path: Path, block_samples: int) -> Iterator[NDArray[np.float32]]:
+        return rebuffer(_resampled_frames(file_path), block_samples)
+
+    def probe_seconds(self, file_path: Path) -> float | None:
+        with av.open(str(file_path)) as container:
+            stream = container.streams.audio[0]
+            if stream.duration is not None and stream.time_base is not None:
+                return float(stream.duration * stream.time_base)
+            if container.duration is not None:
+                return container.duration / av.time_base
+            return None
@@ -3,8 +3,9 @@ from collections.abc import Callable
 
 from pynput import keyboard
 
-from voct.domain.entities import TriggerKey
+from voct.domain.entities import CpuPartition, TriggerKey
 from voct.domain.ports import HotkeyListenerPort
+from voct.infra.cpu_affinity import CaptureThreadPinner
 
 # TriggerKey → pynput keyboard.Key の属性名マッピング
 # キーの解決は start() 時に行うことで、テストでのモック差し替えに対応する
@@ -20,10 +21,20 @@ _KEY_MAP: dict[TriggerKey, str] = {
 
 
 class PynputHotkeyListener(HotkeyListenerPort):
-    """pynput を使ったグローバルキーボードリスナー実装。"""
+    """pynput を使ったグローバルキーボードリスナー実装。
 
-    def __init__(self) -> None:
+    cpu_partition を渡すと、リスナースレッドを最初のキー入力時にキャプチャ用コアへ固定する。
+    add_hotkey で割り当てたキーは押下時にコールバックを呼ぶ（キーリピートによる連続した押下は 1 回とみなす）。
+    """
+
+    def __init__(self, cpu_partition: CpuPartition | None = None) -> None:
         self._listener: keyboard.Listener | None = None
+        self._pin_listener_thread = CaptureThreadPinner(cpu_partition)
+        self._hotkeys: dict[TriggerKey, Callable[[], None]] = {}
+
+    def add_hotkey(self, key: TriggerKey, on_press: Callable[[], None]) -> bool:
+        self._hotkeys[key] = on_press
+        return True
 
     def start(
         self,
@@ -33,14 +44,22 @@ class PynputHotkeyListener(HotkeyListenerPort):
     ) -> None:
         """キーリスナーをバックグラウンドで開始する。macOS 権限エラー時は案内して終了。"""
         target_key = getattr(keyboard.Key, _KEY_MAP[trigger_key])
+        hotkeys = {getattr(keyboard.Key, _KEY_MAP[key]): callback for key, callback in self._hotkeys.items()}
+        held: set = set()
 
         def _on_press(key: keyboard.Key) -> None:
+            self._pin_listener_thread()
             if key == target_key:
                 on_press()
+            elif key in hotkeys and key not in held:
+                held.add(key)
+                hotkeys[key]()
 
         def _on_release(key: keyboard.Key) -> None:
             if key == target_key:
                 on_release()
+            else:
+                held.discard(key)
 
         try:
             self._listener = keyboard.Listener(
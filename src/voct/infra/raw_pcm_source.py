@@ -0,0 +1,60 @@
+from collections.abc import Iterator
+from typing import BinaryIO
+
+import numpy as np
+from numpy.typing import NDArray
+
+from voct.domain.ports import PcmSourcePort
+from voct.infra.block_rebuffer import rebuffer
+from voct.infra.sinc_resampler import SincResampler
+
+_TARGET_SAMPLE_RATE = 16000
+# ffmpeg の -f と同じ名前 → (numpy の dtype, float32 に直す係数, 中心値)
+SAMPLE_FORMATS: dict[str, tuple[str, float, float]] = {
+    "s16le": ("<i2", 1.0 / 32768.0, 0.0),
+    "s32le": ("<i4", 1.0 / 2147483648.0, 0.0),
+    "f32le": ("<f4", 1.0, 0.0),
+    "u8": ("u1", 1.0 / 128.0, 128.0),
+}
+
+
+class RawPcmSource(PcmSourcePort):
+    """ヘッダーのない生 PCM をバイナリストリーム（標準入力など）から読み、16kHz モノラル float32 にする実装。
+
+    読み込みは 1 ブロックずつ行い、下流が止まっている間は読まないため、パイプの上流はそのまま待たされる。
+    16kHz 以外の入力は SincResampler で変換する。途中で切れた最後のフレームは捨てる。
+    """
+
+    def __init__(self, stream: BinaryIO, sample_format: str = "s16le", sample_rate: int = 16000, channels: int = 1):
+        if sample_format not in SAMPLE_FORMATS:
+            raise ValueError(f"unsupported sample format: {sample_format}")
+        self._stream = stream
+        self._dtype, self._scale, self._offset = SAMPLE_FORMATS[sample_format]
+        self._sample_rate = sample_rate
+        self._channels = channels
+        self._frame_bytes = np.dtype(self._dtype).itemsize * channels
+
+    def iter_blocks(self, block_samples: int) -> Iterator[NDArray[np.float32]]:
+        return rebuffer(self._converted(block_samples), block_samples)
+
+    def _converted(self, block_samples: int) -> Iterator[NDArray[np.float32]]:
+        resampler = None
+        if self._sample_rate != _TARGET_SAMPLE_RATE:
+            resampler = SincResampler(self._sample_rate, _TARGET_SAMPLE_RATE)
+        read_frames = max(1, block_samples * self._sample_rate // _TARGET_SAMPLE_RATE)
+        remainder = b""
+        while True:
+            data = self._stream.read(read_frames * self._frame_bytes)
+            if not data:
+                break
+            data = remainder + data
+            usable = len(data) - len(data) % self._frame_bytes
+            remainder = data[usable:]
+            frames = np.frombuffer(data[:usable], dtype=self._dtype).reshape(-1, self._channels)
+            mono = frames.mean(axis=1, dtype=np.float32) if self._channels > 1 else frames[:, 0].astype(np.float32)
+            if self._offset:
+                mono -= self._offset
+            mono *= self._scale
+            yield resampler.process(mono) if resampler is not None else mono
+        if resampler is not None:
+            yield resampler.flush()
@@ -0,0 +1,78 @@
+import json
+import threading
+import time
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+from voct.domain.entities import TriggerKey
+from voct.domain.ports import HotkeyListenerPort
+
+
+def load_key_script(file_path: Path) -> list[tuple[float, float]]:
+    """[{"press": 秒, "release": 秒}, ...] 形式の JSON からキー操作スクリプトを読み込む。"""
+    entries = json.loads(file_path.read_text(encoding="utf-8"))
+    return [(float(entry["press"]), float(entry["release"])) for entry in entries]
+
+
+def uniform_key_script(cycles: int, hold_seconds: float, gap_seconds: float) -> list[tuple[float, float]]:
+    """hold_seconds 押し続けて gap_seconds 待つ操作を cycles 回繰り返すスクリプトを生成する。"""
+    script = []
+    t = 0.0
+    for _ in range(cycles):
+        script.append((t, t + hold_seconds))
+        t += hold_seconds + gap_seconds
+    return script
+
+
+class ScriptedHotkeyListener(HotkeyListenerPort):
+    """記録されたタイムスタンプどおりに押下・解放を発生させるホットキーリスナー。キーボードなしでの検証用。
+
+    script は (押下時刻, 解放時刻) の秒数の列で、speed 倍速で再生する。trigger_key は無視する。
+    """
+
+    def __init__(self, script: Sequence[tuple[float, float]], speed: float = 1.0) -> None:
+        self._script = list(script)
+        self._speed = speed
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(
+        self,
+        on_press: Callable[[], None],
+        on_release: Callable[[], None],
+        trigger_key: TriggerKey,
+    ) -> None:
+        """スクリプトの再生をバックグラウンドで開始する。"""
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._play,
+            args=(on_press, on_release),
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _wait_until(self, t0: float, at_seconds: float) -> bool:
+        """スクリプト上の時刻まで待機する。stop() された場合は False を返す。"""
+        remaining = t0 + at_seconds / self._speed - time.perf_counter()
+        if remaining > 0:
+            return not self._stop_event.wait(remaining)
+        return not self._stop_event.is_set()
+
+    def _play(self, on_press: Callable[[], None], on_release: Callable[[], None]) -> None:
+        t0 = time.perf_counter()
+        for press_at, release_at in self._script:
+            if not self._wait_until(t0, press_at):
+                return
+            on_press()
+            if not self._wait_until(t0, release_at):
+                return
+            on_release()
+
+    def join(self) -> None:
+        """スクリプトの再生終了を待機する（ブロッキング）。"""
+        if self._thread is not None:
+            self._thread.join()
+
+    def stop(self) -> None:
+        """スクリプトの再生を中断する。"""
+        self._stop_event.set()
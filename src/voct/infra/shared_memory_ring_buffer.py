@@ -0,0 +1,107 @@
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# ヘッダー（int64 × 4）: 書き込み済みサンプル数, オーバーフロー回数, 最後の書き込み時刻 (ns), 最大書き込み間隔 (ns)
+_HEADER_SLOTS = 4
+_HEADER_BYTES = _HEADER_SLOTS * 8
+_WRITE_SEQ = 0
+_OVERFLOWS = 1
+_LAST_WRITE_NS = 2
+_MAX_GAP_NS = 3
+
+
+class SharedMemoryRingBuffer:
+    """録音プロセスが書き込み、推論プロセスが読み出す float32 サンプルの共有メモリリングバッファ。
+
+    書き込み側は 1 プロセスだけで、サンプルを書いてから書き込み済みサンプル数（シーケンス番号）を進める。
+    読み出し側はシーケンス番号で範囲を指定し、折り返していなければコピーなしのビューを受け取る。
+    ビューは書き込み側が capacity サンプル先まで進むと上書きされるため、それまでに使い終える必要がある。
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, capacity: int, owner: bool) -> None:
+        self._shm = shm
+        self._capacity = capacity
+        self._owner = owner
+        self._header = np.ndarray((_HEADER_SLOTS,), dtype=np.int64, buffer=shm.buf)
+        self._samples = np.ndarray((capacity,), dtype=np.float32, buffer=shm.buf, offset=_HEADER_BYTES)
+
+    @classmethod
+    def create(cls, capacity: int) -> "SharedMemoryRingBuffer":
+        """capacity サンプル分の共有メモリを確保する。確保した側が close() で解放する。"""
+        shm = shared_memory.SharedMemory(create=True, size=_HEADER_BYTES + capacity * 4)
+        ring = cls(shm, capacity, owner=True)
+        ring._header[:] = 0
+        return ring
+
+    @classmethod
+    def attach(cls, name: str, capacity: int) -> "SharedMemoryRingBuffer":
+        """別プロセスで確保された共有メモリに接続する。
+
+        spawn で起動した子プロセスは親の resource_tracker を共有するため、接続しても二重に登録されない。
+        """
+        return cls(shared_memory.SharedMemory(name=name), capacity, owner=False)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def write_seq(self) -> int:
+        """これまでに書き込まれたサンプル数。"""
+        return int(self._header[_WRITE_SEQ])
+
+    @property
+    def overflow_count(self) -> int:
+        return int(self._header[_OVERFLOWS])
+
+    @property
+    def max_write_gap_seconds(self) -> float:
+        """書き込み間隔の最大値。録音プロセスが待たされた時間の上限の目安になる。"""
+        return int(self._header[_MAX_GAP_NS]) / 1e9
+
+    def write(self, block: np.ndarray, now_ns: int, overflowed: bool = False) -> None:
+        """ブロックを書き込んでからシーケンス番号を進める。書き込み側のプロセスからだけ呼ぶ。"""
+        block = block[-self._capacity :]
+        seq = int(self._header[_WRITE_SEQ])
+        start = seq % self._capacity
+        first = min(len(block), self._capacity - start)
+        self._samples[start : start + first] = block[:first]
+        self._samples[: len(block) - first] = block[first:]
+        last = int(self._header[_LAST_WRITE_NS])
+        if last:
+            self._header[_MAX_GAP_NS] = max(int(self._header[_MAX_GAP_NS]), now_ns - last)
+        self._header[_LAST_WRITE_NS] = now_ns
+        if overflowed:
+            self._header[_OVERFLOWS] += 1
+        self._header[_WRITE_SEQ] = seq + len(block)
+
+    def read(self, start_seq: int, end_seq: int) -> np.ndarray:
+        """[start_seq, end_seq) のサンプルを返す。折り返していなければ共有メモリのビュー、折り返していればコピー。
+
+        すでに上書きされた古い範囲は切り捨て、残っている最新 capacity サンプルまでを返す。
+        """
+        end_seq = min(end_seq, self.write_seq)
+        start_seq = max(start_seq, end_seq - self._capacity, 0)
+        if start_seq >= end_seq:
+            return np.empty(0, dtype=np.float32)
+        start = start_seq % self._capacity
+        length = end_seq - start_seq
+        if start + length <= self._capacity:
+            return self._samples[start : start + length]
+        return np.concatenate([self._samples[start:], self._samples[: length - (self._capacity - start)]])
+
+    def close(self) -> None:
+        """共有メモリへの接続を閉じる。確保した側なら共有メモリ自体も削除する。"""
+        del self._header, self._samples
+        try:
+            self._shm.close()
+        except BufferError:
+            # read() のビューがまだ使われている場合、マッピングはプロセス終了時に解放される
+            pass
+        if self._owner:
+            self._shm.unlink()
@@ -0,0 +1,12 @@
+from voct.domain.entities import NotificationConfig
+from voct.domain.ports import NotifierPort
+
+
+class SilentNotifier(NotifierPort):
+    """音を鳴らさない通知実装。サウンドデバイスのない環境での実行用。"""
+
+    def play_start_sound(self, config: NotificationConfig) -> None:
+        pass
+
+    def play_stop_sound(self, config: NotificationConfig) -> None:
+        pass
@@ -0,0 +1,75 @@
+import math
+
+import numpy as np
+from numpy.typing import NDArray
+
+# 窓付き sinc の片側の零交差の数。大きいほど遷移帯域が狭くなるが、1 サンプルあたりの積和が増える
+_ZERO_CROSSINGS = 8
+# 出力側ナイキスト周波数に対する通過帯域の上端。残りを遷移帯域に充てて折り返しを抑える
+_ROLLOFF = 0.9
+# 一度に計算する出力サンプル数。ブロックが大きくても作業用の行列がこの大きさに収まる
+_OUTPUT_CHUNK = 8192
+
+
+class SincResampler:
+    """窓付き sinc 補間でサンプリングレートを変換する、状態を持つリサンプラー。
+
+    ブロックを順に process() へ渡すと、ブロック境界をまたいでも全体を一度に変換した場合と同じ出力になる。
+    変換比を既約分数にしたときの分母の数だけ位相ごとのフィルタ係数を前もって計算しておく。
+    ダウンサンプリングでは出力側のナイキスト周波数以下に帯域を絞ってから間引く。
+    """
+
+    def __init__(self, src_rate: int, dst_rate: int) -> None:
+        g = math.gcd(src_rate, dst_rate)
+        self._step = src_rate // g  # 出力 1 サンプルあたりに進む入力サンプル数（phases 分の 1 単位）
+        self._phases = dst_rate // g
+        cutoff = min(1.0, dst_rate / src_rate) * _ROLLOFF
+        self._half_width = math.ceil(_ZERO_CROSSINGS / cutoff)
+        taps = np.arange(-self._half_width + 1, self._half_width + 1)
+        # 出力位置 i + p/phases に対し、入力 i + taps の重み
+        x = np.arange(self._phases)[:, None] / self._phases - taps[None, :]
+        window = 0.5 + 0.5 * np.cos(np.pi * np.clip(x / self._half_width, -1.0, 1.0))
+        self._table = (cutoff * np.sinc(cutoff * x) * window).astype(np.float32)
+        self._taps = taps
+        # 先頭の出力も対称な窓で計算できるよう、入力の前に half_width 個の 0 を置く
+        self._buffer = np.zeros(self._half_width, dtype=np.float32)
+        self._buffer_start = -self._half_width
+        self._consumed = 0
+        self._produced = 0
+
+    def process(self, block: NDArray[np.float32]) -> NDArray[np.float32]:
+        """block を入力に加え、計算できるところまでの出力を返す。"""
+        self._buffer = np.concatenate([self._buffer, np.asarray(block, dtype=np.float32)])
+        self._consumed += len(block)
+        return self._drain()
+
+    def flush(self) -> NDArray[np.float32]:
+        """入力の終わりを 0 で埋め、残りの出力を返す。入力全体に対応する ceil(入力長 * dst / src) サンプルで終わる。"""
+        self._buffer = np.concatenate([self._buffer, np.zeros(self._half_width, dtype=np.float32)])
+        return self._drain(final=True)
+
+    def _drain(self, final: bool = False) -> NDArray[np.float32]:
+        available_end = self._buffer_start + len(self._buffer)
+        if final:
+            # 入力の最後のサンプル以前に位置する出力まで
+            end = -(-self._consumed * self._phases // self._step)
+        else:
+            # 右側の taps がすべて届いている出力まで
+            end = max(self._produced, ((available_end - self._half_width) * self._phases - 1) // self._step + 1)
+        outputs = []
+        for start in range(self._produced, end, _OUTPUT_CHUNK):
+            n = np.arange(start, min(end, start + _OUTPUT_CHUNK), dtype=np.int64)
+            positions = n * self._step
+            base = positions // self._phases
+            phase = positions % self._phases
+            index = base[:, None] + self._taps[None, :] - self._buffer_start
+            outputs.append(np.einsum("ij,ij->i", self._buffer[index], self._table[phase]))
+        self._produced = max(self._produced, end)
+        # 次の出力が参照する最も古い入力より前を捨てる
+        keep_from = self._produced * self._step // self._phases - self._half_width + 1
+        drop = min(max(0, keep_from - self._buffer_start), len(self._buffer))
+        self._buffer = self._buffer[drop:]
+        self._buffer_start += drop
+        if not outputs:
+            return np.zeros(0, dtype=np.float32)
+        return np.concatenate(outputs).astype(np.float32, copy=False)
@@ -0,0 +1,45 @@
+from collections.abc import Callable
+
+import numpy as np
+import sounddevice as sd
+from numpy.typing import NDArray
+
+from voct.domain.entities import RecordingConfig
+from voct.domain.ports import ContinuousRecorderPort
+from voct.infra.cpu_affinity import CaptureThreadPinner
+
+
+class SoundDeviceContinuousRecorder(ContinuousRecorderPort):
+    """sounddevice のコールバックストリームで停止されるまで録音し続ける実装。"""
+
+    def __init__(self) -> None:
+        self._stream: sd.InputStream | None = None
+        self._overflow_count: int = 0
+
+    def start(self, config: RecordingConfig, on_block: Callable[[NDArray[np.float32]], None]) -> None:
+        """入力ストリームを開き、PortAudio のスレッドから on_block を呼び出す（非ブロッキング）。"""
+        self._overflow_count = 0
+        pin_capture_thread = CaptureThreadPinner(config.cpu_partition)
+
+        def _callback(indata: np.ndarray, frames: int, time_info, status: sd.CallbackFlags) -> None:
+            pin_capture_thread()
+            if status.input_overflow:
+                self._overflow_count += 1
+            on_block(indata.mean(axis=1) if indata.shape[1] > 1 else indata[:, 0].copy())
+
+        self._stream = sd.InputStream(
+            samplerate=config.sample_rate,
+            channels=config.channels,
+            blocksize=config.block_size,
+            dtype="float32",
+            callback=_callback,
+        )
+        self._stream.start()
+
+    def stop(self) -> int:
+        """ストリームを停止し、入力オーバーフロー回数を返す。"""
+        if self._stream is not None:
+            self._stream.stop()
+            self._stream.close()
+            self._stream = None
+        return self._overflow_count
@@ -5,11 +5,17 @@ import sounddevice as sd
 
 from voct.domain.entities import AudioData, RecordingConfig
 from voct.domain.ports import RecorderPort
+from voct.infra.adaptive_block_size import AdaptiveBlockSizePolicy, stream_settings
+from voct.infra.spill_buffer import SpillToDiskBuffer
+from voct.infra.wav_file_repository import open_lazy_wav
 
 
 class SoundDeviceRecorder(RecorderPort):
     """sounddeviceを使用した録音実装。"""
 
+    def __init__(self) -> None:
+        self._block_policy: AdaptiveBlockSizePolicy | None = None
+
     def record(self, config: RecordingConfig) -> AudioData:
         stop_event = threading.Event()
 
@@ -23,20 +29,32 @@ class SoundDeviceRecorder(RecorderPort):
         enter_thread = threading.Thread(target=_wait_for_enter, daemon=True)
         enter_thread.start()
 
+        self._block_policy, block_size, stream_kwargs = stream_settings(config, self._block_policy)
+
         chunks: list[np.ndarray] = []
-        max_chunks = int(config.sample_rate * config.timeout_seconds / config.block_size)
-
-        with sd.InputStream(
-            samplerate=config.sample_rate,
-            channels=config.channels,
-            blocksize=config.block_size,
-            dtype="float32",
-        ) as stream:
+        spill = None
+        if config.spill_to_disk:
+            spill = SpillToDiskBuffer(config.sample_rate, config.channels, config.spill_directory)
+        overflow_count = 0
+        max_chunks = int(config.sample_rate * config.effective_timeout_seconds / block_size)
+
+        with sd.InputStream(**stream_kwargs) as stream:
             for _ in range(max_chunks):
                 if stop_event.is_set():
                     break
-                data, _overflowed = stream.read(config.block_size)
-                chunks.append(data.copy())
+                data, overflowed = stream.read(block_size)
+                if overflowed:
+                    overflow_count += 1
+                if spill is not None:
+                    spill.append(data)
+                else:
+                    chunks.append(data.copy())
+
+        if self._block_policy is not None:
+            self._block_policy.record_result(overflow_count)
+
+        if spill is not None:
+            return open_lazy_wav(spill.close(), overflow_count=overflow_count, temporary=True)
 
         if not chunks:
             audio_data = np.array([], dtype=np.float32)
@@ -49,4 +67,5 @@ class SoundDeviceRecorder(RecorderPort):
             data=audio_data,
             sample_rate=config.sample_rate,
             duration_seconds=duration_seconds,
+            overflow_count=overflow_count,
         )
@@ -0,0 +1,42 @@
+import math
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+from numpy.typing import NDArray
+
+from voct.domain.ports import AudioDecoderPort
+from voct.infra.block_rebuffer import rebuffer
+from voct.infra.sinc_resampler import SincResampler
+
+_TARGET_SAMPLE_RATE = 16000
+
+
+def _resampled_blocks(file_path: Path, read_frames: int) -> Iterator[NDArray[np.float32]]:
+    with sf.SoundFile(str(file_path)) as f:
+        resampler = SincResampler(f.samplerate, _TARGET_SAMPLE_RATE) if f.samplerate != _TARGET_SAMPLE_RATE else None
+        for block in f.blocks(blocksize=read_frames, dtype="float32", always_2d=True):
+            mono = block.mean(axis=1) if block.shape[1] > 1 else block[:, 0]
+            yield resampler.process(mono) if resampler is not None else mono
+        if resampler is not None:
+            yield resampler.flush()
+
+
+class SoundfileDecoder(AudioDecoderPort):
+    """libsndfile でデコードし、SincResampler で 16kHz モノラルに変換する実装。
+
+    WAV・FLAC・Ogg Vorbis/Opus・MP3（libsndfile 1.1 以降）を読める。M4A(AAC) は読めない。
+    """
+
+    @property
+    def name(self) -> str:
+        return "soundfile"
+
+    def iter_blocks(self, file_path: Path, block_samples: int) -> Iterator[NDArray[np.float32]]:
+        info = sf.info(str(file_path))
+        read_frames = math.ceil(block_samples * info.samplerate / _TARGET_SAMPLE_RATE)
+        return rebuffer(_resampled_blocks(file_path, read_frames), block_samples)
+
+    def probe_seconds(self, file_path: Path) -> float | None:
+        return sf.info(str(file_path)).duration
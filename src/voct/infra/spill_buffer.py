@@ -0,0 +1,44 @@
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+
+class SpillToDiskBuffer:
+    """録音ブロックを追記専用の PCM_16 WAV に書き出し、メモリには保持しないバッファ。
+
+    WAV ヘッダのデータ長は close() 時に libsndfile が書き戻す。
+    """
+
+    def __init__(
+        self,
+        sample_rate: int,
+        channels: int,
+        directory: Path | None = None,
+    ) -> None:
+        fd, name = tempfile.mkstemp(suffix=".wav", prefix="voct-", dir=directory)
+        os.close(fd)
+        self._path = Path(name)
+        self._file = sf.SoundFile(str(self._path), "w", samplerate=sample_rate, channels=channels, subtype="PCM_16")
+        self._frames_written = 0
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def frames_written(self) -> int:
+        return self._frames_written
+
+    def append(self, block: np.ndarray) -> None:
+        """ブロックをファイルに追記する。"""
+        self._file.write(block)
+        self._frames_written += len(block)
+
+    def close(self) -> Path:
+        """ファイルを閉じてヘッダを確定し、パスを返す。"""
+        if not self._file.closed:
+            self._file.close()
+        return self._path
@@ -0,0 +1,179 @@
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from voct.domain.entities import TranscriptHit, TranscriptionResult, TranscriptOutput
+from voct.domain.ports import TranscriptFilePort
+
+DB_FILENAME = "transcripts.sqlite3"
+# trigram トークナイザーは 3 文字未満の語を索引できないため、短い語は LIKE で絞り込む
+_MIN_TRIGRAM_CHARS = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS utterances (
+    id INTEGER PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    text TEXT NOT NULL,
+    language TEXT,
+    language_probability REAL,
+    duration_seconds REAL,
+    transcription_seconds REAL,
+    model_load_seconds REAL,
+    partial INTEGER NOT NULL DEFAULT 0,
+    source_key TEXT
+);
+CREATE INDEX IF NOT EXISTS utterances_created_at ON utterances (created_at);
+CREATE VIRTUAL TABLE IF NOT EXISTS utterances_fts USING fts5 (
+    text, content='utterances', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS utterances_ai AFTER INSERT ON utterances BEGIN
+    INSERT INTO utterances_fts (rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS utterances_ad AFTER DELETE ON utterances BEGIN
+    INSERT INTO utterances_fts (utterances_fts, rowid, text) VALUES ('delete', old.id, old.text);
+END;
+"""
+# source_key 列がなかった頃のデータベースには列を足してから索引を作る
+_SOURCE_KEY_INDEX = "CREATE UNIQUE INDEX IF NOT EXISTS utterances_source_key ON utterances (source_key)"
+
+
+def default_transcript_dir() -> Path:
+    """文字起こし履歴の保存先。"""
+    return Path.home() / ".local" / "share" / "voct" / "transcripts"
+
+
+def _row(text: str, timestamp: datetime, result: TranscriptionResult | None, key: str | None = None) -> tuple:
+    if result is None:
+        return (timestamp.isoformat(), text, None, None, None, None, None, 0, key)
+    return (
+        timestamp.isoformat(),
+        text,
+        result.language,
+        result.language_probability,
+        result.duration_seconds,
+        result.transcription_time_seconds,
+        result.model_load_time_seconds,
+        int(result.partial),
+        key,
+    )
+
+
+def _match_expression(terms: list[str]) -> str:
+    """各語をフレーズとして AND で結ぶ FTS5 の検索式を作る。語中の " は二重にしてエスケープする。"""
+    return " AND ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+def _like_pattern(term: str) -> str:
+    return "%" + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
+class SqliteTranscriptStore(TranscriptFilePort):
+    """文字起こし結果を 1 つの SQLite データベースに保存し、FTS5 で全文検索できる TranscriptFilePort 実装。
+
+    データベースは directory/transcripts.sqlite3 に WAL モードで作り、言語や処理時間も列として保存する。
+    索引は日本語のように区切りのない文でも部分一致できる trigram トークナイザーを使う。
+    save_many は 1 トランザクションでまとめて挿入する。
+    key を渡した保存は同じ key の行を置き換えるため、バッチのやり直しでも行が重複しない。
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._connections: dict[Path, sqlite3.Connection] = {}
+
+    def _connect(self, directory: Path) -> sqlite3.Connection:
+        path = directory / DB_FILENAME
+        conn = self._connections.get(path)
+        if conn is None:
+            directory.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(utterances)")}
+            if "source_key" not in columns:
+                conn.execute("ALTER TABLE utterances ADD COLUMN source_key TEXT")
+            conn.execute(_SOURCE_KEY_INDEX)
+            self._connections[path] = conn
+        return conn
+
+    def save(
+        self,
+        text: str,
+        directory: Path,
+        filename_format: str,
+        timestamp: datetime | None = None,
+        result: TranscriptionResult | None = None,
+        key: str | None = None,
+    ) -> Path:
+        """1 件保存してデータベースのパスを返す。filename_format は使わない。"""
+        self._insert(directory, [_row(text, timestamp or datetime.now(), result, key)])
+        return directory / DB_FILENAME
+
+    def save_many(self, outputs: list[TranscriptOutput], directory: Path, filename_format: str) -> None:
+        self._insert(directory, [_row(output.text, output.created_at, output.result) for output in outputs])
+
+    def _insert(self, directory: Path, rows: list[tuple]) -> None:
+        with self._lock:
+            conn = self._connect(directory)
+            with conn:
+                # 同じ key の古い行は削除トリガーで索引からも消してから挿入する
+                conn.executemany(
+                    "DELETE FROM utterances WHERE source_key = ?", [(row[-1],) for row in rows if row[-1] is not None]
+                )
+                conn.executemany(
+                    "INSERT INTO utterances (created_at, text, language, language_probability, duration_seconds,"
+                    " transcription_seconds, model_load_seconds, partial, source_key)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+
+    def count(self, directory: Path) -> int:
+        with self._lock:
+            return self._connect(directory).execute("SELECT count(*) FROM utterances").fetchone()[0]
+
+    def search(self, directory: Path, query: str, limit: int = 20) -> list[TranscriptHit]:
+        """空白区切りの語をすべて含む発話を関連度順に返す。
+
+        3 文字以上の語は FTS5 の索引で探して bm25 で並べ、3 文字未満の語は LIKE で絞り込む。
+        索引を使える語がなければ新しい順に返す。
+        """
+        terms = query.split()
+        if not terms:
+            return []
+        indexed = [term for term in terms if len(term) >= _MIN_TRIGRAM_CHARS]
+        short = [term for term in terms if len(term) < _MIN_TRIGRAM_CHARS]
+        like = "".join(" AND u.text LIKE ? ESCAPE '\\'" for _ in short)
+        like_args = [_like_pattern(term) for term in short]
+        if indexed:
+            sql = (
+                "SELECT u.id, u.created_at, u.text,"
+                " snippet(utterances_fts, 0, '[', ']', '…', 16), utterances_fts.rank"
+                " FROM utterances_fts JOIN utterances u ON u.id = utterances_fts.rowid"
+                f" WHERE utterances_fts MATCH ?{like} ORDER BY utterances_fts.rank LIMIT ?"
+            )
+            args = [_match_expression(indexed), *like_args, limit]
+        else:
+            sql = (
+                "SELECT u.id, u.created_at, u.text, u.text, 0.0 FROM utterances u"
+                f" WHERE 1{like} ORDER BY u.created_at DESC LIMIT ?"
+            )
+            args = [*like_args, limit]
+        with self._lock:
+            rows = self._connect(directory).execute(sql, args).fetchall()
+        return [
+            TranscriptHit(
+                id=row[0],
+                created_at=datetime.fromisoformat(row[1]),
+                text=row[2],
+                snippet=row[3],
+                rank=row[4],
+            )
+            for row in rows
+        ]
+
+    def close(self) -> None:
+        with self._lock:
+            for conn in self._connections.values():
+                conn.close()
+            self._connections.clear()
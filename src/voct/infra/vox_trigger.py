@@ -0,0 +1,143 @@
+import dataclasses
+import math
+import queue
+import threading
+from collections import deque
+from collections.abc import Callable
+
+import numpy as np
+from numpy.typing import NDArray
+
+from voct.domain.entities import AudioData, RecordingConfig, TriggerKey, VoxConfig
+from voct.domain.overflow import warn_overflow
+from voct.domain.ports import ContinuousRecorderPort, HotkeyListenerPort, PushToTalkRecorderPort
+from voct.infra.spill_buffer import SpillToDiskBuffer
+from voct.infra.voice_activity import VoiceActivityDetector
+from voct.infra.wav_file_repository import open_lazy_wav
+
+
+class VoxTrigger(HotkeyListenerPort, PushToTalkRecorderPort):
+    """常時開いた入力ストリーム上の発話検出で押下・解放を発生させる音声起動トリガー。
+
+    発話開始を押下、発話終了を解放として通知するため、PushToTalkUseCase をそのまま使える。
+    同じストリームを録音にも使い、発話開始前の pre_roll_seconds と attack_seconds 分を録音の先頭に含める。
+    特徴量の計算とコールバックは専用スレッドで行い、PortAudio のコールバックではキューに積むだけにする。
+    trigger_key は無視する。
+    """
+
+    def __init__(
+        self,
+        recorder: ContinuousRecorderPort,
+        config: VoxConfig,
+        recording_config: RecordingConfig,
+    ) -> None:
+        self._recorder = recorder
+        self._config = config
+        self._recording_config = recording_config
+        self._sample_rate = recording_config.sample_rate
+        self._queue: queue.SimpleQueue[NDArray[np.float32] | None] = queue.SimpleQueue()
+        self._worker: threading.Thread | None = None
+        self._lock = threading.Lock()
+        pre_roll_blocks = math.ceil(
+            (config.pre_roll_seconds + config.attack_seconds) * self._sample_rate / config.block_size
+        )
+        self._pre_roll: deque[NDArray[np.float32]] = deque(maxlen=pre_roll_blocks + 1)
+        self._capturing = False
+        self._chunks: list[NDArray[np.float32]] = []
+        self._captured_samples = 0
+        self._max_samples = 0
+        self._spill: SpillToDiskBuffer | None = None
+
+    def start(
+        self,
+        on_press: Callable[[], None],
+        on_release: Callable[[], None],
+        trigger_key: TriggerKey,
+    ) -> None:
+        """入力ストリームと発話検出スレッドを開始する（非ブロッキング）。"""
+        detector = VoiceActivityDetector(self._config, self._sample_rate)
+        self._worker = threading.Thread(
+            target=self._work,
+            args=(detector, on_press, on_release),
+            daemon=True,
+        )
+        self._worker.start()
+        stream_config = dataclasses.replace(self._recording_config, block_size=self._config.block_size)
+        self._recorder.start(stream_config, self._queue.put)
+
+    def join(self) -> None:
+        """発話検出スレッドの終了を待機する（ブロッキング）。"""
+        if self._worker is not None:
+            self._worker.join()
+
+    def stop(self) -> None:
+        """入力ストリームを停止し、発話検出スレッドを終了させる。"""
+        warn_overflow(self._recorder.stop())
+        self._queue.put(None)
+
+    def _work(
+        self,
+        detector: VoiceActivityDetector,
+        on_press: Callable[[], None],
+        on_release: Callable[[], None],
+    ) -> None:
+        while True:
+            block = self._queue.get()
+            if block is None:
+                return
+            was_active = detector.active
+            active = detector.update(block)
+            self._append(block)
+            if active and not was_active:
+                on_press()
+            elif was_active and not active:
+                on_release()
+
+    def _append(self, block: NDArray[np.float32]) -> None:
+        """録音中なら録音に、そうでなければ直近の音声としてブロックを保持する。"""
+        with self._lock:
+            if not self._capturing:
+                self._pre_roll.append(block)
+                return
+            if self._captured_samples >= self._max_samples:
+                return
+            self._captured_samples += len(block)
+            if self._spill is not None:
+                self._spill.append(block)
+            else:
+                self._chunks.append(block)
+
+    def start_recording(self, config: RecordingConfig) -> None:
+        """直近の音声を先頭に含めて録音を開始する。ストリームは開始済みのものを使う。"""
+        with self._lock:
+            self._spill = None
+            if config.spill_to_disk:
+                self._spill = SpillToDiskBuffer(self._sample_rate, 1, config.spill_directory)
+            self._chunks = []
+            self._captured_samples = 0
+            self._max_samples = int(self._sample_rate * config.effective_timeout_seconds)
+            self._capturing = True
+            pre_roll = list(self._pre_roll)
+            self._pre_roll.clear()
+        for block in pre_roll:
+            self._append(block)
+
+    def stop_recording(self) -> AudioData:
+        """録音を終了して AudioData を返す。ディスク退避モードでは LazyAudioData を返す。
+
+        入力オーバーフローはストリーム全体で集計されるため、録音ごとの overflow_count は 0 になる。
+        """
+        with self._lock:
+            self._capturing = False
+            chunks, self._chunks = self._chunks, []
+            spill, self._spill = self._spill, None
+
+        if spill is not None:
+            return open_lazy_wav(spill.close(), temporary=True)
+
+        audio_data = np.concatenate(chunks) if chunks else np.array([], dtype=np.float32)
+        return AudioData(
+            data=audio_data,
+            sample_rate=self._sample_rate,
+            duration_seconds=len(audio_data) / self._sample_rate,
+        )
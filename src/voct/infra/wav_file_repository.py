@@ -1,16 +1,105 @@
+from collections.abc import Callable
 from pathlib import Path
 
 import numpy as np
 import soundfile as sf
+from numpy.typing import NDArray
 
-from voct.domain.entities import AudioData
+from voct.domain.entities import AudioData, LazyAudioData
 from voct.domain.ports import AudioFilePort
 
+# 遅延データを書き出す際の 1 ブロックのサンプル数
+_WRITE_BLOCK_FRAMES = 16000 * 30
+_PCM16_SCALE = np.float32(1.0 / 32768.0)
+
+
+def _find_wav_data_chunk(file_path: Path) -> tuple[int, int] | None:
+    """RIFF/WAVE の data チャンクのオフセットとバイト長を返す。見つからなければ None。"""
+    with open(file_path, "rb") as f:
+        header = f.read(12)
+        if len(header) < 12 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+            return None
+        while True:
+            chunk_header = f.read(8)
+            if len(chunk_header) < 8:
+                return None
+            chunk_size = int.from_bytes(chunk_header[4:], "little")
+            if chunk_header[:4] == b"data":
+                return f.tell(), chunk_size
+            # チャンクは 2 バイト境界に揃えられる
+            f.seek(chunk_size + (chunk_size & 1), 1)
+
+
+def _to_mono(block: np.ndarray) -> np.ndarray:
+    return block.mean(axis=1) if block.shape[1] > 1 else block[:, 0]
+
+
+def _memmap_reader(
+    file_path: Path, channels: int, frames: int
+) -> tuple[Callable[[int, int], NDArray[np.float32]], int] | None:
+    """PCM_16 WAV の data チャンクをメモリマップして読み込む reader とフレーム数を返す。"""
+    chunk = _find_wav_data_chunk(file_path)
+    if chunk is None:
+        return None
+    offset, nbytes = chunk
+    frames = min(frames, nbytes // (2 * channels))
+    if frames == 0:
+        return None
+    mapped = np.memmap(file_path, dtype="<i2", mode="r", offset=offset, shape=(frames, channels))
+
+    def read(start: int, count: int) -> NDArray[np.float32]:
+        block = _to_mono(mapped[start : start + count])
+        return block.astype(np.float32) * _PCM16_SCALE
+
+    return read, frames
+
+
+def _soundfile_reader(file_path: Path) -> Callable[[int, int], NDArray[np.float32]]:
+    """soundfile で必要な範囲だけを読み込む reader を返す。"""
+
+    def read(start: int, count: int) -> NDArray[np.float32]:
+        with sf.SoundFile(str(file_path)) as f:
+            f.seek(start)
+            block = f.read(count, dtype="float32", always_2d=True)
+        return np.asarray(_to_mono(block), dtype=np.float32)
+
+    return read
+
+
+def open_lazy_wav(file_path: Path, overflow_count: int = 0, temporary: bool = False) -> LazyAudioData:
+    """PCM_16 WAV はメモリマップし、それ以外は soundfile で範囲読み込みする LazyAudioData を返す。
+
+    いずれもモノラルにダウンミックスした float32 を返し、ピークメモリは読み込み単位に比例する。
+    temporary は file_path が録音を退避した一時ファイルで、使い終わったら削除してよいことを表す。
+    """
+    info = sf.info(str(file_path))
+    mapped = None
+    if info.format == "WAV" and info.subtype == "PCM_16":
+        mapped = _memmap_reader(file_path, info.channels, info.frames)
+    if mapped is not None:
+        reader, frames = mapped
+    else:
+        reader, frames = _soundfile_reader(file_path), info.frames
+    return LazyAudioData(
+        reader=reader,
+        num_samples=frames,
+        sample_rate=info.samplerate,
+        overflow_count=overflow_count,
+        source_path=file_path,
+        owned_temp_path=file_path if temporary else None,
+    )
+
 
 class WavFileRepository(AudioFilePort):
     """soundfileを使用したWAVファイルI/O実装。"""
 
     def save(self, audio: AudioData, file_path: Path) -> Path:
+        if isinstance(audio, LazyAudioData):
+            # 全体を展開せずブロック単位で書き出す
+            with sf.SoundFile(str(file_path), "w", samplerate=audio.sample_rate, channels=1, subtype="PCM_16") as f:
+                for block in audio.iter_blocks(_WRITE_BLOCK_FRAMES):
+                    f.write(block)
+            return file_path
         sf.write(str(file_path), audio.data, audio.sample_rate, subtype="PCM_16")
         return file_path
 
@@ -22,3 +111,6 @@ class WavFileRepository(AudioFilePort):
             sample_rate=sample_rate,
             duration_seconds=duration_seconds,
         )
+
+    def load_lazy(self, file_path: Path) -> AudioData:
+        return open_lazy_wav(file_path)
@@ -0,0 +1,79 @@
+import threading
+import time
+
+import numpy as np
+
+from voct.domain.entities import AudioData, RecordingConfig
+from voct.domain.ports import PushToTalkRecorderPort
+
+
+class WavReplayRecorder(PushToTalkRecorderPort):
+    """録音済み音声を実時間（または speed 倍速）で流し込む Push-to-Talk 録音実装。
+
+    マイクなしでパイプライン全体を検証するためのもので、録音ごとに音源の続きから読み、末尾に達すると先頭に戻る。
+    """
+
+    def __init__(self, source: AudioData, speed: float = 1.0) -> None:
+        if source.num_samples == 0:
+            raise ValueError("source audio is empty")
+        self._source = np.asarray(source.data, dtype=np.float32).reshape(-1)
+        self._source_rate = source.sample_rate
+        self._speed = speed
+        self._cursor = 0
+        self._stop_event = threading.Event()
+        self._streaming_thread: threading.Thread | None = None
+        self._chunks: list[np.ndarray] = []
+
+    def start_recording(self, config: RecordingConfig) -> None:
+        """バックグラウンドスレッドで音源の再生を開始する（非ブロッキング）。"""
+        self._stop_event.clear()
+        self._chunks = []
+        self._streaming_thread = threading.Thread(
+            target=self._stream_loop,
+            args=(config,),
+            daemon=True,
+        )
+        self._streaming_thread.start()
+
+    def _next_block(self, frames: int) -> np.ndarray:
+        """カーソル位置から frames サンプルを取り出す。末尾では先頭に巻き戻して連結する。"""
+        end = self._cursor + frames
+        if end <= len(self._source):
+            block = self._source[self._cursor : end]
+        else:
+            wrapped = end - len(self._source)
+            block = np.concatenate([self._source[self._cursor :], self._source[:wrapped]])
+        self._cursor = end % len(self._source)
+        return block
+
+    def _stream_loop(self, config: RecordingConfig) -> None:
+        """経過時間 × speed に相当するサンプルをブロック単位で蓄積する。stop_event またはタイムアウトで停止。"""
+        block_size = config.block_size
+        max_samples = int(self._source_rate * config.timeout_seconds)
+        block_interval = block_size / self._source_rate / self._speed
+        emitted = 0
+        t0 = time.perf_counter()
+        while not self._stop_event.is_set() and emitted < max_samples:
+            due = int((time.perf_counter() - t0) * self._speed * self._source_rate)
+            while emitted + block_size <= due and emitted < max_samples:
+                self._chunks.append(self._next_block(block_size))
+                emitted += block_size
+            self._stop_event.wait(block_interval)
+
+    def stop_recording(self) -> AudioData:
+        """再生を停止し、それまでに流し込んだ音声を AudioData として返す。"""
+        self._stop_event.set()
+        if self._streaming_thread is not None:
+            self._streaming_thread.join()
+
+        if not self._chunks:
+            audio_data = np.array([], dtype=np.float32)
+        else:
+            audio_data = np.concatenate(self._chunks)
+        self._chunks = []
+
+        return AudioData(
+            data=audio_data,
+            sample_rate=self._source_rate,
+            duration_seconds=len(audio_data) / self._source_rate,
+        )
@@ -1,41 +1,309 @@
+import bisect
+import gc
+import threading
 import time
+from collections.abc import Callable, Generator, Sequence
 from pathlib import Path
 
-from faster_whisper import WhisperModel
+import numpy as np
+from faster_whisper import BatchedInferencePipeline, WhisperModel, decode_audio
 
-from voct.domain.entities import TranscriptionResult
-from voct.domain.ports import TranscriberPort
+from voct.domain.entities import AudioData, DecodeOptions, TranscriptionResult, TranscriptionSegment
+from voct.domain.ports import ModelResidencyPort, TranscriberPort
+from voct.infra.local_model_store import LocalModelStore
+from voct.infra.process_memory import current_rss_bytes
 
+# faster-whisper に配列で渡す音声のサンプリングレート
+WHISPER_SAMPLE_RATE = 16000
+# 最後のセグメントの終端が音声の終端からこの秒数以内なら、期限切れでも打ち切らない
+_END_TOLERANCE_SECONDS = 0.5
+# バッチ推論で 1 チャンクとして扱える最大長（Whisper の入力窓）
+_MAX_CHUNK_SAMPLES = 30 * WHISPER_SAMPLE_RATE
+# クリップ境界の秒数が 2 進小数で正確に表せるよう、各クリップをこの長さの倍数に無音で揃える
+_CLIP_ALIGN_SAMPLES = WHISPER_SAMPLE_RATE // 2
 
-class WhisperTranscriber(TranscriberPort):
-    """faster-whisperを使用した文字起こし実装。"""
+
+def _decode_kwargs(options: DecodeOptions | None) -> dict:
+    """DecodeOptions を faster-whisper の transcribe() の引数に変換する。"""
+    if options is None:
+        return {}
+    return {
+        "beam_size": options.beam_size,
+        "best_of": options.best_of,
+        "temperature": list(options.temperature),
+        "compression_ratio_threshold": options.compression_ratio_threshold,
+        "condition_on_previous_text": options.condition_on_previous_text,
+    }
+
+
+def _deadline_at(start: float, options: DecodeOptions | None) -> float:
+    """期限の時刻（perf_counter 基準）を返す。期限がなければ無限大。"""
+    if options is None or options.deadline_seconds is None:
+        return float("inf")
+    return start + options.deadline_seconds
+
+
+def _pad_to_alignment(samples: np.ndarray) -> np.ndarray:
+    remainder = len(samples) % _CLIP_ALIGN_SAMPLES
+    if remainder == 0:
+        return samples
+    return np.concatenate([samples, np.zeros(_CLIP_ALIGN_SAMPLES - remainder, dtype=np.float32)])
+
+
+class WhisperTranscriber(TranscriberPort, ModelResidencyPort):
+    """faster-whisperを使用した文字起こし実装。
+
+    model_store に固定済みのモデルはローカルパスから local_files_only で読み込み、ネットワークに触れない。
+    keep_resident が True なら一度読み込んだモデルを保持し、次回以降のロードを省く。
+    cpu_threads を指定すると CTranslate2 の推論スレッド数をその数に制限する（0 なら既定値）。
+    """
+
+    def __init__(
+        self,
+        model_store: LocalModelStore | None = None,
+        keep_resident: bool = True,
+        cpu_threads: int = 0,
+    ) -> None:
+        self._model_store = model_store
+        self._keep_resident = keep_resident
+        self._model_kwargs: dict = {"device": "cpu", "compute_type": "int8"}
+        if cpu_threads > 0:
+            self._model_kwargs["cpu_threads"] = cpu_threads
+        self._models: dict[str, WhisperModel] = {}
+        self._models_lock = threading.Lock()
+        self._load_locks: dict[str, threading.Lock] = {}
+
+    def _load_model(self, model_size: str) -> tuple[WhisperModel, float]:
+        """モデルとロードにかかった秒数を返す。保持済みのモデルはロード時間 0 で返す。
+
+        ロードはモデルごとのロックで行うため、別のモデルのロード中でも保持済みのモデルは待たずに使える。
+        """
+        with self._models_lock:
+            model = self._models.get(model_size)
+            if model is not None:
+                return model, 0.0
+            load_lock = self._load_locks.setdefault(model_size, threading.Lock())
+        with load_lock:
+            with self._models_lock:
+                model = self._models.get(model_size)
+            if model is not None:
+                # 同じモデルを先に読み込み始めたスレッドの完了を待った
+                return model, 0.0
+            t0 = time.perf_counter()
+            path = self._model_store.resolve(model_size) if self._model_store is not None else None
+            if path is not None:
+                model = WhisperModel(str(path), local_files_only=True, **self._model_kwargs)
+            else:
+                model = WhisperModel(model_size, **self._model_kwargs)
+            load_time = time.perf_counter() - t0
+            if path is not None:
+                self._model_store.record_load_time(model_size, load_time)
+            if self._keep_resident:
+                with self._models_lock:
+                    self._models[model_size] = model
+            return model, load_time
 
     def transcribe(
         self,
         audio_path: Path,
         model_size: str = "base",
         language: str | None = None,
+        on_segment: Callable[[TranscriptionSegment], None] | None = None,
+        options: DecodeOptions | None = None,
+    ) -> TranscriptionResult:
+        return self._drain(self.stream(audio_path, model_size, language, options), on_segment)
+
+    def transcribe_audio(
+        self,
+        audio: AudioData,
+        model_size: str = "base",
+        language: str | None = None,
+        on_segment: Callable[[TranscriptionSegment], None] | None = None,
+        options: DecodeOptions | None = None,
     ) -> TranscriptionResult:
+        if audio.sample_rate != WHISPER_SAMPLE_RATE:
+            raise ValueError(f"audio must be {WHISPER_SAMPLE_RATE} Hz, got {audio.sample_rate} Hz")
+        samples = np.asarray(audio.data, dtype=np.float32).reshape(-1)
+        return self._drain(self._stream(samples, model_size, language, options), on_segment)
+
+    def load(self, model_size: str = "base") -> float:
+        """モデルを読み込み、ロードにかかった秒数を返す。保持済みなら 0 を返す。"""
+        return self._load_model(model_size)[1]
+
+    def warm(self, model_size: str) -> float:
+        return self.load(model_size)
+
+    def is_resident(self, model_size: str) -> bool:
+        with self._models_lock:
+            return model_size in self._models
+
+    def evict(self) -> int | None:
+        """保持中のモデルを手放し、RSS の減少量を返す。文字起こし中のモデルはその完了後に解放される。"""
+        before = current_rss_bytes()
+        with self._models_lock:
+            self._models.clear()
+        gc.collect()
+        after = current_rss_bytes()
+        if before is None or after is None:
+            return None
+        return max(before - after, 0)
+
+    def load_audio(self, audio_path: Path) -> np.ndarray:
+        """音声ファイルを 16 kHz モノラルの float32 配列として読み込む。"""
+        return decode_audio(str(audio_path), sampling_rate=WHISPER_SAMPLE_RATE)
+
+    def transcribe_batch(
+        self,
+        audios: Sequence[np.ndarray],
+        model_size: str = "base",
+        language: str | None = None,
+        batch_size: int = 8,
+        options: DecodeOptions | None = None,
+    ) -> list[TranscriptionResult]:
+        """16 kHz の複数の音声を 1 回のバッチ推論で文字起こしし、入力と同じ順の結果を返す。
+
+        各音声を 30 秒以下のクリップに分けて連結し、clip_timestamps として BatchedInferencePipeline に渡す。
+        セグメントは開始時刻から元の音声に振り分け、時刻は各音声の先頭からの秒数に戻す。
+        言語は 1 回の推論で共通のため、language 未指定時は全体で 1 つの言語が検出される。
+        モデルロード時間と推論時間はバッチ全体の値を各結果に記録する。
+        options.deadline_seconds を過ぎた場合は打ち切り、すべての結果を partial とする。
+        """
         t0 = time.perf_counter()
-        model = WhisperModel(model_size, device="cpu", compute_type="int8")
+        parts: list[np.ndarray] = []
+        clips: list[dict[str, float]] = []
+        clip_owners: list[int] = []
+        audio_offsets: list[float] = []
+        offset = 0
+        for index, audio in enumerate(audios):
+            samples = np.asarray(audio, dtype=np.float32).reshape(-1)
+            audio_offsets.append(offset / WHISPER_SAMPLE_RATE)
+            for start in range(0, len(samples), _MAX_CHUNK_SAMPLES):
+                part = _pad_to_alignment(samples[start : start + _MAX_CHUNK_SAMPLES])
+                end = offset + len(part)
+                clips.append({"start": offset / WHISPER_SAMPLE_RATE, "end": end / WHISPER_SAMPLE_RATE})
+                clip_owners.append(index)
+                parts.append(part)
+                offset = end
+
+        model, model_load_time = self._load_model(model_size)
+
+        per_audio: list[list[TranscriptionSegment]] = [[] for _ in audios]
+        detected_language, language_probability = language or "", 1.0
         t1 = time.perf_counter()
-        model_load_time = t1 - t0
+        deadline = _deadline_at(t0, options)
+        partial = False
+        if clips:
+            pipeline = BatchedInferencePipeline(model=model)
+            raw_segments, info = pipeline.transcribe(
+                np.concatenate(parts),
+                language=language,
+                clip_timestamps=clips,
+                batch_size=batch_size,
+                vad_filter=False,
+                **_decode_kwargs(options),
+            )
+            clip_starts = [clip["start"] for clip in clips]
+            for seg in raw_segments:
+                owner = clip_owners[max(bisect.bisect_right(clip_starts, seg.start) - 1, 0)]
+                base = audio_offsets[owner]
+                per_audio[owner].append(
+                    TranscriptionSegment(
+                        text=seg.text,
+                        start=seg.start - base,
+                        end=seg.end - base,
+                        avg_logprob=seg.avg_logprob,
+                    )
+                )
+                if time.perf_counter() >= deadline:
+                    partial = True
+                    break
+            detected_language, language_probability = info.language, info.language_probability
+        transcription_time = time.perf_counter() - t1
+
+        return [
+            TranscriptionResult(
+                text="".join(seg.text for seg in segments),
+                language=detected_language,
+                language_probability=language_probability,
+                duration_seconds=np.asarray(audio).size / WHISPER_SAMPLE_RATE,
+                model_load_time_seconds=model_load_time,
+                transcription_time_seconds=transcription_time,
+                segments=tuple(segments),
+                partial=partial,
+            )
+            for audio, segments in zip(audios, per_audio, strict=True)
+        ]
+
+    @staticmethod
+    def _drain(
+        segments: Generator[TranscriptionSegment, None, TranscriptionResult],
+        on_segment: Callable[[TranscriptionSegment], None] | None,
+    ) -> TranscriptionResult:
+        """セグメントを on_segment に渡しながらジェネレータを最後まで進め、結果を返す。"""
+        while True:
+            try:
+                segment = next(segments)
+            except StopIteration as stop:
+                return stop.value
+            if on_segment is not None:
+                on_segment(segment)
+
+    def stream(
+        self,
+        audio_path: Path,
+        model_size: str = "base",
+        language: str | None = None,
+        options: DecodeOptions | None = None,
+    ) -> Generator[TranscriptionSegment, None, TranscriptionResult]:
+        """faster-whisper がセグメントを出力するたびに yield し、最後に TranscriptionResult を返す。"""
+        return self._stream(str(audio_path), model_size, language, options)
+
+    def _stream(
+        self,
+        audio: str | np.ndarray,
+        model_size: str,
+        language: str | None,
+        options: DecodeOptions | None = None,
+    ) -> Generator[TranscriptionSegment, None, TranscriptionResult]:
+        deadline = _deadline_at(time.perf_counter(), options)
+        model, model_load_time = self._load_model(model_size)
 
-        transcribe_kwargs: dict = {"vad_filter": True}
+        transcribe_kwargs: dict = {"vad_filter": options is None or options.vad_filter}
         if language is not None:
             transcribe_kwargs["language"] = language
+        transcribe_kwargs.update(_decode_kwargs(options))
 
         t2 = time.perf_counter()
-        segments, info = model.transcribe(str(audio_path), **transcribe_kwargs)
-        text = "".join(seg.text for seg in segments)
+        raw_segments, info = model.transcribe(audio, **transcribe_kwargs)
+        segments: list[TranscriptionSegment] = []
+        time_to_first_segment: float | None = None
+        partial = False
+        for seg in raw_segments:
+            if time_to_first_segment is None:
+                time_to_first_segment = time.perf_counter() - t2
+            segment = TranscriptionSegment(
+                text=seg.text,
+                start=seg.start,
+                end=seg.end,
+                avg_logprob=seg.avg_logprob,
+            )
+            segments.append(segment)
+            yield segment
+            if time.perf_counter() >= deadline and seg.end < info.duration - _END_TOLERANCE_SECONDS:
+                # 期限切れ: 残りのセグメントはデコードせずに打ち切る
+                partial = True
+                break
         t3 = time.perf_counter()
         transcription_time = t3 - t2
 
         return TranscriptionResult(
-            text=text,
+            text="".join(seg.text for seg in segments),
             language=info.language,
             language_probability=info.language_probability,
             duration_seconds=info.duration,
             model_load_time_seconds=model_load_time,
             transcription_time_seconds=transcription_time,
+            time_to_first_segment_seconds=time_to_first_segment,
+            segments=tuple(segments),
+            partial=partial,
         )
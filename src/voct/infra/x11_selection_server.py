@@ -0,0 +1,79 @@
+import select
+from multiprocessing.connection import Connection
+
+# 1 回の ChangeProperty で送れる大きさに収める（INCR による分割転送には対応しない）
+MAX_SELECTION_BYTES = 256 * 1024
+
+
+def _answer_request(request, data: bytes, atoms: dict[str, int]) -> None:
+    """SelectionRequest に応答する。対応しない形式を要求されたら property を None にして断る。"""
+    from Xlib import X, Xatom
+    from Xlib.protocol import event
+
+    prop = request.property if request.property != X.NONE else request.target
+    if request.target == atoms["TARGETS"]:
+        targets = [atoms["TARGETS"], atoms["UTF8_STRING"], atoms["TEXT"], Xatom.STRING]
+        request.requestor.change_property(prop, Xatom.ATOM, 32, targets)
+    elif request.target in (atoms["UTF8_STRING"], atoms["TEXT"], Xatom.STRING):
+        request.requestor.change_property(prop, request.target, 8, data)
+    else:
+        prop = X.NONE
+    notify = event.SelectionNotify(
+        time=request.time,
+        requestor=request.requestor,
+        selection=request.selection,
+        target=request.target,
+        property=prop,
+    )
+    request.requestor.send_event(notify, event_mask=0)
+
+
+def serve_x11_selection(conn: Connection) -> None:
+    """CLIPBOARD の選択範囲を持ち続け、他のアプリからの貼り付け要求に応える X11 のサーバー。
+
+    PersistentClipboard のヘルパープロセスで動かす。新しいテキストを受け取るたびに選択範囲の所有者になり直す。
+    他のアプリがコピーして所有権を失った後は、次のテキストを受け取るまで要求に応えない。
+    """
+    try:
+        from Xlib import X
+        from Xlib import display as xdisplay
+
+        display = xdisplay.Display()
+        window = display.screen().root.create_window(0, 0, 1, 1, 0, X.CopyFromParent)
+        atoms = {name: display.intern_atom(name) for name in ("CLIPBOARD", "TARGETS", "UTF8_STRING", "TEXT")}
+    except Exception as e:
+        conn.send(("error", repr(e)))
+        return
+
+    data = b""
+    owned = False
+    conn.send(("ready", None))
+    while True:
+        while display.pending_events():
+            ev = display.next_event()
+            if ev.type == X.SelectionRequest and owned:
+                _answer_request(ev, data, atoms)
+            elif ev.type == X.SelectionClear:
+                owned = False
+        display.flush()
+
+        readable, _, _ = select.select([display.fileno(), conn.fileno()], [], [])
+        if conn.fileno() not in readable:
+            continue
+        try:
+            command, value = conn.recv()
+        except EOFError:
+            return
+        if command == "stop":
+            return
+        if command == "set":
+            encoded = value.encode("utf-8")
+            if len(encoded) > MAX_SELECTION_BYTES:
+                conn.send(("error", f"text too large for selection ({len(encoded)} bytes)"))
+                continue
+            data = encoded
+            window.set_selection_owner(atoms["CLIPBOARD"], X.CurrentTime)
+            owned = display.get_selection_owner(atoms["CLIPBOARD"]).id == window.id
+            conn.send(("ok", None) if owned else ("error", "could not acquire CLIPBOARD"))
+        else:
+            conn.send(("ok", data.decode("utf-8")))
@@ -1,24 +1,213 @@
+import argparse
 import os
 import tempfile
 from pathlib import Path
 
-from voct.domain.entities import NotificationConfig, RecordingConfig
-from voct.infra.sounddevice_notifier import SoundDeviceNotifier
-from voct.infra.sounddevice_recorder import SoundDeviceRecorder
-from voct.infra.wav_file_repository import WavFileRepository
-from voct.infra.whisper_transcriber import WhisperTranscriber
-from voct.usecase.record_and_transcribe import RecordAndTranscribeUseCase
+from voct.domain.entities import (
+    AudioData,
+    BatchConfig,
+    BatchingConfig,
+    DecodeStats,
+    LiveCaptionConfig,
+    ModelArtifact,
+    NotificationConfig,
+    PushToTalkConfig,
+    RecordingConfig,
+    StreamConfig,
+    TranscriptionSegment,
+    VoxConfig,
+    WatchConfig,
+)
 
 
-def main() -> None:
+class _SegmentPrinter:
+    """セグメントが届くたびに標準出力へ逐次表示する。"""
+
+    def __init__(self) -> None:
+        self.printed = False
+
+    def __call__(self, segment: TranscriptionSegment) -> None:
+        if not self.printed:
+            print("[Voct] 結果:")
+            self.printed = True
+        print(segment.text, end="", flush=True)
+
+
+def _make_transcriber():
+    """固定済みモデルをローカルパスから読み込む WhisperTranscriber を作る。"""
+    from voct.infra.local_model_store import LocalModelStore, default_model_dir
+    from voct.infra.whisper_transcriber import WhisperTranscriber
+
+    return WhisperTranscriber(model_store=LocalModelStore(default_model_dir()))
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="voct", description="ローカル完結型の音声入力ツール。")
+    parser.add_argument(
+        "--long",
+        action="store_true",
+        help="録音をディスクに退避し、タイムアウトなしで長時間録音する（Enter キーで停止）",
+    )
+    parser.add_argument(
+        "--adaptive-block-size",
+        action="store_true",
+        help="入力オーバーフローが起きたら次の録音からブロックサイズとレイテンシを広げる",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    replay = subparsers.add_parser(
+        "replay",
+        help="録音済み WAV とキー操作スクリプトで Push-to-Talk のレイテンシを計測する",
+    )
+    replay.add_argument("wav", type=Path, help="マイク入力の代わりに流し込む音声ファイル")
+    replay.add_argument("--script", type=Path, help='[{"press": 秒, "release": 秒}, ...] 形式のキー操作 JSON')
+    replay.add_argument("--cycles", type=int, default=100, help="--script 未指定時のサイクル数")
+    replay.add_argument("--hold", type=float, default=1.0, help="--script 未指定時のキー押下秒数")
+    replay.add_argument("--gap", type=float, default=0.5, help="--script 未指定時のキー解放から次の押下までの秒数")
+    replay.add_argument("--speed", type=float, default=1.0, help="再生速度の倍率")
+    replay.add_argument("--model", default="base", help="faster-whisper のモデルサイズ")
+    replay.add_argument("--language", default=None, help="文字起こし言語（未指定時は自動検出）")
+
+    live = subparsers.add_parser("live", help="連続録音し、重なりのある窓ごとにライブ字幕を表示する")
+    live.add_argument("--window", type=float, default=10.0, help="1 回に文字起こしする窓の秒数")
+    live.add_argument("--overlap", type=float, default=2.0, help="隣り合う窓の重なりの秒数")
+    live.add_argument("--max-lag", type=float, default=15.0, help="これより遅れた窓は文字起こしせずに捨てる")
+    live.add_argument("--output", type=Path, default=None, help="確定した行を追記する Markdown ファイル")
+    live.add_argument("--model", default="base", help="faster-whisper のモデルサイズ")
+    live.add_argument("--language", default=None, help="文字起こし言語（未指定時は自動検出）")
+
+    batch_bench = subparsers.add_parser(
+        "batch-bench",
+        help="複数の音声ファイルを逐次推論とマイクロバッチ推論で文字起こしし、スループットを比較する",
+    )
+    batch_bench.add_argument("files", type=Path, nargs="+", help="文字起こしする音声ファイル")
+    batch_bench.add_argument("--batch-size", type=int, default=8, help="1 回のバッチ推論にまとめる最大件数")
+    batch_bench.add_argument("--max-wait", type=float, default=0.05, help="バッチを確定するまでの最大待ち時間（秒）")
+    batch_bench.add_argument("--model", default="base", help="faster-whisper のモデルサイズ")
+    batch_bench.add_argument("--language", default=None, help="文字起こし言語（未指定時は自動検出）")
+
+    capture_bench = subparsers.add_parser(
+        "capture-bench",
+        help="推論相当の CPU 負荷をかけながら録音し、コア分割の有無で入力オーバーフロー回数を比較する",
+    )
+    capture_bench.add_argument("--seconds", type=float, default=30.0, help="各条件で録音する秒数")
+    capture_bench.add_argument("--capture-cores", type=int, default=1, help="録音用に予約するコア数")
+    capture_bench.add_argument("--capture-nice", type=int, default=None, help="録音スレッドの nice 値（Linux のみ）")
+    capture_bench.add_argument("--workers", type=int, default=None, help="負荷スレッド数（デフォルト: 全コア数）")
+    capture_bench.add_argument("--block-size", type=int, default=256, help="録音のブロックサイズ（小さいほど厳しい）")
+
+    search = subparsers.add_parser("search", help="SQLite に保存した文字起こし履歴を全文検索する")
+    search.add_argument("query", help="検索語（空白区切りの語をすべて含む発話を探す）")
+    search.add_argument(
+        "--dir", type=Path, default=None, help="履歴の保存先（デフォルト: ~/.local/share/voct/transcripts）"
+    )
+    search.add_argument("--limit", type=int, default=20, help="表示する最大件数")
+    search.add_argument(
+        "--export", type=Path, default=None, help="ヒットした発話を Markdown ファイルとして書き出すディレクトリ"
+    )
+
+    batch = subparsers.add_parser(
+        "batch", help="多数の音声ファイルを文字起こしする。中断しても同じマニフェストで続きから再開できる"
+    )
+    batch.add_argument("files", type=Path, nargs="+", help="文字起こしする音声ファイル")
+    batch.add_argument("--output-dir", type=Path, default=Path("transcripts"), help="結果の保存先")
+    batch.add_argument(
+        "--manifest", type=Path, default=None, help="進捗を記録するファイル（デフォルト: 保存先の manifest.jsonl）"
+    )
+    batch.add_argument("--transcript-store", choices=["markdown", "sqlite"], default="markdown", help="結果の保存形式")
+    batch.add_argument("--workers", type=int, default=2, help="同時に文字起こしするファイル数")
+    batch.add_argument("--max-attempts", type=int, default=3, help="1 ファイルあたりの最大試行回数")
+    batch.add_argument("--backoff", type=float, default=1.0, help="失敗後の最初の待ち時間（秒, 以降は倍々に延ばす）")
+    batch.add_argument(
+        "--decoder",
+        choices=["auto", "pyav", "ffmpeg", "soundfile", "none"],
+        default="auto",
+        help="圧縮音声のデコーダー（auto: PyAV→ffmpeg→libsndfile で最初に使えるもの, none: 全体を一度に読む）",
+    )
+    batch.add_argument("--model", default="base", help="faster-whisper のモデルサイズ")
+    batch.add_argument("--language", default=None, help="文字起こし言語（未指定時は自動検出）")
+
+    watch = subparsers.add_parser("watch", help="フォルダーに届いた音声ファイルを自動で文字起こしして保存する")
+    watch.add_argument("directory", type=Path, help="監視するフォルダー")
+    watch.add_argument(
+        "--output-dir", type=Path, default=None, help="結果の保存先（デフォルト: 監視フォルダー内の transcripts）"
+    )
+    watch.add_argument("--transcript-store", choices=["markdown", "sqlite"], default="markdown", help="結果の保存形式")
+    watch.add_argument("--workers", type=int, default=2, help="同時に文字起こしするファイル数")
+    watch.add_argument("--max-backlog", type=int, default=64, help="文字起こし待ちにできるファイル数の上限")
+    watch.add_argument("--existing", action="store_true", help="開始時にすでにあるファイルも文字起こしする")
+    watch.add_argument("--poll", action="store_true", help="inotify を使わず定期的に走査する（ネットワーク共有向け）")
+    watch.add_argument("--poll-interval", type=float, default=1.0, help="--poll の走査間隔（秒）")
+    watch.add_argument(
+        "--settle", type=float, default=2.0, help="--poll で大きさが変わらなくなってから書き込み完了とみなす秒数"
+    )
+    watch.add_argument("--report-interval", type=float, default=30.0, help="待ち件数と遅延を表示する間隔（秒）")
+    watch.add_argument(
+        "--decoder",
+        choices=["auto", "pyav", "ffmpeg", "soundfile", "none"],
+        default="auto",
+        help="圧縮音声のデコーダー（auto: PyAV→ffmpeg→libsndfile で最初に使えるもの, none: 全体を一度に読む）",
+    )
+    watch.add_argument("--model", default="base", help="faster-whisper のモデルサイズ")
+    watch.add_argument("--language", default=None, help="文字起こし言語（未指定時は自動検出）")
+
+    stream = subparsers.add_parser(
+        "stream", help="標準入力の生 PCM を発話区間ごとに文字起こしし、1 区間 1 行の JSON を標準出力に書く"
+    )
+    stream.add_argument(
+        "--format", choices=["s16le", "s32le", "f32le", "u8"], default="s16le", help="入力のサンプル形式"
+    )
+    stream.add_argument("--rate", type=int, default=16000, help="入力のサンプリングレート（Hz）")
+    stream.add_argument("--channels", type=int, default=1, help="入力のチャンネル数（モノラルにまとめる）")
+    stream.add_argument("--max-segment", type=float, default=30.0, help="1 区間の最大秒数（超えたら区切る）")
+    stream.add_argument(
+        "--max-backlog", type=int, default=4, help="文字起こし待ちにできる区間数の上限（満杯なら入力を待たせる）"
+    )
+    stream.add_argument(
+        "--vad-threshold",
+        type=float,
+        default=VoxConfig.energy_threshold_db,
+        help="発話とみなすエネルギーの閾値 (dBFS, デフォルト: %(default)s)",
+    )
+    stream.add_argument(
+        "--hangover", type=float, default=VoxConfig.hangover_seconds, help="発話の終わりとみなす無音の秒数"
+    )
+    stream.add_argument("--model", default="base", help="faster-whisper のモデルサイズ")
+    stream.add_argument("--language", default=None, help="文字起こし言語（未指定時は自動検出）")
+
+    models = subparsers.add_parser("models", help="オフラインで使うモデルを取得・固定・検証する")
+    models.add_argument("--dir", type=Path, default=None, help="モデルの保存先（デフォルト: $VOCT_MODEL_DIR）")
+    models_commands = models.add_subparsers(dest="models_command", required=True)
+    models_commands.add_parser("list", help="固定済みのモデルとロード時間を表示する")
+    fetch = models_commands.add_parser("fetch", help="モデルをダウンロードして固定する")
+    fetch.add_argument("names", nargs="+", help="モデルサイズ（tiny, base, small など）")
+    import_ = models_commands.add_parser("import", help="変換済みモデルのディレクトリを取り込んで固定する")
+    import_.add_argument("name", help="固定する名前（--model に指定する値）")
+    import_.add_argument("source", type=Path, help="model.bin を含む CTranslate2 モデルのディレクトリ")
+    verify = models_commands.add_parser("verify", help="固定済みモデルの sha256 を検証する")
+    verify.add_argument("names", nargs="*", help="検証するモデル（未指定時はすべて）")
+    remove = models_commands.add_parser("remove", help="固定を解除してモデルを削除する")
+    remove.add_argument("name")
+    bench = models_commands.add_parser("bench", help="固定済みモデルのロード時間を計測して記録する")
+    bench.add_argument("names", nargs="*", help="計測するモデル（未指定時はすべて）")
+
+    return parser.parse_args(argv)
+
+
+def _run_record(args: argparse.Namespace) -> None:
+    from voct.infra.sounddevice_notifier import SoundDeviceNotifier
+    from voct.infra.sounddevice_recorder import SoundDeviceRecorder
+    from voct.infra.wav_file_repository import WavFileRepository
+    from voct.usecase.record_and_transcribe import RecordAndTranscribeUseCase
+
     recorder = SoundDeviceRecorder()
     audio_file = WavFileRepository()
-    transcriber = WhisperTranscriber()
+    transcriber = _make_transcriber()
     notifier = SoundDeviceNotifier()
 
     usecase = RecordAndTranscribeUseCase(recorder, audio_file, transcriber, notifier)
 
-    recording_config = RecordingConfig()
+    recording_config = RecordingConfig(spill_to_disk=args.long, adaptive_block_size=args.adaptive_block_size)
     notification_config = NotificationConfig()
 
     tmp = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
@@ -26,25 +215,417 @@ def main() -> None:
     tmp.close()
 
     try:
-        print("[Voct] 録音を開始します... (Enterキーで停止、または5秒でタイムアウト)")
+        if args.long:
+            print("[Voct] 録音を開始します... (Enterキーで停止)")
+        else:
+            print("[Voct] 録音を開始します... (Enterキーで停止、または5秒でタイムアウト)")
+        printer = _SegmentPrinter()
         result = usecase.execute(
             recording_config=recording_config,
             notification_config=notification_config,
             temp_file_path=temp_path,
+            on_segment=printer,
         )
+        if printer.printed:
+            print()
+        else:
+            print("[Voct] 文字起こし結果が空です")
         print(f"[Voct] 録音完了: {result.duration_seconds:.1f}秒")
         print(f"[Voct] モデルロード時間: {result.model_load_time_seconds:.1f}秒")
+        if result.time_to_first_segment_seconds is not None:
+            print(f"[Voct] 最初のセグメントまで: {result.time_to_first_segment_seconds:.2f}秒")
         ratio = result.transcription_time_seconds / result.duration_seconds if result.duration_seconds > 0 else 0
         print(f"[Voct] 文字起こし時間: {result.transcription_time_seconds:.1f}秒 (録音時間比: {ratio:.2f}x)")
-
-        if result.text:
-            print(f"[Voct] 結果:\n{result.text}")
-        else:
-            print("[Voct] 文字起こし結果が空です")
     finally:
         if temp_path.exists():
             os.unlink(temp_path)
 
 
+def _run_replay(args: argparse.Namespace) -> None:
+    from voct.infra.markdown_transcript_file import MarkdownTranscriptFile
+    from voct.infra.memory_clipboard import InMemoryClipboard
+    from voct.infra.scripted_hotkey_listener import ScriptedHotkeyListener, load_key_script, uniform_key_script
+    from voct.infra.silent_notifier import SilentNotifier
+    from voct.infra.wav_file_repository import WavFileRepository
+    from voct.infra.wav_replay_recorder import WavReplayRecorder
+    from voct.usecase.replay_benchmark import ReplayBenchmarkUseCase
+
+    audio_file = WavFileRepository()
+    if args.script is not None:
+        script = load_key_script(args.script)
+    else:
+        script = uniform_key_script(args.cycles, args.hold, args.gap)
+
+    usecase = ReplayBenchmarkUseCase(
+        WavReplayRecorder(audio_file.load(args.wav), speed=args.speed),
+        audio_file,
+        _make_transcriber(),
+        InMemoryClipboard(),
+        MarkdownTranscriptFile(),
+        SilentNotifier(),
+        ScriptedHotkeyListener(script, speed=args.speed),
+    )
+    config = PushToTalkConfig(model_size=args.model, language=args.language)
+    report = usecase.execute(config, cycles=len(script))
+
+    print(f"[Voct] サイクル数: {report.cycles} (完了: {report.completed}, 取りこぼし: {report.dropped})")
+    print(
+        f"[Voct] 解放→クリップボード: p50 {report.p50_seconds:.3f}秒 / "
+        f"p95 {report.p95_seconds:.3f}秒 / p99 {report.p99_seconds:.3f}秒"
+    )
+    print(
+        f"[Voct] スループット: {report.throughput_cycles_per_second:.2f} サイクル/秒 ({report.wall_time_seconds:.1f}秒)"
+    )
+
+
+def _run_live(args: argparse.Namespace) -> None:
+    from voct.infra.markdown_transcript_file import MarkdownTranscriptFile
+    from voct.infra.sounddevice_continuous_recorder import SoundDeviceContinuousRecorder
+    from voct.usecase.live_caption import LiveCaptionUseCase
+
+    usecase = LiveCaptionUseCase(SoundDeviceContinuousRecorder(), _make_transcriber(), MarkdownTranscriptFile())
+    usecase.run(
+        LiveCaptionConfig(
+            window_seconds=args.window,
+            overlap_seconds=args.overlap,
+            max_lag_seconds=args.max_lag,
+            model_size=args.model,
+            language=args.language,
+            output_path=args.output,
+        )
+    )
+
+
+def _run_batch_bench(args: argparse.Namespace) -> None:
+    from voct.infra.micro_batching_transcriber import MicroBatchingTranscriber
+    from voct.usecase.batch_benchmark import BatchThroughputBenchmarkUseCase
+
+    transcriber = _make_transcriber()
+    batched = MicroBatchingTranscriber(
+        transcriber,
+        BatchingConfig(max_batch_size=args.batch_size, max_wait_seconds=args.max_wait),
+    )
+    audios = []
+    for path in args.files:
+        samples = transcriber.load_audio(path)
+        audios.append(AudioData(data=samples, sample_rate=16000, duration_seconds=len(samples) / 16000))
+
+    report = BatchThroughputBenchmarkUseCase(transcriber, batched).execute(audios, args.model, args.language)
+    batched.close()
+    stats = batched.stats
+
+    print(f"[Voct] 音声: {report.clips} 件 / {report.audio_seconds:.1f}秒")
+    print(f"[Voct] 逐次推論: {report.sequential_seconds:.2f}秒")
+    print(
+        f"[Voct] マイクロバッチ推論: {report.batched_seconds:.2f}秒 "
+        f"(平均バッチサイズ: {stats.mean_batch_size:.1f}, 平均待ち時間: {stats.mean_wait_seconds * 1000:.0f}ms)"
+    )
+    print(f"[Voct] 高速化: {report.speedup:.2f}x")
+
+
+def _cpu_load_worker(partition, stop) -> None:
+    """停止されるまで GIL を解放する numpy 演算で 1 コアを使い続ける。分割ありなら推論用コアに固定する。"""
+    import numpy as np
+
+    from voct.infra.cpu_affinity import pin_current_thread
+
+    if partition is not None:
+        pin_current_thread(partition.inference_cores)
+    buffer = np.random.default_rng().random(1 << 20)
+    while not stop.is_set():
+        np.sqrt(buffer, out=buffer)
+        np.exp(buffer, out=buffer)
+
+
+def _run_capture_bench(args: argparse.Namespace) -> None:
+    from voct.infra.cpu_affinity import available_cores, plan_cpu_partition
+    from voct.infra.sounddevice_continuous_recorder import SoundDeviceContinuousRecorder
+    from voct.usecase.capture_stress_benchmark import CaptureStressBenchmarkUseCase
+
+    cores = available_cores()
+    partition = plan_cpu_partition(args.capture_cores, args.capture_nice, cores)
+    if not partition.capture_cores:
+        print(f"[Voct] コアが {len(cores)} 個しかないため分割できません")
+        return
+    workers = args.workers or len(cores)
+    print(
+        f"[Voct] 録音用コア: {sorted(partition.capture_cores)} / 推論用コア: {sorted(partition.inference_cores)} / "
+        f"負荷スレッド: {workers}"
+    )
+    usecase = CaptureStressBenchmarkUseCase(SoundDeviceContinuousRecorder(), _cpu_load_worker, workers)
+    results = usecase.execute(RecordingConfig(block_size=args.block_size), partition, args.seconds)
+    for result in results:
+        label = "分割あり" if result.partitioned else "分割なし"
+        print(
+            f"[Voct] {label}: {result.seconds:.1f}秒 / {result.blocks} ブロック / "
+            f"オーバーフロー {result.overflow_count}回"
+        )
+
+
+def _run_search(args: argparse.Namespace) -> None:
+    import time
+
+    from voct.infra.markdown_transcript_file import MarkdownTranscriptFile
+    from voct.infra.sqlite_transcript_store import DB_FILENAME, SqliteTranscriptStore, default_transcript_dir
+
+    directory = args.dir or default_transcript_dir()
+    if not (directory / DB_FILENAME).exists():
+        print(f"[Voct] 文字起こし履歴がありません ({directory / DB_FILENAME})")
+        return
+    store = SqliteTranscriptStore()
+    t0 = time.perf_counter()
+    hits = store.search(directory, args.query, args.limit)
+    elapsed_ms = (time.perf_counter() - t0) * 1000
+    store.close()
+
+    for hit in hits:
+        print(f"{hit.created_at:%Y-%m-%d %H:%M:%S}  {hit.snippet}")
+    print(f"[Voct] {len(hits)}件 ({elapsed_ms:.1f}ms)")
+    if args.export is not None and hits:
+        markdown = MarkdownTranscriptFile()
+        for hit in hits:
+            markdown.save(hit.text, args.export, "%Y%m%d-%H%M%S-%f", hit.created_at)
+        print(f"[Voct] {len(hits)}件を書き出しました: {args.export}")
+
+
+def _make_decoder(name: str):
+    """--decoder の値からデコーダーを作る。none なら None を返す。"""
+    from voct.infra.ffmpeg_decoder import FfmpegDecoder, ffmpeg_available
+    from voct.infra.soundfile_decoder import SoundfileDecoder
+
+    if name == "none":
+        return None
+    if name in ("auto", "pyav"):
+        try:
+            from voct.infra.pyav_decoder import PyAvDecoder
+        except ImportError:
+            if name == "pyav":
+                print("[Voct] PyAV がインストールされていません (pip install av)")
+                raise SystemExit(1) from None
+        else:
+            return PyAvDecoder()
+    if name == "ffmpeg" or (name == "auto" and ffmpeg_available()):
+        if not ffmpeg_available():
+            print("[Voct] ffmpeg コマンドが見つかりません")
+            raise SystemExit(1)
+        return FfmpegDecoder()
+    return SoundfileDecoder()
+
+
+def _print_decode_stats(stats: list[DecodeStats]) -> None:
+    for entry in stats:
+        print(
+            f"[Voct] デコード {entry.format} ({entry.backend}): {entry.files}件, 音声 {entry.audio_seconds:.0f}秒, "
+            f"{entry.decode_seconds:.1f}秒 ({entry.speed:.0f}倍速)"
+        )
+
+
+def _run_batch(args: argparse.Namespace) -> None:
+    from voct.infra.jsonl_batch_manifest import JsonlBatchManifest
+    from voct.infra.markdown_transcript_file import MarkdownTranscriptFile
+    from voct.infra.sqlite_transcript_store import SqliteTranscriptStore
+    from voct.infra.wav_file_repository import WavFileRepository
+    from voct.usecase.batch_transcription import BatchTranscriptionUseCase
+    from voct.usecase.streaming_decode import StreamingDecodeTranscriber
+
+    manifest_path = args.manifest or args.output_dir / "manifest.jsonl"
+    if args.transcript_store == "sqlite":
+        transcript_file = SqliteTranscriptStore()
+    else:
+        transcript_file = MarkdownTranscriptFile()
+    decoder = _make_decoder(args.decoder)
+    transcriber = _make_transcriber()
+    if decoder is not None:
+        transcriber = StreamingDecodeTranscriber(decoder, transcriber)
+    usecase = BatchTranscriptionUseCase(
+        WavFileRepository(), transcriber, transcript_file, JsonlBatchManifest(manifest_path), decoder=decoder
+    )
+    config = BatchConfig(
+        output_dir=args.output_dir,
+        model_size=args.model,
+        language=args.language,
+        workers=args.workers,
+        max_attempts=args.max_attempts,
+        backoff_seconds=args.backoff,
+    )
+    try:
+        report = usecase.execute(args.files, config)
+    except KeyboardInterrupt:
+        print(f"\n[Voct] 中断しました。同じマニフェストで再実行すると続きから再開します ({manifest_path})")
+        raise SystemExit(130) from None
+    finally:
+        transcript_file.close()
+
+    print(
+        f"[Voct] 完了 {report.completed}件 / 飛ばした {report.skipped}件 / 失敗 {report.failed}件 "
+        f"(全 {report.total}件, 音声 {report.audio_seconds:.0f}秒, {report.wall_seconds:.1f}秒)"
+    )
+    if decoder is not None:
+        _print_decode_stats(transcriber.stats)
+    print(f"[Voct] マニフェスト: {manifest_path}")
+    if report.failed:
+        raise SystemExit(1)
+
+
+def _run_watch(args: argparse.Namespace) -> None:
+    from voct.infra.inotify_directory_watcher import InotifyDirectoryWatcher, inotify_available
+    from voct.infra.markdown_transcript_file import MarkdownTranscriptFile
+    from voct.infra.polling_directory_watcher import PollingDirectoryWatcher
+    from voct.infra.sqlite_transcript_store import SqliteTranscriptStore
+    from voct.infra.wav_file_repository import WavFileRepository
+    from voct.usecase.streaming_decode import StreamingDecodeTranscriber
+    from voct.usecase.watch_folder import WatchFolderUseCase
+
+    if not args.directory.is_dir():
+        print(f"[Voct] フォルダーがありません: {args.directory}")
+        raise SystemExit(1)
+    if args.poll or not inotify_available():
+        watcher = PollingDirectoryWatcher(args.poll_interval, args.settle)
+    else:
+        watcher = InotifyDirectoryWatcher()
+    if args.transcript_store == "sqlite":
+        transcript_file = SqliteTranscriptStore()
+    else:
+        transcript_file = MarkdownTranscriptFile()
+    decoder = _make_decoder(args.decoder)
+    transcriber = _make_transcriber()
+    if decoder is not None:
+        transcriber = StreamingDecodeTranscriber(decoder, transcriber)
+    usecase = WatchFolderUseCase(watcher, WavFileRepository(), transcriber, transcript_file, decoder=decoder)
+    config = WatchConfig(
+        directory=args.directory,
+        output_dir=args.output_dir or args.directory / "transcripts",
+        model_size=args.model,
+        language=args.language,
+        workers=args.workers,
+        max_backlog=args.max_backlog,
+        include_existing=args.existing,
+    )
+    try:
+        usecase.run(config, args.report_interval)
+    finally:
+        transcript_file.close()
+    if decoder is not None:
+        _print_decode_stats(transcriber.stats)
+
+
+def _run_stream(args: argparse.Namespace) -> None:
+    import contextlib
+    import sys
+
+    from voct.infra.json_lines_segment_writer import JsonLinesSegmentWriter
+    from voct.infra.raw_pcm_source import RawPcmSource
+    from voct.infra.voice_activity import VoiceActivityDetector
+    from voct.usecase.stream_transcription import StreamTranscriptionUseCase
+
+    config = StreamConfig(
+        sample_format=args.format,
+        sample_rate=args.rate,
+        channels=args.channels,
+        model_size=args.model,
+        language=args.language,
+        max_segment_seconds=args.max_segment,
+        max_backlog=args.max_backlog,
+        vox_config=VoxConfig(energy_threshold_db=args.vad_threshold, hangover_seconds=args.hangover),
+    )
+    stdout = sys.stdout
+    writer = JsonLinesSegmentWriter(stdout)
+    # 標準出力は JSON 行だけにし、進捗や警告は標準エラーに出す
+    with contextlib.redirect_stdout(sys.stderr):
+        transcriber = _make_transcriber()
+        load_time = transcriber.load(args.model)
+        print(f"[Voct] モデルを読み込みました ({load_time:.1f}秒)。標準入力を待っています。")
+        usecase = StreamTranscriptionUseCase(
+            RawPcmSource(sys.stdin.buffer, args.format, args.rate, args.channels),
+            VoiceActivityDetector(config.vox_config, 16000),
+            transcriber,
+            writer,
+        )
+        try:
+            report = usecase.execute(config)
+        except KeyboardInterrupt:
+            raise SystemExit(130) from None
+        except BrokenPipeError:
+            # 下流（head など）が先に終了した。以降の書き込みで再び失敗しないよう標準出力を捨てる
+            # （ここでは sys.stdout が標準エラーに差し替わっているため、元の標準出力の fd を使う）
+            os.dup2(os.open(os.devnull, os.O_WRONLY), stdout.fileno())
+            raise SystemExit(0) from None
+        speed = report.audio_seconds / report.wall_seconds if report.wall_seconds > 0 else 0.0
+        print(
+            f"[Voct] {report.segments}区間 / 失敗 {report.failures}件 / 音声 {report.audio_seconds:.0f}秒 "
+            f"(発話 {report.speech_seconds:.0f}秒, {speed:.1f}倍速, 入力待たせ {report.backpressure_seconds:.1f}秒)"
+        )
+
+
+def _print_pinned(artifact: ModelArtifact) -> None:
+    print(f"[Voct] 固定しました: {artifact.name} ({artifact.size_bytes / 1e6:.0f}MB, sha256 {artifact.sha256[:12]})")
+
+
+def _run_models(args: argparse.Namespace) -> None:
+    from voct.infra.local_model_store import LocalModelStore, default_model_dir
+    from voct.infra.whisper_transcriber import WhisperTranscriber
+
+    store = LocalModelStore(args.dir or default_model_dir())
+    command = args.models_command
+    if command == "fetch":
+        for name in args.names:
+            artifact = store.fetch(name)
+            _print_pinned(artifact)
+    elif command == "import":
+        artifact = store.import_model(args.name, args.source)
+        _print_pinned(artifact)
+    elif command == "verify":
+        names = args.names or [artifact.name for artifact in store.list_models()]
+        failed = [name for name in names if not store.verify(name)]
+        for name in names:
+            print(f"[Voct] {name}: {'NG' if name in failed else 'OK'}")
+        if failed:
+            raise SystemExit(1)
+    elif command == "remove":
+        store.remove(args.name)
+        print(f"[Voct] 削除しました: {args.name}")
+    elif command == "bench":
+        names = args.names or [artifact.name for artifact in store.list_models()]
+        for name in names:
+            if store.resolve(name) is None:
+                print(f"[Voct] {name}: 固定されていません")
+                continue
+            seconds = WhisperTranscriber(model_store=store, keep_resident=False).load(name)
+            print(f"[Voct] {name}: ロード {seconds:.2f}秒")
+    else:
+        artifacts = store.list_models()
+        if not artifacts:
+            print(f"[Voct] 固定済みのモデルはありません ({store.root})")
+        for artifact in artifacts:
+            load = f"{artifact.load_seconds:.2f}秒" if artifact.load_seconds is not None else "未計測"
+            print(
+                f"{artifact.name:<16} {artifact.size_bytes / 1e6:>8.0f}MB  sha256 {artifact.sha256[:12]}  ロード {load}"
+            )
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = _parse_args(argv)
+    if args.command == "replay":
+        _run_replay(args)
+    elif args.command == "live":
+        _run_live(args)
+    elif args.command == "batch-bench":
+        _run_batch_bench(args)
+    elif args.command == "capture-bench":
+        _run_capture_bench(args)
+    elif args.command == "search":
+        _run_search(args)
+    elif args.command == "batch":
+        _run_batch(args)
+    elif args.command == "watch":
+        _run_watch(args)
+    elif args.command == "stream":
+        _run_stream(args)
+    elif args.command == "models":
+        _run_models(args)
+    else:
+        _run_record(args)
+
+
 if __name__ == "__main__":
     main()
@@ -1,14 +1,38 @@
+import argparse
+import os
+import platform
 import sys
 import termios
+import threading
+from pathlib import Path
 
-from voct.domain.entities import PushToTalkConfig
+from voct.domain.entities import (
+    DecodeOptions,
+    PushToTalkConfig,
+    RecordingConfig,
+    RoutingConfig,
+    TriggerKey,
+    VoxConfig,
+)
+from voct.infra.aho_corasick_dictionary import AhoCorasickDictionary
+from voct.infra.capture_process_recorder import CaptureProcessRecorder
+from voct.infra.cpu_affinity import pin_current_thread, plan_cpu_partition
+from voct.infra.json_routing_history import JsonRoutingHistory, default_routing_history_path
+from voct.infra.local_model_store import LocalModelStore, default_model_dir
 from voct.infra.markdown_transcript_file import MarkdownTranscriptFile
+from voct.infra.persistent_clipboard import PersistentClipboard
 from voct.infra.push_to_talk_recorder import PushToTalkSoundDeviceRecorder
 from voct.infra.pyperclip_clipboard import PyperclipClipboard
-from voct.infra.pynput_hotkey_listener import PynputHotkeyListener
+from voct.infra.silent_notifier import SilentNotifier
+from voct.infra.sounddevice_continuous_recorder import SoundDeviceContinuousRecorder
 from voct.infra.sounddevice_notifier import SoundDeviceNotifier
+from voct.infra.sqlite_transcript_store import SqliteTranscriptStore, default_transcript_dir
+from voct.infra.vox_trigger import VoxTrigger
 from voct.infra.wav_file_repository import WavFileRepository
 from voct.infra.whisper_transcriber import WhisperTranscriber
+from voct.infra.x11_selection_server import serve_x11_selection
+from voct.usecase.idle_eviction import IdleEvictionListener
+from voct.usecase.model_router import ModelRouter
 from voct.usecase.push_to_talk import PushToTalkUseCase
 
 
@@ -33,23 +57,287 @@ def _restore_echo(old_settings: list | None) -> None:
             pass
 
 
-def ptt_main() -> None:
-    recorder = PushToTalkSoundDeviceRecorder()
+def _make_clipboard(use_helper: bool) -> PyperclipClipboard | PersistentClipboard:
+    """X11 では選択範囲を持ち続けるヘルパーを使い、起動できなければコピーのたびにコマンドを起動する。"""
+    fallback = PyperclipClipboard()
+    if not use_helper or platform.system() != "Linux" or not os.environ.get("DISPLAY"):
+        return fallback
+    clipboard = PersistentClipboard(serve_x11_selection, fallback=fallback)
+    try:
+        clipboard.open()
+    except RuntimeError as e:
+        print(f"[Voct] クリップボードのヘルパーを起動できません。コピーのたびにコマンドを起動します ({e})")
+        return fallback
+    return clipboard
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="voct-ptt", description="Push-to-Talk で録音・文字起こしする。")
+    parser.add_argument(
+        "--clipboard-per-segment",
+        action="store_true",
+        help="セグメントが確定するたびにクリップボードを更新する",
+    )
+    parser.add_argument(
+        "--long",
+        action="store_true",
+        help="録音をディスクに退避し、5 秒の上限なしで長時間録音する",
+    )
+    parser.add_argument(
+        "--adaptive-block-size",
+        action="store_true",
+        help="入力オーバーフローが起きたら次の録音からブロックサイズとレイテンシを広げる",
+    )
+    parser.add_argument(
+        "--vox",
+        action="store_true",
+        help="キーの代わりに発話を検出して録音する（通知音は鳴らさない）",
+    )
+    parser.add_argument(
+        "--vox-threshold",
+        type=float,
+        default=VoxConfig.energy_threshold_db,
+        help="発話とみなすエネルギーの閾値 (dBFS, デフォルト: %(default)s)",
+    )
+    parser.add_argument(
+        "--evict-after",
+        type=float,
+        default=10.0,
+        help="この分数キーが押されなければモデルをメモリから解放する（0 で無効, デフォルト: %(default)s）",
+    )
+    parser.add_argument(
+        "--latency-target",
+        type=float,
+        default=None,
+        help="キー解放から文字起こし完了までの目標秒数。指定すると発話の長さに応じてモデルを選ぶ",
+    )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        default=None,
+        help="1 回の文字起こしの上限秒数。超えたらその時点までの結果を使う",
+    )
+    parser.add_argument(
+        "--temperature",
+        type=lambda value: tuple(float(t) for t in value.split(",")),
+        default=DecodeOptions.temperature,
+        help="失敗したセグメントを再デコードする温度の列（カンマ区切り, 0 のみで再デコードしない）",
+    )
+    parser.add_argument(
+        "--compression-ratio-threshold",
+        type=float,
+        default=DecodeOptions.compression_ratio_threshold,
+        help="これを超える圧縮率のセグメントを繰り返しとみなして再デコードする (デフォルト: %(default)s)",
+    )
+    parser.add_argument(
+        "--capture-cores",
+        type=int,
+        default=0,
+        help="録音とキー監視のスレッド用に予約するコア数。推論は残りのコアで動かす（0 で分割しない）",
+    )
+    parser.add_argument(
+        "--capture-nice",
+        type=int,
+        default=None,
+        help="録音スレッドの nice 値。負の値で優先度を上げる（Linux のみ, CAP_SYS_NICE などが必要）",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=None,
+        help="文字起こし結果の保存先（sqlite 保存と --journal のデフォルト: ~/.local/share/voct/transcripts）",
+    )
+    parser.add_argument(
+        "--transcript-store",
+        choices=["markdown", "sqlite"],
+        default="markdown",
+        help="結果の保存形式。sqlite は 1 つのデータベースに保存し voct search で検索できる (デフォルト: %(default)s)",
+    )
+    parser.add_argument(
+        "--journal",
+        choices=["daily", "session"],
+        default=None,
+        help="markdown 保存で発話ごとにファイルを作らず、1 日または起動ごとの 1 ファイルに時刻付きで追記する",
+    )
+    parser.add_argument(
+        "--fsync-interval",
+        type=float,
+        default=1.0,
+        help="--journal の追記をディスクへ書き出す間隔（秒, 0 で追記のたび, デフォルト: %(default)s）",
+    )
+    parser.add_argument(
+        "--dictionary",
+        type=Path,
+        default=None,
+        help="「誤<TAB>正」形式の置換辞書。出力前に結果を書き換え、ファイルを更新すると次のサイクルから反映する",
+    )
+    parser.add_argument(
+        "--retranscribe-key",
+        choices=[key.value for key in TriggerKey if key != PushToTalkConfig.trigger_key],
+        default=None,
+        help=(
+            "このキーで直前の発話を --retranscribe-model で文字起こしし直し、クリップボードを置き換える。"
+            "モデルの読み込みを含め、終わるまで録音キーは受け付けない"
+        ),
+    )
+    parser.add_argument(
+        "--retranscribe-model",
+        default=PushToTalkConfig.retranscribe_model_size,
+        help="文字起こしし直すときのモデル (デフォルト: %(default)s)",
+    )
+    parser.add_argument(
+        "--retranscribe-language",
+        default=None,
+        help="文字起こしし直すときの言語（未指定なら自動判定）",
+    )
+    parser.add_argument(
+        "--history",
+        type=int,
+        default=10,
+        help="文字起こしし直せるよう音声をメモリに残す発話の数 (デフォルト: %(default)s)",
+    )
+    parser.add_argument(
+        "--history-max-mb",
+        type=float,
+        default=64.0,
+        help="発話の履歴に使うメモリの上限 (MB, デフォルト: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-clipboard-helper",
+        action="store_true",
+        help="常駐ヘルパーを使わず、コピーのたびに xclip などを起動する",
+    )
+    parser.add_argument(
+        "--async-output",
+        action="store_true",
+        help="クリップボードのコピーとファイル保存を別スレッドで行い、完了を待たずに次の録音を受け付ける",
+    )
+    parser.add_argument(
+        "--capture-process",
+        action="store_true",
+        help="録音を別プロセスで行い、共有メモリ経由で受け取る（推論の負荷で録音が途切れない）",
+    )
+    args = parser.parse_args(argv)
+    if args.capture_process and (args.vox or args.long):
+        parser.error("--capture-process は --vox / --long と併用できません")
+    if args.adaptive_block_size and (args.vox or args.capture_process):
+        parser.error("--adaptive-block-size は --vox / --capture-process と併用できません")
+    if args.journal is not None and args.transcript_store != "markdown":
+        parser.error("--journal は --transcript-store markdown でのみ使えます")
+    return args
+
+
+def ptt_main(argv: list[str] | None = None) -> None:
+    args = _parse_args(argv)
+
+    post_processor = None
+    if args.dictionary is not None:
+        try:
+            post_processor = AhoCorasickDictionary(args.dictionary)
+        except (OSError, UnicodeDecodeError, ValueError) as e:
+            print(f"[Voct] 辞書を読み込めません: {args.dictionary} ({e})")
+            raise SystemExit(1) from e
+        print(f"[Voct] 辞書: {args.dictionary} ({post_processor.entry_count}語)")
+
+    partition = None
+    if args.capture_cores > 0 or args.capture_nice is not None:
+        partition = plan_cpu_partition(args.capture_cores, args.capture_nice)
+        # 以降に作られるスレッド（推論スレッドを含む）が推論用コアを引き継ぐよう、最初にメインスレッドを固定する
+        if pin_current_thread(partition.inference_cores) and partition.capture_cores:
+            print(
+                f"[Voct] 録音用コア: {sorted(partition.capture_cores)} / "
+                f"推論用コア: {sorted(partition.inference_cores)}"
+            )
+
+    recording_config = RecordingConfig(
+        spill_to_disk=args.long,
+        cpu_partition=partition,
+        adaptive_block_size=args.adaptive_block_size,
+    )
+    if args.vox:
+        # 通知音を拾って再び発話と判定しないよう、VOX では通知音を鳴らさない
+        vox = VoxTrigger(
+            SoundDeviceContinuousRecorder(),
+            VoxConfig(energy_threshold_db=args.vox_threshold),
+            recording_config,
+        )
+        recorder, listener, notifier = vox, vox, SilentNotifier()
+        print("[Voct] VOX モード: 話し始めると録音を開始し、無音が続くと文字起こしします。")
+    else:
+        # pynput はディスプレイのない環境で import に失敗するため、キー操作を使うときだけ読み込む
+        from voct.infra.pynput_hotkey_listener import PynputHotkeyListener
+
+        recorder = CaptureProcessRecorder() if args.capture_process else PushToTalkSoundDeviceRecorder()
+        listener = PynputHotkeyListener(cpu_partition=partition)
+        notifier = SoundDeviceNotifier()
     audio_file = WavFileRepository()
-    transcriber = WhisperTranscriber()
-    clipboard = PyperclipClipboard()
-    transcript_file = MarkdownTranscriptFile()
-    notifier = SoundDeviceNotifier()
-    listener = PynputHotkeyListener()
+    transcriber = WhisperTranscriber(
+        model_store=LocalModelStore(default_model_dir()),
+        cpu_threads=partition.inference_threads if partition is not None else 0,
+    )
+    clipboard = _make_clipboard(not args.no_clipboard_helper)
+    output_dir = args.output_dir
+    if args.transcript_store == "sqlite":
+        transcript_file = SqliteTranscriptStore()
+        output_dir = output_dir or default_transcript_dir()
+    else:
+        transcript_file = MarkdownTranscriptFile(journal=args.journal, fsync_interval_seconds=args.fsync_interval)
+        if args.journal is not None:
+            output_dir = output_dir or default_transcript_dir()
+    decode_options = DecodeOptions(
+        temperature=args.temperature,
+        compression_ratio_threshold=args.compression_ratio_threshold,
+        deadline_seconds=args.deadline,
+    )
+    config = PushToTalkConfig(
+        clipboard_per_segment=args.clipboard_per_segment,
+        decode_options=decode_options if decode_options != DecodeOptions() else None,
+        async_output=args.async_output,
+        output_dir=output_dir,
+        history_size=args.history if args.retranscribe_key is not None else 0,
+        history_max_bytes=int(args.history_max_mb * 1024 * 1024),
+        retranscribe_key=TriggerKey(args.retranscribe_key) if args.retranscribe_key is not None else None,
+        retranscribe_model_size=args.retranscribe_model,
+        retranscribe_language=args.retranscribe_language,
+        recording_config=recording_config,
+    )
+    router = None
+    if args.latency_target is not None:
+        router = ModelRouter(
+            RoutingConfig(latency_target_seconds=args.latency_target),
+            JsonRoutingHistory(default_routing_history_path()),
+            residency=transcriber,
+        )
+        # 未ロードのモデルはロード時間のぶん選ばれにくいため、候補を先に読み込んでおく
+        threading.Thread(target=router.warm_candidates, args=(config.model_size,), daemon=True).start()
+    if args.evict_after > 0:
+        listener = IdleEvictionListener(listener, transcriber, config.model_size, args.evict_after * 60, router=router)
 
     usecase = PushToTalkUseCase(
         recorder, audio_file, transcriber,
         clipboard, transcript_file, notifier, listener,
+        router=router,
+        post_processor=post_processor,
     )
-    config = PushToTalkConfig()
+
+    if isinstance(recorder, CaptureProcessRecorder):
+        # 最初の押下で録音の冒頭を失わないよう、録音プロセスは先に起動しておく
+        recorder.open(recording_config)
 
     old_settings = _disable_echo()
     try:
         usecase.run(config)
     finally:
         _restore_echo(old_settings)
+        transcript_file.close()
+        if isinstance(clipboard, PersistentClipboard):
+            stats = clipboard.stats
+            if stats.copies:
+                print(
+                    f"[Voct] コピー: {stats.copies}回 (平均 {stats.mean_latency_seconds * 1000:.1f}ms, "
+                    f"最大 {stats.max_latency_seconds * 1000:.1f}ms, 代替手段 {stats.fallbacks}回)"
+                )
+            clipboard.close()
+        if isinstance(recorder, CaptureProcessRecorder):
+            print(f"[Voct] 録音プロセスの最大書き込み間隔: {recorder.max_write_gap_seconds * 1000:.1f}ms")
+            recorder.close()
@@ -0,0 +1,53 @@
+import threading
+import time
+from collections.abc import Sequence
+
+from voct.domain.entities import AudioData, BatchThroughputReport, DecodeOptions
+from voct.domain.ports import TranscriberPort
+
+
+class BatchThroughputBenchmarkUseCase:
+    """同じ音声群を逐次推論とマイクロバッチ推論で文字起こしし、スループットを比較するユースケース。
+
+    逐次推論では 1 件ずつ順に、マイクロバッチ推論では全件を同時に投入して所要時間を計る。
+    モデルのロードや初回実行の遅さを計測に含めないよう、計測前に両方で最初の音声を 1 回ずつ文字起こししておく。
+    バッチ推論は VAD を使えないため、条件を揃えるよう逐次推論も VAD なしで文字起こしする。
+    """
+
+    def __init__(self, sequential: TranscriberPort, batched: TranscriberPort) -> None:
+        self._sequential = sequential
+        self._batched = batched
+
+    def execute(
+        self,
+        audios: Sequence[AudioData],
+        model_size: str = "base",
+        language: str | None = None,
+    ) -> BatchThroughputReport:
+        sequential_options = DecodeOptions(vad_filter=False)
+        if audios:
+            self._sequential.transcribe_audio(audios[0], model_size, language, options=sequential_options)
+            self._batched.transcribe_audio(audios[0], model_size, language)
+
+        t0 = time.perf_counter()
+        for audio in audios:
+            self._sequential.transcribe_audio(audio, model_size, language, options=sequential_options)
+        sequential_seconds = time.perf_counter() - t0
+
+        threads = [
+            threading.Thread(target=self._batched.transcribe_audio, args=(audio, model_size, language))
+            for audio in audios
+        ]
+        t1 = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        batched_seconds = time.perf_counter() - t1
+
+        return BatchThroughputReport(
+            clips=len(audios),
+            audio_seconds=sum(audio.duration_seconds for audio in audios),
+            sequential_seconds=sequential_seconds,
+            batched_seconds=batched_seconds,
+        )
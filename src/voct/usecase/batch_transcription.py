@@ -0,0 +1,159 @@
+import dataclasses
+import queue
+import threading
+import time
+from pathlib import Path
+
+from voct.domain.entities import BatchConfig, BatchReport, ManifestItem, ManifestStatus
+from voct.domain.ports import (
+    AudioDecoderPort,
+    AudioFilePort,
+    BatchManifestPort,
+    TranscriberPort,
+    TranscriptFilePort,
+)
+from voct.usecase.content_hash import file_digest
+
+
+def output_filename_format(item: ManifestItem) -> str:
+    """入力名と内容のハッシュから、実行のたびに変わらない保存名を作る（strftime を通るため % はエスケープする）。"""
+    return f"{item.input_path.stem}-{item.sha256[:8]}".replace("%", "%%")
+
+
+class BatchTranscriptionUseCase:
+    """多数の音声ファイルを文字起こしし、進捗をマニフェストに記録して中断後に続きから再開できるユースケース。
+
+    完了した入力はマニフェストに記録し、同じマニフェストで再実行すると読み込まずに飛ばす。
+    未完了の入力は内容のハッシュを比べ、変わっていれば試行回数を数え直す。
+    残りは長いものから順にワーカーへ渡し、最後に長い 1 件だけが残ってワーカーが遊ぶのを避ける。
+    失敗した入力は待ち時間を倍々に延ばしながら max_attempts 回まで試す。
+    decoder を渡すと、長さは全体をデコードせずに decoder で調べる（libsndfile で読めない形式の入力向け）。
+    """
+
+    def __init__(
+        self,
+        audio_file: AudioFilePort,
+        transcriber: TranscriberPort,
+        transcript_file: TranscriptFilePort,
+        manifest: BatchManifestPort,
+        decoder: AudioDecoderPort | None = None,
+    ) -> None:
+        self._audio_file = audio_file
+        self._transcriber = transcriber
+        self._transcript_file = transcript_file
+        self._manifest = manifest
+        self._decoder = decoder
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._finished = 0
+
+    def stop(self) -> None:
+        """処理中の入力を終えたら、残りを始めずに終了させる。"""
+        self._stop.set()
+
+    def execute(self, inputs: list[Path], config: BatchConfig) -> BatchReport:
+        t0 = time.perf_counter()
+        self._stop.clear()
+        self._finished = 0
+        items = {item.input_path: item for item in self._manifest.load()}
+        paths = list(dict.fromkeys(path.resolve() for path in inputs))
+        skipped = 0
+        todo: list[ManifestItem] = []
+        for path in paths:
+            item = items.get(path)
+            if item is not None and item.status is ManifestStatus.DONE:
+                skipped += 1
+                continue
+            item = self._prepare(path, item)
+            items[path] = item
+            if item.status is ManifestStatus.PENDING:
+                todo.append(item)
+        # 前回の強制終了で欠けた行や古い行を書き直してから追記を始める
+        self._manifest.compact(list(items.values()))
+        if skipped:
+            print(f"[Voct] 完了済みの {skipped} 件を飛ばします")
+
+        todo.sort(key=lambda item: item.duration_seconds or 0.0, reverse=True)
+        work: queue.Queue[ManifestItem] = queue.Queue()
+        for item in todo:
+            work.put(item)
+        workers = [
+            threading.Thread(target=self._work, args=(work, config, len(todo), items), daemon=True)
+            for _ in range(max(1, min(config.workers, len(todo))))
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        final = [items[path] for path in paths]
+        done = [item for item in final if item.status is ManifestStatus.DONE]
+        return BatchReport(
+            total=len(paths),
+            completed=len(done) - skipped,
+            skipped=skipped,
+            failed=sum(item.status is ManifestStatus.FAILED for item in final),
+            audio_seconds=sum(item.duration_seconds or 0.0 for item in done),
+            wall_seconds=time.perf_counter() - t0,
+        )
+
+    def _prepare(self, path: Path, item: ManifestItem | None) -> ManifestItem:
+        """内容のハッシュと長さを調べる。読めない入力は失敗として記録する。"""
+        try:
+            digest = file_digest(path)
+            if self._decoder is not None:
+                duration = self._decoder.probe_seconds(path)
+            else:
+                duration = self._audio_file.load_lazy(path).duration_seconds
+        except Exception as e:
+            print(f"[Voct] 警告: {path.name} を読み込めません: {e}")
+            return ManifestItem(path, item.sha256 if item else "", ManifestStatus.FAILED, error=repr(e))
+        if item is None or item.sha256 != digest:
+            return ManifestItem(path, digest, duration_seconds=duration)
+        # 前回失敗した入力も、今回の実行で改めて max_attempts 回まで試す
+        return dataclasses.replace(item, status=ManifestStatus.PENDING, duration_seconds=duration)
+
+    def _work(
+        self, work: queue.Queue[ManifestItem], config: BatchConfig, total: int, items: dict[Path, ManifestItem]
+    ) -> None:
+        while not self._stop.is_set():
+            try:
+                item = work.get_nowait()
+            except queue.Empty:
+                return
+            item = self._transcribe_with_retry(item, config)
+            with self._lock:
+                items[item.input_path] = item
+                self._finished += 1
+                finished = self._finished
+            label = "完了" if item.status is ManifestStatus.DONE else f"失敗 ({item.error})"
+            print(f"[Voct] [{finished}/{total}] {item.input_path.name}: {label}")
+
+    def _transcribe_with_retry(self, item: ManifestItem, config: BatchConfig) -> ManifestItem:
+        for attempt in range(config.max_attempts):
+            if attempt > 0 and self._stop.wait(config.backoff_seconds * 2 ** (attempt - 1)):
+                break
+            t0 = time.perf_counter()
+            try:
+                result = self._transcriber.transcribe(item.input_path, config.model_size, config.language)
+                # 保存後にマニフェストへ記録する前に中断しても、やり直しで結果が重複しないよう入力のハッシュで保存する
+                output_path = self._transcript_file.save(
+                    result.text, config.output_dir, output_filename_format(item), result=result, key=item.sha256
+                )
+            except Exception as e:
+                item = dataclasses.replace(
+                    item, status=ManifestStatus.FAILED, attempts=item.attempts + 1, error=repr(e)
+                )
+                self._manifest.append(item)
+                continue
+            item = dataclasses.replace(
+                item,
+                status=ManifestStatus.DONE,
+                output_path=output_path,
+                transcription_seconds=time.perf_counter() - t0,
+                attempts=item.attempts + 1,
+                error=None,
+            )
+            self._manifest.append(item)
+            break
+        return item
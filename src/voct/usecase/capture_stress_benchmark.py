@@ -0,0 +1,68 @@
+import dataclasses
+import threading
+import time
+from collections.abc import Callable
+
+from voct.domain.entities import CaptureStressResult, CpuPartition, RecordingConfig
+from voct.domain.ports import ContinuousRecorderPort
+
+# 負荷スレッドの処理。コア分割の有無と停止イベントを受け取り、停止されるまで CPU を使い続ける
+LoadWorker = Callable[[CpuPartition | None, threading.Event], None]
+
+
+class CaptureStressBenchmarkUseCase:
+    """推論相当の CPU 負荷をかけながら録音し、コア分割の有無で入力オーバーフロー回数を比較するユースケース。
+
+    分割なしでは負荷スレッドと録音スレッドが全コアを奪い合い、分割ありでは録音スレッドを予約コアに、
+    負荷スレッドを残りのコアに固定する。負荷スレッドの固定は load_worker が partition を見て行う。
+    """
+
+    def __init__(self, recorder: ContinuousRecorderPort, load_worker: LoadWorker, workers: int) -> None:
+        self._recorder = recorder
+        self._load_worker = load_worker
+        self._workers = workers
+
+    def execute(
+        self,
+        recording_config: RecordingConfig,
+        partition: CpuPartition,
+        seconds: float,
+    ) -> list[CaptureStressResult]:
+        """分割なし → 分割ありの順に seconds 秒ずつ録音した結果を返す。"""
+        return [self._run(recording_config, None, seconds), self._run(recording_config, partition, seconds)]
+
+    def _run(
+        self,
+        recording_config: RecordingConfig,
+        partition: CpuPartition | None,
+        seconds: float,
+    ) -> CaptureStressResult:
+        stop = threading.Event()
+        threads = [
+            threading.Thread(target=self._load_worker, args=(partition, stop), daemon=True)
+            for _ in range(self._workers)
+        ]
+        for thread in threads:
+            thread.start()
+
+        blocks = 0
+
+        def _on_block(_block) -> None:
+            nonlocal blocks
+            blocks += 1
+
+        t0 = time.perf_counter()
+        try:
+            self._recorder.start(dataclasses.replace(recording_config, cpu_partition=partition), _on_block)
+            time.sleep(seconds)
+            overflow_count = self._recorder.stop()
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+        return CaptureStressResult(
+            partitioned=partition is not None,
+            seconds=time.perf_counter() - t0,
+            blocks=blocks,
+            overflow_count=overflow_count,
+        )
@@ -0,0 +1,8 @@
+import hashlib
+from pathlib import Path
+
+
+def file_digest(path: Path) -> str:
+    """ファイル内容の sha256。"""
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
@@ -0,0 +1,139 @@
+import threading
+from collections.abc import Callable
+
+from voct.domain.entities import ModelResidencyStats, TriggerKey
+from voct.domain.ports import HotkeyListenerPort, ModelResidencyPort
+from voct.usecase.model_router import ModelRouter
+
+
+class IdleEvictionListener(HotkeyListenerPort):
+    """キー操作を監視し、一定時間押されなければモデルを解放して、押下時に読み込み直すリスナーのラッパー。
+
+    再読み込みは押下と同時にバックグラウンドで始めるため、ロード時間の大半は発話中に隠れる。
+    解放したメモリ量と再読み込みのレイテンシはセッション単位で stats に集計する。
+    解放と読み込みは _residency_lock で 1 つずつ行い、押下のたびに進める世代で古いタイマーによる解放を取り消す。
+    router を渡した場合は、model_size だけでなくルーターが起動時に読み込む候補も読み込み直す。
+    """
+
+    def __init__(
+        self,
+        inner: HotkeyListenerPort,
+        residency: ModelResidencyPort,
+        model_size: str,
+        idle_seconds: float,
+        router: ModelRouter | None = None,
+    ) -> None:
+        self._inner = inner
+        self._residency = residency
+        self._model_size = model_size
+        self._idle_seconds = idle_seconds
+        self._router = router
+        self._lock = threading.Lock()
+        self._residency_lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+        self._generation = 0
+        self._evicted = True
+        self._evictions = 0
+        self._released_bytes = 0
+        self._reload_seconds: list[float] = []
+
+    @property
+    def stats(self) -> ModelResidencyStats:
+        with self._lock:
+            reloads = list(self._reload_seconds)
+            return ModelResidencyStats(
+                evictions=self._evictions,
+                released_bytes=self._released_bytes,
+                reloads=len(reloads),
+                mean_reload_seconds=sum(reloads) / len(reloads) if reloads else 0.0,
+                max_reload_seconds=max(reloads, default=0.0),
+            )
+
+    def start(
+        self,
+        on_press: Callable[[], None],
+        on_release: Callable[[], None],
+        trigger_key: TriggerKey,
+    ) -> None:
+        def _on_press() -> None:
+            self._cancel_timer()
+            self._warm_in_background()
+            on_press()
+
+        def _on_release() -> None:
+            on_release()
+            self._restart_timer()
+
+        self._inner.start(_on_press, _on_release, trigger_key)
+
+    def add_hotkey(self, key: TriggerKey, on_press: Callable[[], None]) -> bool:
+        return self._inner.add_hotkey(key, on_press)
+
+    def join(self) -> None:
+        self._inner.join()
+
+    def stop(self) -> None:
+        self._cancel_timer()
+        self._inner.stop()
+        self._print_summary()
+
+    def _warm_in_background(self) -> None:
+        """解放済みなら、発話と並行してモデルを読み込み直す。"""
+        with self._lock:
+            if not self._evicted:
+                return
+            self._evicted = False
+            # 起動直後の初回ロードは再読み込みに数えない
+            is_reload = self._evictions > 0
+        threading.Thread(target=self._warm, args=(is_reload,), daemon=True).start()
+
+    def _warm(self, is_reload: bool) -> None:
+        with self._residency_lock:
+            if self._router is not None:
+                seconds = self._router.warm_candidates(self._model_size)
+            else:
+                seconds = self._residency.warm(self._model_size)
+        if is_reload and seconds > 0:
+            with self._lock:
+                self._reload_seconds.append(seconds)
+
+    def _cancel_timer(self) -> None:
+        with self._lock:
+            # すでに発火して解放を待っているタイマーも取り消す
+            self._generation += 1
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def _restart_timer(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self._idle_seconds, self._evict, args=(self._generation,))
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _evict(self, generation: int) -> None:
+        with self._residency_lock:
+            with self._lock:
+                if self._evicted or generation != self._generation:
+                    return
+                self._evicted = True
+                self._timer = None
+            released = self._residency.evict()
+        with self._lock:
+            self._evictions += 1
+            self._released_bytes += released or 0
+        minutes = self._idle_seconds / 60
+        released_text = f" ({released / 1e6:.0f}MB 解放)" if released else ""
+        print(f"[Voct] {minutes:g}分間操作がなかったためモデルを解放しました{released_text}")
+
+    def _print_summary(self) -> None:
+        stats = self.stats
+        if stats.evictions == 0 and stats.reloads == 0:
+            return
+        print(
+            f"[Voct] モデル解放: {stats.evictions}回 ({stats.released_bytes / 1e6:.0f}MB) / "
+            f"再読み込み: {stats.reloads}回 "
+            f"(平均 {stats.mean_reload_seconds:.2f}秒, 最大 {stats.max_reload_seconds:.2f}秒)"
+        )
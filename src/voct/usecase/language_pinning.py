@@ -0,0 +1,41 @@
+from voct.domain.entities import TranscriptionResult
+
+
+class SessionLanguagePinner:
+    """セッション内で検出言語を固定し、発話ごとの言語検出を省くポリシー。
+
+    言語未指定で文字起こしした結果の確信度が threshold 以上なら、その言語を以降のサイクルに固定する。
+    recheck_interval サイクルごとに 1 回だけ言語未指定で文字起こしし、固定した言語を検証し直す。
+    recheck_interval が 0 の場合は再検証しない。
+    録音中の先頭 1 秒で言語を先に検出することはしない。PushToTalkRecorderPort は停止時にしか音声を返さず、
+    TranscriberPort にも言語検出だけを行う口がないため、固定した言語を使い回して検出を省く。
+    """
+
+    def __init__(self, threshold: float, recheck_interval: int) -> None:
+        self._threshold = threshold
+        self._recheck_interval = recheck_interval
+        self._pinned: str | None = None
+        self._cycles_since_check = 0
+
+    @property
+    def pinned_language(self) -> str | None:
+        return self._pinned
+
+    def language_for_next_cycle(self) -> str | None:
+        """次のサイクルで文字起こしに渡す言語を返す。None の場合は faster-whisper が言語を検出する。"""
+        if self._pinned is None:
+            return None
+        if self._recheck_interval > 0 and self._cycles_since_check >= self._recheck_interval:
+            return None
+        return self._pinned
+
+    def observe(self, requested_language: str | None, result: TranscriptionResult) -> bool:
+        """文字起こし結果を反映する。固定言語が新たに決まった・変わった場合に True を返す。"""
+        if requested_language is not None:
+            self._cycles_since_check += 1
+            return False
+        self._cycles_since_check = 0
+        if result.language_probability < self._threshold or result.language == self._pinned:
+            return False
+        self._pinned = result.language
+        return True
@@ -0,0 +1,217 @@
+import queue
+import threading
+import time
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import NDArray
+
+from voct.domain.entities import AudioData, CaptionLine, LiveCaptionConfig
+from voct.domain.overflow import warn_overflow
+from voct.domain.ports import ContinuousRecorderPort, TranscriberPort, TranscriptLogPort
+
+# 重なり区間 1 秒あたりに重複し得る最大文字数の目安
+_MAX_OVERLAP_CHARS_PER_SECOND = 20
+# 偶然の一致を避けるため、これより短い重なりは重複とみなさない
+_MIN_OVERLAP_CHARS = 2
+
+
+@dataclass(frozen=True)
+class _Window:
+    """文字起こし待ちの 1 窓。start_sample はセッション開始からのサンプル位置。"""
+
+    samples: NDArray[np.float32]
+    start_sample: int
+    captured_at: float
+
+
+def _format_timestamp(seconds: float) -> str:
+    total = int(seconds)
+    return f"{total // 3600:02d}:{total % 3600 // 60:02d}:{total % 60:02d}"
+
+
+def remove_overlap(previous: str, current: str, max_chars: int) -> str:
+    """previous の末尾と一致する current の先頭部分（最長 max_chars 文字）を取り除く。"""
+    limit = min(max_chars, len(previous), len(current))
+    for k in range(limit, _MIN_OVERLAP_CHARS - 1, -1):
+        if previous.endswith(current[:k]):
+            return current[k:].lstrip()
+    return current
+
+
+class LiveCaptionUseCase:
+    """連続録音を重なりのある窓に区切ってバックグラウンドで文字起こしし、字幕行として出力するユースケース。
+
+    文字起こし待ちの窓は 1 つだけ保持し、処理が追いつかないときは古い窓を捨てて最新の窓を優先する。
+    取り出した窓の遅延が窓の間隔を超えていれば末尾 min_window_seconds に縮め、
+    max_lag_seconds を超えていれば文字起こしせずに捨てることで、遅延を上限内に保つ。
+    """
+
+    def __init__(
+        self,
+        recorder: ContinuousRecorderPort,
+        transcriber: TranscriberPort,
+        transcript_log: TranscriptLogPort,
+    ) -> None:
+        self._recorder = recorder
+        self._transcriber = transcriber
+        self._transcript_log = transcript_log
+        self._config: LiveCaptionConfig | None = None
+        self._lock = threading.Lock()
+        self._blocks: list[NDArray[np.float32]] = []
+        self._buffered_samples = 0
+        self._window_start = 0
+        self._queue: queue.Queue[_Window | None] = queue.Queue(maxsize=1)
+        self._worker: threading.Thread | None = None
+        self._last_text = ""
+        self._last_end_sample = 0
+        self.lines: list[CaptionLine] = []
+        self.skipped_windows = 0
+        self.shrunk_windows = 0
+        self.overflow_count = 0
+
+    def run(self, config: LiveCaptionConfig) -> None:
+        """ライブ字幕を開始し、Ctrl+C で終了する。"""
+        print("[Voct] ライブ字幕を開始します。Ctrl+C で終了。")
+        self.start(config)
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            print("\n[Voct] 終了します。")
+        finally:
+            self.stop()
+        self._print_summary()
+
+    def start(self, config: LiveCaptionConfig) -> None:
+        """録音とバックグラウンドの文字起こしを開始する（非ブロッキング）。"""
+        self._config = config
+        self._worker = threading.Thread(target=self._work, daemon=True)
+        self._worker.start()
+        self._recorder.start(config.recording_config, self._on_block)
+
+    def stop(self) -> None:
+        """録音を停止し、残りの音声を文字起こししてからワーカーを終了する。"""
+        self.overflow_count = self._recorder.stop()
+        overlap_samples = self._samples(self._config.overlap_seconds)
+        remainder = None
+        with self._lock:
+            if self._buffered_samples > overlap_samples:
+                remainder = self._cut(self._buffered_samples)
+        if remainder is not None:
+            # 最後の窓は待機中の窓を捨てずに順番を待つ
+            self._put_while_worker_alive(remainder)
+        self._put_while_worker_alive(None)
+        if self._worker is not None:
+            self._worker.join()
+
+    def _put_while_worker_alive(self, window: _Window | None) -> None:
+        """ワーカーが生きている間だけ待ち行列が空くのを待つ。ワーカーが終了していれば諦める。"""
+        while self._worker is not None and self._worker.is_alive():
+            try:
+                self._queue.put(window, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _samples(self, seconds: float) -> int:
+        return int(seconds * self._config.recording_config.sample_rate)
+
+    def _on_block(self, block: NDArray[np.float32]) -> None:
+        """録音ブロックを蓄積し、窓の長さに達するたびに文字起こし待ちにする。"""
+        window_samples = self._samples(self._config.window_seconds)
+        with self._lock:
+            self._blocks.append(block)
+            self._buffered_samples += len(block)
+            while self._buffered_samples >= window_samples:
+                self._schedule(self._cut(window_samples))
+
+    def _cut(self, window_samples: int) -> _Window:
+        """蓄積した音声の先頭から窓を切り出し、重なり分を残して次の窓の開始位置へ進める。"""
+        buffered = np.concatenate(self._blocks)
+        window = _Window(
+            samples=buffered[:window_samples],
+            start_sample=self._window_start,
+            captured_at=time.perf_counter(),
+        )
+        hop = max(window_samples - self._samples(self._config.overlap_seconds), 1)
+        rest = buffered[hop:]
+        self._blocks = [rest]
+        self._buffered_samples = len(rest)
+        self._window_start += hop
+        return window
+
+    def _schedule(self, window: _Window) -> None:
+        """窓を文字起こし待ちにする。前の窓がまだ待っていれば捨てて置き換える。"""
+        while True:
+            try:
+                self._queue.put_nowait(window)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                    self.skipped_windows += 1
+                except queue.Empty:
+                    pass
+
+    def _work(self) -> None:
+        while True:
+            window = self._queue.get()
+            if window is None:
+                return
+            try:
+                self._process_window(window)
+            except Exception as e:
+                # 1 つの窓の失敗でワーカーを止めず、その窓はスキップした扱いにする
+                print(f"[Voct] 警告: 字幕の文字起こしに失敗しました（窓をスキップします）: {e}")
+                self.skipped_windows += 1
+
+    def _process_window(self, window: _Window) -> None:
+        config = self._config
+        sample_rate = config.recording_config.sample_rate
+        lag = time.perf_counter() - window.captured_at
+        if lag > config.max_lag_seconds:
+            self.skipped_windows += 1
+            return
+
+        samples = window.samples
+        start_sample = window.start_sample
+        hop_seconds = config.window_seconds - config.overlap_seconds
+        min_samples = self._samples(config.min_window_seconds)
+        if lag > hop_seconds and len(samples) > min_samples:
+            # 処理が遅れているため、最新の部分だけを文字起こしする
+            start_sample += len(samples) - min_samples
+            samples = samples[-min_samples:]
+            self.shrunk_windows += 1
+
+        result = self._transcriber.transcribe_audio(
+            AudioData(data=samples, sample_rate=sample_rate, duration_seconds=len(samples) / sample_rate),
+            config.model_size,
+            config.language,
+        )
+        text = result.text.strip()
+        if start_sample < self._last_end_sample:
+            max_chars = int(config.overlap_seconds * _MAX_OVERLAP_CHARS_PER_SECOND)
+            text = remove_overlap(self._last_text, text, max_chars)
+        self._last_end_sample = start_sample + len(samples)
+        if not text:
+            return
+        self._last_text = text
+
+        line = CaptionLine(
+            text=text,
+            start_seconds=start_sample / sample_rate,
+            end_seconds=self._last_end_sample / sample_rate,
+            lag_seconds=time.perf_counter() - window.captured_at,
+        )
+        self.lines.append(line)
+        timestamp = _format_timestamp(line.start_seconds)
+        print(f"[{timestamp}] {text}", flush=True)
+        if config.output_path is not None:
+            self._transcript_log.append(f"- **{timestamp}** {text}", config.output_path)
+
+    def _print_summary(self) -> None:
+        if self.lines:
+            lags = [line.lag_seconds for line in self.lines]
+            print(f"[Voct] 確定行数: {len(self.lines)} (遅延 平均: {np.mean(lags):.2f}秒 / 最大: {max(lags):.2f}秒)")
+        print(f"[Voct] スキップした窓: {self.skipped_windows} / 縮小した窓: {self.shrunk_windows}")
+        warn_overflow(self.overflow_count)
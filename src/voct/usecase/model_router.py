@@ -0,0 +1,147 @@
+import threading
+
+from voct.domain.entities import DecodeOptions, RoutingConfig, RoutingDecision
+from voct.domain.ports import ModelResidencyPort, RoutingHistoryPort
+
+# 計測値がないときの int8 / CPU での実時間比（ビームサーチ 5 の場合）の目安
+_PRIOR_RTF: dict[str, float] = {
+    "tiny": 0.05,
+    "base": 0.1,
+    "small": 0.3,
+    "medium": 0.8,
+    "large-v3": 1.6,
+}
+# 計測値がないときのモデルロード秒数の目安
+_PRIOR_LOAD_SECONDS: dict[str, float] = {
+    "tiny": 0.5,
+    "base": 1.0,
+    "small": 3.0,
+    "medium": 8.0,
+    "large-v3": 15.0,
+}
+_UNKNOWN_MODEL_RTF = 1.0
+_UNKNOWN_MODEL_LOAD_SECONDS = 10.0
+# 貪欲デコードはビームサーチ 5 に比べておおよそこの比率の時間で済む
+_GREEDY_SPEED_RATIO = 0.6
+
+BEAM_SEARCH = DecodeOptions(beam_size=5, best_of=5)
+GREEDY = DecodeOptions(beam_size=1, best_of=1)
+
+
+def _rtf_key(model_size: str, options: DecodeOptions) -> str:
+    return f"{model_size}:beam{options.beam_size}"
+
+
+def _load_key(model_size: str) -> str:
+    return f"{model_size}:load"
+
+
+class ModelRouter:
+    """録音時間とレイテンシ目標から、発話ごとにモデルとデコード設定を選ぶルーター。
+
+    予測時間は「録音秒数 × 実時間比（RTF）」に、未ロードのモデルならロード時間を足したもの。
+    大きいモデルから順に、ビームサーチ → 貪欲デコードの順で目標に収まる組み合わせを探し、
+    どれも収まらなければ最小のモデルを貪欲デコードで使う。
+    RTF とロード時間は実行のたびに指数移動平均で更新して履歴に保存するため、
+    マシンの負荷が変わっても次の発話から予測に反映される。
+    常駐しているかは residency に問い合わせるため、解放されたモデルには再びロード時間が加わる。
+    """
+
+    def __init__(
+        self,
+        config: RoutingConfig,
+        history: RoutingHistoryPort | None = None,
+        residency: ModelResidencyPort | None = None,
+    ) -> None:
+        self._config = config
+        self._history = history
+        self._residency = residency
+        self._lock = threading.Lock()
+        self._values: dict[str, float] = history.load() if history is not None else {}
+
+    def _rtf(self, model_size: str, options: DecodeOptions) -> float:
+        measured = self._values.get(_rtf_key(model_size, options))
+        if measured is not None:
+            return measured
+        base = self._values.get(_rtf_key(model_size, BEAM_SEARCH), _PRIOR_RTF.get(model_size, _UNKNOWN_MODEL_RTF))
+        if options.beam_size <= 1:
+            return base * _GREEDY_SPEED_RATIO
+        return base
+
+    def _load_seconds(self, model_size: str) -> float:
+        if self._residency is not None and self._residency.is_resident(model_size):
+            return 0.0
+        default = _PRIOR_LOAD_SECONDS.get(model_size, _UNKNOWN_MODEL_LOAD_SECONDS)
+        return self._values.get(_load_key(model_size), default)
+
+    def predict(self, model_size: str, options: DecodeOptions, duration_seconds: float) -> float:
+        """キー解放から文字起こし完了までの予測秒数を返す。"""
+        with self._lock:
+            return duration_seconds * self._rtf(model_size, options) + self._load_seconds(model_size)
+
+    def route(self, duration_seconds: float) -> RoutingDecision:
+        """録音秒数に対して、レイテンシ目標に収まる最も精度の高い組み合わせを返す。"""
+        target = self._config.latency_target_seconds
+        for model_size in reversed(self._config.model_sizes):
+            for options in (BEAM_SEARCH, GREEDY):
+                predicted = self.predict(model_size, options, duration_seconds)
+                if predicted <= target:
+                    return RoutingDecision(model_size=model_size, options=options, predicted_seconds=predicted)
+        fallback = self._config.model_sizes[0]
+        return RoutingDecision(
+            model_size=fallback,
+            options=GREEDY,
+            predicted_seconds=self.predict(fallback, GREEDY, duration_seconds),
+        )
+
+    def warm_candidates(self, model_size: str) -> float:
+        """model_size と次に大きい候補だけを読み込んで常駐させ、ロード時間を記録する。合計のロード秒数を返す。
+
+        未ロードのモデルはロード時間の目安が目標を超えて選ばれないため、起動時にバックグラウンドで呼ぶ。
+        すべての候補を常駐させるとメモリを使いすぎるため、それ以外の候補は選ばれたときに読み込む。
+        model_size が候補になければ最小の候補だけを読み込む。
+        """
+        if self._residency is None:
+            return 0.0
+        sizes = self._config.model_sizes
+        if model_size in sizes:
+            index = sizes.index(model_size)
+            candidates = sizes[index : index + 2]
+        else:
+            candidates = sizes[:1]
+        total = 0.0
+        for candidate in candidates:
+            load_seconds = self._residency.warm(candidate)
+            if load_seconds > 0:
+                total += load_seconds
+                with self._lock:
+                    self._update(_load_key(candidate), load_seconds)
+        self._save()
+        return total
+
+    def observe(
+        self,
+        decision: RoutingDecision,
+        duration_seconds: float,
+        transcription_seconds: float,
+        load_seconds: float,
+    ) -> None:
+        """実測した処理時間で RTF とロード時間を更新し、履歴に保存する。"""
+        with self._lock:
+            if duration_seconds > 0:
+                self._update(_rtf_key(decision.model_size, decision.options), transcription_seconds / duration_seconds)
+            if load_seconds > 0:
+                self._update(_load_key(decision.model_size), load_seconds)
+        self._save()
+
+    def _update(self, key: str, value: float) -> None:
+        """計測値を指数移動平均で反映する。_lock を握って呼ぶ。"""
+        alpha = self._config.ewma_alpha
+        previous = self._values.get(key)
+        self._values[key] = value if previous is None else alpha * value + (1 - alpha) * previous
+
+    def _save(self) -> None:
+        with self._lock:
+            values = dict(self._values)
+        if self._history is not None:
+            self._history.save(values)
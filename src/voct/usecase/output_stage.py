@@ -0,0 +1,186 @@
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from voct.domain.entities import OutputSinkStats, TranscriptionResult, TranscriptOutput
+from voct.domain.ports import ClipboardPort, OutputSinkPort, TranscriptFilePort
+
+
+class ClipboardSink(OutputSinkPort):
+    """最新の結果だけをクリップボードにコピーする出力先。古い結果は上書きされるためコピーしない。"""
+
+    def __init__(self, clipboard: ClipboardPort) -> None:
+        self._clipboard = clipboard
+
+    @property
+    def name(self) -> str:
+        return "clipboard"
+
+    def write(self, outputs: list[TranscriptOutput]) -> None:
+        self._clipboard.copy(outputs[-1].text)
+
+
+class TranscriptFileSink(OutputSinkPort):
+    """結果を TranscriptFilePort に保存する出力先。溜まった結果は save_many でまとめて保存する。"""
+
+    def __init__(self, transcript_file: TranscriptFilePort, directory: Path, filename_format: str) -> None:
+        self._transcript_file = transcript_file
+        self._directory = directory
+        self._filename_format = filename_format
+
+    @property
+    def name(self) -> str:
+        return "transcript"
+
+    def write(self, outputs: list[TranscriptOutput]) -> None:
+        self._transcript_file.save_many(outputs, self._directory, self._filename_format)
+
+
+@dataclass
+class _Pending:
+    output: TranscriptOutput
+    enqueued_at: float
+
+
+class _SinkWorker:
+    """1 つの出力先を専用スレッドで順に書き出すワーカー。溜まった結果は 1 回の write にまとめる。"""
+
+    def __init__(self, sink: OutputSinkPort, timeout_seconds: float) -> None:
+        self.sink = sink
+        self.timeout_seconds = timeout_seconds
+        self._queue: queue.Queue[_Pending | None] = queue.Queue()
+        self._idle = threading.Condition()
+        self._pending = 0
+        self._outputs = 0
+        self._writes = 0
+        self._timeouts = 0
+        self._failures = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+        self._thread = threading.Thread(target=self._run, name=f"voct-output-{sink.name}", daemon=True)
+        self._thread.start()
+
+    def put(self, pending: _Pending) -> None:
+        with self._idle:
+            self._pending += 1
+        self._queue.put(pending)
+
+    def wait_idle(self, timeout: float | None) -> bool:
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+    def stop(self) -> bool:
+        """残りを書き出してからスレッドを止める。timeout_seconds 以内に終わらなければ False。"""
+        self._queue.put(None)
+        self._thread.join(self.timeout_seconds)
+        return not self._thread.is_alive()
+
+    @property
+    def stats(self) -> OutputSinkStats:
+        with self._idle:
+            return OutputSinkStats(
+                name=self.sink.name,
+                outputs=self._outputs,
+                writes=self._writes,
+                timeouts=self._timeouts,
+                failures=self._failures,
+                mean_latency_seconds=self._latency_total / self._outputs if self._outputs else 0.0,
+                max_latency_seconds=self._latency_max,
+                pending=self._pending,
+            )
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            closing = False
+            while True:
+                try:
+                    pending = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if pending is None:
+                    closing = True
+                    break
+                batch.append(pending)
+            self._write(batch)
+            if closing:
+                return
+
+    def _write(self, batch: list[_Pending]) -> None:
+        started = time.perf_counter()
+        failed = False
+        try:
+            self.sink.write([pending.output for pending in batch])
+        except Exception as e:
+            failed = True
+            print(f"[Voct] 警告: 出力先 {self.sink.name} への書き出しに失敗しました: {e}")
+        finished = time.perf_counter()
+        timed_out = finished - started > self.timeout_seconds
+        if timed_out:
+            print(
+                f"[Voct] 警告: 出力先 {self.sink.name} の書き出しに {finished - started:.2f}秒かかりました"
+                f"（上限 {self.timeout_seconds:g}秒）"
+            )
+        with self._idle:
+            self._writes += 1
+            self._timeouts += int(timed_out)
+            if failed:
+                self._failures += len(batch)
+            else:
+                self._outputs += len(batch)
+                for pending in batch:
+                    latency = finished - pending.enqueued_at
+                    self._latency_total += latency
+                    self._latency_max = max(self._latency_max, latency)
+            self._pending -= len(batch)
+            self._idle.notify_all()
+
+
+class OutputStage:
+    """文字起こし結果を出力先ごとの専用スレッドへ順番どおりに渡す非同期の出力ステージ。
+
+    submit はすぐに戻るため、クリップボードのコピーやファイル保存を待たずに次の録音を受け付けられる。
+    出力先はリストの順に投入され（先頭をクリップボードにすると最初に更新される）、遅い出力先は他を待たせない。
+    書き出しが出力先ごとの timeout を超えたら警告して数え、close は出力先ごとに timeout までしか待たない。
+    """
+
+    def __init__(
+        self,
+        sinks: list[OutputSinkPort],
+        timeout_seconds: float = 2.0,
+        timeouts: dict[str, float] | None = None,
+    ) -> None:
+        timeouts = timeouts or {}
+        self._workers = [_SinkWorker(sink, timeouts.get(sink.name, timeout_seconds)) for sink in sinks]
+
+    @property
+    def stats(self) -> list[OutputSinkStats]:
+        return [worker.stats for worker in self._workers]
+
+    def submit(self, text: str, result: TranscriptionResult | None = None) -> None:
+        """結果をすべての出力先の待ち行列に追加する（非ブロッキング）。"""
+        pending = _Pending(TranscriptOutput(text=text, created_at=datetime.now(), result=result), time.perf_counter())
+        for worker in self._workers:
+            worker.put(pending)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """すべての出力先が書き出し終えるまで待つ。timeout 以内に終わらなければ False。"""
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        for worker in self._workers:
+            remaining = None if deadline is None else max(deadline - time.perf_counter(), 0.0)
+            if not worker.wait_idle(remaining):
+                return False
+        return True
+
+    def close(self) -> list[OutputSinkStats]:
+        """残りを書き出してから停止し、出力先ごとの統計を返す。"""
+        for worker in self._workers:
+            if not worker.stop():
+                print(f"[Voct] 警告: 出力先 {worker.sink.name} の書き出しが終わらないまま終了します")
+        return self.stats
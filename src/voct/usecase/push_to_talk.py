@@ -1,17 +1,34 @@
+import dataclasses
 import tempfile
 import threading
+import time
+from collections.abc import Callable
 from pathlib import Path
 
-from voct.domain.entities import PushToTalkConfig
+from voct.domain.entities import (
+    DecodeOptions,
+    LazyAudioData,
+    OutputSinkStats,
+    PushToTalkConfig,
+    TranscriptionSegment,
+    UtteranceRecord,
+)
+from voct.domain.overflow import warn_overflow
 from voct.domain.ports import (
     AudioFilePort,
     ClipboardPort,
     HotkeyListenerPort,
     NotifierPort,
+    OutputSinkPort,
     PushToTalkRecorderPort,
-    TranscriptFilePort,
+    TextPostProcessorPort,
     TranscriberPort,
+    TranscriptFilePort,
 )
+from voct.usecase.language_pinning import SessionLanguagePinner
+from voct.usecase.model_router import ModelRouter
+from voct.usecase.output_stage import ClipboardSink, OutputStage, TranscriptFileSink
+from voct.usecase.utterance_history import UtteranceHistory
 
 
 class PushToTalkUseCase:
@@ -26,6 +43,8 @@ class PushToTalkUseCase:
         transcript_file: TranscriptFilePort,
         notifier: NotifierPort,
         listener: HotkeyListenerPort,
+        router: ModelRouter | None = None,
+        post_processor: TextPostProcessorPort | None = None,
     ) -> None:
         self._recorder = recorder
         self._audio_file = audio_file
@@ -34,13 +53,41 @@ class PushToTalkUseCase:
         self._transcript_file = transcript_file
         self._notifier = notifier
         self._listener = listener
+        self._router = router
+        self._post_processor = post_processor
         self._is_processing: bool = False
         self._is_recording: bool = False
         self._config: PushToTalkConfig | None = None
+        self._language_pinner: SessionLanguagePinner | None = None
+        self._output_stage: OutputStage | None = None
+        self._history: UtteranceHistory | None = None
+
+    @property
+    def is_processing(self) -> bool:
+        """文字起こしサイクルを処理中かどうか。"""
+        return self._is_processing
+
+    @property
+    def is_recording(self) -> bool:
+        """キーが押されて録音中かどうか。"""
+        return self._is_recording
 
     def run(self, config: PushToTalkConfig) -> None:
         """バックグラウンド常駐ループを開始し、Ctrl+C で終了する。"""
         self._config = config
+        self._language_pinner = None
+        if config.async_output:
+            self._output_stage = self._make_output_stage(config)
+        if config.history_size > 0:
+            self._history = UtteranceHistory(config.history_size, config.history_max_bytes)
+        if config.retranscribe_key is not None:
+            if self._listener.add_hotkey(config.retranscribe_key, self.retranscribe_latest):
+                print(
+                    f"[Voct] {config.retranscribe_key.name}キーで直前の発話を "
+                    f"{config.retranscribe_model_size} で文字起こしし直します。"
+                )
+            else:
+                print("[Voct] 警告: このキー入力では文字起こしし直すキーを使えません")
         print(f"[Voct] 起動しました。{config.trigger_key.name}キーを押している間だけ録音します。Ctrl+C で終了。")
         self._listener.start(self._on_press, self._on_release, config.trigger_key)
         try:
@@ -49,6 +96,27 @@ class PushToTalkUseCase:
             print("\n[Voct] 終了します。")
         finally:
             self._listener.stop()
+            if self._output_stage is not None:
+                self._print_output_stats(self._output_stage.close())
+                self._output_stage = None
+
+    def _make_output_stage(self, config: PushToTalkConfig) -> OutputStage:
+        """クリップボードを先に、ファイル保存をその後ろに並べた出力ステージを作る。"""
+        sinks: list[OutputSinkPort] = [ClipboardSink(self._clipboard)]
+        if config.output_dir is not None:
+            sinks.append(TranscriptFileSink(self._transcript_file, config.output_dir, config.filename_format))
+        return OutputStage(sinks, config.output_timeout_seconds)
+
+    @staticmethod
+    def _print_output_stats(stats: list[OutputSinkStats]) -> None:
+        for sink in stats:
+            if sink.outputs == 0 and sink.failures == 0:
+                continue
+            print(
+                f"[Voct] 出力 {sink.name}: {sink.outputs}件 / {sink.writes}回 "
+                f"(平均 {sink.mean_latency_seconds * 1000:.0f}ms, 最大 {sink.max_latency_seconds * 1000:.0f}ms, "
+                f"超過 {sink.timeouts}回, 失敗 {sink.failures}件)"
+            )
 
     def _on_press(self) -> None:
         """キー押下コールバック: 処理中・録音中でなければ録音を開始する。"""
@@ -59,44 +127,150 @@ class PushToTalkUseCase:
         print("[Voct] 録音中...")
 
     def _on_release(self) -> None:
-        """キーリリースコールバック: 処理中でなければ処理スレッドを起動する。"""
-        if self._is_processing:
+        """キーリリースコールバック: 録音中であれば処理スレッドを起動する。押下を無視したキーの解放は無視する。"""
+        if self._is_processing or not self._is_recording:
             return
         self._is_recording = False
         self._is_processing = True
         threading.Thread(target=self._process_cycle, daemon=True).start()
 
+    def _resolve_language(self) -> str | None:
+        """設定で言語が指定されていなければ、セッション内で固定した言語を返す。"""
+        if self._config.language is not None:
+            return self._config.language
+        if self._language_pinner is None:
+            self._language_pinner = SessionLanguagePinner(
+                self._config.language_pin_threshold,
+                self._config.language_recheck_interval,
+            )
+        return self._language_pinner.language_for_next_cycle()
+
+    def _make_segment_copier(self) -> Callable[[TranscriptionSegment], None]:
+        """セグメントが届くたびにそれまでのテキストをクリップボードへ反映するコールバックを返す。"""
+        texts: list[str] = []
+
+        def _on_segment(segment: TranscriptionSegment) -> None:
+            texts.append(segment.text)
+            text = "".join(texts)
+            self._clipboard.copy(self._post_processor.process(text) if self._post_processor is not None else text)
+
+        return _on_segment
+
     def _process_cycle(self) -> None:
         """1 サイクル分の処理: 停止→文字起こし→保存→クリップボードコピー。"""
         try:
             audio = self._recorder.stop_recording()
+            warn_overflow(audio.overflow_count)
 
             if audio.duration_seconds < self._config.min_recording_seconds:
                 print("[Voct] 録音が短すぎます。スキップします。")
+                if isinstance(audio, LazyAudioData) and audio.owned_temp_path is not None:
+                    audio.owned_temp_path.unlink(missing_ok=True)
                 return
 
-            temp_path = Path(tempfile.mktemp(suffix=".wav"))
-            self._audio_file.save(audio, temp_path)
+            if isinstance(audio, LazyAudioData) and audio.owned_temp_path is not None:
+                # ディスクに退避済みの録音はそのまま文字起こしに渡す
+                temp_path = audio.owned_temp_path
+            else:
+                temp_path = Path(tempfile.mktemp(suffix=".wav"))
+                self._audio_file.save(audio, temp_path)
             print("[Voct] 文字起こし中...")
-            result = self._transcriber.transcribe(
-                temp_path,
-                self._config.model_size,
-                self._config.language,
-            )
+            language = self._resolve_language()
+            model_size = self._config.model_size
+            transcribe_kwargs: dict = {
+                "on_segment": self._make_segment_copier() if self._config.clipboard_per_segment else None,
+            }
+            options = self._config.decode_options
+            decision = None
+            if self._router is not None:
+                decision = self._router.route(audio.duration_seconds)
+                model_size = decision.model_size
+                options = dataclasses.replace(
+                    options or DecodeOptions(),
+                    beam_size=decision.options.beam_size,
+                    best_of=decision.options.best_of,
+                )
+                print(
+                    f"[Voct] モデル: {model_size} (beam {decision.options.beam_size}, "
+                    f"予測 {decision.predicted_seconds:.2f}秒)"
+                )
+            if options is not None:
+                transcribe_kwargs["options"] = options
+            result = self._transcriber.transcribe(temp_path, model_size, language, **transcribe_kwargs)
+            if result.partial:
+                print("[Voct] 警告: 文字起こしが時間内に終わらなかったため、途中までの結果を使います")
+            if decision is not None:
+                self._router.observe(
+                    decision,
+                    audio.duration_seconds,
+                    result.transcription_time_seconds,
+                    result.model_load_time_seconds,
+                )
+            if self._config.language is None and self._language_pinner.observe(language, result):
+                print(f"[Voct] 言語を {result.language} に固定しました (確信度: {result.language_probability:.2f})")
+            if self._post_processor is not None:
+                t0 = time.perf_counter()
+                result = dataclasses.replace(result, text=self._post_processor.process(result.text))
+                print(f"[Voct] 後処理完了 ({(time.perf_counter() - t0) * 1000:.1f}ms)")
+            if self._history is not None:
+                # ディスクに退避した録音は一時ファイルと同時に消えるため、削除する前に履歴へ移す
+                self._history.add(audio, result.text, model_size, language)
             try:
                 temp_path.unlink(missing_ok=True)
             except OSError:
                 pass
 
-            if self._config.output_dir is not None:
-                self._transcript_file.save(
-                    result.text,
-                    self._config.output_dir,
-                    self._config.filename_format,
-                )
+            if self._output_stage is not None:
+                # コピーと保存は出力ステージに任せ、完了を待たずに次の録音を受け付ける
+                self._output_stage.submit(result.text, result)
+                print(f"[Voct] 出力中: {result.text[:50]}")
+            else:
+                if self._config.output_dir is not None:
+                    self._transcript_file.save(
+                        result.text,
+                        self._config.output_dir,
+                        self._config.filename_format,
+                        result=result,
+                    )
+
+                t0 = time.perf_counter()
+                self._clipboard.copy(result.text)
+                copy_ms = (time.perf_counter() - t0) * 1000
+                print(f"[Voct] コピー完了 ({copy_ms:.0f}ms): {result.text[:50]}")
+            print(f"[Voct] 待機中... ({self._config.trigger_key.name}キーで録音)")
+        finally:
+            self._is_processing = False
 
-            self._clipboard.copy(result.text)
-            print(f"[Voct] コピー完了: {result.text[:50]}")
+    def retranscribe_latest(self) -> None:
+        """直前の発話を再文字起こし用のモデルでバックグラウンドで文字起こしし直す（非ブロッキング）。"""
+        record = self._history.latest() if self._history is not None else None
+        if record is None:
+            print("[Voct] 文字起こしし直せる発話がありません。")
+            return
+        if self._is_processing or self._is_recording:
+            print("[Voct] 処理中のため、文字起こしし直せません。")
+            return
+        self._is_processing = True
+        threading.Thread(target=self._retranscribe, args=(record,), daemon=True).start()
+
+    def _retranscribe(self, record: UtteranceRecord) -> None:
+        """履歴の音声を文字起こしし直し、履歴のテキストとクリップボードを置き換える。"""
+        try:
+            model_size = self._config.retranscribe_model_size
+            language = self._config.retranscribe_language
+            print(f"[Voct] {model_size} で文字起こしし直しています...")
+            try:
+                result = self._transcriber.transcribe_audio(record.to_audio(), model_size, language)
+            except Exception as e:
+                print(f"[Voct] 文字起こしし直せませんでした: {e}")
+                return
+            text = self._post_processor.process(result.text) if self._post_processor is not None else result.text
+            self._history.update_text(record.id, text, model_size, language)
+            if self._output_stage is not None:
+                # 出力ステージに残っている元の結果で上書きされないよう、書き出しを待ってからコピーする
+                self._output_stage.flush(self._config.output_timeout_seconds)
+            self._clipboard.copy(text)
+            print(f"[Voct] 文字起こしし直しました ({result.transcription_time_seconds:.1f}秒): {text[:50]}")
             print(f"[Voct] 待機中... ({self._config.trigger_key.name}キーで録音)")
         finally:
             self._is_processing = False
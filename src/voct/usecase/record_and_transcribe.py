@@ -1,6 +1,14 @@
+from collections.abc import Callable
 from pathlib import Path
 
-from voct.domain.entities import NotificationConfig, RecordingConfig, TranscriptionResult
+from voct.domain.entities import (
+    LazyAudioData,
+    NotificationConfig,
+    RecordingConfig,
+    TranscriptionResult,
+    TranscriptionSegment,
+)
+from voct.domain.overflow import warn_overflow
 from voct.domain.ports import AudioFilePort, NotifierPort, RecorderPort, TranscriberPort
 
 
@@ -26,9 +34,17 @@ class RecordAndTranscribeUseCase:
         temp_file_path: Path,
         model_size: str = "base",
         language: str | None = None,
+        on_segment: Callable[[TranscriptionSegment], None] | None = None,
     ) -> TranscriptionResult:
         self._notifier.play_start_sound(notification_config)
         audio = self._recorder.record(recording_config)
+        warn_overflow(audio.overflow_count)
         self._notifier.play_stop_sound(notification_config)
+        if isinstance(audio, LazyAudioData) and audio.owned_temp_path is not None:
+            # ディスクに退避済みの録音はコピーせずに文字起こしし、退避ファイルを削除する
+            try:
+                return self._transcriber.transcribe(audio.owned_temp_path, model_size, language, on_segment=on_segment)
+            finally:
+                audio.owned_temp_path.unlink(missing_ok=True)
         self._audio_file.save(audio, temp_file_path)
-        return self._transcriber.transcribe(temp_file_path, model_size, language)
+        return self._transcriber.transcribe(temp_file_path, model_size, language, on_segment=on_segment)
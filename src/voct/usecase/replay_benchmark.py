@@ -0,0 +1,129 @@
+import bisect
+import time
+from collections.abc import Callable
+
+import numpy as np
+
+from voct.domain.entities import LatencyReport, PushToTalkConfig, TriggerKey
+from voct.domain.ports import (
+    AudioFilePort,
+    ClipboardPort,
+    HotkeyListenerPort,
+    NotifierPort,
+    PushToTalkRecorderPort,
+    TranscriberPort,
+    TranscriptFilePort,
+)
+from voct.usecase.push_to_talk import PushToTalkUseCase
+
+_DRAIN_POLL_SECONDS = 0.01
+
+
+class _TimingListener(HotkeyListenerPort):
+    """処理が開始されたキー解放の時刻を記録するリスナーのラッパー。"""
+
+    def __init__(self, inner: HotkeyListenerPort, is_ignored: Callable[[], bool]) -> None:
+        self._inner = inner
+        self._is_ignored = is_ignored
+        self.release_times: list[float] = []
+        self.ignored_releases = 0
+
+    def start(
+        self,
+        on_press: Callable[[], None],
+        on_release: Callable[[], None],
+        trigger_key: TriggerKey,
+    ) -> None:
+        def _on_release() -> None:
+            # 録音中でないとき（処理中に押下した場合など）の解放は PushToTalkUseCase に無視されるため計測対象外とする
+            if self._is_ignored():
+                self.ignored_releases += 1
+            else:
+                self.release_times.append(time.perf_counter())
+            on_release()
+
+        self._inner.start(on_press, _on_release, trigger_key)
+
+    def join(self) -> None:
+        self._inner.join()
+
+    def stop(self) -> None:
+        self._inner.stop()
+
+
+class _TimingClipboard(ClipboardPort):
+    """コピーの時刻を記録するクリップボードのラッパー。"""
+
+    def __init__(self, inner: ClipboardPort) -> None:
+        self._inner = inner
+        self.copy_times: list[float] = []
+
+    def copy(self, text: str) -> None:
+        self._inner.copy(text)
+        self.copy_times.append(time.perf_counter())
+
+
+def _summarize(release_times: list[float], copy_times: list[float], cycles: int, wall_time: float) -> LatencyReport:
+    """処理が開始された各解放に、次の解放までの最後のコピーを対応付けてレイテンシを集計する。"""
+    latencies = []
+    for i, released in enumerate(release_times):
+        next_release = release_times[i + 1] if i + 1 < len(release_times) else float("inf")
+        last_copy = bisect.bisect_left(copy_times, next_release) - 1
+        if last_copy >= 0 and copy_times[last_copy] >= released:
+            latencies.append(copy_times[last_copy] - released)
+
+    if latencies:
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+    else:
+        p50 = p95 = p99 = float("nan")
+    return LatencyReport(
+        cycles=cycles,
+        completed=len(latencies),
+        dropped=cycles - len(latencies),
+        p50_seconds=float(p50),
+        p95_seconds=float(p95),
+        p99_seconds=float(p99),
+        wall_time_seconds=wall_time,
+        throughput_cycles_per_second=len(latencies) / wall_time if wall_time > 0 else 0.0,
+    )
+
+
+class ReplayBenchmarkUseCase:
+    """録音・キー操作のリプレイで PushToTalkUseCase を駆動し、解放→クリップボードのレイテンシを計測するユースケース。
+
+    処理中に届いたキー操作は PushToTalkUseCase が無視するため、
+    クリップボードに到達しなかったサイクルは dropped に数える。
+    キー操作の間隔を詰めて dropped が出始める点がスループットの上限になる。
+    """
+
+    def __init__(
+        self,
+        recorder: PushToTalkRecorderPort,
+        audio_file: AudioFilePort,
+        transcriber: TranscriberPort,
+        clipboard: ClipboardPort,
+        transcript_file: TranscriptFilePort,
+        notifier: NotifierPort,
+        listener: HotkeyListenerPort,
+    ) -> None:
+        self._listener = _TimingListener(listener, lambda: not self._usecase.is_recording)
+        self._clipboard = _TimingClipboard(clipboard)
+        self._usecase = PushToTalkUseCase(
+            recorder,
+            audio_file,
+            transcriber,
+            self._clipboard,
+            transcript_file,
+            notifier,
+            self._listener,
+        )
+
+    def execute(self, config: PushToTalkConfig, cycles: int, drain_timeout_seconds: float = 60.0) -> LatencyReport:
+        """スクリプトを最後まで再生し、最後のサイクルの処理完了を待ってから集計する。"""
+        t0 = time.perf_counter()
+        self._usecase.run(config)
+        deadline = time.perf_counter() + drain_timeout_seconds
+        while self._usecase.is_processing and time.perf_counter() < deadline:
+            time.sleep(_DRAIN_POLL_SECONDS)
+        wall_time = time.perf_counter() - t0
+        return _summarize(self._listener.release_times, self._clipboard.copy_times, cycles, wall_time)
@@ -0,0 +1,163 @@
+import math
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import NDArray
+
+from voct.domain.entities import AudioData, StreamConfig, StreamReport, StreamSegment
+from voct.domain.ports import PcmSourcePort, SegmentWriterPort, TranscriberPort, VoiceActivityPort
+
+_SAMPLE_RATE = 16000
+
+
+@dataclass(frozen=True)
+class _Pending:
+    """文字起こし待ちの 1 区間。start_sample と end_sample は入力の先頭からのサンプル位置。"""
+
+    index: int
+    samples: NDArray[np.float32]
+    start_sample: int
+    end_sample: int
+    finalized_at: float
+
+
+class StreamTranscriptionUseCase:
+    """パイプなどから読んだ PCM を発話区間に区切り、常駐モデルで 1 区間ずつ文字起こしして書き出すユースケース。
+
+    入力の読み込みと発話検出は呼び出し元のスレッドで、文字起こしと書き出しは 1 本のワーカーで行う。
+    文字起こし待ちが max_backlog 区間に達すると読み込みを止め、上流（パイプの書き手）を待たせる。
+    文字起こし結果が空の区間（雑音など）は書き出さない。書き出し先が閉じられたら入力の読み込みをやめる。
+    detector は config.vox_config.block_size サンプルずつの 16kHz のブロックで判定するものを渡す。
+    """
+
+    def __init__(
+        self,
+        source: PcmSourcePort,
+        detector: VoiceActivityPort,
+        transcriber: TranscriberPort,
+        writer: SegmentWriterPort,
+    ) -> None:
+        self._source = source
+        self._detector = detector
+        self._transcriber = transcriber
+        self._writer = writer
+        self._queue: queue.Queue[_Pending | None] = queue.Queue()
+        self._error: Exception | None = None
+        self._segments = 0
+        self._failures = 0
+
+    def execute(self, config: StreamConfig) -> StreamReport:
+        """入力が終わるまで読み、残りの区間を書き出してから結果を返す。書き出しに失敗したらその例外を送出する。"""
+        t0 = time.perf_counter()
+        self._queue = queue.Queue(maxsize=config.max_backlog)
+        self._error = None
+        self._segments = 0
+        self._failures = 0
+        worker = threading.Thread(target=self._work, args=(config,), name="voct-stream", daemon=True)
+        worker.start()
+
+        vox = config.vox_config
+        detector = self._detector
+        pre_roll_blocks = math.ceil((vox.pre_roll_seconds + vox.attack_seconds) * _SAMPLE_RATE / vox.block_size)
+        pre_roll: deque[NDArray[np.float32]] = deque(maxlen=pre_roll_blocks + 1)
+        max_segment_samples = int(config.max_segment_seconds * _SAMPLE_RATE)
+        capturing = False
+        chunks: list[NDArray[np.float32]] = []
+        captured = 0
+        start_sample = 0
+        position = 0
+        speech_samples = 0
+        backpressure = 0.0
+        index = 0
+
+        def finalize() -> None:
+            nonlocal chunks, captured, start_sample, index, speech_samples, backpressure
+            pending = _Pending(index, np.concatenate(chunks), start_sample, position, time.perf_counter())
+            index += 1
+            speech_samples += captured
+            chunks, captured, start_sample = [], 0, position
+            t_put = time.perf_counter()
+            self._queue.put(pending)
+            backpressure += time.perf_counter() - t_put
+
+        for block in self._source.iter_blocks(vox.block_size):
+            if self._error is not None:
+                break
+            was_active = detector.active
+            active = detector.update(block)
+            position += len(block)
+            if capturing:
+                chunks.append(block)
+                captured += len(block)
+            else:
+                pre_roll.append(block)
+            if active and not was_active:
+                # 発話開始前の音声も区間の先頭に含める
+                capturing = True
+                chunks = list(pre_roll)
+                captured = sum(len(b) for b in chunks)
+                start_sample = position - captured
+                pre_roll.clear()
+            elif capturing and not active:
+                capturing = False
+                finalize()
+            elif capturing and captured >= max_segment_samples:
+                # 長い発話はこの長さで区切り、続きを次の区間にする
+                finalize()
+        if captured and self._error is None:
+            finalize()
+        self._queue.put(None)
+        worker.join()
+        if self._error is not None:
+            raise self._error
+        return StreamReport(
+            segments=self._segments,
+            failures=self._failures,
+            audio_seconds=position / _SAMPLE_RATE,
+            speech_seconds=speech_samples / _SAMPLE_RATE,
+            wall_seconds=time.perf_counter() - t0,
+            backpressure_seconds=backpressure,
+        )
+
+    def _work(self, config: StreamConfig) -> None:
+        while True:
+            pending = self._queue.get()
+            if pending is None:
+                return
+            if self._error is not None:
+                # 書き出せなくなったら、読み込み側が止まるまで残りを捨てる
+                continue
+            started_at = time.perf_counter()
+            audio = AudioData(
+                data=pending.samples, sample_rate=_SAMPLE_RATE, duration_seconds=len(pending.samples) / _SAMPLE_RATE
+            )
+            try:
+                result = self._transcriber.transcribe_audio(audio, config.model_size, config.language)
+            except Exception as e:
+                self._failures += 1
+                print(f"[Voct] 警告: 区間 {pending.index} を文字起こしできません: {e}")
+                continue
+            finished_at = time.perf_counter()
+            text = result.text.strip()
+            if not text:
+                continue
+            segment = StreamSegment(
+                index=pending.index,
+                start_seconds=pending.start_sample / _SAMPLE_RATE,
+                end_seconds=pending.end_sample / _SAMPLE_RATE,
+                text=text,
+                language=result.language,
+                queue_seconds=started_at - pending.finalized_at,
+                transcription_seconds=finished_at - started_at,
+                latency_seconds=time.perf_counter() - pending.finalized_at,
+            )
+            try:
+                self._writer.write(segment)
+            except Exception as e:
+                self._error = e
+                continue
+            self._segments += 1
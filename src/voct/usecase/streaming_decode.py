@@ -0,0 +1,221 @@
+import dataclasses
+import math
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import closing
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import NDArray
+
+from voct.domain.entities import AudioData, DecodeOptions, DecodeStats, TranscriptionResult, TranscriptionSegment
+from voct.domain.ports import AudioDecoderPort, TranscriberPort
+
+_SAMPLE_RATE = 16000
+# チャンクの終わりのこの秒数の中で最も静かな位置で切り、単語の途中で切らないようにする
+_CUT_SEARCH_SECONDS = 2.0
+# 静かな位置を探すときのフレーム長
+_CUT_FRAME_SAMPLES = 320
+_END = object()
+
+
+def prefetch(blocks: Iterator[NDArray[np.float32]], depth: int) -> Iterator[NDArray[np.float32]]:
+    """blocks を別スレッドで最大 depth 個先まで読み進めながら返す。
+
+    読み出し側が途中でやめると、読み進めているスレッドも止めてから戻る。blocks の例外は読み出し側で送出する。
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(entry: tuple) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for block in blocks:
+                if not put((block, None)):
+                    return
+            put((_END, None))
+        except Exception as e:
+            put((_END, e))
+        finally:
+            close = getattr(blocks, "close", None)
+            if close is not None:
+                close()
+
+    thread = threading.Thread(target=produce, name="voct-decode", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if item is _END:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+def quiet_cut_point(samples: NDArray[np.float32], limit: int, search: int) -> int:
+    """samples[:limit] の終わり search サンプルの中で、最もエネルギーの小さいフレームの中央の位置を返す。"""
+    start = max(0, limit - search)
+    frames = (limit - start) // _CUT_FRAME_SAMPLES
+    if frames == 0:
+        return limit
+    region = samples[start : start + frames * _CUT_FRAME_SAMPLES].reshape(frames, _CUT_FRAME_SAMPLES)
+    energy = np.einsum("ij,ij->i", region, region)
+    return start + int(np.argmin(energy)) * _CUT_FRAME_SAMPLES + _CUT_FRAME_SAMPLES // 2
+
+
+def _format_of(file_path: Path) -> str:
+    return file_path.suffix.lower().lstrip(".") or "unknown"
+
+
+class StreamingDecodeTranscriber(TranscriberPort):
+    """音声ファイルを AudioDecoderPort でブロックずつデコードしながら文字起こしする TranscriberPort 実装。
+
+    デコードは別スレッドで次のチャンクまで先に進め、前のチャンクの推論と重ねる。
+    チャンクは chunk_seconds ごとに、終わり付近の最も静かな位置で切って transcribe_audio に渡す。
+    言語を指定しなければ、発話のあった最初のチャンクで検出した言語を残りのチャンクにも使う。
+    デコードにかかった時間は形式ごとに集計し、stats で返す。
+    """
+
+    def __init__(
+        self,
+        decoder: AudioDecoderPort,
+        transcriber: TranscriberPort,
+        chunk_seconds: float = 30.0,
+        block_seconds: float = 1.0,
+    ) -> None:
+        self._decoder = decoder
+        self._transcriber = transcriber
+        self._chunk_samples = int(chunk_seconds * _SAMPLE_RATE)
+        self._block_samples = int(block_seconds * _SAMPLE_RATE)
+        # 推論中に次のチャンクを丸ごとデコードし終えられるだけ先読みする
+        self._prefetch_blocks = math.ceil(self._chunk_samples / self._block_samples) + 1
+        self._lock = threading.Lock()
+        self._stats: dict[str, DecodeStats] = {}
+
+    @property
+    def stats(self) -> list[DecodeStats]:
+        """最後までデコードできたファイルの形式ごとの累計統計。"""
+        with self._lock:
+            return [self._stats[key] for key in sorted(self._stats)]
+
+    def transcribe(
+        self,
+        audio_path: Path,
+        model_size: str = "base",
+        language: str | None = None,
+        on_segment: Callable[[TranscriptionSegment], None] | None = None,
+        options: DecodeOptions | None = None,
+    ) -> TranscriptionResult:
+        t0 = time.perf_counter()
+        decode_seconds = [0.0]
+        results: list[TranscriptionResult] = []
+        segments: list[TranscriptionSegment] = []
+        first_segment_at: float | None = None
+        offset = 0
+        pending: list[NDArray[np.float32]] = []
+        pending_samples = 0
+        # 短いチャンクでも切り出しが細切れにならないよう、探す範囲はチャンクの 4 分の 1 までにする
+        search = min(int(_CUT_SEARCH_SECONDS * _SAMPLE_RATE), self._chunk_samples // 4)
+
+        def run(chunk: NDArray[np.float32]) -> None:
+            nonlocal language
+            shift = offset / _SAMPLE_RATE
+
+            def shifted(segment: TranscriptionSegment) -> TranscriptionSegment:
+                return dataclasses.replace(segment, start=segment.start + shift, end=segment.end + shift)
+
+            def forward(segment: TranscriptionSegment) -> None:
+                nonlocal first_segment_at
+                if first_segment_at is None:
+                    first_segment_at = time.perf_counter() - t0
+                if on_segment is not None:
+                    on_segment(shifted(segment))
+
+            audio = AudioData(data=chunk, sample_rate=_SAMPLE_RATE, duration_seconds=len(chunk) / _SAMPLE_RATE)
+            result = self._transcriber.transcribe_audio(audio, model_size, language, forward, options)
+            if language is None and result.segments:
+                language = result.language
+            results.append(result)
+            segments.extend(shifted(segment) for segment in result.segments)
+
+        blocks = prefetch(self._timed_blocks(audio_path, decode_seconds), self._prefetch_blocks)
+        with closing(blocks):
+            for block in blocks:
+                pending.append(block)
+                pending_samples += len(block)
+                if pending_samples < self._chunk_samples:
+                    continue
+                joined = np.concatenate(pending)
+                cut = quiet_cut_point(joined, self._chunk_samples, search)
+                run(joined[:cut])
+                offset += cut
+                pending = [joined[cut:]]
+                pending_samples = len(joined) - cut
+        if pending_samples or not results:
+            run(np.concatenate(pending) if pending else np.zeros(0, dtype=np.float32))
+        duration = (offset + pending_samples) / _SAMPLE_RATE
+        self._record(audio_path, duration, decode_seconds[0])
+
+        spoken = next((r for r in results if r.segments), results[0])
+        return TranscriptionResult(
+            text="".join(r.text for r in results),
+            language=spoken.language,
+            language_probability=spoken.language_probability,
+            duration_seconds=duration,
+            model_load_time_seconds=sum(r.model_load_time_seconds for r in results),
+            transcription_time_seconds=sum(r.transcription_time_seconds for r in results),
+            time_to_first_segment_seconds=first_segment_at,
+            segments=tuple(segments),
+            partial=any(r.partial for r in results),
+        )
+
+    def transcribe_audio(
+        self,
+        audio: AudioData,
+        model_size: str = "base",
+        language: str | None = None,
+        on_segment: Callable[[TranscriptionSegment], None] | None = None,
+        options: DecodeOptions | None = None,
+    ) -> TranscriptionResult:
+        return self._transcriber.transcribe_audio(audio, model_size, language, on_segment, options)
+
+    def _timed_blocks(self, audio_path: Path, decode_seconds: list[float]) -> Iterator[NDArray[np.float32]]:
+        """デコーダーのブロックを返しながら、デコードにかかった時間を decode_seconds[0] に足していく。"""
+        blocks = self._decoder.iter_blocks(audio_path, self._block_samples)
+        try:
+            while True:
+                t0 = time.perf_counter()
+                block = next(blocks, None)
+                decode_seconds[0] += time.perf_counter() - t0
+                if block is None:
+                    return
+                yield block
+        finally:
+            close = getattr(blocks, "close", None)
+            if close is not None:
+                close()
+
+    def _record(self, audio_path: Path, audio_seconds: float, decode_seconds: float) -> None:
+        key = _format_of(audio_path)
+        with self._lock:
+            previous = self._stats.get(key, DecodeStats(key, self._decoder.name, 0, 0.0, 0.0))
+            self._stats[key] = dataclasses.replace(
+                previous,
+                files=previous.files + 1,
+                audio_seconds=previous.audio_seconds + audio_seconds,
+                decode_seconds=previous.decode_seconds + decode_seconds,
+            )
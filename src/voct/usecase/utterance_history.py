@@ -0,0 +1,82 @@
+import dataclasses
+import threading
+from collections import OrderedDict
+from datetime import datetime
+
+import numpy as np
+from numpy.typing import NDArray
+
+from voct.domain.entities import AudioData, UtteranceRecord
+
+_CONVERT_BLOCK_SAMPLES = 16000 * 30
+
+
+def to_int16(audio: AudioData) -> NDArray[np.int16]:
+    """float32 の音声を int16 に変換する。ディスク上の長い録音もブロックごとに読み込んで変換する。"""
+    samples = np.empty(audio.num_samples, dtype=np.int16)
+    offset = 0
+    for block in audio.iter_blocks(_CONVERT_BLOCK_SAMPLES):
+        samples[offset : offset + len(block)] = np.clip(block, -1.0, 1.0) * 32767.0
+        offset += len(block)
+    return samples[:offset]
+
+
+class UtteranceHistory:
+    """直近の発話の音声と結果を int16 で保持する履歴。
+
+    max_utterances 件か max_bytes バイトを超えたら、古いものから捨てる。
+    1 件で max_bytes を超える発話は保持しない。
+    """
+
+    def __init__(self, max_utterances: int, max_bytes: int) -> None:
+        self._max_utterances = max_utterances
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._records: OrderedDict[int, UtteranceRecord] = OrderedDict()
+        self._next_id = 1
+        self._total_bytes = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._records)
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._total_bytes
+
+    def add(self, audio: AudioData, text: str, model_size: str, language: str | None) -> UtteranceRecord | None:
+        """発話を追加して返す。大きすぎて保持できなければ None を返す。"""
+        if self._max_utterances <= 0 or audio.num_samples * 2 > self._max_bytes:
+            return None
+        samples = to_int16(audio)
+        with self._lock:
+            record = UtteranceRecord(
+                id=self._next_id,
+                samples=samples,
+                sample_rate=audio.sample_rate,
+                created_at=datetime.now(),
+                text=text,
+                model_size=model_size,
+                language=language,
+            )
+            self._next_id += 1
+            self._records[record.id] = record
+            self._total_bytes += record.nbytes
+            while len(self._records) > self._max_utterances or self._total_bytes > self._max_bytes:
+                _, evicted = self._records.popitem(last=False)
+                self._total_bytes -= evicted.nbytes
+        return record
+
+    def latest(self) -> UtteranceRecord | None:
+        """最も新しく追加された発話を返す。"""
+        with self._lock:
+            return next(reversed(self._records.values()), None)
+
+    def update_text(self, record_id: int, text: str, model_size: str, language: str | None) -> None:
+        """再文字起こしの結果で発話のテキストを置き換える。"""
+        with self._lock:
+            record = self._records.get(record_id)
+            if record is None:
+                return
+            self._records[record_id] = dataclasses.replace(record, text=text, model_size=model_size, language=language)
@@ -0,0 +1,192 @@
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from voct.domain.entities import WatchConfig, WatchStats
+from voct.domain.ports import (
+    AudioDecoderPort,
+    AudioFilePort,
+    DirectoryWatcherPort,
+    TranscriberPort,
+    TranscriptFilePort,
+)
+from voct.usecase.content_hash import file_digest
+from voct.usecase.output_stage import OutputStage, TranscriptFileSink
+
+
+@dataclass
+class _Job:
+    path: Path
+    detected_at: float
+
+
+class WatchFolderUseCase:
+    """監視フォルダーに届いた音声ファイルを、決まった数のワーカーで文字起こしして保存するユースケース。
+
+    同じ内容のファイルは内容のハッシュで見分けて 1 回だけ文字起こしする。
+    文字起こし待ちが上限に達したら、監視側を待たせて取りこぼさずに受け付けを遅らせる。
+    結果は出力ステージ経由で TranscriptFilePort に保存する。
+    decoder を渡すと、読めるかどうかと長さは全体をデコードせずに decoder で調べる。
+    """
+
+    def __init__(
+        self,
+        watcher: DirectoryWatcherPort,
+        audio_file: AudioFilePort,
+        transcriber: TranscriberPort,
+        transcript_file: TranscriptFilePort,
+        decoder: AudioDecoderPort | None = None,
+    ) -> None:
+        self._watcher = watcher
+        self._audio_file = audio_file
+        self._transcriber = transcriber
+        self._transcript_file = transcript_file
+        self._decoder = decoder
+        self._config: WatchConfig | None = None
+        self._queue: queue.Queue[_Job | None] = queue.Queue()
+        self._workers: list[threading.Thread] = []
+        self._output_stage: OutputStage | None = None
+        self._lock = threading.Lock()
+        self._digests: set[str] = set()
+        self._detected = 0
+        self._duplicates = 0
+        self._processed = 0
+        self._failures = 0
+        self._in_flight = 0
+        self._lag_total = 0.0
+        self._lag_max = 0.0
+        self._audio_seconds = 0.0
+
+    @property
+    def stats(self) -> WatchStats:
+        with self._lock:
+            return WatchStats(
+                detected=self._detected,
+                duplicates=self._duplicates,
+                processed=self._processed,
+                failures=self._failures,
+                backlog=self._queue.qsize() + self._in_flight,
+                mean_lag_seconds=self._lag_total / self._processed if self._processed else 0.0,
+                max_lag_seconds=self._lag_max,
+                audio_seconds=self._audio_seconds,
+            )
+
+    def run(self, config: WatchConfig, report_interval_seconds: float = 30.0) -> None:
+        """監視を開始し、Ctrl+C で終了する。report_interval_seconds ごとに待ち件数と遅延を表示する。"""
+        print(f"[Voct] {config.directory} を監視しています。Ctrl+C で終了。")
+        self.start(config)
+        last = self.stats
+        try:
+            while True:
+                time.sleep(report_interval_seconds)
+                stats = self.stats
+                if stats != last:
+                    self._print_stats(stats)
+                    last = stats
+        except KeyboardInterrupt:
+            print("\n[Voct] 終了します。")
+        finally:
+            self._print_stats(self.stop())
+
+    def start(self, config: WatchConfig) -> None:
+        """ワーカーと監視を開始する（非ブロッキング）。"""
+        self._config = config
+        self._queue = queue.Queue(maxsize=config.max_backlog)
+        self._output_stage = OutputStage(
+            [TranscriptFileSink(self._transcript_file, config.output_dir, config.filename_format)]
+        )
+        self._workers = [
+            threading.Thread(target=self._work, name=f"voct-watch-{i}", daemon=True) for i in range(config.workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+        self._watcher.start(config.directory, self.submit)
+        if config.include_existing:
+            for path in sorted(config.directory.iterdir()):
+                if path.is_file():
+                    self.submit(path)
+
+    def stop(self) -> WatchStats:
+        """監視を止め、受け付け済みのファイルを文字起こしし終えてから統計を返す。"""
+        self._watcher.stop()
+        for _ in self._workers:
+            self._queue.put(None)
+        for worker in self._workers:
+            worker.join()
+        self._workers = []
+        if self._output_stage is not None:
+            self._output_stage.close()
+            self._output_stage = None
+        return self.stats
+
+    def submit(self, path: Path) -> None:
+        """ファイルを文字起こし待ちに加える。対象外の拡張子と隠しファイルは無視する。待ちが満杯なら空くまで待つ。"""
+        if path.name.startswith(".") or path.suffix.lower() not in self._config.extensions:
+            return
+        with self._lock:
+            self._detected += 1
+        self._queue.put(_Job(path, time.perf_counter()))
+
+    def _work(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            with self._lock:
+                self._in_flight += 1
+            try:
+                self._process(job)
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+
+    def _process(self, job: _Job) -> None:
+        try:
+            digest = file_digest(job.path)
+        except OSError as e:
+            self._fail(job.path, e)
+            return
+        with self._lock:
+            if digest in self._digests:
+                self._duplicates += 1
+                return
+            self._digests.add(digest)
+        try:
+            duration = self._probe_seconds(job.path)
+            result = self._transcriber.transcribe(job.path, self._config.model_size, self._config.language)
+        except Exception as e:
+            with self._lock:
+                # 書きかけで読めなかったファイルは、書き直されたときに再び受け付ける
+                self._digests.discard(digest)
+            self._fail(job.path, e)
+            return
+        self._output_stage.submit(result.text, result)
+        if duration is None:
+            duration = result.duration_seconds
+        lag = time.perf_counter() - job.detected_at
+        with self._lock:
+            self._processed += 1
+            self._lag_total += lag
+            self._lag_max = max(self._lag_max, lag)
+            self._audio_seconds += duration
+        print(f"[Voct] {job.path.name} ({duration:.1f}秒, 遅延 {lag:.1f}秒): {result.text[:50]}")
+
+    def _probe_seconds(self, path: Path) -> float | None:
+        if self._decoder is not None:
+            return self._decoder.probe_seconds(path)
+        return self._audio_file.load_lazy(path).duration_seconds
+
+    def _fail(self, path: Path, error: Exception) -> None:
+        with self._lock:
+            self._failures += 1
+        print(f"[Voct] 警告: {path.name} を文字起こしできません: {error}")
+
+    @staticmethod
+    def _print_stats(stats: WatchStats) -> None:
+        print(
+            f"[Voct] 検出 {stats.detected}件 / 完了 {stats.processed}件 / 重複 {stats.duplicates}件 / "
+            f"失敗 {stats.failures}件 / 待ち {stats.backlog}件 "
+            f"(遅延 平均 {stats.mean_lag_seconds:.1f}秒, 最大 {stats.max_lag_seconds:.1f}秒)"
+        )
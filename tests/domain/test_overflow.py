@@ -0,0 +1,15 @@
+"""warn_overflow のテスト。"""
+
+from voct.domain.overflow import warn_overflow
+
+
+class TestWarnOverflow:
+    def test_warns_with_count(self, capsys):
+        warn_overflow(3)
+
+        assert "入力オーバーフローが 3 回発生しました" in capsys.readouterr().out
+
+    def test_silent_without_overflow(self, capsys):
+        warn_overflow(0)
+
+        assert capsys.readouterr().out == ""
@@ -0,0 +1,103 @@
+"""AdaptiveBlockSizePolicy のテスト。"""
+
+from voct.domain.entities import RecordingConfig
+from voct.infra.adaptive_block_size import AdaptiveBlockSizePolicy, stream_settings
+
+
+class TestAdaptiveBlockSizePolicy:
+    def test_initial_block_size_matches_config(self):
+        policy = AdaptiveBlockSizePolicy(RecordingConfig(block_size=512))
+
+        assert policy.block_size == 512
+
+    def test_overflow_doubles_block_size(self):
+        """オーバーフローが発生した録音の後はブロックサイズが倍になる。"""
+        policy = AdaptiveBlockSizePolicy(RecordingConfig(block_size=512))
+
+        policy.record_result(overflow_count=3)
+
+        assert policy.block_size == 1024
+
+    def test_block_size_is_capped_at_max(self):
+        policy = AdaptiveBlockSizePolicy(RecordingConfig(block_size=1024, max_block_size=2048))
+
+        for _ in range(5):
+            policy.record_result(overflow_count=1)
+
+        assert policy.block_size == 2048
+
+    def test_clean_recordings_shrink_block_size(self):
+        """オーバーフローのない録音が規定回数続くとブロックサイズが半分に戻る。"""
+        config = RecordingConfig(block_size=512, clean_recordings_before_shrink=2)
+        policy = AdaptiveBlockSizePolicy(config)
+        policy.record_result(overflow_count=1)
+        policy.record_result(overflow_count=1)
+        assert policy.block_size == 2048
+
+        policy.record_result(overflow_count=0)
+        assert policy.block_size == 2048
+        policy.record_result(overflow_count=0)
+        assert policy.block_size == 1024
+
+    def test_block_size_never_shrinks_below_config(self):
+        policy = AdaptiveBlockSizePolicy(RecordingConfig(block_size=512, clean_recordings_before_shrink=1))
+
+        for _ in range(5):
+            policy.record_result(overflow_count=0)
+
+        assert policy.block_size == 512
+
+    def test_overflow_resets_clean_streak(self):
+        config = RecordingConfig(block_size=512, clean_recordings_before_shrink=2)
+        policy = AdaptiveBlockSizePolicy(config)
+        policy.record_result(overflow_count=1)
+        policy.record_result(overflow_count=0)
+        policy.record_result(overflow_count=1)
+        policy.record_result(overflow_count=0)
+
+        assert policy.block_size == 2048
+
+    def test_stream_kwargs_include_latency(self):
+        policy = AdaptiveBlockSizePolicy(RecordingConfig(sample_rate=16000, block_size=1024))
+        policy.record_result(overflow_count=1)
+
+        kwargs = policy.stream_kwargs()
+
+        assert kwargs["blocksize"] == 2048
+        assert kwargs["latency"] == 2 * 2048 / 16000
+        assert kwargs["samplerate"] == 16000
+
+
+class TestStreamSettings:
+    def test_disabled_returns_fixed_block_size(self):
+        """適応制御が無効ならポリシーを持たず、設定どおりのブロックサイズを使う。"""
+        config = RecordingConfig(block_size=512)
+
+        policy, block_size, kwargs = stream_settings(config, AdaptiveBlockSizePolicy(config))
+
+        assert policy is None
+        assert block_size == 512
+        assert kwargs["blocksize"] == 512
+        assert "latency" not in kwargs
+
+    def test_keeps_policy_while_config_is_unchanged(self):
+        """設定が同じ間は前回の録音で広げたブロックサイズを引き継ぐ。"""
+        config = RecordingConfig(block_size=512, adaptive_block_size=True)
+        first, _, _ = stream_settings(config, None)
+        first.record_result(overflow_count=1)
+
+        policy, block_size, kwargs = stream_settings(config, first)
+
+        assert policy is first
+        assert block_size == 1024
+        assert kwargs["latency"] == 2 * 1024 / config.sample_rate
+
+    def test_new_config_starts_new_policy(self):
+        config = RecordingConfig(block_size=512, adaptive_block_size=True)
+        first, _, _ = stream_settings(config, None)
+        first.record_result(overflow_count=1)
+
+        policy, block_size, _ = stream_settings(RecordingConfig(block_size=256, adaptive_block_size=True), first)
+
+        assert policy is not first
+        assert block_size == 256
@@ -0,0 +1,134 @@
+"""AhoCorasickDictionary のテスト。"""
+
+import os
+import random
+import re
+import time
+
+import pytest
+
+
+class TestParseDictionary:
+    def test_skips_comments_and_blank_lines(self):
+        """空行と # の行は無視し、同じ語は後の行を使う。"""
+        from voct.infra.aho_corasick_dictionary import parse_dictionary
+
+        entries = parse_dictionary("# 製品名\n\nぼくと\tVoct\nぼくと\tvoct\n機会学習\t機械学習\n")
+
+        assert entries == {"ぼくと": "voct", "機会学習": "機械学習"}
+
+    def test_rejects_line_without_tab(self):
+        """タブのない行は行番号付きの ValueError にする。"""
+        from voct.infra.aho_corasick_dictionary import parse_dictionary
+
+        with pytest.raises(ValueError, match="line 2"):
+            parse_dictionary("a\tb\nこわれた行\n")
+
+
+class TestAhoCorasickAutomaton:
+    def test_replaces_all_occurrences(self):
+        """辞書の語をすべて置き換え、置換した数を返す。"""
+        from voct.infra.aho_corasick_dictionary import AhoCorasickAutomaton
+
+        automaton = AhoCorasickAutomaton({"ぱいそん": "Python", "ギットハブ": "GitHub"})
+
+        assert automaton.replace("ぱいそんのコードをギットハブに置く。ぱいそん") == (
+            "PythonのコードをGitHubに置く。Python",
+            3,
+        )
+
+    def test_prefers_leftmost_then_longest(self):
+        """重なる候補は先に始まるものを、同じ位置では長いものを選ぶ。"""
+        from voct.infra.aho_corasick_dictionary import AhoCorasickAutomaton
+
+        automaton = AhoCorasickAutomaton({"ab": "X", "bcd": "Y", "cd": "Z", "abc": "W"})
+
+        assert automaton.replace("abcd") == ("Wd", 1)
+        assert automaton.replace("xbcdab") == ("xYX", 2)
+
+    def test_finds_match_hidden_behind_longer_suffix(self):
+        """長い候補に隠れた短い一致も、前の置換と重ならなければ置き換える。"""
+        from voct.infra.aho_corasick_dictionary import AhoCorasickAutomaton
+
+        automaton = AhoCorasickAutomaton({"ab": "X", "bcd": "Y", "cd": "Z"})
+
+        assert automaton.replace("abcd") == ("XZ", 2)
+
+    def test_text_without_matches_is_unchanged(self):
+        from voct.infra.aho_corasick_dictionary import AhoCorasickAutomaton
+
+        assert AhoCorasickAutomaton({"語": "単語"}).replace("一致なし") == ("一致なし", 0)
+        assert AhoCorasickAutomaton({}).replace("空の辞書") == ("空の辞書", 0)
+
+    def test_matches_regex_alternation_on_random_dictionary(self):
+        """長い順に並べた正規表現の選択と同じ結果になる。"""
+        from voct.infra.aho_corasick_dictionary import AhoCorasickAutomaton
+
+        rng = random.Random(0)
+        alphabet = "あいうアイ漢字"
+        entries = {"".join(rng.choice(alphabet) for _ in range(rng.randint(1, 5))): str(i) for i in range(300)}
+        pattern = re.compile("|".join(re.escape(k) for k in sorted(entries, key=len, reverse=True)))
+        automaton = AhoCorasickAutomaton(entries)
+
+        for _ in range(50):
+            text = "".join(rng.choice(alphabet) for _ in range(200))
+            assert automaton.replace(text)[0] == pattern.sub(lambda m: entries[m.group()], text)
+
+    def test_large_dictionary_rewrites_in_one_pass(self):
+        """数千語の辞書でも 1 発話の置換は数ミリ秒で終わる。"""
+        from voct.infra.aho_corasick_dictionary import AhoCorasickAutomaton
+
+        entries = {f"用語{i:05d}": f"term{i}" for i in range(5000)}
+        automaton = AhoCorasickAutomaton(entries)
+        text = "今日は用語00042と用語04999について話します。" * 10
+
+        t0 = time.perf_counter()
+        rewritten, count = automaton.replace(text)
+        elapsed = time.perf_counter() - t0
+
+        assert count == 20
+        assert "term42" in rewritten and "term4999" in rewritten
+        assert elapsed < 0.05
+
+
+class TestAhoCorasickDictionary:
+    def test_process_rewrites_with_file_entries(self, tmp_path):
+        from voct.infra.aho_corasick_dictionary import AhoCorasickDictionary
+
+        path = tmp_path / "dict.tsv"
+        path.write_text("ぼくと\tVoct\n", encoding="utf-8")
+        dictionary = AhoCorasickDictionary(path)
+
+        assert dictionary.entry_count == 1
+        assert dictionary.process("ぼくとで文字起こし") == "Voctで文字起こし"
+        assert dictionary.last_replacements == 1
+
+    def test_reloads_when_file_changes(self, tmp_path, capsys):
+        """ファイルを更新すると次の process から新しい辞書を使う。"""
+        from voct.infra.aho_corasick_dictionary import AhoCorasickDictionary
+
+        path = tmp_path / "dict.tsv"
+        path.write_text("ぼくと\tVoct\n", encoding="utf-8")
+        dictionary = AhoCorasickDictionary(path)
+        path.write_text("ぼくと\tvoct\nきかい\t機械\n", encoding="utf-8")
+        os.utime(path, ns=(time.time_ns(), time.time_ns() + 1_000_000_000))
+
+        assert dictionary.process("ぼくとのきかい") == "voctの機械"
+        assert dictionary.entry_count == 2
+        assert "2語" in capsys.readouterr().out
+
+    def test_keeps_previous_dictionary_when_reload_fails(self, tmp_path, capsys):
+        """読み直しに失敗したら警告し、直前の辞書を使い続ける。"""
+        from voct.infra.aho_corasick_dictionary import AhoCorasickDictionary
+
+        path = tmp_path / "dict.tsv"
+        path.write_text("ぼくと\tVoct\n", encoding="utf-8")
+        dictionary = AhoCorasickDictionary(path)
+        path.write_text("タブなし\n", encoding="utf-8")
+        os.utime(path, ns=(time.time_ns(), time.time_ns() + 1_000_000_000))
+
+        assert dictionary.process("ぼくと") == "Voct"
+        assert "前の辞書を使います" in capsys.readouterr().out
+
+        path.unlink()
+        assert dictionary.process("ぼくと") == "Voct"
@@ -0,0 +1,23 @@
+"""rebuffer のテスト。"""
+
+import numpy as np
+
+from voct.infra.block_rebuffer import rebuffer
+
+
+class TestRebuffer:
+    def test_regroups_into_fixed_blocks_with_short_tail(self):
+        chunks = [np.arange(0, 3), np.arange(3, 8), np.arange(8, 9), np.arange(9, 19)]
+
+        blocks = list(rebuffer(chunks, 4))
+
+        assert [len(block) for block in blocks] == [4, 4, 4, 4, 3]
+        np.testing.assert_array_equal(np.concatenate(blocks), np.arange(19))
+
+    def test_exact_multiple_has_no_tail(self):
+        blocks = list(rebuffer([np.zeros(8), np.zeros(0)], 4))
+
+        assert [len(block) for block in blocks] == [4, 4]
+
+    def test_empty_input_yields_nothing(self):
+        assert list(rebuffer([], 4)) == []
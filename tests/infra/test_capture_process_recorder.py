@@ -0,0 +1,104 @@
+"""CaptureProcessRecorder のテスト。"""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from voct.domain.entities import RecordingConfig
+
+
+def _ready_conn(status: str = "ready", detail=None) -> MagicMock:
+    conn = MagicMock()
+    conn.poll.return_value = True
+    conn.recv.return_value = (status, detail)
+    return conn
+
+
+class TestCaptureProcessRecorder:
+    @patch("voct.infra.capture_process_recorder._spawn_capture")
+    def test_returns_samples_between_press_and_release(self, mock_spawn):
+        """押下時と解放時のシーケンス番号の間に録音プロセスが書き込んだサンプルを返す。"""
+        from voct.infra.capture_process_recorder import CaptureProcessRecorder
+
+        mock_spawn.return_value = (MagicMock(), _ready_conn())
+        recorder = CaptureProcessRecorder(ring_seconds=1.0)
+        config = RecordingConfig(sample_rate=16000)
+        recorder.open(config)
+        ring = recorder._ring
+        try:
+            ring.write(np.zeros(800, dtype=np.float32), time.monotonic_ns())
+            recorder.start_recording(config)
+            ring.write(np.full(1600, 0.5, dtype=np.float32), time.monotonic_ns(), overflowed=True)
+
+            audio = recorder.stop_recording()
+
+            assert audio.num_samples == 1600
+            assert audio.duration_seconds == pytest.approx(0.1)
+            assert np.all(audio.data == 0.5)
+            assert audio.overflow_count == 1
+            del audio
+        finally:
+            recorder.close()
+
+    @patch("voct.infra.capture_process_recorder._spawn_capture")
+    def test_recording_is_capped_at_timeout(self, mock_spawn):
+        from voct.infra.capture_process_recorder import CaptureProcessRecorder
+
+        mock_spawn.return_value = (MagicMock(), _ready_conn())
+        recorder = CaptureProcessRecorder(ring_seconds=1.0)
+        config = RecordingConfig(sample_rate=1000, timeout_seconds=0.5)
+        recorder.start_recording(config)
+        try:
+            recorder._ring.write(np.ones(900, dtype=np.float32), time.monotonic_ns())
+
+            assert recorder.stop_recording().num_samples == 500
+        finally:
+            recorder.close()
+
+    @patch("voct.infra.capture_process_recorder._spawn_capture")
+    def test_open_raises_when_capture_process_fails(self, mock_spawn):
+        """録音プロセスが入力ストリームを開けなければ例外を送出し、共有メモリを解放する。"""
+        from voct.infra.capture_process_recorder import CaptureProcessRecorder
+
+        process = MagicMock()
+        process.is_alive.return_value = False
+        mock_spawn.return_value = (process, _ready_conn("error", "PortAudioError()"))
+        recorder = CaptureProcessRecorder(ring_seconds=1.0)
+
+        with pytest.raises(RuntimeError, match="PortAudioError"):
+            recorder.open(RecordingConfig())
+
+        assert recorder._ring is None
+        process.join.assert_called_once()
+
+    @patch("voct.infra.capture_process_recorder._spawn_capture")
+    def test_close_stops_capture_process(self, mock_spawn):
+        from voct.infra.capture_process_recorder import CaptureProcessRecorder
+
+        process = MagicMock()
+        process.is_alive.return_value = True
+        conn = _ready_conn()
+        mock_spawn.return_value = (process, conn)
+        recorder = CaptureProcessRecorder(ring_seconds=1.0)
+        recorder.open(RecordingConfig())
+
+        recorder.close()
+
+        conn.send.assert_called_once_with(("stop", None))
+        process.terminate.assert_called_once()
+
+    @patch("voct.infra.capture_process_recorder._spawn_capture")
+    def test_open_raises_when_capture_process_exits_early(self, mock_spawn):
+        """録音プロセスが応答せずに終了した場合も例外にする。"""
+        from voct.infra.capture_process_recorder import CaptureProcessRecorder
+
+        conn = _ready_conn()
+        conn.recv.side_effect = EOFError()
+        process = MagicMock()
+        process.is_alive.return_value = False
+        mock_spawn.return_value = (process, conn)
+
+        with pytest.raises(RuntimeError, match="did not start"):
+            CaptureProcessRecorder(ring_seconds=1.0).open(RecordingConfig())
@@ -0,0 +1,88 @@
+"""cpu_affinity のテスト。"""
+
+import threading
+from unittest.mock import patch
+
+from voct.domain.entities import CpuPartition
+from voct.infra.cpu_affinity import (
+    CaptureThreadPinner,
+    apply_capture_partition,
+    available_cores,
+    pin_current_thread,
+    plan_cpu_partition,
+)
+
+
+class TestPlanCpuPartition:
+    def test_reserves_highest_cores_for_capture(self):
+        partition = plan_cpu_partition(1, cores=frozenset({0, 1, 2, 3}))
+
+        assert partition.capture_cores == frozenset({3})
+        assert partition.inference_cores == frozenset({0, 1, 2})
+        assert partition.inference_threads == 3
+
+    def test_does_not_partition_without_spare_core(self):
+        """推論用のコアが残らない場合は分割せず、推論スレッド数も既定値のままにする。"""
+        partition = plan_cpu_partition(1, capture_nice=-5, cores=frozenset({0}))
+
+        assert partition.capture_cores == frozenset()
+        assert partition.inference_cores == frozenset({0})
+        assert partition.inference_threads == 0
+        assert partition.capture_nice == -5
+
+    def test_available_cores_is_not_empty(self):
+        assert available_cores()
+
+
+class TestPinning:
+    @patch("voct.infra.cpu_affinity.os.sched_setaffinity")
+    def test_pins_calling_thread_by_native_id(self, mock_setaffinity):
+        """プロセス全体ではなく、呼び出したスレッドの ID を指定して固定する。"""
+        native_ids = []
+
+        def _pin() -> None:
+            native_ids.append(threading.get_native_id())
+            pin_current_thread(frozenset({2}))
+
+        thread = threading.Thread(target=_pin)
+        thread.start()
+        thread.join()
+
+        mock_setaffinity.assert_called_once_with(native_ids[0], frozenset({2}))
+
+    @patch("voct.infra.cpu_affinity.os.sched_setaffinity", side_effect=OSError)
+    def test_pin_failure_is_reported_not_raised(self, mock_setaffinity):
+        assert pin_current_thread(frozenset({99})) is False
+
+    def test_empty_core_set_is_not_applied(self):
+        assert pin_current_thread(frozenset()) is False
+
+    @patch("voct.infra.cpu_affinity.os.setpriority", side_effect=PermissionError)
+    @patch("voct.infra.cpu_affinity.os.sched_setaffinity")
+    def test_nice_permission_error_warns_once(self, mock_setaffinity, mock_setpriority, capsys):
+        """権限がなく優先度を上げられなくても録音は続け、警告は一度だけ出す。"""
+        partition = CpuPartition(capture_cores=frozenset({1}), inference_cores=frozenset({0}), capture_nice=-10)
+        with patch("voct.infra.cpu_affinity._warned_nice", False):
+            apply_capture_partition(partition)
+            apply_capture_partition(partition)
+
+        assert capsys.readouterr().out.count("nice 値") == 1
+        assert mock_setaffinity.call_count == 2
+
+    @patch("voct.infra.cpu_affinity.os.sched_setaffinity")
+    def test_pinner_applies_once_per_thread(self, mock_setaffinity):
+        pinner = CaptureThreadPinner(CpuPartition(capture_cores=frozenset({1}), inference_cores=frozenset({0})))
+
+        pinner()
+        pinner()
+        thread = threading.Thread(target=pinner)
+        thread.start()
+        thread.join()
+
+        assert mock_setaffinity.call_count == 2
+
+    @patch("voct.infra.cpu_affinity.os.sched_setaffinity")
+    def test_pinner_without_partition_does_nothing(self, mock_setaffinity):
+        CaptureThreadPinner(None)()
+
+        mock_setaffinity.assert_not_called()
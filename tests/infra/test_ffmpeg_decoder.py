@@ -0,0 +1,56 @@
+"""FfmpegDecoder のテスト。ffmpeg の代わりに、同じ引数を受け取って f32le を書き出すスクリプトを使う。"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+from voct.infra.ffmpeg_decoder import FfmpegDecoder
+
+
+def _fake_ffmpeg(tmp_path, body: str) -> str:
+    path = tmp_path / "ffmpeg"
+    path.write_text(f"#!{sys.executable}\nimport sys\n{body}\n", encoding="utf-8")
+    path.chmod(0o755)
+    return str(path)
+
+
+class TestFfmpegDecoder:
+    def test_reads_stdout_in_fixed_blocks(self, tmp_path):
+        executable = _fake_ffmpeg(
+            tmp_path,
+            "assert sys.argv[sys.argv.index('-ar') + 1] == '16000'\n"
+            "import array\n"
+            "sys.stdout.buffer.write(array.array('f', range(10)).tobytes())",
+        )
+
+        blocks = list(FfmpegDecoder(executable).iter_blocks(tmp_path / "a.m4a", 4))
+
+        assert [len(block) for block in blocks] == [4, 4, 2]
+        np.testing.assert_array_equal(np.concatenate(blocks), np.arange(10, dtype=np.float32))
+
+    def test_failure_raises_with_stderr(self, tmp_path):
+        executable = _fake_ffmpeg(tmp_path, "sys.stderr.write('Invalid data found'); sys.exit(1)")
+
+        with pytest.raises(RuntimeError, match="Invalid data found"):
+            list(FfmpegDecoder(executable).iter_blocks(tmp_path / "a.mp3", 4))
+
+    def test_abandoned_iteration_kills_process(self, tmp_path):
+        """途中で読むのをやめると ffmpeg を止める。"""
+        pid_file = tmp_path / "pid"
+        executable = _fake_ffmpeg(
+            tmp_path,
+            f"import os, time\nopen({str(pid_file)!r}, 'w').write(str(os.getpid()))\n"
+            "while True:\n    sys.stdout.buffer.write(b'\\0' * 16); sys.stdout.flush(); time.sleep(0.01)",
+        )
+        blocks = FfmpegDecoder(executable).iter_blocks(tmp_path / "a.mp3", 4)
+
+        next(blocks)
+        blocks.close()
+
+        with pytest.raises(ProcessLookupError):
+            os.kill(int(pid_file.read_text()), 0)
+
+    def test_probe_without_ffprobe_is_unknown(self, tmp_path):
+        assert FfmpegDecoder(probe_executable=str(tmp_path / "missing")).probe_seconds(tmp_path / "a.mp3") is None
@@ -0,0 +1,81 @@
+"""InotifyDirectoryWatcher のテスト。"""
+
+import os
+import struct
+import threading
+
+import pytest
+
+from voct.infra.inotify_directory_watcher import (
+    IN_CLOSE_WRITE,
+    IN_MOVED_TO,
+    IN_Q_OVERFLOW,
+    InotifyDirectoryWatcher,
+    inotify_available,
+    parse_events,
+)
+
+
+def _event(mask: int, name: bytes) -> bytes:
+    padded = name + b"\0" * (16 - len(name))
+    return struct.pack("iIII", 1, mask, 0, len(padded)) + padded
+
+
+class TestParseEvents:
+    def test_parses_multiple_events_and_strips_padding(self):
+        data = _event(IN_CLOSE_WRITE, b"a.wav") + _event(IN_MOVED_TO, "会議.wav".encode())
+
+        assert parse_events(data) == [(IN_CLOSE_WRITE, "a.wav"), (IN_MOVED_TO, "会議.wav")]
+
+    def test_event_without_name(self):
+        assert parse_events(struct.pack("iIII", -1, IN_Q_OVERFLOW, 0, 0)) == [(IN_Q_OVERFLOW, "")]
+
+
+@pytest.mark.skipif(not inotify_available(), reason="inotify が使えない環境")
+class TestInotifyDirectoryWatcher:
+    def _start(self, tmp_path):
+        found = []
+        event = threading.Event()
+
+        def on_file(path):
+            found.append(path)
+            event.set()
+
+        watcher = InotifyDirectoryWatcher()
+        watcher.start(tmp_path, on_file)
+        return watcher, found, event
+
+    def test_reports_file_only_after_it_is_closed(self, tmp_path):
+        """書き込み中のファイルは閉じるまで報告しない。"""
+        watcher, found, event = self._start(tmp_path)
+        try:
+            with open(tmp_path / "a.wav", "wb") as f:
+                f.write(b"x" * 1000)
+                f.flush()
+                assert not event.wait(0.1)
+            assert event.wait(2.0)
+        finally:
+            watcher.stop()
+
+        assert found == [tmp_path / "a.wav"]
+
+    def test_reports_file_moved_into_directory(self, tmp_path):
+        """別の場所で書き終えて移動してきたファイルも報告し、ディレクトリは報告しない。"""
+        staging = tmp_path / "staging"
+        inbox = tmp_path / "inbox"
+        staging.mkdir()
+        inbox.mkdir()
+        (staging / "b.wav").write_bytes(b"x")
+        watcher, found, event = self._start(inbox)
+        try:
+            (inbox / "sub").mkdir()
+            os.rename(staging / "b.wav", inbox / "b.wav")
+            assert event.wait(2.0)
+        finally:
+            watcher.stop()
+
+        assert found == [inbox / "b.wav"]
+
+    def test_missing_directory_raises(self, tmp_path):
+        with pytest.raises(OSError):
+            InotifyDirectoryWatcher().start(tmp_path / "missing", lambda path: None)
@@ -0,0 +1,31 @@
+"""JsonLinesSegmentWriter のテスト。"""
+
+import io
+import json
+
+from voct.domain.entities import StreamSegment
+from voct.infra.json_lines_segment_writer import JsonLinesSegmentWriter
+
+
+class TestJsonLinesSegmentWriter:
+    def test_writes_one_json_object_per_line(self):
+        stream = io.StringIO()
+        writer = JsonLinesSegmentWriter(stream)
+
+        writer.write(StreamSegment(0, 1.23456, 2.5, "こんにちは", "ja", 0.01, 0.4, 0.41))
+        writer.write(StreamSegment(1, 3.0, 4.0, 'say "hi"', "en", 0.0, 0.2, 0.2))
+
+        lines = stream.getvalue().splitlines()
+        assert len(lines) == 2
+        assert "こんにちは" in lines[0]
+        assert json.loads(lines[0]) == {
+            "index": 0,
+            "start": 1.235,
+            "end": 2.5,
+            "text": "こんにちは",
+            "language": "ja",
+            "queue_seconds": 0.01,
+            "transcription_seconds": 0.4,
+            "latency_seconds": 0.41,
+        }
+        assert json.loads(lines[1])["text"] == 'say "hi"'
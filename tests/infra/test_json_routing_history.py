@@ -0,0 +1,23 @@
+"""JsonRoutingHistory のテスト。"""
+
+from voct.infra.json_routing_history import JsonRoutingHistory
+
+
+class TestJsonRoutingHistory:
+    def test_load_returns_empty_when_missing(self, tmp_path):
+        assert JsonRoutingHistory(tmp_path / "routing.json").load() == {}
+
+    def test_save_and_load_roundtrip(self, tmp_path):
+        path = tmp_path / "state" / "routing.json"
+        history = JsonRoutingHistory(path)
+
+        history.save({"base:beam5": 0.12, "base:load": 1.5})
+
+        assert JsonRoutingHistory(path).load() == {"base:beam5": 0.12, "base:load": 1.5}
+        assert [p.name for p in path.parent.iterdir()] == ["routing.json"]
+
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        path = tmp_path / "routing.json"
+        path.write_text("{not json")
+
+        assert JsonRoutingHistory(path).load() == {}
@@ -0,0 +1,63 @@
+"""JsonlBatchManifest のテスト。"""
+
+from pathlib import Path
+
+from voct.domain.entities import ManifestItem, ManifestStatus
+from voct.infra.jsonl_batch_manifest import JsonlBatchManifest
+
+
+def _item(name: str, status=ManifestStatus.PENDING, **kwargs) -> ManifestItem:
+    return ManifestItem(Path(f"/data/{name}"), "ab" * 32, status, **kwargs)
+
+
+class TestJsonlBatchManifest:
+    def test_missing_file_loads_empty(self, tmp_path):
+        assert JsonlBatchManifest(tmp_path / "manifest.jsonl").load() == []
+
+    def test_round_trips_all_fields(self, tmp_path):
+        manifest = JsonlBatchManifest(tmp_path / "manifest.jsonl")
+        item = _item(
+            "会議.wav",
+            ManifestStatus.DONE,
+            output_path=Path("/out/会議.md"),
+            duration_seconds=12.5,
+            transcription_seconds=1.25,
+            attempts=2,
+        )
+
+        manifest.append(item)
+
+        assert manifest.load() == [item]
+
+    def test_latest_line_wins(self, tmp_path):
+        manifest = JsonlBatchManifest(tmp_path / "manifest.jsonl")
+        manifest.append(_item("a.wav"))
+        manifest.append(_item("b.wav"))
+        manifest.append(_item("a.wav", ManifestStatus.FAILED, attempts=1, error="boom"))
+
+        loaded = {item.input_path.name: item for item in manifest.load()}
+
+        assert loaded["a.wav"].status is ManifestStatus.FAILED
+        assert loaded["b.wav"].status is ManifestStatus.PENDING
+
+    def test_torn_last_line_is_ignored(self, tmp_path):
+        """強制終了で書きかけになった最後の行は読み飛ばす。"""
+        path = tmp_path / "manifest.jsonl"
+        manifest = JsonlBatchManifest(path)
+        manifest.append(_item("a.wav", ManifestStatus.DONE))
+        with path.open("a", encoding="utf-8") as f:
+            f.write('{"input_path": "/data/b.wav", "sha')
+
+        assert [item.input_path.name for item in manifest.load()] == ["a.wav"]
+
+    def test_compact_replaces_history(self, tmp_path):
+        path = tmp_path / "manifest.jsonl"
+        manifest = JsonlBatchManifest(path)
+        for _ in range(3):
+            manifest.append(_item("a.wav"))
+
+        manifest.compact([_item("a.wav", ManifestStatus.DONE)])
+
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 1
+        assert manifest.load()[0].status is ManifestStatus.DONE
+        assert [p.name for p in tmp_path.iterdir()] == ["manifest.jsonl"]
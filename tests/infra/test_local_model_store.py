@@ -0,0 +1,106 @@
+"""LocalModelStore のテスト。"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from voct.infra.local_model_store import LocalModelStore, default_model_dir, hash_model_dir
+
+
+def _make_model_dir(path, content: bytes = b"weights"):
+    path.mkdir(parents=True)
+    (path / "model.bin").write_bytes(content)
+    (path / "config.json").write_text("{}")
+    return path
+
+
+class TestLocalModelStore:
+    def test_import_copies_and_pins_with_checksum(self, tmp_path):
+        source = _make_model_dir(tmp_path / "converted")
+        store = LocalModelStore(tmp_path / "store")
+
+        artifact = store.import_model("base", source)
+
+        assert artifact.path == tmp_path / "store" / "base"
+        assert (artifact.path / "model.bin").read_bytes() == b"weights"
+        assert artifact.sha256 == hash_model_dir(source)[0]
+        assert artifact.size_bytes == len(b"weights") + 2
+        manifest = json.loads((tmp_path / "store" / "manifest.json").read_text())
+        assert manifest["models"]["base"]["sha256"] == artifact.sha256
+
+    def test_import_rejects_non_ctranslate2_dir(self, tmp_path):
+        (tmp_path / "empty").mkdir()
+        with pytest.raises(ValueError):
+            LocalModelStore(tmp_path / "store").import_model("base", tmp_path / "empty")
+
+    @pytest.mark.parametrize("name", ["..", "../outside", "nested/base", "", "manifest.json"])
+    def test_import_rejects_names_outside_store(self, tmp_path, name):
+        """モデル置き場の直下を指さない名前では、既存のディレクトリを消さずに拒否する。"""
+        outside = _make_model_dir(tmp_path / "outside")
+        store = LocalModelStore(tmp_path / "store")
+
+        with pytest.raises(ValueError):
+            store.import_model(name, _make_model_dir(tmp_path / "converted"))
+
+        assert (outside / "model.bin").exists()
+
+    def test_resolve_returns_path_only_for_pinned_models(self, tmp_path):
+        store = LocalModelStore(tmp_path / "store")
+        store.import_model("small", _make_model_dir(tmp_path / "converted"))
+
+        assert store.resolve("small") == tmp_path / "store" / "small"
+        assert store.resolve("base") is None
+
+    def test_verify_detects_modified_files(self, tmp_path):
+        store = LocalModelStore(tmp_path / "store")
+        artifact = store.import_model("base", _make_model_dir(tmp_path / "converted"))
+
+        assert store.verify("base")
+        (artifact.path / "model.bin").write_bytes(b"tampered")
+        assert not store.verify("base")
+        assert not store.verify("missing")
+
+    def test_record_load_time_is_listed(self, tmp_path):
+        store = LocalModelStore(tmp_path / "store")
+        store.import_model("tiny", _make_model_dir(tmp_path / "a"))
+        store.import_model("base", _make_model_dir(tmp_path / "b"))
+
+        store.record_load_time("base", 1.25)
+
+        artifacts = store.list_models()
+        assert [a.name for a in artifacts] == ["base", "tiny"]
+        assert artifacts[0].load_seconds == 1.25
+        assert artifacts[1].load_seconds is None
+
+    def test_remove_unpins_and_deletes(self, tmp_path):
+        store = LocalModelStore(tmp_path / "store")
+        artifact = store.import_model("base", _make_model_dir(tmp_path / "converted"))
+
+        store.remove("base")
+
+        assert store.list_models() == []
+        assert not artifact.path.exists()
+
+    @patch("voct.infra.local_model_store.download_model")
+    def test_fetch_downloads_into_store(self, mock_download, tmp_path):
+        store = LocalModelStore(tmp_path / "store")
+        mock_download.side_effect = lambda name, output_dir: _make_model_dir(tmp_path / "store" / name)
+
+        artifact = store.fetch("tiny")
+
+        mock_download.assert_called_once_with("tiny", output_dir=str(tmp_path / "store" / "tiny"))
+        assert store.resolve("tiny") == artifact.path
+
+    @pytest.mark.parametrize("name", ["..", "../outside", "nested/base", "", "manifest.json"])
+    @patch("voct.infra.local_model_store.download_model")
+    def test_fetch_rejects_names_outside_store(self, mock_download, tmp_path, name):
+        """モデル置き場の直下を指さない名前ではダウンロードせずに拒否する。"""
+        with pytest.raises(ValueError):
+            LocalModelStore(tmp_path / "store").fetch(name)
+
+        mock_download.assert_not_called()
+
+    def test_default_model_dir_honors_env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("VOCT_MODEL_DIR", str(tmp_path))
+        assert default_model_dir() == tmp_path
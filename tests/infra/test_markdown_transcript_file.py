@@ -35,6 +35,27 @@ class TestMarkdownTranscriptFile:
 
         assert result.read_text(encoding="utf-8") == text
 
+    def test_save_uses_given_timestamp_for_filename(self, tmp_path):
+        """timestamp を渡すと、保存した時刻ではなくその時刻でファイル名を付ける。"""
+        from voct.infra.markdown_transcript_file import MarkdownTranscriptFile
+
+        result = MarkdownTranscriptFile().save("hello", tmp_path, "%Y%m%d-%H%M%S", datetime(2025, 1, 2, 3, 4, 5))
+
+        assert result.name == "20250102-030405.md"
+
+    def test_save_many_saves_each_output(self, tmp_path):
+        """save_many は結果ごとに確定時刻の名前でファイルを保存する。"""
+        from voct.domain.entities import TranscriptOutput
+        from voct.infra.markdown_transcript_file import MarkdownTranscriptFile
+
+        outputs = [
+            TranscriptOutput("一", datetime(2025, 1, 1, 0, 0, 1)),
+            TranscriptOutput("二", datetime(2025, 1, 1, 0, 0, 2)),
+        ]
+        MarkdownTranscriptFile().save_many(outputs, tmp_path, "%H%M%S")
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["000001.md", "000002.md"]
+
     def test_save_creates_directory_if_not_exists(self, tmp_path):
         """save() はディレクトリが存在しない場合に自動作成する。"""
         from voct.infra.markdown_transcript_file import MarkdownTranscriptFile
@@ -84,3 +105,111 @@ class TestMarkdownTranscriptFile:
             result = tf.save("hello", tmp_path, "%Y-%m-%d")
 
         assert result.name == "2025-03-15.md"
+
+    def test_append_adds_lines(self, tmp_path):
+        """append() はファイル末尾に 1 行ずつ追記する。"""
+        from voct.infra.markdown_transcript_file import MarkdownTranscriptFile
+
+        path = tmp_path / "logs" / "live.md"
+        tf = MarkdownTranscriptFile()
+        tf.append("一行目", path)
+        tf.append("二行目", path)
+
+        assert path.read_text(encoding="utf-8") == "一行目\n二行目\n"
+
+
+class TestMarkdownTranscriptJournal:
+    def test_daily_journal_appends_timestamped_entries_to_one_file(self, tmp_path):
+        """daily では同じ日の発話を 1 つのファイルに時刻付きの見出しで追記する。"""
+        from voct.infra.markdown_transcript_file import MarkdownTranscriptFile
+
+        tf = MarkdownTranscriptFile(journal="daily")
+        first = tf.save("一", tmp_path, "%Y%m%d-%H%M%S", datetime(2025, 1, 2, 3, 4, 5))
+        second = tf.save("二", tmp_path, "%Y%m%d-%H%M%S", datetime(2025, 1, 2, 3, 4, 5))
+        tf.close()
+
+        assert first == second == tmp_path / "2025-01-02.md"
+        assert first.read_text(encoding="utf-8") == "## 2025-01-02 03:04:05\n\n一\n\n## 2025-01-02 03:04:05\n\n二\n\n"
+
+    def test_daily_journal_rolls_over_on_date_change(self, tmp_path):
+        """日付が変わると新しい日のファイルに切り替え、前のファイルは閉じる。"""
+        from voct.domain.entities import TranscriptOutput
+        from voct.infra.markdown_transcript_file import MarkdownTranscriptFile
+
+        tf = MarkdownTranscriptFile(journal="daily")
+        tf.save_many(
+            [
+                TranscriptOutput("前日", datetime(2025, 1, 1, 23, 59, 59)),
+                TranscriptOutput("翌日", datetime(2025, 1, 2, 0, 0, 1)),
+            ],
+            tmp_path,
+            "%H%M%S",
+        )
+        tf.close()
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["2025-01-01.md", "2025-01-02.md"]
+        assert "翌日" in (tmp_path / "2025-01-02.md").read_text(encoding="utf-8")
+
+    def test_session_journal_uses_first_entry_time(self, tmp_path):
+        """session では最初の発話の時刻を名前にした 1 ファイルに、日付をまたいでも追記し続ける。"""
+        from voct.infra.markdown_transcript_file import MarkdownTranscriptFile
+
+        tf = MarkdownTranscriptFile(journal="session")
+        first = tf.save("一", tmp_path, "%H%M%S", datetime(2025, 1, 1, 23, 59, 59))
+        second = tf.save("二", tmp_path, "%H%M%S", datetime(2025, 1, 2, 0, 0, 1))
+        tf.close()
+
+        assert first == second == tmp_path / "session-20250101-235959.md"
+
+    def test_journal_keeps_handle_open_between_saves(self, tmp_path):
+        """追記のたびにファイルを開き直さない。"""
+        from voct.infra.markdown_transcript_file import MarkdownTranscriptFile
+
+        real_open = Path.open
+        tf = MarkdownTranscriptFile(journal="daily", fsync_interval_seconds=60.0)
+        with patch.object(Path, "open", autospec=True, side_effect=real_open) as mock_open:
+            for i in range(100):
+                tf.save(f"発話{i}", tmp_path, "%H%M%S", datetime(2025, 1, 2, 3, 4, 5))
+        tf.close()
+
+        assert mock_open.call_count == 1
+        assert (tmp_path / "2025-01-02.md").read_text(encoding="utf-8").count("## ") == 100
+
+    def test_journal_batches_fsync_on_interval(self, tmp_path):
+        """fsync は追記のたびではなく間隔ごとにまとめて行い、close でも書き出す。"""
+        from voct.infra.markdown_transcript_file import MarkdownTranscriptFile
+
+        tf = MarkdownTranscriptFile(journal="daily", fsync_interval_seconds=60.0)
+        with patch("voct.infra.markdown_transcript_file.os.fsync") as mock_fsync:
+            for i in range(10):
+                tf.save(f"発話{i}", tmp_path, "%H%M%S", datetime(2025, 1, 2, 3, 4, 5))
+            assert mock_fsync.call_count == 0
+            tf.close()
+
+        assert mock_fsync.call_count == 1
+
+    def test_journal_syncs_in_background_after_interval(self, tmp_path):
+        """間隔が経つと、次の追記や close を待たずにディスクへ書き出す。"""
+        import threading
+
+        from voct.infra.markdown_transcript_file import MarkdownTranscriptFile
+
+        synced = threading.Event()
+        tf = MarkdownTranscriptFile(journal="daily", fsync_interval_seconds=0.01)
+        with patch("voct.infra.markdown_transcript_file.os.fsync", side_effect=lambda fd: synced.set()):
+            path = tf.save("一", tmp_path, "%H%M%S", datetime(2025, 1, 2, 3, 4, 5))
+            assert synced.wait(5.0)
+            assert path.read_text(encoding="utf-8") == "## 2025-01-02 03:04:05\n\n一\n\n"
+            tf.close()
+
+    def test_zero_interval_syncs_every_save(self, tmp_path):
+        """fsync_interval_seconds=0 なら追記のたびに書き出す。"""
+        from voct.infra.markdown_transcript_file import MarkdownTranscriptFile
+
+        tf = MarkdownTranscriptFile(journal="daily", fsync_interval_seconds=0)
+        with patch("voct.infra.markdown_transcript_file.os.fsync") as mock_fsync:
+            tf.save("一", tmp_path, "%H%M%S", datetime(2025, 1, 2, 3, 4, 5))
+            tf.save("二", tmp_path, "%H%M%S", datetime(2025, 1, 2, 3, 4, 5))
+            tf.close()
+
+        assert mock_fsync.call_count == 2
@@ -0,0 +1,145 @@
+"""MicroBatchingTranscriber のテスト。"""
+
+import threading
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from voct.domain.entities import AudioData, BatchingConfig, TranscriptionResult, TranscriptionSegment
+from voct.infra.micro_batching_transcriber import MicroBatchingTranscriber
+
+
+def _audio(seconds: float = 1.0) -> AudioData:
+    samples = np.zeros(int(16000 * seconds), dtype=np.float32)
+    return AudioData(data=samples, sample_rate=16000, duration_seconds=seconds)
+
+
+def _result(text: str) -> TranscriptionResult:
+    return TranscriptionResult(
+        text=text,
+        language="ja",
+        language_probability=0.9,
+        duration_seconds=1.0,
+        model_load_time_seconds=0.0,
+        transcription_time_seconds=0.0,
+        segments=(TranscriptionSegment(text=text, start=0.0, end=1.0, avg_logprob=-0.1),),
+    )
+
+
+def _fake_whisper() -> MagicMock:
+    """入力の音声長を文字列にして返す transcribe_batch を持つ WhisperTranscriber の代役。"""
+    whisper = MagicMock()
+    whisper.transcribe_batch.side_effect = lambda audios, model_size, language, batch_size, options=None: [
+        _result(f"{len(a)}") for a in audios
+    ]
+    return whisper
+
+
+def _submit_concurrently(transcriber, audios, **kwargs) -> list[TranscriptionResult]:
+    results: list[TranscriptionResult | None] = [None] * len(audios)
+
+    def worker(i: int) -> None:
+        results[i] = transcriber.transcribe_audio(audios[i], **kwargs)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(len(audios))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestMicroBatchingTranscriber:
+    def test_concurrent_requests_share_one_batch(self):
+        """待ち時間内に届いた要求は 1 回のバッチ推論にまとめられ、各呼び出し元に自分の結果が返る。"""
+        whisper = _fake_whisper()
+        transcriber = MicroBatchingTranscriber(whisper, BatchingConfig(max_batch_size=8, max_wait_seconds=0.5))
+        audios = [_audio(1.0), _audio(2.0), _audio(3.0)]
+
+        results = _submit_concurrently(transcriber, audios)
+        transcriber.close()
+
+        assert [r.text for r in results] == ["16000", "32000", "48000"]
+        assert whisper.transcribe_batch.call_count == 1
+        assert transcriber.stats.batches == 1
+        assert transcriber.stats.mean_batch_size == 3
+        assert transcriber.stats.audio_seconds == 6.0
+
+    def test_max_batch_size_splits_batches(self):
+        whisper = _fake_whisper()
+        transcriber = MicroBatchingTranscriber(whisper, BatchingConfig(max_batch_size=2, max_wait_seconds=0.5))
+
+        _submit_concurrently(transcriber, [_audio() for _ in range(4)])
+        transcriber.close()
+
+        assert all(len(c.args[0]) <= 2 for c in whisper.transcribe_batch.call_args_list)
+        assert transcriber.stats.clips == 4
+
+    def test_zero_wait_runs_single_request_immediately(self):
+        whisper = _fake_whisper()
+        transcriber = MicroBatchingTranscriber(whisper, BatchingConfig(max_batch_size=8, max_wait_seconds=0.0))
+
+        result = transcriber.transcribe_audio(_audio())
+        transcriber.close()
+
+        assert result.text == "16000"
+        assert transcriber.stats.mean_wait_seconds < 0.1
+
+    def test_groups_by_model_and_language(self):
+        """モデルサイズや言語が異なる要求は別々に推論される。"""
+        whisper = _fake_whisper()
+        transcriber = MicroBatchingTranscriber(whisper, BatchingConfig(max_batch_size=8, max_wait_seconds=0.5))
+        results: dict[str, TranscriptionResult] = {}
+
+        def worker(language: str) -> None:
+            results[language] = transcriber.transcribe_audio(_audio(), "base", language)
+
+        threads = [threading.Thread(target=worker, args=(lang,)) for lang in ("ja", "en")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        transcriber.close()
+
+        languages = sorted(c.args[2] for c in whisper.transcribe_batch.call_args_list)
+        assert languages == ["en", "ja"]
+        assert set(results) == {"ja", "en"}
+
+    def test_on_segment_receives_segments(self):
+        transcriber = MicroBatchingTranscriber(_fake_whisper(), BatchingConfig(max_wait_seconds=0.0))
+        on_segment = MagicMock()
+
+        transcriber.transcribe_audio(_audio(), on_segment=on_segment)
+        transcriber.close()
+
+        on_segment.assert_called_once()
+        assert on_segment.call_args[0][0].text == "16000"
+
+    def test_errors_propagate_to_callers(self):
+        whisper = MagicMock()
+        whisper.transcribe_batch.side_effect = RuntimeError("model failed")
+        transcriber = MicroBatchingTranscriber(whisper, BatchingConfig(max_wait_seconds=0.0))
+
+        with pytest.raises(RuntimeError, match="model failed"):
+            transcriber.transcribe_audio(_audio())
+        transcriber.close()
+
+    def test_transcribe_loads_file_through_whisper(self, tmp_path):
+        whisper = _fake_whisper()
+        whisper.load_audio.return_value = np.zeros(8000, dtype=np.float32)
+        transcriber = MicroBatchingTranscriber(whisper, BatchingConfig(max_wait_seconds=0.0))
+
+        result = transcriber.transcribe(tmp_path / "a.wav")
+        transcriber.close()
+
+        whisper.load_audio.assert_called_once_with(tmp_path / "a.wav")
+        assert result.text == "8000"
+
+    def test_rejects_other_sample_rates(self):
+        transcriber = MicroBatchingTranscriber(_fake_whisper())
+        audio = AudioData(data=np.zeros(8000, dtype=np.float32), sample_rate=8000, duration_seconds=1.0)
+
+        with pytest.raises(ValueError):
+            transcriber.transcribe_audio(audio)
+        transcriber.close()
@@ -0,0 +1,126 @@
+"""PersistentClipboard のテスト。"""
+
+import os
+import time
+from multiprocessing.connection import Connection
+from unittest.mock import MagicMock
+
+import pytest
+
+from voct.infra.persistent_clipboard import PersistentClipboard, serve_in_memory
+
+
+def _serve_unavailable(conn: Connection) -> None:
+    """ディスプレイに接続できない環境を模したサーバー。"""
+    conn.send(("error", "DisplayNameError"))
+
+
+def _serve_then_crash(conn: Connection) -> None:
+    """最初のコピーの後に異常終了するサーバー。"""
+    conn.send(("ready", None))
+    conn.recv()
+    conn.send(("ok", None))
+    conn.recv()
+    os._exit(1)
+
+
+class TestPersistentClipboard:
+    def test_copy_updates_helper_and_reuses_one_process(self):
+        """1 つのヘルパープロセスにパイプで送り続け、コピーごとにプロセスを起動しない。"""
+        clipboard = PersistentClipboard(serve_in_memory)
+        clipboard.open()
+        try:
+            pid = clipboard._process.pid
+            for text in ("一", "二", "三"):
+                clipboard.copy(text)
+
+            assert clipboard.paste() == "三"
+            assert clipboard._process.pid == pid
+            stats = clipboard.stats
+            assert stats.copies == 3
+            assert stats.fallbacks == 0
+            assert stats.max_latency_seconds >= stats.mean_latency_seconds > 0
+        finally:
+            clipboard.close()
+
+    def test_copy_latency_is_lower_than_spawning_a_process(self):
+        """常駐ヘルパーへのコピーは、コピーごとにプロセスを起動するより速い。"""
+        import subprocess
+        import sys
+
+        clipboard = PersistentClipboard(serve_in_memory)
+        clipboard.open()
+        try:
+            for i in range(20):
+                clipboard.copy(f"text {i}")
+            persistent = clipboard.stats.mean_latency_seconds
+        finally:
+            clipboard.close()
+
+        t0 = time.perf_counter()
+        for _ in range(5):
+            subprocess.run([sys.executable, "-c", "pass"], check=True)
+        per_spawn = (time.perf_counter() - t0) / 5
+
+        assert persistent < per_spawn
+
+    def test_open_raises_when_helper_cannot_start(self):
+        clipboard = PersistentClipboard(_serve_unavailable)
+
+        with pytest.raises(RuntimeError, match="DisplayNameError"):
+            clipboard.open()
+
+    def test_falls_back_when_helper_dies(self, capsys):
+        """ヘルパーが落ちたら警告して代替手段でコピーし、以降もそれを使う。"""
+        fallback = MagicMock()
+        clipboard = PersistentClipboard(_serve_then_crash, fallback=fallback, timeout_seconds=0.5)
+        clipboard.open()
+        try:
+            clipboard.copy("first")
+            clipboard.copy("second")
+            clipboard.copy("third")
+        finally:
+            clipboard.close()
+
+        assert [c.args[0] for c in fallback.copy.call_args_list] == ["second", "third"]
+        assert clipboard.stats.fallbacks == 2
+        assert capsys.readouterr().out.count("ヘルパー") == 1
+
+    def test_close_hands_last_text_to_fallback(self):
+        """ヘルパーの終了で選択範囲が消えないよう、最後のテキストを fallback にコピーする。"""
+        fallback = MagicMock()
+        clipboard = PersistentClipboard(serve_in_memory, fallback=fallback)
+        clipboard.open()
+        clipboard.copy("一")
+        clipboard.copy("二")
+        fallback.copy.assert_not_called()
+
+        clipboard.close()
+
+        fallback.copy.assert_called_once_with("二")
+
+    def test_close_skips_fallback_when_it_already_has_the_text(self):
+        fallback = MagicMock()
+        clipboard = PersistentClipboard(_serve_then_crash, fallback=fallback, timeout_seconds=0.5)
+        clipboard.open()
+        clipboard.copy("first")
+        clipboard.copy("second")
+
+        clipboard.close()
+
+        fallback.copy.assert_called_once_with("second")
+
+    def test_error_reply_uses_fallback_once_and_keeps_helper(self):
+        """ヘルパーが扱えないテキストだけ代替手段でコピーし、ヘルパーは使い続ける。"""
+        fallback = MagicMock()
+        clipboard = PersistentClipboard(serve_in_memory, fallback=fallback)
+        clipboard._conn = MagicMock()
+        clipboard._conn.poll.return_value = True
+        clipboard._conn.recv.side_effect = [("error", "too large"), ("ok", None)]
+
+        clipboard.copy("巨大なテキスト")
+        clipboard.copy("短い")
+
+        fallback.copy.assert_called_once_with("巨大なテキスト")
+        assert not clipboard._failed
+        clipboard._conn = None
@@ -0,0 +1,66 @@
+"""PollingDirectoryWatcher のテスト。"""
+
+import os
+
+from voct.infra.polling_directory_watcher import PollingDirectoryWatcher
+
+
+def _make(tmp_path, settle_seconds=2.0):
+    found = []
+    watcher = PollingDirectoryWatcher(interval_seconds=3600, settle_seconds=settle_seconds)
+    watcher.start(tmp_path, found.append)
+    return watcher, found
+
+
+class TestPollingDirectoryWatcher:
+    def test_ignores_files_present_at_start(self, tmp_path):
+        (tmp_path / "old.wav").write_bytes(b"x")
+        watcher, found = _make(tmp_path)
+
+        watcher.poll(0.0)
+        watcher.poll(10.0)
+        watcher.stop()
+
+        assert found == []
+
+    def test_reports_file_after_it_stops_changing(self, tmp_path):
+        """大きさが settle_seconds 変わらなくなってから 1 回だけ報告する。"""
+        watcher, found = _make(tmp_path)
+        path = tmp_path / "a.wav"
+
+        path.write_bytes(b"x" * 10)
+        watcher.poll(0.0)
+        path.write_bytes(b"x" * 20)
+        watcher.poll(1.5)
+        watcher.poll(3.0)
+        assert found == []
+        watcher.poll(3.5)
+        watcher.poll(10.0)
+        watcher.stop()
+
+        assert found == [path]
+
+    def test_rewritten_file_is_reported_again(self, tmp_path):
+        watcher, found = _make(tmp_path, settle_seconds=0.0)
+        path = tmp_path / "a.wav"
+
+        path.write_bytes(b"x")
+        watcher.poll(0.0)
+        watcher.poll(0.0)
+        path.write_bytes(b"xy")
+        os.utime(path, ns=(0, 1))
+        watcher.poll(1.0)
+        watcher.poll(1.0)
+        watcher.stop()
+
+        assert found == [path, path]
+
+    def test_directories_are_not_reported(self, tmp_path):
+        watcher, found = _make(tmp_path, settle_seconds=0.0)
+
+        (tmp_path / "sub").mkdir()
+        watcher.poll(0.0)
+        watcher.poll(1.0)
+        watcher.stop()
+
+        assert found == []
@@ -0,0 +1,21 @@
+"""process_memory のテスト。"""
+
+import sys
+
+import pytest
+
+from voct.infra.process_memory import current_rss_bytes
+
+
+class TestCurrentRssBytes:
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="/proc が必要")
+    def test_returns_positive_bytes_on_linux(self):
+        rss = current_rss_bytes()
+        assert rss is not None and rss > 0
+
+    def test_returns_none_without_proc(self, monkeypatch):
+        def _raise(*args, **kwargs):
+            raise OSError
+
+        monkeypatch.setattr("builtins.open", _raise)
+        assert current_rss_bytes() is None
@@ -166,3 +166,78 @@ class TestPushToTalkSoundDeviceRecorder:
         assert isinstance(result, AudioData)
         assert result.data.dtype == np.float32
         assert result.sample_rate == 16000
+
+    @patch("voct.infra.push_to_talk_recorder.sd")
+    def test_overflows_are_counted(self, mock_sd):
+        """stream.read() が返すオーバーフローフラグを録音ごとに数える。"""
+        from voct.infra.push_to_talk_recorder import PushToTalkSoundDeviceRecorder
+
+        chunk = np.zeros((1024, 1), dtype=np.float32)
+        mock_stream = MagicMock()
+        mock_stream.read.side_effect = [(chunk, True), (chunk, False), (chunk, True)] + [(chunk, False)] * 1000
+        mock_sd.InputStream.return_value.__enter__ = MagicMock(return_value=mock_stream)
+        mock_sd.InputStream.return_value.__exit__ = MagicMock(return_value=False)
+
+        recorder = PushToTalkSoundDeviceRecorder()
+        config = RecordingConfig(sample_rate=16000, timeout_seconds=0.3, block_size=1024)
+
+        recorder.start_recording(config)
+        time.sleep(0.1)
+        result = recorder.stop_recording()
+
+        assert result.overflow_count == 2
+
+    @patch("voct.infra.push_to_talk_recorder.sd")
+    def test_adaptive_block_size_grows_after_overflow(self, mock_sd):
+        """adaptive_block_size 有効時はオーバーフロー後の録音でブロックサイズとレイテンシを広げる。"""
+        from voct.infra.push_to_talk_recorder import PushToTalkSoundDeviceRecorder
+
+        mock_stream = MagicMock()
+        mock_stream.read.side_effect = lambda frames: (np.zeros((frames, 1), dtype=np.float32), True)
+        mock_sd.InputStream.return_value.__enter__ = MagicMock(return_value=mock_stream)
+        mock_sd.InputStream.return_value.__exit__ = MagicMock(return_value=False)
+
+        recorder = PushToTalkSoundDeviceRecorder()
+        config = RecordingConfig(sample_rate=16000, timeout_seconds=0.2, block_size=1024, adaptive_block_size=True)
+
+        recorder.start_recording(config)
+        recorder.stop_recording()
+        recorder.start_recording(config)
+        recorder.stop_recording()
+
+        first_kwargs = mock_sd.InputStream.call_args_list[0][1]
+        second_kwargs = mock_sd.InputStream.call_args_list[1][1]
+        assert first_kwargs["blocksize"] == 1024
+        assert second_kwargs["blocksize"] == 2048
+        assert second_kwargs["latency"] > first_kwargs["latency"]
+
+    @patch("voct.infra.push_to_talk_recorder.sd")
+    def test_spill_to_disk_returns_lazy_audio_data(self, mock_sd, tmp_path):
+        """spill_to_disk 有効時は録音をディスクに退避し、timeout_seconds を超えて録音できる。"""
+        from voct.domain.entities import LazyAudioData
+        from voct.infra.push_to_talk_recorder import PushToTalkSoundDeviceRecorder
+
+        chunk = np.full((1024, 1), 0.5, dtype=np.float32)
+        mock_stream = MagicMock()
+        mock_stream.read.return_value = (chunk, False)
+        mock_sd.InputStream.return_value.__enter__ = MagicMock(return_value=mock_stream)
+        mock_sd.InputStream.return_value.__exit__ = MagicMock(return_value=False)
+
+        recorder = PushToTalkSoundDeviceRecorder()
+        config = RecordingConfig(
+            sample_rate=16000,
+            timeout_seconds=0.1,
+            block_size=1024,
+            spill_to_disk=True,
+            spill_directory=tmp_path,
+        )
+
+        recorder.start_recording(config)
+        time.sleep(0.1)
+        result = recorder.stop_recording()
+
+        assert isinstance(result, LazyAudioData)
+        assert result.source_path.parent == tmp_path
+        assert result.owned_temp_path == result.source_path
+        assert result.duration_seconds > config.timeout_seconds
+        assert np.allclose(result.read(0, 1024), 0.5, atol=1e-4)
@@ -0,0 +1,55 @@
+"""PyAvDecoder のテスト。"""
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+av = pytest.importorskip("av")
+
+from voct.infra.pyav_decoder import PyAvDecoder  # noqa: E402
+
+
+def _write_m4a(path, rate: int, seconds: float) -> None:
+    """PyAV 同梱の AAC エンコーダーで M4A を書く（libsndfile では読めない形式）。"""
+    t = np.arange(int(rate * seconds)) / rate
+    tone = (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+    with av.open(str(path), "w") as container:
+        stream = container.add_stream("aac", rate=rate)
+        stream.layout = "mono"
+        for start in range(0, len(tone), 1024):
+            frame = av.AudioFrame.from_ndarray(tone[None, start : start + 1024], format="fltp", layout="mono")
+            frame.sample_rate = rate
+            for packet in stream.encode(frame):
+                container.mux(packet)
+        for packet in stream.encode(None):
+            container.mux(packet)
+
+
+class TestPyAvDecoder:
+    def test_decodes_m4a_to_16k_mono_fixed_blocks(self, tmp_path):
+        path = tmp_path / "a.m4a"
+        _write_m4a(path, 44100, 2.0)
+
+        blocks = list(PyAvDecoder().iter_blocks(path, 4000))
+
+        assert all(len(block) == 4000 for block in blocks[:-1])
+        assert all(block.dtype == np.float32 and block.ndim == 1 for block in blocks)
+        # AAC はエンコーダーの遅延分だけ先頭に無音が付く
+        assert sum(len(block) for block in blocks) == pytest.approx(32000, abs=2048)
+        assert PyAvDecoder().probe_seconds(path) == pytest.approx(2.0, abs=0.1)
+
+    def test_flac_matches_source(self, tmp_path):
+        path = tmp_path / "a.flac"
+        t = np.arange(16000) / 16000
+        sf.write(str(path), (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32), 16000)
+
+        samples = np.concatenate(list(PyAvDecoder().iter_blocks(path, 3000)))
+
+        np.testing.assert_allclose(samples, sf.read(str(path), dtype="float32")[0], atol=1e-4)
+
+    def test_unreadable_file_raises(self, tmp_path):
+        path = tmp_path / "a.mp3"
+        path.write_bytes(b"not audio")
+
+        with pytest.raises(av.FFmpegError):
+            list(PyAvDecoder().iter_blocks(path, 4000))
@@ -189,3 +189,34 @@ class TestPynputHotkeyListener:
 
         for trigger_key in TriggerKey:
             assert trigger_key in _KEY_MAP, f"{trigger_key} が _KEY_MAP に存在しない"
+
+
+class TestPynputAdditionalHotkeys:
+    @patch("voct.infra.pynput_hotkey_listener.keyboard")
+    def test_added_hotkey_fires_once_per_press(self, mock_keyboard):
+        """add_hotkey のキーは押下で 1 回だけ呼ばれ、キーリピートでは呼ばれない。"""
+        from voct.infra.pynput_hotkey_listener import PynputHotkeyListener
+
+        captured = {}
+
+        def fake_listener(**kwargs):
+            captured.update(kwargs)
+            return MagicMock()
+
+        mock_keyboard.Listener.side_effect = fake_listener
+        mock_keyboard.Key.enter = "enter_key"
+        mock_keyboard.Key.f2 = "f2_key"
+
+        listener = PynputHotkeyListener()
+        hotkey_cb = MagicMock()
+        on_press_cb = MagicMock()
+        assert listener.add_hotkey(TriggerKey.F2, hotkey_cb)
+        listener.start(on_press_cb, MagicMock(), TriggerKey.ENTER)
+
+        captured["on_press"]("f2_key")
+        captured["on_press"]("f2_key")
+        captured["on_release"]("f2_key")
+        captured["on_press"]("f2_key")
+
+        assert hotkey_cb.call_count == 2
+        on_press_cb.assert_not_called()
@@ -0,0 +1,78 @@
+"""RawPcmSource のテスト。"""
+
+import io
+
+import numpy as np
+import pytest
+
+from voct.infra.raw_pcm_source import RawPcmSource
+
+
+class _TrickleStream(io.RawIOBase):
+    """パイプのように、要求より少ないバイト数ずつ返すストリーム。"""
+
+    def __init__(self, data: bytes, chunk: int) -> None:
+        self._data = data
+        self._chunk = chunk
+
+    def read(self, size: int = -1) -> bytes:
+        piece, self._data = self._data[: self._chunk], self._data[self._chunk :]
+        return piece
+
+
+class TestRawPcmSource:
+    def test_s16le_is_scaled_to_float32_fixed_blocks(self):
+        samples = np.array([0, 16384, -32768, 32767] * 250, dtype="<i2")
+
+        blocks = list(RawPcmSource(io.BytesIO(samples.tobytes())).iter_blocks(300))
+
+        assert [len(block) for block in blocks] == [300, 300, 300, 100]
+        out = np.concatenate(blocks)
+        assert out.dtype == np.float32
+        np.testing.assert_allclose(out[:4], [0.0, 0.5, -1.0, 32767 / 32768])
+
+    def test_partial_reads_are_reassembled(self):
+        """フレームの途中で切れた読み込みも、次の読み込みとつないで正しく解釈する。"""
+        samples = np.arange(-500, 500, dtype="<i2")
+
+        out = np.concatenate(list(RawPcmSource(_TrickleStream(samples.tobytes(), 7)).iter_blocks(128)))
+
+        np.testing.assert_allclose(out, samples / 32768.0)
+
+    @pytest.mark.parametrize(
+        ("sample_format", "raw", "expected"),
+        [
+            ("u8", np.array([128, 255, 0], dtype="u1"), [0.0, 127 / 128, -1.0]),
+            ("s32le", np.array([0, 2**30, -(2**31)], dtype="<i4"), [0.0, 0.5, -1.0]),
+            ("f32le", np.array([0.25, -0.5, 1.0], dtype="<f4"), [0.25, -0.5, 1.0]),
+        ],
+    )
+    def test_other_sample_formats(self, sample_format, raw, expected):
+        out = np.concatenate(list(RawPcmSource(io.BytesIO(raw.tobytes()), sample_format).iter_blocks(16)))
+
+        np.testing.assert_allclose(out, expected)
+
+    def test_stereo_is_mixed_to_mono(self):
+        frames = np.array([[16384, 0], [-16384, -16384]], dtype="<i2")
+
+        out = np.concatenate(list(RawPcmSource(io.BytesIO(frames.tobytes()), channels=2).iter_blocks(16)))
+
+        np.testing.assert_allclose(out, [0.25, -0.5])
+
+    def test_other_rates_are_resampled_to_16k(self):
+        samples = (np.sin(2 * np.pi * 440 * np.arange(48000) / 48000) * 16000).astype("<i2")
+
+        out = np.concatenate(list(RawPcmSource(io.BytesIO(samples.tobytes()), sample_rate=48000).iter_blocks(1024)))
+
+        assert len(out) == 16000
+
+    def test_truncated_last_frame_is_dropped(self):
+        data = np.array([1000, 2000], dtype="<i2").tobytes() + b"\x01"
+
+        out = np.concatenate(list(RawPcmSource(io.BytesIO(data)).iter_blocks(16)))
+
+        assert len(out) == 2
+
+    def test_unknown_format_is_rejected(self):
+        with pytest.raises(ValueError, match="s24le"):
+            RawPcmSource(io.BytesIO(b""), "s24le")
@@ -0,0 +1,54 @@
+"""ScriptedHotkeyListener のテスト。"""
+
+import json
+import time
+
+from voct.domain.entities import TriggerKey
+from voct.infra.scripted_hotkey_listener import ScriptedHotkeyListener, load_key_script, uniform_key_script
+
+
+class TestScriptedHotkeyListener:
+    def test_emits_press_and_release_in_order(self):
+        events = []
+        listener = ScriptedHotkeyListener([(0.0, 0.01), (0.02, 0.03)])
+
+        listener.start(lambda: events.append("press"), lambda: events.append("release"), TriggerKey.ENTER)
+        listener.join()
+
+        assert events == ["press", "release", "press", "release"]
+
+    def test_follows_script_timestamps(self):
+        """押下・解放はスクリプト上の時刻 / speed に発生する。"""
+        times = []
+        listener = ScriptedHotkeyListener([(0.5, 1.0)], speed=10.0)
+
+        t0 = time.perf_counter()
+        listener.start(
+            lambda: times.append(time.perf_counter() - t0),
+            lambda: times.append(time.perf_counter() - t0),
+            TriggerKey.ENTER,
+        )
+        listener.join()
+
+        assert 0.04 <= times[0] < 0.09
+        assert 0.09 <= times[1] < 0.15
+
+    def test_stop_interrupts_script(self):
+        events = []
+        listener = ScriptedHotkeyListener([(0.0, 10.0)])
+
+        listener.start(lambda: events.append("press"), lambda: events.append("release"), TriggerKey.ENTER)
+        time.sleep(0.02)
+        listener.stop()
+        listener.join()
+
+        assert events == ["press"]
+
+    def test_uniform_key_script(self):
+        assert uniform_key_script(2, hold_seconds=1.0, gap_seconds=0.5) == [(0.0, 1.0), (1.5, 2.5)]
+
+    def test_load_key_script(self, tmp_path):
+        path = tmp_path / "script.json"
+        path.write_text(json.dumps([{"press": 0.5, "release": 1.25}]), encoding="utf-8")
+
+        assert load_key_script(path) == [(0.5, 1.25)]
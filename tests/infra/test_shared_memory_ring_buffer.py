@@ -0,0 +1,100 @@
+"""SharedMemoryRingBuffer のテスト。"""
+
+import multiprocessing
+import threading
+import time
+
+import numpy as np
+
+from voct.infra.shared_memory_ring_buffer import SharedMemoryRingBuffer
+
+
+def _write_ramp(name: str, capacity: int, blocks: int, block_size: int, period: float) -> None:
+    """別プロセスから period 秒ごとに連番のブロックを書き込む録音プロセスの代役。"""
+    ring = SharedMemoryRingBuffer.attach(name, capacity)
+    next_at = time.monotonic()
+    for i in range(blocks):
+        ring.write(np.arange(i * block_size, (i + 1) * block_size, dtype=np.float32), time.monotonic_ns())
+        next_at += period
+        time.sleep(max(next_at - time.monotonic(), 0))
+    ring.close()
+
+
+def _hog_gil(stop: threading.Event) -> None:
+    """GIL を離さない Python コードで推論側の後処理を模す。"""
+    while not stop.is_set():
+        sum(i * i for i in range(10000))
+
+
+class TestSharedMemoryRingBuffer:
+    def test_read_returns_zero_copy_view_when_contiguous(self):
+        ring = SharedMemoryRingBuffer.create(100)
+        try:
+            ring.write(np.arange(30, dtype=np.float32), time.monotonic_ns())
+
+            view = ring.read(10, 20)
+
+            np.testing.assert_array_equal(view, np.arange(10, 20))
+            assert not view.flags.owndata
+            assert ring.write_seq == 30
+            del view
+        finally:
+            ring.close()
+
+    def test_wrapped_range_is_copied_in_order(self):
+        ring = SharedMemoryRingBuffer.create(10)
+        try:
+            for start in range(0, 25, 5):
+                ring.write(np.arange(start, start + 5, dtype=np.float32), time.monotonic_ns())
+
+            np.testing.assert_array_equal(ring.read(17, 23), np.arange(17, 23))
+        finally:
+            ring.close()
+
+    def test_overwritten_range_is_truncated_to_latest_capacity(self):
+        """すでに上書きされた範囲は返さず、残っている最新 capacity サンプルだけを返す。"""
+        ring = SharedMemoryRingBuffer.create(10)
+        try:
+            ring.write(np.arange(25, dtype=np.float32), time.monotonic_ns())
+
+            np.testing.assert_array_equal(ring.read(0, 25), np.arange(15, 25))
+            assert ring.read(30, 40).size == 0
+        finally:
+            ring.close()
+
+    def test_overflows_and_write_gap_are_tracked(self):
+        ring = SharedMemoryRingBuffer.create(10)
+        try:
+            ring.write(np.zeros(2, dtype=np.float32), 1_000_000_000)
+            ring.write(np.zeros(2, dtype=np.float32), 1_030_000_000, overflowed=True)
+            ring.write(np.zeros(2, dtype=np.float32), 1_040_000_000)
+
+            assert ring.overflow_count == 1
+            assert abs(ring.max_write_gap_seconds - 0.03) < 1e-9
+        finally:
+            ring.close()
+
+    def test_writer_process_is_not_delayed_by_gil_bound_reader(self):
+        """読み出し側が GIL を握り続けても、別プロセスの書き込みは遅れずに連番が途切れない。"""
+        block_size, blocks, period = 160, 100, 0.01
+        ring = SharedMemoryRingBuffer.create(block_size * blocks)
+        stop = threading.Event()
+        hogs = [threading.Thread(target=_hog_gil, args=(stop,)) for _ in range(4)]
+        try:
+            writer = multiprocessing.get_context("spawn").Process(
+                target=_write_ramp, args=(ring.name, ring.capacity, blocks, block_size, period)
+            )
+            writer.start()
+            for hog in hogs:
+                hog.start()
+            writer.join(timeout=30)
+            stop.set()
+            for hog in hogs:
+                hog.join()
+
+            assert writer.exitcode == 0
+            np.testing.assert_array_equal(ring.read(0, ring.write_seq), np.arange(block_size * blocks))
+            assert ring.max_write_gap_seconds < period + 0.1
+        finally:
+            stop.set()
+            ring.close()
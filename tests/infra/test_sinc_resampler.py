@@ -0,0 +1,55 @@
+"""SincResampler のテスト。"""
+
+import numpy as np
+import pytest
+
+from voct.infra.sinc_resampler import SincResampler
+
+
+def _sine(frequency: float, rate: int, seconds: float) -> np.ndarray:
+    t = np.arange(int(rate * seconds)) / rate
+    return (0.5 * np.sin(2 * np.pi * frequency * t)).astype(np.float32)
+
+
+def _resample_all(src_rate: int, blocks: list[np.ndarray]) -> np.ndarray:
+    resampler = SincResampler(src_rate, 16000)
+    return np.concatenate([resampler.process(block) for block in blocks] + [resampler.flush()])
+
+
+class TestSincResampler:
+    @pytest.mark.parametrize("src_rate", [8000, 22050, 44100, 48000])
+    def test_output_length_matches_rate_ratio(self, src_rate):
+        samples = _sine(440, src_rate, 1.3)
+
+        out = _resample_all(src_rate, [samples])
+
+        assert len(out) == -(-len(samples) * 16000 // src_rate)
+
+    @pytest.mark.parametrize("src_rate", [8000, 44100, 48000])
+    def test_passband_tone_is_preserved(self, src_rate):
+        out = _resample_all(src_rate, [_sine(440, src_rate, 1.0)])
+
+        expected = _sine(440, 16000, 1.0)
+        # 入力の両端は 0 で埋めた扱いになるため、端を除いて比べる
+        assert np.max(np.abs(out[200:-200] - expected[200:-200])) < 1e-3
+
+    def test_blockwise_matches_one_shot(self):
+        """ブロックの切れ目をまたいでも、全体を一度に変換した場合と同じ出力になる。"""
+        samples = np.random.default_rng(0).standard_normal(44100).astype(np.float32)
+
+        one_shot = _resample_all(44100, [samples])
+        blockwise = _resample_all(44100, np.array_split(samples, 37))
+
+        np.testing.assert_allclose(blockwise, one_shot, atol=1e-6)
+
+    def test_tone_above_output_nyquist_is_suppressed(self):
+        """出力のナイキスト周波数を超える成分は折り返さずに落とす。"""
+        out = _resample_all(44100, [_sine(10000, 44100, 1.0)])
+
+        assert np.sqrt(np.mean(out[200:-200] ** 2)) < 0.01
+
+    def test_empty_blocks_produce_nothing(self):
+        resampler = SincResampler(44100, 16000)
+
+        assert len(resampler.process(np.zeros(0, dtype=np.float32))) == 0
+        assert len(resampler.flush()) == 0
@@ -0,0 +1,57 @@
+"""SoundDeviceContinuousRecorder のテスト。"""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from voct.domain.entities import RecordingConfig
+
+
+class TestSoundDeviceContinuousRecorder:
+    @patch("voct.infra.sounddevice_continuous_recorder.sd")
+    def test_start_opens_callback_stream(self, mock_sd):
+        from voct.infra.sounddevice_continuous_recorder import SoundDeviceContinuousRecorder
+
+        recorder = SoundDeviceContinuousRecorder()
+        recorder.start(RecordingConfig(sample_rate=16000, block_size=512), MagicMock())
+
+        kwargs = mock_sd.InputStream.call_args[1]
+        assert kwargs["samplerate"] == 16000
+        assert kwargs["blocksize"] == 512
+        assert callable(kwargs["callback"])
+        mock_sd.InputStream.return_value.start.assert_called_once()
+
+    @patch("voct.infra.sounddevice_continuous_recorder.sd")
+    def test_callback_passes_mono_blocks_and_counts_overflows(self, mock_sd):
+        from voct.infra.sounddevice_continuous_recorder import SoundDeviceContinuousRecorder
+
+        blocks = []
+        recorder = SoundDeviceContinuousRecorder()
+        recorder.start(RecordingConfig(), blocks.append)
+        callback = mock_sd.InputStream.call_args[1]["callback"]
+
+        callback(np.ones((4, 1), dtype=np.float32), 4, None, MagicMock(input_overflow=True))
+        callback(np.ones((4, 1), dtype=np.float32), 4, None, MagicMock(input_overflow=False))
+        overflow_count = recorder.stop()
+
+        assert [block.shape for block in blocks] == [(4,), (4,)]
+        assert overflow_count == 1
+        mock_sd.InputStream.return_value.stop.assert_called_once()
+
+    @patch("voct.infra.cpu_affinity.os.sched_setaffinity")
+    @patch("voct.infra.sounddevice_continuous_recorder.sd")
+    def test_callback_thread_is_pinned_to_capture_cores(self, mock_sd, mock_setaffinity):
+        """コア分割を指定すると、PortAudio のコールバックスレッドを最初のブロックで予約コアに固定する。"""
+        from voct.domain.entities import CpuPartition
+        from voct.infra.sounddevice_continuous_recorder import SoundDeviceContinuousRecorder
+
+        partition = CpuPartition(capture_cores=frozenset({3}), inference_cores=frozenset({0, 1, 2}))
+        recorder = SoundDeviceContinuousRecorder()
+        recorder.start(RecordingConfig(cpu_partition=partition), MagicMock())
+        callback = mock_sd.InputStream.call_args[1]["callback"]
+
+        for _ in range(3):
+            callback(np.ones((4, 1), dtype=np.float32), 4, None, MagicMock(input_overflow=False))
+
+        assert mock_setaffinity.call_count == 1
+        assert mock_setaffinity.call_args[0][1] == frozenset({3})
@@ -74,3 +74,18 @@ class TestSoundDeviceRecorder:
         result = recorder.record(config)
 
         assert result.data.ndim == 1
+
+    @patch("voct.infra.sounddevice_recorder.sd")
+    def test_record_counts_overflows(self, mock_sd):
+        mock_stream = MagicMock()
+        chunk = np.zeros((1024, 1), dtype=np.float32)
+        mock_stream.read.side_effect = [(chunk, True), (chunk, True), (chunk, False), (chunk, False), (chunk, False)]
+        mock_sd.InputStream.return_value.__enter__ = MagicMock(return_value=mock_stream)
+        mock_sd.InputStream.return_value.__exit__ = MagicMock(return_value=False)
+
+        recorder = SoundDeviceRecorder()
+        config = RecordingConfig(timeout_seconds=0.32, block_size=1024, sample_rate=16000)
+
+        result = recorder.record(config)
+
+        assert result.overflow_count == 2
@@ -0,0 +1,53 @@
+"""SoundfileDecoder のテスト。"""
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from voct.infra.soundfile_decoder import SoundfileDecoder
+
+
+def _write_tone(path, rate: int, seconds: float, channels: int = 1, **kwargs) -> None:
+    t = np.arange(int(rate * seconds)) / rate
+    tone = (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+    sf.write(str(path), np.stack([tone] * channels, axis=1), rate, **kwargs)
+
+
+class TestSoundfileDecoder:
+    @pytest.mark.parametrize(
+        ("name", "kwargs"),
+        [("a.wav", {}), ("a.flac", {}), ("a.ogg", {"subtype": "VORBIS"})],
+    )
+    def test_decodes_to_16k_mono_fixed_blocks(self, tmp_path, name, kwargs):
+        path = tmp_path / name
+        _write_tone(path, 44100, 2.5, channels=2, **kwargs)
+
+        blocks = list(SoundfileDecoder().iter_blocks(path, 4000))
+
+        assert all(len(block) == 4000 for block in blocks[:-1])
+        assert 0 < len(blocks[-1]) <= 4000
+        assert sum(len(block) for block in blocks) == 40000
+        assert all(block.dtype == np.float32 for block in blocks)
+        samples = np.concatenate(blocks)
+        assert np.sqrt(np.mean(samples[1000:-1000] ** 2)) == pytest.approx(0.5 / np.sqrt(2), rel=0.05)
+
+    def test_16k_input_is_passed_through(self, tmp_path):
+        path = tmp_path / "a.wav"
+        _write_tone(path, 16000, 1.0, subtype="FLOAT")
+
+        samples = np.concatenate(list(SoundfileDecoder().iter_blocks(path, 3000)))
+
+        np.testing.assert_array_equal(samples, sf.read(str(path), dtype="float32")[0])
+
+    def test_probe_seconds(self, tmp_path):
+        path = tmp_path / "a.flac"
+        _write_tone(path, 48000, 1.5)
+
+        assert SoundfileDecoder().probe_seconds(path) == pytest.approx(1.5)
+
+    def test_unreadable_file_raises(self, tmp_path):
+        path = tmp_path / "a.m4a"
+        path.write_bytes(b"not audio")
+
+        with pytest.raises(sf.LibsndfileError):
+            list(SoundfileDecoder().iter_blocks(path, 4000))
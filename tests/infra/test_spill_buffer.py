@@ -0,0 +1,36 @@
+"""SpillToDiskBuffer のテスト。"""
+
+import numpy as np
+import soundfile as sf
+
+from voct.infra.spill_buffer import SpillToDiskBuffer
+
+
+class TestSpillToDiskBuffer:
+    def test_append_writes_wav_with_patched_header(self, tmp_path):
+        """close() 後の WAV は追記したフレーム数をヘッダに持つ。"""
+        buffer = SpillToDiskBuffer(16000, 1, directory=tmp_path)
+        for _ in range(10):
+            buffer.append(np.full((1600, 1), 0.25, dtype=np.float32))
+
+        path = buffer.close()
+
+        info = sf.info(str(path))
+        assert path.parent == tmp_path
+        assert info.frames == 16000
+        assert info.subtype == "PCM_16"
+        assert buffer.frames_written == 16000
+
+    def test_written_samples_roundtrip(self, tmp_path):
+        buffer = SpillToDiskBuffer(16000, 1, directory=tmp_path)
+        block = np.linspace(-0.5, 0.5, 1024, dtype=np.float32).reshape(-1, 1)
+        buffer.append(block)
+
+        data, _ = sf.read(str(buffer.close()), dtype="float32")
+
+        assert np.allclose(data, block[:, 0], atol=1e-4)
+
+    def test_close_is_idempotent(self, tmp_path):
+        buffer = SpillToDiskBuffer(16000, 1, directory=tmp_path)
+
+        assert buffer.close() == buffer.close()
@@ -0,0 +1,142 @@
+"""SqliteTranscriptStore のテスト。"""
+
+import sqlite3
+import time
+from datetime import datetime, timedelta
+
+from voct.domain.entities import TranscriptionResult, TranscriptOutput
+from voct.infra.sqlite_transcript_store import DB_FILENAME, SqliteTranscriptStore
+
+
+def _result(text: str) -> TranscriptionResult:
+    return TranscriptionResult(
+        text=text,
+        language="ja",
+        language_probability=0.98,
+        duration_seconds=2.0,
+        model_load_time_seconds=0.0,
+        transcription_time_seconds=0.4,
+    )
+
+
+class TestSqliteTranscriptStore:
+    def test_save_writes_row_with_metadata_in_wal_mode(self, tmp_path):
+        store = SqliteTranscriptStore()
+        timestamp = datetime(2025, 1, 2, 3, 4, 5, 678900)
+
+        path = store.save("会議の議事録を送ってください", tmp_path, "%Y%m%d", timestamp, _result("x"))
+        store.close()
+
+        assert path == tmp_path / DB_FILENAME
+        conn = sqlite3.connect(path)
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        row = conn.execute(
+            "SELECT created_at, text, language, duration_seconds, transcription_seconds, partial FROM utterances"
+        ).fetchone()
+        assert row == ("2025-01-02T03:04:05.678900", "会議の議事録を送ってください", "ja", 2.0, 0.4, 0)
+
+    def test_same_second_saves_do_not_collide(self, tmp_path):
+        """同じ秒に保存しても上書きされない。"""
+        store = SqliteTranscriptStore()
+        timestamp = datetime(2025, 1, 1, 12, 0, 0)
+
+        store.save("一つ目", tmp_path, "%Y%m%d-%H%M%S", timestamp)
+        store.save("二つ目", tmp_path, "%Y%m%d-%H%M%S", timestamp)
+
+        assert store.count(tmp_path) == 2
+        store.close()
+
+    def test_save_with_same_key_replaces_row(self, tmp_path):
+        """同じ key の保存は前の行を置き換え、検索にも新しいテキストだけが残る。"""
+        store = SqliteTranscriptStore()
+
+        store.save("古い議事録の結果", tmp_path, "%Y%m%d", key="abc")
+        store.save("新しい議事録の結果", tmp_path, "%Y%m%d", key="abc")
+        store.save("別の入力の結果", tmp_path, "%Y%m%d", key="def")
+
+        assert store.count(tmp_path) == 2
+        assert [hit.text for hit in store.search(tmp_path, "議事録")] == ["新しい議事録の結果"]
+        store.close()
+
+    def test_adds_key_column_to_existing_database(self, tmp_path):
+        """key の列がない古いデータベースにも列を足してから保存する。"""
+        conn = sqlite3.connect(tmp_path / DB_FILENAME)
+        conn.execute(
+            "CREATE TABLE utterances (id INTEGER PRIMARY KEY, created_at TEXT NOT NULL, text TEXT NOT NULL,"
+            " language TEXT, language_probability REAL, duration_seconds REAL, transcription_seconds REAL,"
+            " model_load_seconds REAL, partial INTEGER NOT NULL DEFAULT 0)"
+        )
+        conn.close()
+        store = SqliteTranscriptStore()
+
+        store.save("一つ目", tmp_path, "%Y%m%d", key="abc")
+        store.save("二つ目", tmp_path, "%Y%m%d", key="abc")
+
+        assert store.count(tmp_path) == 1
+        store.close()
+
+    def test_search_ranks_japanese_substring_matches(self, tmp_path):
+        store = SqliteTranscriptStore()
+        now = datetime(2025, 1, 1)
+        store.save_many(
+            [
+                TranscriptOutput("明日の会議の資料を準備する", now),
+                TranscriptOutput("会議室の予約を取り消す", now + timedelta(seconds=1)),
+                TranscriptOutput("昼ごはんを食べに行く", now + timedelta(seconds=2)),
+                TranscriptOutput("会議の資料と会議の議事録", now + timedelta(seconds=3)),
+            ],
+            tmp_path,
+            "",
+        )
+
+        hits = store.search(tmp_path, "会議の資料")
+
+        assert [hit.text for hit in hits] == ["会議の資料と会議の議事録", "明日の会議の資料を準備する"]
+        assert "[会議の資料]" in hits[0].snippet
+        assert hits[0].created_at == now + timedelta(seconds=3)
+        store.close()
+
+    def test_short_terms_are_matched_with_like(self, tmp_path):
+        """trigram で索引できない 2 文字以下の語も絞り込みに使える。"""
+        store = SqliteTranscriptStore()
+        now = datetime(2025, 1, 1)
+        store.save_many(
+            [TranscriptOutput(text, now) for text in ("東京で会議", "大阪で会議", "100%_ok")],
+            tmp_path,
+            "",
+        )
+
+        assert [hit.text for hit in store.search(tmp_path, "会議 大阪")] == ["大阪で会議"]
+        assert [hit.text for hit in store.search(tmp_path, "東京")] == ["東京で会議"]
+        assert [hit.text for hit in store.search(tmp_path, "%_")] == ["100%_ok"]
+        assert store.search(tmp_path, "  ") == []
+        store.close()
+
+    def test_query_syntax_is_escaped(self, tmp_path):
+        store = SqliteTranscriptStore()
+        store.save('say "hello" AND NOT bye', tmp_path, "")
+
+        assert len(store.search(tmp_path, '"hello" NOT')) == 1
+        store.close()
+
+    def test_search_over_100k_utterances_is_fast(self, tmp_path):
+        """10 万発話の履歴でも検索は数十ミリ秒以内に返る。"""
+        store = SqliteTranscriptStore()
+        start = datetime(2025, 1, 1)
+        topics = ["会議の資料", "来週の出張", "昼ごはん", "請求書の確認", "新機能の設計", "バグの修正"]
+        store.save_many(
+            [
+                TranscriptOutput(f"{topics[i % len(topics)]}について{i}番目のメモ", start + timedelta(seconds=i))
+                for i in range(100_000)
+            ],
+            tmp_path,
+            "",
+        )
+
+        t0 = time.perf_counter()
+        hits = store.search(tmp_path, "請求書の確認 99")
+        elapsed = time.perf_counter() - t0
+
+        assert hits and all("請求書の確認" in hit.text and "99" in hit.text for hit in hits)
+        assert elapsed < 0.2
+        store.close()
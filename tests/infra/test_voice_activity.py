@@ -0,0 +1,75 @@
+"""voice_activity の発話検出のテスト。"""
+
+import numpy as np
+
+from voct.domain.entities import VoxConfig
+from voct.infra.voice_activity import (
+    IDLE_CPU_BUDGET,
+    VoiceActivityDetector,
+    block_energy_db,
+    measure_idle_cpu,
+    spectral_flatness,
+)
+
+_SAMPLE_RATE = 16000
+_BLOCK = 1024
+
+
+def _voiced_block(amplitude: float = 0.1) -> np.ndarray:
+    """200 Hz の倍音を重ねた有声音らしいブロック。"""
+    t = np.arange(_BLOCK) / _SAMPLE_RATE
+    wave = sum(np.sin(2 * np.pi * 200 * k * t) / k for k in range(1, 6))
+    return (amplitude * wave).astype(np.float32)
+
+
+def _noise_block(db: float) -> np.ndarray:
+    rng = np.random.default_rng(1)
+    return (rng.standard_normal(_BLOCK) * 10 ** (db / 20)).astype(np.float32)
+
+
+class TestFeatures:
+    def test_energy_of_full_scale_square_is_zero_db(self):
+        assert abs(block_energy_db(np.ones(_BLOCK, dtype=np.float32))) < 1e-6
+
+    def test_flatness_separates_voice_from_white_noise(self):
+        """有声音の平坦度は低く、白色雑音は 1 に近い。"""
+        assert spectral_flatness(_voiced_block()) < 0.1
+        assert spectral_flatness(_noise_block(-20)) > 0.5
+
+
+class TestVoiceActivityDetector:
+    def _detector(self, **kwargs) -> VoiceActivityDetector:
+        return VoiceActivityDetector(VoxConfig(block_size=_BLOCK, **kwargs), _SAMPLE_RATE)
+
+    def test_quiet_noise_is_not_voice(self):
+        detector = self._detector()
+        assert not detector.is_voice(_noise_block(-60))
+
+    def test_loud_white_noise_is_not_voice(self):
+        """エネルギーが大きくても平坦なスペクトル（ファン音など）は音声とみなさない。"""
+        detector = self._detector()
+        assert not detector.is_voice(_noise_block(-20))
+
+    def test_activates_after_attack(self):
+        """attack_seconds 分の音声が続いてから発話開始になる。"""
+        detector = self._detector(attack_seconds=0.15)  # 1024 サンプル = 64ms なので 3 ブロック目で開始
+        states = [detector.update(_voiced_block()) for _ in range(3)]
+        assert states == [False, False, True]
+
+    def test_short_click_does_not_activate(self):
+        detector = self._detector(attack_seconds=0.15)
+        detector.update(_voiced_block())
+        detector.update(_noise_block(-60))
+        detector.update(_voiced_block())
+        assert not detector.active
+
+    def test_deactivates_after_hangover(self):
+        """無音が hangover_seconds 続くまで発話中を保つ。"""
+        detector = self._detector(attack_seconds=0.0, hangover_seconds=0.2)
+        detector.update(_voiced_block())
+        states = [detector.update(_noise_block(-60)) for _ in range(4)]
+        assert states == [True, True, True, False]
+
+    def test_idle_cpu_within_budget(self):
+        """無音時の検出処理が IDLE_CPU_BUDGET（1 コアの 1%）に収まる。"""
+        assert measure_idle_cpu(VoxConfig(), _SAMPLE_RATE, seconds=60.0) < IDLE_CPU_BUDGET
@@ -0,0 +1,164 @@
+"""VoxTrigger のテスト。"""
+
+import time
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from voct.domain.entities import RecordingConfig, TriggerKey, VoxConfig
+from voct.domain.ports import ContinuousRecorderPort
+from voct.infra.vox_trigger import VoxTrigger
+
+_SAMPLE_RATE = 16000
+_BLOCK = 1024
+
+
+class _FakeContinuousRecorder(ContinuousRecorderPort):
+    """feed() で渡したブロックを on_block に流すテスト用レコーダー。"""
+
+    def __init__(self) -> None:
+        self.config: RecordingConfig | None = None
+        self._on_block = None
+
+    def start(self, config, on_block) -> None:
+        self.config = config
+        self._on_block = on_block
+
+    def stop(self) -> int:
+        return 0
+
+    def feed(self, blocks) -> None:
+        for block in blocks:
+            self._on_block(block)
+
+
+def _voiced(value: float = 0.1) -> np.ndarray:
+    t = np.arange(_BLOCK) / _SAMPLE_RATE
+    wave = sum(np.sin(2 * np.pi * 200 * k * t) / k for k in range(1, 6))
+    return (value * wave).astype(np.float32)
+
+
+def _silence() -> np.ndarray:
+    return np.zeros(_BLOCK, dtype=np.float32)
+
+
+def _run(trigger: VoxTrigger, recorder: _FakeContinuousRecorder, blocks, on_press, on_release) -> None:
+    trigger.start(on_press, on_release, TriggerKey.ENTER)
+    recorder.feed(blocks)
+    trigger.stop()
+    trigger.join()
+
+
+class TestVoxTrigger:
+    def _make(self, **kwargs) -> tuple[VoxTrigger, _FakeContinuousRecorder]:
+        recorder = _FakeContinuousRecorder()
+        config = VoxConfig(block_size=_BLOCK, **kwargs)
+        return VoxTrigger(recorder, config, RecordingConfig(sample_rate=_SAMPLE_RATE)), recorder
+
+    def test_stream_uses_vox_block_size(self):
+        trigger, recorder = self._make()
+        _run(trigger, recorder, [], MagicMock(), MagicMock())
+        assert recorder.config.block_size == _BLOCK
+        assert recorder.config.sample_rate == _SAMPLE_RATE
+
+    def test_speech_fires_press_then_release(self):
+        """発話で押下、無音が続くと解放が 1 回ずつ呼ばれる。"""
+        trigger, recorder = self._make(attack_seconds=0.1, hangover_seconds=0.2)
+        events = []
+        blocks = [_silence()] * 5 + [_voiced()] * 10 + [_silence()] * 10
+        _run(trigger, recorder, blocks, lambda: events.append("press"), lambda: events.append("release"))
+        assert events == ["press", "release"]
+
+    def test_recording_includes_pre_roll_and_attack(self):
+        """押下前の pre_roll と attack 区間も録音の先頭に含まれる。"""
+        trigger, recorder = self._make(attack_seconds=0.1, hangover_seconds=0.2, pre_roll_seconds=0.1)
+        results = []
+
+        def on_press():
+            trigger.start_recording(RecordingConfig(sample_rate=_SAMPLE_RATE))
+
+        def on_release():
+            results.append(trigger.stop_recording())
+
+        blocks = [_silence()] * 10 + [_voiced(0.1 + i * 0.01) for i in range(8)] + [_silence()] * 10
+        _run(trigger, recorder, blocks, on_press, on_release)
+
+        audio = results[0]
+        first_voiced = np.max(np.abs(_voiced(0.1)))
+        # 先頭に pre_roll の無音があり、その後に最初の発話ブロックが続く
+        assert audio.data[0] == 0.0
+        assert np.isclose(np.max(np.abs(audio.data)), np.max(np.abs(_voiced(0.17))))
+        assert np.any(np.isclose(np.abs(audio.data), first_voiced))
+        assert audio.sample_rate == _SAMPLE_RATE
+
+    def test_recording_is_capped_by_timeout(self):
+        trigger, recorder = self._make(attack_seconds=0.0, hangover_seconds=0.1, pre_roll_seconds=0.0)
+        results = []
+        blocks = [_voiced()] * 40 + [_silence()] * 5
+        _run(
+            trigger,
+            recorder,
+            blocks,
+            lambda: trigger.start_recording(RecordingConfig(sample_rate=_SAMPLE_RATE, timeout_seconds=1.0)),
+            lambda: results.append(trigger.stop_recording()),
+        )
+        assert results[0].duration_seconds < 1.1
+
+    def test_spill_mode_returns_lazy_audio(self, tmp_path):
+        from voct.domain.entities import LazyAudioData
+
+        trigger, recorder = self._make(attack_seconds=0.0, hangover_seconds=0.1)
+        results = []
+        config = RecordingConfig(sample_rate=_SAMPLE_RATE, spill_to_disk=True, spill_directory=tmp_path)
+        _run(
+            trigger,
+            recorder,
+            [_voiced()] * 5 + [_silence()] * 3,
+            lambda: trigger.start_recording(config),
+            lambda: results.append(trigger.stop_recording()),
+        )
+        audio = results[0]
+        assert isinstance(audio, LazyAudioData)
+        assert audio.source_path.parent == tmp_path
+        assert audio.owned_temp_path == audio.source_path
+        assert audio.num_samples >= 5 * _BLOCK
+
+    def test_drives_push_to_talk_usecase_unchanged(self):
+        """PushToTalkUseCase の録音・リスナーとしてそのまま使える。"""
+        from voct.domain.entities import PushToTalkConfig, TranscriptionResult
+        from voct.usecase.push_to_talk import PushToTalkUseCase
+
+        trigger, recorder = self._make(attack_seconds=0.05, hangover_seconds=0.2)
+        transcriber = MagicMock()
+        transcriber.transcribe.return_value = TranscriptionResult(
+            text="こんにちは",
+            language="ja",
+            language_probability=0.99,
+            duration_seconds=1.0,
+            model_load_time_seconds=0.0,
+            transcription_time_seconds=0.0,
+        )
+        clipboard = MagicMock()
+        usecase = PushToTalkUseCase(
+            trigger,
+            MagicMock(),
+            transcriber,
+            clipboard,
+            MagicMock(),
+            MagicMock(),
+            trigger,
+        )
+
+        def feed_after_start(config, on_block):
+            _FakeContinuousRecorder.start(recorder, config, on_block)
+            recorder.feed([_voiced()] * 15 + [_silence()] * 6)
+            on_block(None)  # 検出スレッドを終了させる
+
+        recorder.start = feed_after_start
+        usecase.run(PushToTalkConfig(language="ja"))
+        for _ in range(100):
+            if not usecase.is_processing:
+                break
+            time.sleep(0.01)
+
+        clipboard.copy.assert_called_once_with("こんにちは")
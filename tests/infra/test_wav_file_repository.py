@@ -1,7 +1,9 @@
+from unittest.mock import patch
+
 import numpy as np
 import soundfile as sf
 
-from voct.domain.entities import AudioData
+from voct.domain.entities import AudioData, LazyAudioData
 from voct.infra.wav_file_repository import WavFileRepository
 
 
@@ -60,3 +62,73 @@ class TestWavFileRepository:
 
         assert loaded.sample_rate == audio.sample_rate
         assert np.allclose(loaded.data, original_data, atol=1e-4)
+
+    def test_load_lazy_returns_lazy_audio_data(self, tmp_path):
+        repo = WavFileRepository()
+        original_data = np.sin(np.linspace(0, 2 * np.pi, 16000)).astype(np.float32)
+        path = tmp_path / "lazy.wav"
+        repo.save(AudioData(data=original_data, sample_rate=16000, duration_seconds=1.0), path)
+
+        loaded = repo.load_lazy(path)
+
+        assert isinstance(loaded, LazyAudioData)
+        assert loaded.sample_rate == 16000
+        assert loaded.num_samples == 16000
+        assert loaded.duration_seconds == 1.0
+        assert loaded.source_path == path
+        assert loaded.owned_temp_path is None
+
+    def test_load_lazy_iter_blocks_matches_full_load(self, tmp_path):
+        repo = WavFileRepository()
+        original_data = (np.random.rand(40000).astype(np.float32) - 0.5) * 0.8
+        path = tmp_path / "blocks.wav"
+        repo.save(AudioData(data=original_data, sample_rate=16000, duration_seconds=2.5), path)
+
+        lazy = repo.load_lazy(path)
+        blocks = list(lazy.iter_blocks(4096))
+
+        assert all(block.dtype == np.float32 for block in blocks)
+        assert all(len(block) <= 4096 for block in blocks)
+        assert np.array_equal(np.concatenate(blocks), repo.load(path).data)
+
+    def test_load_lazy_memory_maps_pcm16_wav(self, tmp_path):
+        """PCM_16 WAV は np.memmap で読み込み、soundfile によるデコードを行わない。"""
+        repo = WavFileRepository()
+        path = tmp_path / "mapped.wav"
+        repo.save(AudioData(data=np.zeros(16000, dtype=np.float32), sample_rate=16000, duration_seconds=1.0), path)
+
+        with patch("voct.infra.wav_file_repository.np.memmap", wraps=np.memmap) as mock_memmap:
+            lazy = repo.load_lazy(path)
+            lazy.read(0, 1024)
+
+        mock_memmap.assert_called_once()
+
+    def test_load_lazy_falls_back_to_soundfile_for_non_pcm16(self, tmp_path):
+        original_data = np.sin(np.linspace(0, 4 * np.pi, 8000)).astype(np.float32)
+        path = tmp_path / "float.flac"
+        sf.write(str(path), original_data, 8000, subtype="PCM_24")
+
+        lazy = WavFileRepository().load_lazy(path)
+
+        assert lazy.num_samples == 8000
+        assert np.allclose(np.concatenate(list(lazy.iter_blocks(1000))), original_data, atol=1e-4)
+
+    def test_load_lazy_downmixes_stereo(self, tmp_path):
+        stereo = np.stack([np.full(1600, 0.5), np.full(1600, -0.25)], axis=1).astype(np.float32)
+        path = tmp_path / "stereo.wav"
+        sf.write(str(path), stereo, 16000, subtype="PCM_16")
+
+        lazy = WavFileRepository().load_lazy(path)
+
+        assert lazy.data.ndim == 1
+        assert np.allclose(lazy.data, 0.125, atol=1e-4)
+
+    def test_save_lazy_audio_data_roundtrip(self, tmp_path):
+        repo = WavFileRepository()
+        original_data = np.sin(np.linspace(0, 2 * np.pi, 16000)).astype(np.float32)
+        source = tmp_path / "source.wav"
+        repo.save(AudioData(data=original_data, sample_rate=16000, duration_seconds=1.0), source)
+
+        copied = repo.save(repo.load_lazy(source), tmp_path / "copy.wav")
+
+        assert np.array_equal(repo.load(copied).data, repo.load(source).data)
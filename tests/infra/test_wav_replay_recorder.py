@@ -0,0 +1,78 @@
+"""WavReplayRecorder のテスト。"""
+
+import time
+
+import numpy as np
+import pytest
+
+from voct.domain.entities import AudioData, RecordingConfig
+from voct.infra.wav_replay_recorder import WavReplayRecorder
+
+
+def _source(seconds: float = 1.0, sample_rate: int = 16000) -> AudioData:
+    data = np.arange(int(sample_rate * seconds), dtype=np.float32) / (sample_rate * seconds)
+    return AudioData(data=data, sample_rate=sample_rate, duration_seconds=seconds)
+
+
+class TestWavReplayRecorder:
+    def test_empty_source_is_rejected(self):
+        with pytest.raises(ValueError):
+            WavReplayRecorder(AudioData(data=np.zeros(0, dtype=np.float32), sample_rate=16000, duration_seconds=0.0))
+
+    def test_start_recording_is_nonblocking(self):
+        recorder = WavReplayRecorder(_source())
+
+        start = time.perf_counter()
+        recorder.start_recording(RecordingConfig())
+        elapsed = time.perf_counter() - start
+        recorder.stop_recording()
+
+        assert elapsed < 0.1
+
+    def test_recording_length_follows_elapsed_time(self):
+        """経過時間 × speed に相当する長さの音声が返る。"""
+        recorder = WavReplayRecorder(_source(seconds=2.0), speed=10.0)
+
+        recorder.start_recording(RecordingConfig(block_size=160))
+        time.sleep(0.1)
+        result = recorder.stop_recording()
+
+        assert 0.5 <= result.duration_seconds <= 1.5
+        assert result.sample_rate == 16000
+        assert result.data.dtype == np.float32
+
+    def test_consecutive_recordings_continue_from_cursor(self):
+        source = _source(seconds=1.0)
+        recorder = WavReplayRecorder(source, speed=20.0)
+        config = RecordingConfig(block_size=160)
+
+        recorder.start_recording(config)
+        time.sleep(0.02)
+        first = recorder.stop_recording()
+        recorder.start_recording(config)
+        time.sleep(0.02)
+        second = recorder.stop_recording()
+
+        assert second.data[0] == source.data[len(first.data) % len(source.data)]
+
+    def test_source_wraps_around(self):
+        """音源の末尾に達すると先頭から続ける。"""
+        source = _source(seconds=0.1)
+        recorder = WavReplayRecorder(source, speed=50.0)
+
+        recorder.start_recording(RecordingConfig(block_size=160, timeout_seconds=0.5))
+        time.sleep(0.05)
+        result = recorder.stop_recording()
+
+        assert result.duration_seconds > source.duration_seconds
+        assert result.data[len(source.data)] == source.data[0]
+
+    def test_timeout_caps_recording(self):
+        recorder = WavReplayRecorder(_source(), speed=100.0)
+        config = RecordingConfig(block_size=160, timeout_seconds=0.2)
+
+        recorder.start_recording(config)
+        time.sleep(0.05)
+        result = recorder.stop_recording()
+
+        assert result.duration_seconds <= config.timeout_seconds
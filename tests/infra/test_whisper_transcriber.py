@@ -1,14 +1,16 @@
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+from voct.domain.entities import TranscriptionSegment
 from voct.infra.whisper_transcriber import WhisperTranscriber
 
 
-def _make_mock_segment(text: str, start: float = 0.0, end: float = 1.0):
+def _make_mock_segment(text: str, start: float = 0.0, end: float = 1.0, avg_logprob: float = -0.2):
     seg = MagicMock()
     seg.text = text
     seg.start = start
     seg.end = end
+    seg.avg_logprob = avg_logprob
     return seg
 
 
@@ -113,3 +115,443 @@ class TestWhisperTranscriber:
         transcriber.transcribe(Path("/tmp/test.wav"), model_size="base")
 
         mock_model_cls.assert_called_once_with("base", device="cpu", compute_type="int8")
+
+    @patch("voct.infra.whisper_transcriber.WhisperModel")
+    def test_transcribe_calls_on_segment_per_segment(self, mock_model_cls):
+        mock_model = MagicMock()
+        mock_model_cls.return_value = mock_model
+        mock_info = MagicMock()
+        mock_info.language = "ja"
+        mock_info.language_probability = 0.9
+        mock_info.duration = 2.0
+        segments = [
+            _make_mock_segment("こんにちは", 0.0, 1.0, -0.1),
+            _make_mock_segment("世界", 1.0, 2.0, -0.3),
+        ]
+        mock_model.transcribe.return_value = (iter(segments), mock_info)
+        received = []
+
+        result = WhisperTranscriber().transcribe(Path("/tmp/test.wav"), on_segment=received.append)
+
+        assert received == [
+            TranscriptionSegment(text="こんにちは", start=0.0, end=1.0, avg_logprob=-0.1),
+            TranscriptionSegment(text="世界", start=1.0, end=2.0, avg_logprob=-0.3),
+        ]
+        assert result.segments == tuple(received)
+
+    @patch("voct.infra.whisper_transcriber.WhisperModel")
+    def test_stream_yields_before_decoding_finishes(self, mock_model_cls):
+        """stream() は後続セグメントのデコードを待たずに最初のセグメントを返す。"""
+        mock_model = MagicMock()
+        mock_model_cls.return_value = mock_model
+        mock_info = MagicMock()
+        mock_info.language = "ja"
+        mock_info.language_probability = 0.9
+        mock_info.duration = 2.0
+        decoded = []
+
+        def lazy_segments():
+            for text in ["一", "二"]:
+                decoded.append(text)
+                yield _make_mock_segment(text)
+
+        mock_model.transcribe.return_value = (lazy_segments(), mock_info)
+
+        stream = WhisperTranscriber().stream(Path("/tmp/test.wav"))
+        first = next(stream)
+
+        assert first.text == "一"
+        assert decoded == ["一"]
+
+    @patch("voct.infra.whisper_transcriber.WhisperModel")
+    def test_transcribe_measures_time_to_first_segment(self, mock_model_cls):
+        mock_model = MagicMock()
+        mock_model_cls.return_value = mock_model
+        mock_info = MagicMock()
+        mock_info.language = "ja"
+        mock_info.language_probability = 0.9
+        mock_info.duration = 2.0
+        mock_model.transcribe.return_value = (iter([_make_mock_segment("test")]), mock_info)
+
+        result = WhisperTranscriber().transcribe(Path("/tmp/test.wav"))
+
+        assert result.time_to_first_segment_seconds is not None
+        assert 0 <= result.time_to_first_segment_seconds <= result.transcription_time_seconds
+
+    @patch("voct.infra.whisper_transcriber.WhisperModel")
+    def test_transcribe_without_segments_has_no_time_to_first_segment(self, mock_model_cls):
+        mock_model = MagicMock()
+        mock_model_cls.return_value = mock_model
+        mock_info = MagicMock()
+        mock_info.language = "ja"
+        mock_info.language_probability = 0.5
+        mock_info.duration = 1.0
+        mock_model.transcribe.return_value = (iter([]), mock_info)
+
+        result = WhisperTranscriber().transcribe(Path("/tmp/test.wav"))
+
+        assert result.time_to_first_segment_seconds is None
+
+    @patch("voct.infra.whisper_transcriber.WhisperModel")
+    def test_transcribe_audio_passes_samples(self, mock_model_cls):
+        """transcribe_audio() は float32 の配列をそのまま faster-whisper に渡す。"""
+        import numpy as np
+
+        from voct.domain.entities import AudioData
+
+        mock_model = MagicMock()
+        mock_model_cls.return_value = mock_model
+        mock_info = MagicMock()
+        mock_info.language = "ja"
+        mock_info.language_probability = 0.9
+        mock_info.duration = 1.0
+        mock_model.transcribe.return_value = (iter([_make_mock_segment("配列")]), mock_info)
+        samples = np.zeros(16000, dtype=np.float32)
+
+        result = WhisperTranscriber().transcribe_audio(AudioData(data=samples, sample_rate=16000, duration_seconds=1.0))
+
+        assert result.text == "配列"
+        assert np.shares_memory(mock_model.transcribe.call_args[0][0], samples)
+
+    def test_transcribe_audio_rejects_other_sample_rates(self):
+        import numpy as np
+        import pytest
+
+        from voct.domain.entities import AudioData
+
+        audio = AudioData(data=np.zeros(8000, dtype=np.float32), sample_rate=8000, duration_seconds=1.0)
+
+        with pytest.raises(ValueError):
+            WhisperTranscriber().transcribe_audio(audio)
+
+    @patch("voct.infra.whisper_transcriber.BatchedInferencePipeline")
+    @patch("voct.infra.whisper_transcriber.WhisperModel")
+    def test_transcribe_batch_maps_segments_back_to_inputs(self, mock_model_cls, mock_pipeline_cls):
+        """transcribe_batch() は連結した音声のクリップ境界でセグメントを元の音声に振り分ける。"""
+        import numpy as np
+
+        mock_info = MagicMock()
+        mock_info.language = "ja"
+        mock_info.language_probability = 0.9
+        # 1 件目は 0.7 秒 → 1.0 秒に揃えられるため、2 件目は 1.0 秒から始まる
+        mock_pipeline_cls.return_value.transcribe.return_value = (
+            iter(
+                [
+                    _make_mock_segment("一件目", 0.0, 0.7),
+                    _make_mock_segment("二件目", 1.0, 2.5),
+                    _make_mock_segment("続き", 2.5, 3.0),
+                ]
+            ),
+            mock_info,
+        )
+        audios = [np.zeros(11200, dtype=np.float32), np.zeros(32000, dtype=np.float32)]
+
+        results = WhisperTranscriber().transcribe_batch(audios, "base", "ja", batch_size=4)
+
+        kwargs = mock_pipeline_cls.return_value.transcribe.call_args[1]
+        assert kwargs["clip_timestamps"] == [{"start": 0.0, "end": 1.0}, {"start": 1.0, "end": 3.0}]
+        assert kwargs["batch_size"] == 4
+        assert kwargs["vad_filter"] is False
+        assert [r.text for r in results] == ["一件目", "二件目続き"]
+        assert results[1].segments[0].start == 0.0
+        assert results[0].duration_seconds == 0.7
+        mock_model_cls.assert_called_once_with("base", device="cpu", compute_type="int8")
+
+    @patch("voct.infra.whisper_transcriber.BatchedInferencePipeline")
+    @patch("voct.infra.whisper_transcriber.WhisperModel")
+    def test_transcribe_batch_splits_long_audio_into_30s_clips(self, mock_model_cls, mock_pipeline_cls):
+        import numpy as np
+
+        mock_pipeline_cls.return_value.transcribe.return_value = (iter([]), MagicMock())
+
+        WhisperTranscriber().transcribe_batch([np.zeros(16000 * 45, dtype=np.float32)])
+
+        kwargs = mock_pipeline_cls.return_value.transcribe.call_args[1]
+        assert kwargs["clip_timestamps"] == [{"start": 0.0, "end": 30.0}, {"start": 30.0, "end": 45.0}]
+
+    @patch("voct.infra.whisper_transcriber.WhisperModel")
+    def test_pinned_model_loads_from_local_path(self, mock_model_cls, tmp_path):
+        """固定済みのモデルはローカルパスと local_files_only で読み込み、ロード時間を記録する。"""
+        from voct.infra.local_model_store import LocalModelStore
+
+        source = tmp_path / "converted"
+        source.mkdir()
+        (source / "model.bin").write_bytes(b"weights")
+        store = LocalModelStore(tmp_path / "store")
+        store.import_model("base", source)
+
+        WhisperTranscriber(model_store=store).load("base")
+
+        mock_model_cls.assert_called_once_with(
+            str(tmp_path / "store" / "base"), device="cpu", compute_type="int8", local_files_only=True
+        )
+        assert store.get("base").load_seconds is not None
+
+    @patch("voct.infra.whisper_transcriber.WhisperModel")
+    def test_unpinned_model_falls_back_to_name(self, mock_model_cls, tmp_path):
+        from voct.infra.local_model_store import LocalModelStore
+
+        WhisperTranscriber(model_store=LocalModelStore(tmp_path)).load("small")
+
+        mock_model_cls.assert_called_once_with("small", device="cpu", compute_type="int8")
+
+    @patch("voct.infra.whisper_transcriber.WhisperModel")
+    def test_cpu_threads_caps_inference_threads(self, mock_model_cls):
+        """cpu_threads を指定すると CTranslate2 の推論スレッド数をその数に制限する。"""
+        WhisperTranscriber(cpu_threads=3).load("base")
+
+        mock_model_cls.assert_called_once_with("base", device="cpu", compute_type="int8", cpu_threads=3)
+
+    @patch("voct.infra.whisper_transcriber.WhisperModel")
+    def test_resident_model_is_loaded_once(self, mock_model_cls):
+        """keep_resident=True ではモデルを保持し、2 回目以降のロード時間は 0 になる。"""
+        mock_info = MagicMock()
+        mock_model_cls.return_value.transcribe.side_effect = lambda *a, **k: (iter([]), mock_info)
+        transcriber = WhisperTranscriber()
+
+        transcriber.transcribe(Path("/tmp/a.wav"))
+        second = transcriber.transcribe(Path("/tmp/b.wav"))
+
+        assert mock_model_cls.call_count == 1
+        assert second.model_load_time_seconds == 0.0
+
+    @patch("voct.infra.whisper_transcriber.WhisperModel")
+    def test_non_resident_model_is_reloaded(self, mock_model_cls):
+        transcriber = WhisperTranscriber(keep_resident=False)
+
+        transcriber.load("base")
+        transcriber.load("base")
+
+        assert mock_model_cls.call_count == 2
+
+    @patch("voct.infra.whisper_transcriber.current_rss_bytes")
+    @patch("voct.infra.whisper_transcriber.WhisperModel")
+    def test_evict_drops_resident_models_and_reports_released_memory(self, mock_model_cls, mock_rss):
+        mock_rss.side_effect = [500_000_000, 200_000_000]
+        transcriber = WhisperTranscriber()
+        transcriber.warm("base")
+
+        released = transcriber.evict()
+        transcriber.warm("base")
+
+        assert released == 300_000_000
+        assert mock_model_cls.call_count == 2
+
+    @patch("voct.infra.whisper_transcriber.WhisperModel")
+    def test_is_resident_follows_warm_and_evict(self, mock_model_cls):
+        transcriber = WhisperTranscriber()
+        assert not transcriber.is_resident("small")
+
+        transcriber.warm("small")
+        assert transcriber.is_resident("small")
+
+        transcriber.evict()
+        assert not transcriber.is_resident("small")
+
+    @patch("voct.infra.whisper_transcriber.WhisperModel")
+    def test_resident_model_does_not_wait_for_other_loads(self, mock_model_cls):
+        """別のモデルのロード中でも、保持済みのモデルはロードの完了を待たずに返る。"""
+        import threading
+
+        loading = threading.Event()
+        release = threading.Event()
+
+        def fake_model(model_size, **kwargs):
+            if model_size == "medium":
+                loading.set()
+                release.wait(timeout=5.0)
+            return MagicMock()
+
+        mock_model_cls.side_effect = fake_model
+        transcriber = WhisperTranscriber()
+        transcriber.warm("base")
+        medium = threading.Thread(target=transcriber.warm, args=("medium",))
+        medium.start()
+        loading.wait(timeout=5.0)
+        try:
+            assert transcriber.load("base") == 0.0
+            assert transcriber.is_resident("base")
+            assert not transcriber.is_resident("medium")
+        finally:
+            release.set()
+            medium.join()
+        assert transcriber.is_resident("medium")
+
+    @patch("voct.infra.whisper_transcriber.WhisperModel")
+    def test_concurrent_loads_of_same_model_load_once(self, mock_model_cls):
+        import threading
+
+        transcriber = WhisperTranscriber()
+        threads = [threading.Thread(target=transcriber.warm, args=("small",)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        mock_model_cls.assert_called_once()
+
+    @patch("voct.infra.whisper_transcriber.WhisperModel")
+    def test_decode_options_are_passed_to_faster_whisper(self, mock_model_cls):
+        from voct.domain.entities import DecodeOptions
+
+        mock_model_cls.return_value.transcribe.return_value = (iter([]), MagicMock())
+
+        WhisperTranscriber().transcribe(Path("/tmp/a.wav"), options=DecodeOptions(beam_size=1, best_of=1))
+
+        kwargs = mock_model_cls.return_value.transcribe.call_args[1]
+        assert kwargs["beam_size"] == 1
+        assert kwargs["best_of"] == 1
+        assert kwargs["vad_filter"] is True
+
+    @patch("voct.infra.whisper_transcriber.WhisperModel")
+    def test_vad_filter_can_be_disabled(self, mock_model_cls):
+        from voct.domain.entities import DecodeOptions
+
+        mock_model_cls.return_value.transcribe.return_value = (iter([]), MagicMock())
+
+        WhisperTranscriber().transcribe(Path("/tmp/a.wav"), options=DecodeOptions(vad_filter=False))
+
+        assert mock_model_cls.return_value.transcribe.call_args[1]["vad_filter"] is False
+
+
+def _adversarial_audio(kind: str, seconds: float = 20.0):
+    """幻覚やループを誘発しやすい音声（白色雑音・同じ音程の繰り返し）を生成する。"""
+    import numpy as np
+
+    t = np.arange(int(16000 * seconds)) / 16000
+    if kind == "noise":
+        return (np.random.default_rng(0).standard_normal(t.size) * 0.3).astype(np.float32)
+    # 0.25 秒ごとに鳴る 440Hz のビープ音
+    gate = (t % 0.5) < 0.25
+    return (0.5 * np.sin(2 * np.pi * 440 * t) * gate).astype(np.float32)
+
+
+class _LoopingModel:
+    """1 セグメントに segment_seconds かかり、音声の長さを超えても同じ文を出し続ける幻覚ループの代役。"""
+
+    def __init__(self, segment_seconds: float = 0.02) -> None:
+        self.segment_seconds = segment_seconds
+        self.kwargs: dict = {}
+
+    def transcribe(self, audio, **kwargs):
+        import itertools
+        import time
+
+        self.kwargs = kwargs
+        info = MagicMock(language="ja", language_probability=0.5, duration=len(audio) / 16000)
+
+        def segments():
+            for i in itertools.count():
+                time.sleep(self.segment_seconds)
+                yield _make_mock_segment("ありがとうございました。", i * 0.5, i * 0.5 + 0.5)
+
+        return segments(), info
+
+
+class TestDeadlineBoundedDecoding:
+    @patch("voct.infra.whisper_transcriber.WhisperModel")
+    def test_deadline_returns_partial_result(self, mock_model_cls):
+        """期限を過ぎるとデコード中のセグメントまでで打ち切り、partial として返す。"""
+        from voct.domain.entities import AudioData, DecodeOptions
+
+        mock_model_cls.return_value = _LoopingModel(segment_seconds=0.02)
+        audio = _adversarial_audio("noise")
+
+        result = WhisperTranscriber().transcribe_audio(
+            AudioData(data=audio, sample_rate=16000, duration_seconds=20.0),
+            options=DecodeOptions(deadline_seconds=0.1),
+        )
+
+        assert result.partial
+        assert 0 < len(result.segments) < 40
+        assert result.text.startswith("ありがとうございました。")
+
+    @patch("voct.infra.whisper_transcriber.WhisperModel")
+    def test_completed_decode_is_not_partial(self, mock_model_cls):
+        from voct.domain.entities import DecodeOptions
+
+        mock_info = MagicMock(language="ja", language_probability=0.9, duration=1.0)
+        mock_model_cls.return_value.transcribe.return_value = (iter([_make_mock_segment("短い", 0.0, 1.0)]), mock_info)
+
+        result = WhisperTranscriber().transcribe(Path("/tmp/a.wav"), options=DecodeOptions(deadline_seconds=0.0))
+
+        assert result.text == "短い"
+        assert not result.partial
+
+    @patch("voct.infra.whisper_transcriber.WhisperModel")
+    def test_fallback_settings_are_passed_to_faster_whisper(self, mock_model_cls):
+        from voct.domain.entities import DecodeOptions
+
+        mock_model_cls.return_value.transcribe.return_value = (iter([]), MagicMock())
+        options = DecodeOptions(temperature=(0.0,), compression_ratio_threshold=1.8, condition_on_previous_text=False)
+
+        WhisperTranscriber().transcribe(Path("/tmp/a.wav"), options=options)
+
+        kwargs = mock_model_cls.return_value.transcribe.call_args[1]
+        assert kwargs["temperature"] == [0.0]
+        assert kwargs["compression_ratio_threshold"] == 1.8
+        assert kwargs["condition_on_previous_text"] is False
+
+    @patch("voct.infra.whisper_transcriber.WhisperModel")
+    def test_tail_latency_is_bounded_on_adversarial_audio(self, mock_model_cls):
+        """雑音・繰り返し音で幻覚ループが起きても、p99 レイテンシは期限 + 1 セグメント分に収まる。"""
+        import time
+
+        import numpy as np
+
+        from voct.domain.entities import AudioData, DecodeOptions
+
+        segment_seconds = 0.01
+        deadline = 0.05
+        mock_model_cls.return_value = _LoopingModel(segment_seconds=segment_seconds)
+        transcriber = WhisperTranscriber()
+        options = DecodeOptions(deadline_seconds=deadline)
+
+        latencies = []
+        for kind in ("noise", "tone") * 10:
+            audio = AudioData(data=_adversarial_audio(kind, 5.0), sample_rate=16000, duration_seconds=5.0)
+            t0 = time.perf_counter()
+            result = transcriber.transcribe_audio(audio, options=options)
+            latencies.append(time.perf_counter() - t0)
+            assert result.partial
+
+        assert np.percentile(latencies, 99) < deadline + segment_seconds + 0.05
+
+    @patch("voct.infra.whisper_transcriber.BatchedInferencePipeline")
+    @patch("voct.infra.whisper_transcriber.WhisperModel")
+    def test_batch_deadline_marks_results_partial(self, mock_model_cls, mock_pipeline_cls):
+        import numpy as np
+
+        from voct.domain.entities import DecodeOptions
+
+        mock_pipeline_cls.return_value = _LoopingModel(segment_seconds=0.02)
+
+        results = WhisperTranscriber().transcribe_batch(
+            [np.zeros(16000, dtype=np.float32)] * 2, options=DecodeOptions(deadline_seconds=0.05)
+        )
+
+        assert all(result.partial for result in results)
+
+    def test_real_model_respects_deadline_on_noise(self):
+        """ローカルに tiny モデルがあれば、実際のモデルでも期限付近で打ち切られることを確認する。"""
+        import time
+
+        import pytest
+
+        from voct.domain.entities import AudioData, DecodeOptions
+
+        try:
+            from faster_whisper.utils import download_model
+
+            download_model("tiny", local_files_only=True)
+        except Exception:
+            pytest.skip("tiny モデルがローカルにない")
+
+        transcriber = WhisperTranscriber()
+        transcriber.load("tiny")
+        audio = AudioData(data=_adversarial_audio("noise", 60.0), sample_rate=16000, duration_seconds=60.0)
+
+        t0 = time.perf_counter()
+        transcriber.transcribe_audio(audio, "tiny", "ja", options=DecodeOptions(deadline_seconds=1.0))
+
+        assert time.perf_counter() - t0 < 1.0 + 5.0
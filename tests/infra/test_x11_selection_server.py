@@ -0,0 +1,53 @@
+"""serve_x11_selection のテスト。"""
+
+from unittest.mock import MagicMock, patch
+
+from Xlib import X, Xatom
+
+from voct.infra.x11_selection_server import _answer_request, serve_x11_selection
+
+_ATOMS = {"CLIPBOARD": 100, "TARGETS": 101, "UTF8_STRING": 102, "TEXT": 103}
+
+
+def _request(target: int, prop: int = 200) -> MagicMock:
+    return MagicMock(target=target, property=prop, time=0, selection=_ATOMS["CLIPBOARD"])
+
+
+class TestAnswerRequest:
+    def test_utf8_request_receives_text(self):
+        request = _request(_ATOMS["UTF8_STRING"])
+
+        _answer_request(request, "こんにちは".encode(), _ATOMS)
+
+        request.requestor.change_property.assert_called_once_with(200, _ATOMS["UTF8_STRING"], 8, "こんにちは".encode())
+        notify = request.requestor.send_event.call_args[0][0]
+        assert notify.property == 200
+
+    def test_targets_lists_supported_formats(self):
+        request = _request(_ATOMS["TARGETS"])
+
+        _answer_request(request, b"", _ATOMS)
+
+        prop, type_, fmt, targets = request.requestor.change_property.call_args[0]
+        assert (prop, type_, fmt) == (200, Xatom.ATOM, 32)
+        assert _ATOMS["UTF8_STRING"] in targets and Xatom.STRING in targets
+
+    def test_unsupported_target_is_refused(self):
+        request = _request(999)
+
+        _answer_request(request, b"text", _ATOMS)
+
+        request.requestor.change_property.assert_not_called()
+        assert request.requestor.send_event.call_args[0][0].property == X.NONE
+
+
+class TestServeX11Selection:
+    @patch("Xlib.display.Display", side_effect=RuntimeError("no display"))
+    def test_reports_error_when_display_is_unavailable(self, mock_display):
+        conn = MagicMock()
+
+        serve_x11_selection(conn)
+
+        status, detail = conn.send.call_args[0][0]
+        assert status == "error"
+        assert "no display" in detail
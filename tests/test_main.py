@@ -0,0 +1,66 @@
+"""voct のコマンドライン（main.py）のテスト。"""
+
+import subprocess
+import sys
+import textwrap
+
+import numpy as np
+
+# 文字起こしを偽物に差し替えて `voct stream` を実行する子プロセスの本体
+_STREAM_WITH_FAKE_TRANSCRIBER = textwrap.dedent(
+    """
+    import importlib
+    import sys
+
+    from voct.domain.entities import TranscriptionResult
+
+    main = importlib.import_module("voct.main")
+
+
+    class _FakeTranscriber:
+        def load(self, model_size):
+            return 0.0
+
+        def transcribe_audio(self, audio, model_size="base", language=None, on_segment=None, options=None):
+            return TranscriptionResult("こんにちは", "ja", 0.99, audio.duration_seconds, 0.0, 0.0)
+
+
+    main._make_transcriber = _FakeTranscriber
+    try:
+        main.main(["stream"])
+    except SystemExit as e:
+        print(f"終了コード {e.code}", file=sys.stderr)
+        raise
+    """
+)
+
+
+def _speech_and_silence_pcm(cycles: int) -> bytes:
+    """1 秒の音と 1 秒の無音を繰り返す 16kHz モノラル s16le。"""
+    t = np.arange(16000) / 16000
+    tone = (np.sin(2 * np.pi * 440 * t) * 16000).astype("<i2")
+    silence = np.zeros(16000, dtype="<i2")
+    return np.concatenate([tone, silence] * cycles).tobytes()
+
+
+class TestStreamCommand:
+    def test_closed_reader_exits_quietly(self):
+        """出力の読み手が先に閉じたら終了コード 0 で終わり、標準エラーはその後も使える。"""
+        process = subprocess.Popen(
+            [sys.executable, "-c", _STREAM_WITH_FAKE_TRANSCRIBER],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        process.stdout.close()
+        try:
+            process.stdin.write(_speech_and_silence_pcm(5))
+            process.stdin.close()
+        except BrokenPipeError:
+            pass
+        stderr = process.stderr.read().decode("utf-8")
+        returncode = process.wait(timeout=30)
+
+        assert returncode == 0, stderr
+        assert "終了コード 0" in stderr
+        assert "Traceback" not in stderr
@@ -0,0 +1,65 @@
+"""BatchThroughputBenchmarkUseCase のテスト。"""
+
+import time
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from voct.domain.entities import AudioData, DecodeOptions
+from voct.usecase.batch_benchmark import BatchThroughputBenchmarkUseCase
+
+
+def _audio(seconds: float) -> AudioData:
+    return AudioData(data=np.zeros(int(16000 * seconds), dtype=np.float32), sample_rate=16000, duration_seconds=seconds)
+
+
+class TestBatchThroughputBenchmarkUseCase:
+    def test_runs_every_clip_through_both_transcribers(self):
+        sequential = MagicMock()
+        batched = MagicMock()
+        audios = [_audio(1.0), _audio(2.0)]
+
+        report = BatchThroughputBenchmarkUseCase(sequential, batched).execute(audios, "base", "ja")
+
+        # 計測前のウォームアップで 1 回ずつ多く呼ばれる
+        assert sequential.transcribe_audio.call_count == 3
+        assert batched.transcribe_audio.call_count == 3
+        assert report.clips == 2
+        assert report.audio_seconds == 3.0
+
+    def test_sequential_runs_without_vad_like_the_batch(self):
+        """バッチ推論は VAD を使わないため、逐次推論も VAD なしで比較する。"""
+        sequential = MagicMock()
+
+        BatchThroughputBenchmarkUseCase(sequential, MagicMock()).execute([_audio(1.0)])
+
+        for call in sequential.transcribe_audio.call_args_list:
+            assert call.kwargs["options"] == DecodeOptions(vad_filter=False)
+
+    def test_batched_requests_are_submitted_concurrently(self):
+        """マイクロバッチ側は全件を同時に投入するため、待ち時間が重なって短く済む。"""
+        sequential = MagicMock()
+        sequential.transcribe_audio.side_effect = lambda *args, **kwargs: time.sleep(0.05)
+        batched = MagicMock()
+        batched.transcribe_audio.side_effect = lambda *args, **kwargs: time.sleep(0.05)
+
+        report = BatchThroughputBenchmarkUseCase(sequential, batched).execute([_audio(1.0)] * 4)
+
+        assert report.sequential_seconds >= 0.2
+        assert report.batched_seconds < report.sequential_seconds
+        assert report.speedup > 1.0
+
+    def test_warm_up_is_not_timed(self):
+        """最初の呼び出し（モデルのロードなど）にかかった時間は計測に含めない。"""
+
+        def slow_first_call() -> MagicMock:
+            transcriber = MagicMock()
+            transcriber.transcribe_audio.side_effect = lambda *args, **kwargs: (
+                time.sleep(0.3) if transcriber.transcribe_audio.call_count == 1 else None
+            )
+            return transcriber
+
+        report = BatchThroughputBenchmarkUseCase(slow_first_call(), slow_first_call()).execute([_audio(1.0)] * 2)
+
+        assert report.sequential_seconds < 0.3
+        assert report.batched_seconds < 0.3
@@ -0,0 +1,225 @@
+"""BatchTranscriptionUseCase のテスト。"""
+
+import multiprocessing
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from voct.domain.entities import AudioData, BatchConfig, ManifestStatus, TranscriptionResult
+from voct.infra.jsonl_batch_manifest import JsonlBatchManifest
+from voct.usecase.batch_transcription import BatchTranscriptionUseCase
+
+
+def _result(text: str) -> TranscriptionResult:
+    return TranscriptionResult(
+        text=text,
+        language="ja",
+        language_probability=0.9,
+        duration_seconds=1.0,
+        model_load_time_seconds=0.0,
+        transcription_time_seconds=0.1,
+    )
+
+
+class _SizeAudioFile:
+    """ファイルの大きさを音声の秒数とみなす AudioFilePort の代わり。"""
+
+    def load_lazy(self, file_path: Path) -> AudioData:
+        return AudioData(data=None, sample_rate=16000, duration_seconds=float(file_path.stat().st_size))
+
+
+class _RecordingTranscriber:
+    def __init__(self, delay: float = 0.0, failures: dict[str, int] | None = None) -> None:
+        self.delay = delay
+        self.failures = dict(failures or {})
+        self.calls: list[str] = []
+        self._lock = threading.Lock()
+
+    def transcribe(self, audio_path, model_size="base", language=None, on_segment=None, options=None):
+        with self._lock:
+            self.calls.append(audio_path.name)
+            if self.failures.get(audio_path.name, 0) > 0:
+                self.failures[audio_path.name] -= 1
+                raise RuntimeError("decode error")
+        time.sleep(self.delay)
+        return _result(f"{audio_path.stem}の内容")
+
+
+def _make_inputs(directory: Path, sizes: list[int]) -> list[Path]:
+    directory.mkdir(exist_ok=True)
+    paths = []
+    for i, size in enumerate(sizes):
+        path = directory / f"{i:03d}.wav"
+        path.write_bytes(bytes([i % 256]) * size)
+        paths.append(path)
+    return paths
+
+
+def _usecase(tmp_path, transcriber):
+    from voct.infra.markdown_transcript_file import MarkdownTranscriptFile
+
+    manifest = JsonlBatchManifest(tmp_path / "out" / "manifest.jsonl")
+    return BatchTranscriptionUseCase(_SizeAudioFile(), transcriber, MarkdownTranscriptFile(), manifest), manifest
+
+
+def _config(tmp_path, **kwargs) -> BatchConfig:
+    return BatchConfig(output_dir=tmp_path / "out", backoff_seconds=0.01, **kwargs)
+
+
+def _run_batch_until_killed(input_dir: str, tmp_dir: str) -> None:
+    """強制終了される子プロセスの本体。1 件ずつ時間をかけて文字起こしする。"""
+    tmp_path = Path(tmp_dir)
+    usecase, _ = _usecase(tmp_path, _RecordingTranscriber(delay=0.05))
+    usecase.execute(sorted(Path(input_dir).iterdir()), _config(tmp_path, workers=2))
+
+
+class TestBatchTranscriptionUseCase:
+    def test_transcribes_all_and_records_manifest(self, tmp_path, capsys):
+        inputs = _make_inputs(tmp_path / "in", [3, 1, 2])
+        transcriber = _RecordingTranscriber()
+        usecase, manifest = _usecase(tmp_path, transcriber)
+
+        report = usecase.execute(inputs, _config(tmp_path))
+
+        assert (report.total, report.completed, report.skipped, report.failed) == (3, 3, 0, 0)
+        assert report.audio_seconds == 6.0
+        items = manifest.load()
+        assert all(item.status is ManifestStatus.DONE and item.attempts == 1 for item in items)
+        assert all(item.output_path.read_text(encoding="utf-8") == f"{item.input_path.stem}の内容" for item in items)
+        assert all(item.transcription_seconds is not None for item in items)
+
+    def test_rerun_skips_completed_inputs(self, tmp_path):
+        """同じマニフェストで再実行すると、完了済みの入力は文字起こししない。"""
+        inputs = _make_inputs(tmp_path / "in", [1, 1])
+        usecase, _ = _usecase(tmp_path, _RecordingTranscriber())
+        usecase.execute(inputs[:1], _config(tmp_path))
+        transcriber = _RecordingTranscriber()
+        usecase, _ = _usecase(tmp_path, transcriber)
+
+        report = usecase.execute(inputs, _config(tmp_path))
+
+        assert transcriber.calls == ["001.wav"]
+        assert (report.completed, report.skipped) == (1, 1)
+
+    def test_replaced_failed_input_starts_over(self, tmp_path):
+        """失敗した入力の内容が変わっていたら、別の入力として試行回数を数え直す。"""
+        inputs = _make_inputs(tmp_path / "in", [1])
+        usecase, _ = _usecase(tmp_path, _RecordingTranscriber(failures={"000.wav": 5}))
+        usecase.execute(inputs, _config(tmp_path, max_attempts=1))
+        inputs[0].write_bytes(b"fixed")
+        usecase, manifest = _usecase(tmp_path, _RecordingTranscriber())
+
+        usecase.execute(inputs, _config(tmp_path))
+
+        item = manifest.load()[0]
+        assert (item.status, item.attempts, item.duration_seconds) == (ManifestStatus.DONE, 1, 5.0)
+
+    def test_redo_with_sqlite_store_does_not_duplicate_rows(self, tmp_path):
+        """保存後にマニフェストへ記録できずにやり直しても、sqlite の行は入力ごとに 1 件のままになる。"""
+        from voct.infra.sqlite_transcript_store import SqliteTranscriptStore
+
+        inputs = _make_inputs(tmp_path / "in", [1, 2])
+        store = SqliteTranscriptStore()
+        for _ in range(2):
+            manifest = JsonlBatchManifest(tmp_path / "manifest.jsonl")
+            usecase = BatchTranscriptionUseCase(_SizeAudioFile(), _RecordingTranscriber(), store, manifest)
+            usecase.execute(inputs, _config(tmp_path))
+            (tmp_path / "manifest.jsonl").unlink()
+
+        assert store.count(tmp_path / "out") == 2
+        store.close()
+
+    def test_longest_inputs_go_first(self, tmp_path):
+        inputs = _make_inputs(tmp_path / "in", [2, 9, 1, 5])
+        transcriber = _RecordingTranscriber()
+        usecase, _ = _usecase(tmp_path, transcriber)
+
+        usecase.execute(inputs, _config(tmp_path, workers=1))
+
+        assert transcriber.calls == ["001.wav", "003.wav", "000.wav", "002.wav"]
+
+    def test_failures_are_retried_with_backoff(self, tmp_path):
+        """失敗した入力は待ち時間を倍々に延ばしながら試し直す。"""
+        inputs = _make_inputs(tmp_path / "in", [1])
+        transcriber = _RecordingTranscriber(failures={"000.wav": 2})
+        usecase, manifest = _usecase(tmp_path, transcriber)
+
+        t0 = time.perf_counter()
+        report = usecase.execute(inputs, BatchConfig(output_dir=tmp_path / "out", backoff_seconds=0.1))
+
+        assert time.perf_counter() - t0 >= 0.3
+        assert report.completed == 1
+        assert manifest.load()[0].attempts == 3
+
+    def test_exhausted_attempts_are_failed_and_retried_next_run(self, tmp_path):
+        inputs = _make_inputs(tmp_path / "in", [1])
+        usecase, manifest = _usecase(tmp_path, _RecordingTranscriber(failures={"000.wav": 5}))
+
+        report = usecase.execute(inputs, _config(tmp_path, max_attempts=2))
+
+        assert report.failed == 1
+        item = manifest.load()[0]
+        assert (item.status, item.attempts, item.error) == (ManifestStatus.FAILED, 2, "RuntimeError('decode error')")
+
+        usecase, manifest = _usecase(tmp_path, _RecordingTranscriber())
+        report = usecase.execute(inputs, _config(tmp_path))
+        assert report.completed == 1
+        assert manifest.load()[0].attempts == 3
+
+    def test_unreadable_input_is_failed(self, tmp_path):
+        transcriber = _RecordingTranscriber()
+        usecase, manifest = _usecase(tmp_path, transcriber)
+
+        report = usecase.execute([tmp_path / "missing.wav"], _config(tmp_path))
+
+        assert report.failed == 1
+        assert transcriber.calls == []
+        assert manifest.load()[0].status is ManifestStatus.FAILED
+
+    def test_decoder_probes_duration_without_audio_file(self, tmp_path):
+        """decoder を渡すと、長さは AudioFilePort ではなく decoder で調べる。"""
+        inputs = _make_inputs(tmp_path / "in", [1, 1])
+        decoder = MagicMock()
+        decoder.probe_seconds.side_effect = lambda path: {"000.wav": 2.0, "001.wav": None}[path.name]
+        audio_file = MagicMock()
+        transcriber = _RecordingTranscriber()
+        usecase = BatchTranscriptionUseCase(
+            audio_file, transcriber, MagicMock(), JsonlBatchManifest(tmp_path / "manifest.jsonl"), decoder=decoder
+        )
+
+        report = usecase.execute(inputs, _config(tmp_path, workers=1))
+
+        audio_file.load_lazy.assert_not_called()
+        assert report.completed == 2
+        assert report.audio_seconds == 2.0
+        assert transcriber.calls == ["000.wav", "001.wav"]
+
+    def test_resumes_after_process_is_killed(self, tmp_path):
+        """実行中のプロセスを強制終了しても、再実行で完了済みを飛ばして残りだけを文字起こしする。"""
+        inputs = _make_inputs(tmp_path / "in", list(range(1, 41)))
+        manifest_path = tmp_path / "out" / "manifest.jsonl"
+        process = multiprocessing.get_context("spawn").Process(
+            target=_run_batch_until_killed, args=(str(tmp_path / "in"), str(tmp_path))
+        )
+        process.start()
+        manifest = JsonlBatchManifest(manifest_path)
+        deadline = time.perf_counter() + 30.0
+        while time.perf_counter() < deadline:
+            if sum(item.status is ManifestStatus.DONE for item in manifest.load()) >= 6:
+                break
+            time.sleep(0.01)
+        process.kill()
+        process.join()
+
+        done_before = {item.input_path.name for item in manifest.load() if item.status is ManifestStatus.DONE}
+        assert 6 <= len(done_before) < 40
+
+        transcriber = _RecordingTranscriber()
+        usecase, manifest = _usecase(tmp_path, transcriber)
+        report = usecase.execute(inputs, _config(tmp_path))
+
+        assert not done_before & set(transcriber.calls)
+        assert len(transcriber.calls) == 40 - len(done_before)
+        assert (report.completed + report.skipped, report.failed) == (40, 0)
+        assert len(list((tmp_path / "out").glob("*.md"))) == 40
@@ -0,0 +1,73 @@
+"""CaptureStressBenchmarkUseCase のテスト。"""
+
+import threading
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from voct.domain.entities import CpuPartition, RecordingConfig
+from voct.usecase.capture_stress_benchmark import CaptureStressBenchmarkUseCase
+
+
+class _FakeRecorder:
+    """start で数ブロック渡し、stop で分割の有無に応じたオーバーフロー回数を返す録音の代役。"""
+
+    def __init__(self) -> None:
+        self.configs: list[RecordingConfig] = []
+
+    def start(self, config, on_block) -> None:
+        self.configs.append(config)
+        for _ in range(4):
+            on_block(np.zeros(256, dtype=np.float32))
+
+    def stop(self) -> int:
+        return 0 if self.configs[-1].cpu_partition is not None else 7
+
+
+class TestCaptureStressBenchmarkUseCase:
+    def test_compares_without_and_with_partition(self):
+        """分割なし → 分割ありの順に録音し、それぞれのオーバーフロー回数を返す。"""
+        recorder = _FakeRecorder()
+        partition = CpuPartition(capture_cores=frozenset({1}), inference_cores=frozenset({0}))
+
+        results = CaptureStressBenchmarkUseCase(recorder, MagicMock(), workers=2).execute(
+            RecordingConfig(block_size=256), partition, seconds=0.01
+        )
+
+        assert [r.partitioned for r in results] == [False, True]
+        assert [r.overflow_count for r in results] == [7, 0]
+        assert [r.blocks for r in results] == [4, 4]
+        assert recorder.configs[0].cpu_partition is None
+        assert recorder.configs[1].cpu_partition == partition
+        assert recorder.configs[1].block_size == 256
+
+    def test_load_workers_run_during_recording_and_stop(self):
+        """負荷スレッドは録音中に partition を受け取って動き、録音後に停止される。"""
+        partition = CpuPartition(capture_cores=frozenset({1}), inference_cores=frozenset({0}))
+        seen = []
+        lock = threading.Lock()
+
+        def _load(worker_partition, stop) -> None:
+            with lock:
+                seen.append(worker_partition)
+            stop.wait()
+
+        CaptureStressBenchmarkUseCase(_FakeRecorder(), _load, workers=3).execute(RecordingConfig(), partition, 0.01)
+
+        assert seen.count(None) == 3
+        assert seen.count(partition) == 3
+
+    def test_load_workers_stop_when_recorder_fails(self):
+        recorder = MagicMock()
+        recorder.start.side_effect = RuntimeError("no device")
+        stopped = []
+
+        def _load(_partition, stop) -> None:
+            stop.wait()
+            stopped.append(True)
+
+        with pytest.raises(RuntimeError):
+            CaptureStressBenchmarkUseCase(recorder, _load, workers=2).execute(RecordingConfig(), CpuPartition(), 0.01)
+
+        assert stopped == [True, True]
@@ -0,0 +1,201 @@
+"""IdleEvictionListener のテスト。"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+from voct.domain.entities import TriggerKey
+from voct.domain.ports import HotkeyListenerPort
+from voct.usecase.idle_eviction import IdleEvictionListener
+
+
+class _ManualListener(HotkeyListenerPort):
+    """テストから press()/release() を呼んでキー操作を発生させるリスナー。"""
+
+    def start(self, on_press, on_release, trigger_key) -> None:
+        self.press = on_press
+        self.release = on_release
+
+    def join(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+
+def _wait_for(condition, timeout: float = 2.0) -> bool:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if condition():
+            return True
+        time.sleep(0.005)
+    return condition()
+
+
+def _make(idle_seconds: float = 0.05, warm_seconds: float = 0.5):
+    inner = _ManualListener()
+    residency = MagicMock()
+    residency.warm.return_value = warm_seconds
+    residency.evict.return_value = 300_000_000
+    listener = IdleEvictionListener(inner, residency, "base", idle_seconds)
+    on_press, on_release = MagicMock(), MagicMock()
+    listener.start(on_press, on_release, TriggerKey.ENTER)
+    return listener, inner, residency, on_press, on_release
+
+
+class TestIdleEvictionListener:
+    def test_press_warms_model_and_forwards(self):
+        """押下でモデルをバックグラウンドで読み込み、元のコールバックにも伝える。"""
+        listener, inner, residency, on_press, _ = _make(idle_seconds=60)
+
+        inner.press()
+
+        on_press.assert_called_once()
+        assert _wait_for(lambda: residency.warm.called)
+        residency.warm.assert_called_once_with("base")
+        listener.stop()
+
+    def test_press_does_not_wait_for_warm(self):
+        """モデルの読み込み中でも押下コールバックはすぐに呼ばれる。"""
+        listener, inner, residency, on_press, _ = _make(idle_seconds=60)
+        loading = threading.Event()
+        residency.warm.side_effect = lambda model_size: loading.wait(1.0) and 0.0
+
+        t0 = time.perf_counter()
+        inner.press()
+        elapsed = time.perf_counter() - t0
+        loading.set()
+
+        assert elapsed < 0.5
+        on_press.assert_called_once()
+        listener.stop()
+
+    def test_evicts_after_idle_period(self):
+        listener, inner, residency, _, on_release = _make(idle_seconds=0.05)
+
+        inner.press()
+        inner.release()
+
+        on_release.assert_called_once()
+        assert _wait_for(lambda: residency.evict.called)
+        assert listener.stats.evictions == 1
+        assert listener.stats.released_bytes == 300_000_000
+        listener.stop()
+
+    def test_press_before_timeout_cancels_eviction(self):
+        listener, inner, residency, _, _ = _make(idle_seconds=0.2)
+
+        inner.press()
+        inner.release()
+        time.sleep(0.05)
+        inner.press()
+        time.sleep(0.3)
+
+        residency.evict.assert_not_called()
+        listener.stop()
+
+    def test_press_while_eviction_waits_for_warm_keeps_model(self):
+        """読み込み中に発火した解放は読み込みの完了を待ち、その間に押下があれば取り消される。"""
+        listener, inner, residency, _, _ = _make(idle_seconds=60)
+        loading = threading.Event()
+        residency.warm.side_effect = lambda model_size: loading.wait(1.0) and 0.0
+
+        inner.press()
+        assert _wait_for(lambda: residency.warm.called)
+        evict = threading.Thread(target=listener._evict, args=(listener._generation,))
+        evict.start()
+        inner.press()
+        loading.set()
+        evict.join()
+
+        residency.evict.assert_not_called()
+        listener.stop()
+
+    def test_press_during_eviction_warms_after_it(self):
+        """解放中の押下による読み込みは、解放が終わってから行う。"""
+        listener, inner, residency, _, _ = _make(idle_seconds=60)
+        evicting = threading.Event()
+        calls = []
+
+        def evict() -> int:
+            calls.append("evict")
+            evicting.wait(1.0)
+            return 0
+
+        def warm(model_size: str) -> float:
+            calls.append("warm")
+            return 0.0
+
+        residency.evict.side_effect = evict
+        residency.warm.side_effect = warm
+
+        inner.press()
+        assert _wait_for(lambda: calls == ["warm"])
+        eviction = threading.Thread(target=listener._evict, args=(listener._generation,))
+        eviction.start()
+        assert _wait_for(lambda: calls == ["warm", "evict"])
+        inner.press()
+        time.sleep(0.05)
+        evicting.set()
+        eviction.join()
+
+        assert _wait_for(lambda: calls == ["warm", "evict", "warm"])
+        listener.stop()
+
+    def test_reload_latency_is_tracked_after_eviction(self):
+        """解放後の押下で再読み込みし、その時間を集計する。初回ロードは数えない。"""
+        listener, inner, residency, _, _ = _make(idle_seconds=0.05, warm_seconds=0.8)
+
+        inner.press()
+        inner.release()
+        assert _wait_for(lambda: listener.stats.evictions == 1)
+        inner.press()
+
+        assert _wait_for(lambda: listener.stats.reloads == 1)
+        assert residency.warm.call_count == 2
+        assert listener.stats.mean_reload_seconds == 0.8
+        listener.stop()
+
+    def test_resident_model_is_not_warmed_again(self):
+        listener, inner, residency, _, _ = _make(idle_seconds=60)
+
+        inner.press()
+        inner.release()
+        inner.press()
+
+        assert _wait_for(lambda: residency.warm.called)
+        time.sleep(0.05)
+        residency.warm.assert_called_once()
+        listener.stop()
+
+    def test_reload_rewarms_router_candidates(self):
+        """ルーターがある場合は、解放後の押下でルーターの候補をまとめて読み込み直す。"""
+        inner = _ManualListener()
+        residency = MagicMock()
+        residency.evict.return_value = None
+        router = MagicMock()
+        router.warm_candidates.return_value = 1.5
+        listener = IdleEvictionListener(inner, residency, "base", 0.05, router=router)
+        listener.start(MagicMock(), MagicMock(), TriggerKey.ENTER)
+
+        inner.press()
+        inner.release()
+        assert _wait_for(lambda: residency.evict.called)
+        inner.press()
+
+        assert _wait_for(lambda: router.warm_candidates.call_count == 2)
+        router.warm_candidates.assert_called_with("base")
+        residency.warm.assert_not_called()
+        assert _wait_for(lambda: listener.stats.reloads == 1)
+        listener.stop()
+
+    def test_add_hotkey_is_forwarded_to_inner_listener(self):
+        """追加のホットキーは元のリスナーに任せる。"""
+        inner = MagicMock()
+        inner.add_hotkey.return_value = True
+        listener = IdleEvictionListener(inner, MagicMock(), "base", 60)
+        callback = MagicMock()
+
+        assert listener.add_hotkey(TriggerKey.F2, callback)
+        inner.add_hotkey.assert_called_once_with(TriggerKey.F2, callback)
+        assert not _ManualListener().add_hotkey(TriggerKey.F2, callback)
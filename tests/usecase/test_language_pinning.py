@@ -0,0 +1,79 @@
+"""SessionLanguagePinner のテスト。"""
+
+from voct.domain.entities import TranscriptionResult
+from voct.usecase.language_pinning import SessionLanguagePinner
+
+
+def _result(language: str, probability: float) -> TranscriptionResult:
+    return TranscriptionResult(
+        text="x",
+        language=language,
+        language_probability=probability,
+        duration_seconds=1.0,
+        model_load_time_seconds=0.0,
+        transcription_time_seconds=0.1,
+    )
+
+
+class TestSessionLanguagePinner:
+    def test_first_cycle_detects_language(self):
+        pinner = SessionLanguagePinner(threshold=0.8, recheck_interval=10)
+
+        assert pinner.language_for_next_cycle() is None
+
+    def test_confident_detection_pins_language(self):
+        """確信度が閾値以上なら以降のサイクルで検出言語を固定する。"""
+        pinner = SessionLanguagePinner(threshold=0.8, recheck_interval=10)
+
+        changed = pinner.observe(None, _result("ja", 0.95))
+
+        assert changed is True
+        assert pinner.pinned_language == "ja"
+        assert pinner.language_for_next_cycle() == "ja"
+
+    def test_low_confidence_detection_does_not_pin(self):
+        pinner = SessionLanguagePinner(threshold=0.8, recheck_interval=10)
+
+        changed = pinner.observe(None, _result("ja", 0.5))
+
+        assert changed is False
+        assert pinner.language_for_next_cycle() is None
+
+    def test_recheck_after_interval(self):
+        """recheck_interval サイクルごとに言語検出をやり直す。"""
+        pinner = SessionLanguagePinner(threshold=0.8, recheck_interval=2)
+        pinner.observe(None, _result("ja", 0.95))
+
+        pinner.observe("ja", _result("ja", 1.0))
+        assert pinner.language_for_next_cycle() == "ja"
+        pinner.observe("ja", _result("ja", 1.0))
+        assert pinner.language_for_next_cycle() is None
+
+    def test_recheck_updates_pinned_language(self):
+        pinner = SessionLanguagePinner(threshold=0.8, recheck_interval=1)
+        pinner.observe(None, _result("ja", 0.95))
+        pinner.observe("ja", _result("ja", 1.0))
+
+        changed = pinner.observe(None, _result("en", 0.9))
+
+        assert changed is True
+        assert pinner.language_for_next_cycle() == "en"
+
+    def test_low_confidence_recheck_keeps_pinned_language(self):
+        pinner = SessionLanguagePinner(threshold=0.8, recheck_interval=1)
+        pinner.observe(None, _result("ja", 0.95))
+        pinner.observe("ja", _result("ja", 1.0))
+
+        changed = pinner.observe(None, _result("en", 0.4))
+
+        assert changed is False
+        assert pinner.language_for_next_cycle() == "ja"
+
+    def test_zero_interval_never_rechecks(self):
+        pinner = SessionLanguagePinner(threshold=0.8, recheck_interval=0)
+        pinner.observe(None, _result("ja", 0.95))
+
+        for _ in range(100):
+            pinner.observe("ja", _result("ja", 1.0))
+
+        assert pinner.language_for_next_cycle() == "ja"
@@ -0,0 +1,192 @@
+"""LiveCaptionUseCase のテスト。"""
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from voct.domain.entities import LiveCaptionConfig, RecordingConfig, TranscriptionResult
+from voct.usecase.live_caption import LiveCaptionUseCase, remove_overlap
+
+
+def _result(text: str) -> TranscriptionResult:
+    return TranscriptionResult(
+        text=text,
+        language="ja",
+        language_probability=0.99,
+        duration_seconds=1.0,
+        model_load_time_seconds=0.0,
+        transcription_time_seconds=0.1,
+    )
+
+
+def _make_usecase(texts=None, delay: float = 0.0):
+    recorder = MagicMock()
+    recorder.stop.return_value = 0
+    transcriber = MagicMock()
+    transcript_log = MagicMock()
+    texts = list(texts or [])
+    windows = []
+
+    def fake_transcribe_audio(audio, model_size, language):
+        windows.append(audio)
+        time.sleep(delay)
+        return _result(texts.pop(0) if texts else "")
+
+    transcriber.transcribe_audio.side_effect = fake_transcribe_audio
+    usecase = LiveCaptionUseCase(recorder, transcriber, transcript_log)
+    return usecase, recorder, transcriber, transcript_log, windows
+
+
+def _config(**kwargs) -> LiveCaptionConfig:
+    defaults = dict(
+        window_seconds=1.0,
+        overlap_seconds=0.25,
+        min_window_seconds=0.5,
+        recording_config=RecordingConfig(sample_rate=1000, block_size=100),
+    )
+    defaults.update(kwargs)
+    return LiveCaptionConfig(**defaults)
+
+
+def _feed(recorder, seconds: float, sample_rate: int = 1000, block_size: int = 100):
+    on_block = recorder.start.call_args[0][1]
+    for _ in range(int(seconds * sample_rate / block_size)):
+        on_block(np.zeros(block_size, dtype=np.float32))
+
+
+class TestRemoveOverlap:
+    def test_removes_repeated_prefix(self):
+        assert remove_overlap("今日はいい天気です", "天気です。明日は雨", 10) == "。明日は雨"
+
+    def test_keeps_text_without_overlap(self):
+        assert remove_overlap("こんにちは", "さようなら", 10) == "さようなら"
+
+    def test_ignores_single_character_match(self):
+        assert remove_overlap("ですね", "ねこがいる", 10) == "ねこがいる"
+
+    def test_respects_max_chars(self):
+        assert remove_overlap("abcdef", "abcdefgh", 3) == "abcdefgh"
+
+
+class TestLiveCaptionUseCase:
+    def test_windows_overlap(self):
+        """窓は window_seconds の長さで、overlap_seconds ずつ重なる。"""
+        usecase, recorder, transcriber, transcript_log, windows = _make_usecase(["a1", "b2", "c3"])
+
+        usecase.start(_config())
+        _feed(recorder, 1.0)
+        time.sleep(0.05)
+        _feed(recorder, 0.8)
+        usecase.stop()
+
+        assert len(windows[0].data) == 1000
+        assert len(windows[1].data) == 1000
+        assert [line.start_seconds for line in usecase.lines[:2]] == [0.0, 0.75]
+
+    def test_boundary_text_is_deduplicated(self):
+        usecase, recorder, transcriber, transcript_log, windows = _make_usecase(["今日はいい天気", "い天気ですね"])
+
+        usecase.start(_config())
+        _feed(recorder, 1.0)
+        time.sleep(0.05)
+        _feed(recorder, 0.8)
+        usecase.stop()
+
+        assert [line.text for line in usecase.lines] == ["今日はいい天気", "ですね"]
+
+    def test_lines_are_appended_to_markdown(self, capsys):
+        usecase, recorder, transcriber, transcript_log, windows = _make_usecase(["こんにちは"])
+        output_path = Path("/tmp/live.md")
+
+        usecase.start(_config(output_path=output_path))
+        _feed(recorder, 1.0)
+        usecase.stop()
+
+        transcript_log.append.assert_called_once_with("- **00:00:00** こんにちは", output_path)
+        assert "[00:00:00] こんにちは" in capsys.readouterr().out
+
+    def test_stop_flushes_remaining_audio(self):
+        """停止時に窓に満たない残りの音声も文字起こしする。"""
+        usecase, recorder, transcriber, transcript_log, windows = _make_usecase(["残り"])
+
+        usecase.start(_config())
+        _feed(recorder, 0.6)
+        usecase.stop()
+
+        assert len(windows) == 1
+        assert len(windows[0].data) == 600
+        assert usecase.lines[0].text == "残り"
+
+    def test_stale_pending_window_is_skipped(self):
+        """ワーカーが処理中に複数の窓が溜まると古い窓を捨てる。"""
+        usecase, recorder, transcriber, transcript_log, windows = _make_usecase(delay=0.2)
+
+        usecase.start(_config())
+        _feed(recorder, 1.0)
+        time.sleep(0.05)
+        _feed(recorder, 3.0)
+        usecase.stop()
+
+        assert usecase.skipped_windows >= 1
+
+    def test_lagging_window_is_dropped(self):
+        usecase, recorder, transcriber, transcript_log, windows = _make_usecase(delay=0.2)
+
+        usecase.start(_config(max_lag_seconds=0.1))
+        _feed(recorder, 1.0)
+        time.sleep(0.05)
+        _feed(recorder, 0.8)
+        usecase.stop()
+
+        assert len(windows) == 1
+        assert usecase.skipped_windows >= 1
+
+    def test_lag_is_measured(self):
+        usecase, recorder, transcriber, transcript_log, windows = _make_usecase(["a"], delay=0.05)
+
+        usecase.start(_config())
+        _feed(recorder, 1.0)
+        usecase.stop()
+
+        assert usecase.lines[0].lag_seconds >= 0.05
+
+    def test_stop_reports_overflows(self):
+        usecase, recorder, transcriber, transcript_log, windows = _make_usecase()
+        recorder.stop.return_value = 3
+
+        usecase.start(_config())
+        usecase.stop()
+
+        assert usecase.overflow_count == 3
+
+    def test_failed_window_is_skipped_and_worker_continues(self, capsys):
+        """文字起こしが失敗した窓はスキップ扱いにし、次の窓の処理を続ける。"""
+        usecase, recorder, transcriber, transcript_log, windows = _make_usecase()
+        transcriber.transcribe_audio.side_effect = [RuntimeError("decode error"), _result("次")]
+
+        usecase.start(_config())
+        _feed(recorder, 1.0)
+        time.sleep(0.05)
+        _feed(recorder, 0.75)
+        usecase.stop()
+
+        assert usecase.skipped_windows == 1
+        assert [line.text for line in usecase.lines] == ["次"]
+        assert "decode error" in capsys.readouterr().out
+
+    def test_stop_does_not_block_on_dead_worker(self):
+        """ワーカーが終了していても、停止時に待ち行列への投入で固まらない。"""
+        usecase, recorder, transcriber, transcript_log, windows = _make_usecase()
+        usecase.start(_config())
+        usecase._queue.put(None)
+        usecase._worker.join()
+        _feed(recorder, 1.6)
+
+        stopper = threading.Thread(target=usecase.stop, daemon=True)
+        stopper.start()
+        stopper.join(timeout=2.0)
+
+        assert not stopper.is_alive()
@@ -0,0 +1,157 @@
+"""ModelRouter のテスト。"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from voct.domain.entities import RoutingConfig
+from voct.domain.ports import ModelResidencyPort
+from voct.usecase.model_router import BEAM_SEARCH, GREEDY, ModelRouter
+
+
+class _FakeResidency(ModelResidencyPort):
+    """warm() したモデルを常駐扱いにし、evict() ですべて手放す常駐ポート。"""
+
+    def __init__(self, load_seconds: float = 0.0) -> None:
+        self.resident: set[str] = set()
+        self._load_seconds = load_seconds
+
+    def warm(self, model_size: str) -> float:
+        if model_size in self.resident:
+            return 0.0
+        self.resident.add(model_size)
+        return self._load_seconds
+
+    def evict(self) -> int | None:
+        self.resident.clear()
+        return None
+
+    def is_resident(self, model_size: str) -> bool:
+        return model_size in self.resident
+
+
+def _router(target: float = 1.5, values: dict | None = None, residency=None, **kwargs) -> ModelRouter:
+    history = MagicMock()
+    history.load.return_value = dict(values or {})
+    return ModelRouter(RoutingConfig(latency_target_seconds=target, **kwargs), history, residency)
+
+
+def _resident(router: ModelRouter, *models: str) -> None:
+    """ロード時間を無視できるよう、指定モデルを常駐させる。"""
+    if router._residency is None:
+        router._residency = _FakeResidency()
+    for model in models:
+        router._residency.warm(model)
+
+
+class TestModelRouter:
+    def test_short_utterance_gets_larger_model(self):
+        """短い発話ほど目標内に収まる大きいモデルが選ばれる。"""
+        values = {"tiny:beam5": 0.05, "base:beam5": 0.1, "small:beam5": 0.3, "medium:beam5": 0.8}
+        router = _router(target=1.5, values=values)
+        _resident(router, "tiny", "base", "small", "medium")
+
+        assert router.route(1.0).model_size == "medium"
+        assert router.route(4.0).model_size == "small"
+        assert router.route(12.0).model_size == "base"
+
+    def test_greedy_is_tried_before_smaller_model(self):
+        """ビームサーチで収まらなければ、同じモデルの貪欲デコードを先に試す。"""
+        values = {"small:beam5": 0.4, "small:beam1": 0.2}
+        router = _router(target=1.5, values=values, model_sizes=("base", "small"))
+        _resident(router, "base", "small")
+
+        decision = router.route(5.0)
+
+        assert decision.model_size == "small"
+        assert decision.options == GREEDY
+        assert decision.predicted_seconds == pytest.approx(1.0)
+
+    def test_falls_back_to_smallest_greedy(self):
+        router = _router(target=0.01, model_sizes=("tiny", "base"))
+
+        decision = router.route(30.0)
+
+        assert decision.model_size == "tiny"
+        assert decision.options == GREEDY
+
+    def test_unloaded_model_includes_load_time(self):
+        """未ロードのモデルは予測にロード時間が加わる。"""
+        router = _router(values={"small:beam5": 0.3, "small:load": 3.0})
+
+        assert router.predict("small", BEAM_SEARCH, 2.0) == pytest.approx(3.6)
+        _resident(router, "small")
+        assert router.predict("small", BEAM_SEARCH, 2.0) == pytest.approx(0.6)
+
+    def test_observe_updates_rtf_with_ewma_and_saves(self):
+        """実測 RTF は指数移動平均で反映され、ロード時間とともに履歴に保存される。"""
+        from voct.domain.entities import RoutingDecision
+
+        history = MagicMock()
+        history.load.return_value = {"base:beam5": 0.1}
+        router = ModelRouter(RoutingConfig(ewma_alpha=0.5), history)
+
+        router.observe(RoutingDecision("base", BEAM_SEARCH, 0.2), 2.0, 0.6, 1.2)
+
+        saved = history.save.call_args[0][0]
+        assert saved["base:beam5"] == pytest.approx(0.2)
+        assert saved["base:load"] == pytest.approx(1.2)
+
+    def test_slower_machine_shifts_routing_down(self):
+        """実測が遅くなると、同じ長さの発話でも小さいモデルに切り替わる。"""
+        from voct.domain.entities import RoutingDecision
+
+        router = _router(target=1.5, values={"small:beam5": 0.3}, model_sizes=("base", "small"), ewma_alpha=1.0)
+        _resident(router, "base", "small")
+        assert router.route(4.0).model_size == "small"
+
+        router.observe(RoutingDecision("small", BEAM_SEARCH, 1.2), 4.0, 4.0, 0.0)
+        router.observe(RoutingDecision("small", GREEDY, 1.2), 4.0, 2.0, 0.0)
+
+        assert router.route(4.0).model_size == "base"
+
+    def test_greedy_prior_derives_from_beam_measurement(self):
+        router = _router(values={"base:beam5": 0.2})
+        _resident(router, "base")
+
+        assert router.predict("base", GREEDY, 1.0) == pytest.approx(0.12)
+
+    def test_small_becomes_selectable_after_warming(self):
+        """ロード時間の目安が目標を超えるモデルも、候補を読み込んでおけば選ばれる。"""
+        residency = _FakeResidency(load_seconds=2.5)
+        router = _router(target=1.5, residency=residency, model_sizes=("tiny", "base", "small"))
+        assert router.route(2.0).model_size != "small"
+
+        router.warm_candidates("base")
+
+        assert router.route(2.0).model_size == "small"
+        assert router._history.save.call_args[0][0]["small:load"] == pytest.approx(2.5)
+
+    def test_warm_candidates_loads_default_and_next_size_only(self):
+        """メモリを抑えるため、既定のモデルと次に大きい候補だけを読み込む。"""
+        residency = _FakeResidency(load_seconds=1.0)
+        router = _router(residency=residency)
+
+        total = router.warm_candidates("base")
+
+        assert residency.resident == {"base", "small"}
+        assert total == pytest.approx(2.0)
+
+    def test_warm_candidates_for_unknown_model_loads_smallest(self):
+        residency = _FakeResidency()
+        router = _router(residency=residency, model_sizes=("tiny", "base"))
+
+        router.warm_candidates("large-v3")
+
+        assert residency.resident == {"tiny"}
+
+    def test_evicted_model_pays_load_time_again(self):
+        """解放されたモデルは常駐扱いのままにせず、ロード時間を予測に加える。"""
+        residency = _FakeResidency()
+        router = _router(values={"small:beam5": 0.3, "small:load": 3.0}, residency=residency)
+        residency.warm("small")
+        assert router.predict("small", BEAM_SEARCH, 2.0) == pytest.approx(0.6)
+
+        residency.evict()
+
+        assert router.predict("small", BEAM_SEARCH, 2.0) == pytest.approx(3.6)
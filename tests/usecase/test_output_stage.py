@@ -0,0 +1,143 @@
+"""OutputStage と出力先のテスト。"""
+
+import threading
+import time
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from voct.domain.entities import TranscriptOutput
+from voct.domain.ports import OutputSinkPort
+from voct.usecase.output_stage import ClipboardSink, OutputStage, TranscriptFileSink
+
+
+class _RecordingSink(OutputSinkPort):
+    """write の呼び出しを記録し、必要なら指定秒数だけ待たせる出力先。"""
+
+    def __init__(self, name: str, delay: float = 0.0, log: list | None = None) -> None:
+        self._name = name
+        self.delay = delay
+        self.batches: list[list[str]] = []
+        self.log = log if log is not None else []
+        self.gate = threading.Event()
+        self.gate.set()
+        self.entered = threading.Event()
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def write(self, outputs: list[TranscriptOutput]) -> None:
+        self.entered.set()
+        self.gate.wait()
+        time.sleep(self.delay)
+        self.batches.append([output.text for output in outputs])
+        self.log.append((self._name, time.perf_counter()))
+
+
+class TestOutputStage:
+    def test_submit_returns_without_waiting_for_sinks(self):
+        sink = _RecordingSink("slow", delay=0.3)
+        stage = OutputStage([sink])
+
+        t0 = time.perf_counter()
+        stage.submit("a")
+        elapsed = time.perf_counter() - t0
+
+        assert elapsed < 0.1
+        assert stage.flush(timeout=2.0)
+        assert sink.batches == [["a"]]
+        stage.close()
+
+    def test_outputs_keep_order_and_are_batched_while_sink_is_busy(self):
+        """出力先が書き出し中に届いた結果は順番を保ったまま次の 1 回の write にまとめられる。"""
+        sink = _RecordingSink("disk")
+        sink.gate.clear()
+        stage = OutputStage([sink])
+
+        stage.submit("1")
+        assert sink.entered.wait(timeout=2.0)
+        for text in ("2", "3", "4"):
+            stage.submit(text)
+        sink.gate.set()
+        stage.flush(timeout=2.0)
+
+        assert sink.batches == [["1"], ["2", "3", "4"]]
+        stats = stage.close()[0]
+        assert (stats.outputs, stats.writes, stats.pending) == (4, 2, 0)
+
+    def test_slow_disk_does_not_delay_clipboard(self):
+        """クリップボードは先に更新され、遅いファイル保存を待たない。"""
+        log: list = []
+        clipboard = _RecordingSink("clipboard", log=log)
+        disk = _RecordingSink("transcript", delay=0.2, log=log)
+        stage = OutputStage([clipboard, disk])
+
+        stage.submit("text")
+        stage.flush(timeout=2.0)
+
+        assert [name for name, _ in log] == ["clipboard", "transcript"]
+        clipboard_stats, disk_stats = stage.close()
+        assert clipboard_stats.max_latency_seconds < 0.15
+        assert disk_stats.max_latency_seconds >= 0.2
+
+    def test_slow_write_is_counted_as_timeout(self, capsys):
+        sink = _RecordingSink("transcript", delay=0.1)
+        stage = OutputStage([sink], timeout_seconds=2.0, timeouts={"transcript": 0.05})
+
+        stage.submit("text")
+        stage.flush(timeout=2.0)
+
+        assert stage.close()[0].timeouts == 1
+        assert "transcript" in capsys.readouterr().out
+
+    def test_failing_sink_is_reported_and_others_continue(self, capsys):
+        failing = MagicMock(spec=OutputSinkPort)
+        failing.name = "broken"
+        failing.write.side_effect = OSError("disk full")
+        ok = _RecordingSink("clipboard")
+        stage = OutputStage([failing, ok])
+
+        stage.submit("text")
+        stage.flush(timeout=2.0)
+
+        broken_stats, ok_stats = stage.close()
+        assert broken_stats.failures == 1
+        assert ok_stats.outputs == 1
+        assert "disk full" in capsys.readouterr().out
+
+    def test_close_gives_up_on_stuck_sink_after_timeout(self, capsys):
+        """書き出しが終わらない出力先があっても close は timeout で戻る。"""
+        sink = _RecordingSink("stuck")
+        sink.gate.clear()
+        stage = OutputStage([sink], timeout_seconds=0.1)
+        stage.submit("text")
+
+        t0 = time.perf_counter()
+        stats = stage.close()[0]
+
+        assert time.perf_counter() - t0 < 1.0
+        assert stats.pending == 1
+        assert "stuck" in capsys.readouterr().out
+        sink.gate.set()
+
+
+class TestSinks:
+    def test_clipboard_sink_copies_latest_only(self):
+        clipboard = MagicMock()
+        now = datetime.now()
+
+        ClipboardSink(clipboard).write([TranscriptOutput("古い", now), TranscriptOutput("新しい", now)])
+
+        clipboard.copy.assert_called_once_with("新しい")
+
+    def test_transcript_sink_saves_each_with_its_timestamp(self, tmp_path):
+        """溜まった結果は save_many にまとめて渡し、各ファイル名には結果が確定した時刻を使う。"""
+        from voct.infra.markdown_transcript_file import MarkdownTranscriptFile
+
+        first = TranscriptOutput("1", datetime(2025, 1, 1, 12, 0, 0))
+        second = TranscriptOutput("2", datetime(2025, 1, 1, 12, 0, 5))
+
+        TranscriptFileSink(MarkdownTranscriptFile(), tmp_path, "%H%M%S").write([first, second])
+
+        assert (tmp_path / "120000.md").read_text(encoding="utf-8") == "1"
+        assert (tmp_path / "120005.md").read_text(encoding="utf-8") == "2"
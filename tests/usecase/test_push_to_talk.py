@@ -47,6 +47,15 @@ def _make_mocks(duration: float = 1.0):
     return recorder, audio_file, transcriber, clipboard, transcript_file, notifier, listener
 
 
+def _wait_for(condition, timeout: float = 2.0) -> bool:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if condition():
+            return True
+        time.sleep(0.005)
+    return condition()
+
+
 class TestPushToTalkUseCaseRun:
     def test_run_starts_listener_and_joins(self):
         """run() はリスナーを起動し listener.join() でブロックする。"""
@@ -162,6 +171,13 @@ class TestPushToTalkUseCaseOnRelease:
         assert usecase._is_processing is True
         recorder.stop_recording.assert_not_called()
 
+    def test_on_release_skipped_when_not_recording(self):
+        """押下が無視されて録音していないとき、_on_release() は処理スレッドを起動しない。"""
+        usecase, recorder, *_ = self._make_usecase_with_config()
+        usecase._on_release()
+        assert usecase._is_processing is False
+        recorder.stop_recording.assert_not_called()
+
     def test_on_release_sets_is_processing(self):
         """_on_release() は _is_processing を True にする。"""
         usecase, recorder, audio_file, transcriber, clipboard, transcript_file = self._make_usecase_with_config()
@@ -173,6 +189,7 @@ class TestPushToTalkUseCaseOnRelease:
             return AudioData(data=np.zeros(0, dtype=np.float32), sample_rate=16000, duration_seconds=0.0)
 
         recorder.stop_recording.side_effect = slow_stop
+        usecase._is_recording = True
         usecase._on_release()
         # スレッドが起動した直後は _is_processing = True
         time.sleep(0.05)
@@ -246,6 +263,7 @@ class TestPushToTalkUseCaseProcessCycle:
             "文字起こし結果",
             tmp_path,
             config.filename_format,
+            result=transcriber.transcribe.return_value,
         )
 
     def test_transcript_file_not_saved_when_output_dir_none(self):
@@ -281,3 +299,246 @@ class TestPushToTalkUseCaseProcessCycle:
         call_args = transcriber.transcribe.call_args
         assert call_args[0][1] == "large"  # model_size
         assert call_args[0][2] == "ja"     # language
+
+    def test_clipboard_not_updated_per_segment_by_default(self):
+        """clipboard_per_segment=False の場合は on_segment を渡さない。"""
+        usecase, recorder, audio_file, transcriber, clipboard, transcript_file = self._make_usecase_with_config()
+
+        usecase._process_cycle()
+
+        assert transcriber.transcribe.call_args[1]["on_segment"] is None
+
+    def test_clipboard_updated_per_segment(self):
+        """clipboard_per_segment=True の場合はセグメントごとに累積テキストをコピーする。"""
+        from voct.domain.entities import TranscriptionSegment
+
+        config = PushToTalkConfig(clipboard_per_segment=True)
+        usecase, recorder, audio_file, transcriber, clipboard, transcript_file = self._make_usecase_with_config(
+            config=config
+        )
+        result = transcriber.transcribe.return_value
+
+        def fake_transcribe(*args, on_segment=None):
+            on_segment(TranscriptionSegment(text="文字起こし", start=0.0, end=0.5, avg_logprob=-0.1))
+            on_segment(TranscriptionSegment(text="結果", start=0.5, end=1.0, avg_logprob=-0.1))
+            return result
+
+        transcriber.transcribe.side_effect = fake_transcribe
+
+        usecase._process_cycle()
+
+        assert clipboard.copy.call_args_list == [call("文字起こし"), call("文字起こし結果"), call("文字起こし結果")]
+
+    def test_detected_language_is_pinned_for_next_cycle(self):
+        """language 未指定時は最初の確信度の高い検出結果を次のサイクルに渡す。"""
+        usecase, recorder, audio_file, transcriber, clipboard, transcript_file = self._make_usecase_with_config()
+
+        usecase._process_cycle()
+        usecase._process_cycle()
+
+        first_language = transcriber.transcribe.call_args_list[0][0][2]
+        second_language = transcriber.transcribe.call_args_list[1][0][2]
+        assert first_language is None
+        assert second_language == "ja"
+
+    def test_configured_language_is_not_overridden(self):
+        config = PushToTalkConfig(language="en")
+        usecase, recorder, audio_file, transcriber, clipboard, transcript_file = self._make_usecase_with_config(
+            config=config
+        )
+
+        usecase._process_cycle()
+        usecase._process_cycle()
+
+        assert [c[0][2] for c in transcriber.transcribe.call_args_list] == ["en", "en"]
+
+    def test_spilled_recording_is_transcribed_in_place(self, tmp_path):
+        """ディスク退避済みの録音は再保存せずに退避ファイルを文字起こしし、処理後に削除する。"""
+        import soundfile as sf
+
+        from voct.infra.wav_file_repository import open_lazy_wav
+
+        spill_path = tmp_path / "spill.wav"
+        sf.write(str(spill_path), np.zeros(16000, dtype=np.float32), 16000, subtype="PCM_16")
+        usecase, recorder, audio_file, transcriber, clipboard, transcript_file = self._make_usecase_with_config()
+        recorder.stop_recording.return_value = open_lazy_wav(spill_path, temporary=True)
+
+        usecase._process_cycle()
+
+        audio_file.save.assert_not_called()
+        assert transcriber.transcribe.call_args[0][0] == spill_path
+        assert not spill_path.exists()
+
+    def test_file_backed_recording_is_not_deleted(self, tmp_path):
+        """一時ファイルでないファイルを読み込んだ録音は、文字起こし後も元のファイルを削除しない。"""
+        import soundfile as sf
+
+        from voct.infra.wav_file_repository import open_lazy_wav
+
+        user_path = tmp_path / "user.wav"
+        sf.write(str(user_path), np.zeros(16000, dtype=np.float32), 16000, subtype="PCM_16")
+        usecase, recorder, audio_file, transcriber, clipboard, transcript_file = self._make_usecase_with_config()
+        recorder.stop_recording.return_value = open_lazy_wav(user_path)
+
+        usecase._process_cycle()
+
+        assert transcriber.transcribe.call_args[0][0] != user_path
+        assert user_path.exists()
+
+    def test_router_picks_model_and_records_timing(self):
+        """ルーターを渡すと発話ごとに選んだモデルとデコード設定で文字起こしし、実測値を返す。"""
+        from voct.domain.entities import DecodeOptions, RoutingDecision
+
+        usecase, recorder, audio_file, transcriber, clipboard, transcript_file = self._make_usecase_with_config()
+        router = MagicMock()
+        greedy = DecodeOptions(beam_size=1, best_of=1)
+        decision = RoutingDecision(model_size="tiny", options=greedy, predicted_seconds=0.2)
+        router.route.return_value = decision
+        usecase._router = router
+
+        usecase._process_cycle()
+
+        router.route.assert_called_once_with(1.0)
+        call_args = transcriber.transcribe.call_args
+        assert call_args[0][1] == "tiny"
+        assert call_args[1]["options"] == greedy
+        router.observe.assert_called_once_with(decision, 1.0, 0.3, 0.5)
+
+    def test_decode_options_and_partial_warning(self, capsys):
+        """config の decode_options を渡し、期限で打ち切られた結果には警告を出して貼り付ける。"""
+        from voct.domain.entities import DecodeOptions
+
+        options = DecodeOptions(deadline_seconds=2.0, temperature=(0.0, 0.4))
+        usecase, recorder, audio_file, transcriber, clipboard, transcript_file = self._make_usecase_with_config(
+            PushToTalkConfig(decode_options=options)
+        )
+        transcriber.transcribe.return_value = TranscriptionResult(
+            text="途中まで",
+            language="ja",
+            language_probability=0.9,
+            duration_seconds=1.0,
+            model_load_time_seconds=0.0,
+            transcription_time_seconds=2.0,
+            partial=True,
+        )
+
+        usecase._process_cycle()
+
+        assert transcriber.transcribe.call_args[1]["options"] == options
+        clipboard.copy.assert_called_with("途中まで")
+        assert "途中までの結果" in capsys.readouterr().out
+
+    def test_post_processor_rewrites_text_before_output(self, tmp_path, capsys):
+        """post_processor で書き換えたテキストを保存・コピーし、後処理の時間を表示する。"""
+        from voct.usecase.push_to_talk import PushToTalkUseCase
+
+        recorder, audio_file, transcriber, clipboard, transcript_file, notifier, listener = _make_mocks()
+        post_processor = MagicMock()
+        post_processor.process.return_value = "書き換え後"
+        usecase = PushToTalkUseCase(
+            recorder, audio_file, transcriber, clipboard, transcript_file, notifier, listener,
+            post_processor=post_processor,
+        )
+        usecase._config = PushToTalkConfig(output_dir=tmp_path)
+
+        usecase._process_cycle()
+
+        post_processor.process.assert_called_once_with("文字起こし結果")
+        clipboard.copy.assert_called_once_with("書き換え後")
+        assert transcript_file.save.call_args[0][0] == "書き換え後"
+        assert transcript_file.save.call_args[1]["result"].text == "書き換え後"
+        assert "後処理完了" in capsys.readouterr().out
+
+    def test_cycle_keeps_utterance_in_history(self):
+        """history が有効なら、文字起こしした音声と結果を履歴に残す。"""
+        from voct.usecase.utterance_history import UtteranceHistory
+
+        usecase, recorder, audio_file, transcriber, clipboard, transcript_file = self._make_usecase_with_config()
+        usecase._history = UtteranceHistory(max_utterances=5, max_bytes=1024 * 1024)
+
+        usecase._process_cycle()
+
+        record = usecase._history.latest()
+        assert record.text == "文字起こし結果"
+        assert len(record.samples) == 16000
+
+    def test_retranscribe_latest_replaces_clipboard(self, capsys):
+        """直前の発話を再文字起こし用のモデルで文字起こしし直し、クリップボードと履歴を置き換える。"""
+        from voct.usecase.utterance_history import UtteranceHistory
+
+        config = PushToTalkConfig(retranscribe_model_size="large-v3", retranscribe_language="en")
+        usecase, recorder, audio_file, transcriber, clipboard, transcript_file = self._make_usecase_with_config(config)
+        usecase._history = UtteranceHistory(max_utterances=5, max_bytes=1024 * 1024)
+        usecase._process_cycle()
+        transcriber.transcribe_audio.return_value = TranscriptionResult(
+            text="better text",
+            language="en",
+            language_probability=0.9,
+            duration_seconds=1.0,
+            model_load_time_seconds=0.0,
+            transcription_time_seconds=1.2,
+        )
+
+        usecase.retranscribe_latest()
+
+        assert _wait_for(lambda: not usecase.is_processing)
+        audio, model_size, language = transcriber.transcribe_audio.call_args[0]
+        assert (len(audio.data), model_size, language) == (16000, "large-v3", "en")
+        clipboard.copy.assert_called_with("better text")
+        assert usecase._history.latest().text == "better text"
+        recorder.stop_recording.assert_called_once()
+        assert "文字起こしし直しました" in capsys.readouterr().out
+
+    def test_retranscribe_without_history_does_nothing(self, capsys):
+        usecase, recorder, audio_file, transcriber, clipboard, transcript_file = self._make_usecase_with_config()
+
+        usecase.retranscribe_latest()
+
+        transcriber.transcribe_audio.assert_not_called()
+        assert not usecase.is_processing
+        assert "発話がありません" in capsys.readouterr().out
+
+    def test_retranscribe_is_refused_while_processing(self):
+        from voct.usecase.utterance_history import UtteranceHistory
+
+        usecase, recorder, audio_file, transcriber, clipboard, transcript_file = self._make_usecase_with_config()
+        usecase._history = UtteranceHistory(max_utterances=5, max_bytes=1024 * 1024)
+        usecase._process_cycle()
+        usecase._is_processing = True
+
+        usecase.retranscribe_latest()
+
+        transcriber.transcribe_audio.assert_not_called()
+
+    def test_run_registers_retranscribe_hotkey(self):
+        """retranscribe_key を設定すると、リスナーにホットキーを登録して履歴を有効にする。"""
+        from voct.usecase.push_to_talk import PushToTalkUseCase
+
+        recorder, audio_file, transcriber, clipboard, transcript_file, notifier, listener = _make_mocks()
+        usecase = PushToTalkUseCase(recorder, audio_file, transcriber, clipboard, transcript_file, notifier, listener)
+
+        usecase.run(PushToTalkConfig(history_size=3, retranscribe_key=TriggerKey.F2))
+
+        listener.add_hotkey.assert_called_once_with(TriggerKey.F2, usecase.retranscribe_latest)
+        assert usecase._history is not None
+
+    def test_async_output_does_not_block_next_cycle(self, tmp_path):
+        """async_output では遅いクリップボードや保存を待たずに処理中フラグを下ろし、後から書き出す。"""
+        config = PushToTalkConfig(async_output=True, output_dir=tmp_path)
+        usecase, recorder, audio_file, transcriber, clipboard, transcript_file = self._make_usecase_with_config(config)
+        clipboard.copy.side_effect = lambda text: time.sleep(0.3)
+        usecase._output_stage = usecase._make_output_stage(config)
+        usecase._is_processing = True
+
+        t0 = time.perf_counter()
+        usecase._process_cycle()
+
+        assert time.perf_counter() - t0 < 0.2
+        assert not usecase.is_processing
+        assert usecase._output_stage.flush(timeout=2.0)
+        clipboard.copy.assert_called_once_with("文字起こし結果")
+        outputs, directory, filename_format = transcript_file.save_many.call_args[0]
+        assert [output.text for output in outputs] == ["文字起こし結果"]
+        assert outputs[0].result is transcriber.transcribe.return_value
+        assert (directory, filename_format) == (tmp_path, config.filename_format)
+        usecase._output_stage.close()
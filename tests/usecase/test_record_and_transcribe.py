@@ -66,7 +66,7 @@ class TestRecordAndTranscribeUseCase:
             call.record(RecordingConfig()),
             call.play_stop_sound(NotificationConfig()),
             call.save(recorder.record.return_value, Path("/tmp/test.wav")),
-            call.transcribe(Path("/tmp/test.wav"), "base", None),
+            call.transcribe(Path("/tmp/test.wav"), "base", None, on_segment=None),
         ]
         manager.assert_has_calls(expected_order)
 
@@ -82,7 +82,7 @@ class TestRecordAndTranscribeUseCase:
             language="ja",
         )
 
-        transcriber.transcribe.assert_called_once_with(Path("/tmp/test.wav"), "small", "ja")
+        transcriber.transcribe.assert_called_once_with(Path("/tmp/test.wav"), "small", "ja", on_segment=None)
 
     def test_execute_passes_notification_config(self):
         recorder, audio_file, transcriber, notifier = self._make_mocks()
@@ -97,3 +97,17 @@ class TestRecordAndTranscribeUseCase:
 
         notifier.play_start_sound.assert_called_once_with(config)
         notifier.play_stop_sound.assert_called_once_with(config)
+
+    def test_execute_passes_on_segment_callback(self):
+        recorder, audio_file, transcriber, notifier = self._make_mocks()
+        usecase = RecordAndTranscribeUseCase(recorder, audio_file, transcriber, notifier)
+        on_segment = MagicMock()
+
+        usecase.execute(
+            recording_config=RecordingConfig(),
+            notification_config=NotificationConfig(),
+            temp_file_path=Path("/tmp/test.wav"),
+            on_segment=on_segment,
+        )
+
+        assert transcriber.transcribe.call_args[1]["on_segment"] is on_segment
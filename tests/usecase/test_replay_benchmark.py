@@ -0,0 +1,105 @@
+"""ReplayBenchmarkUseCase のテスト。"""
+
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from voct.domain.entities import AudioData, PushToTalkConfig, TranscriptionResult
+from voct.infra.memory_clipboard import InMemoryClipboard
+from voct.infra.scripted_hotkey_listener import ScriptedHotkeyListener, uniform_key_script
+from voct.infra.silent_notifier import SilentNotifier
+from voct.infra.wav_file_repository import WavFileRepository
+from voct.infra.wav_replay_recorder import WavReplayRecorder
+from voct.usecase.replay_benchmark import ReplayBenchmarkUseCase, _summarize
+
+
+def _make_transcriber(delay: float = 0.0):
+    transcriber = MagicMock()
+
+    def fake_transcribe(audio_path: Path, model_size, language, on_segment=None):
+        time.sleep(delay)
+        return TranscriptionResult(
+            text="replay",
+            language="ja",
+            language_probability=0.99,
+            duration_seconds=1.0,
+            model_load_time_seconds=0.0,
+            transcription_time_seconds=delay,
+        )
+
+    transcriber.transcribe.side_effect = fake_transcribe
+    return transcriber
+
+
+def _make_usecase(script, transcriber, speed: float = 20.0):
+    source = AudioData(data=np.zeros(16000, dtype=np.float32), sample_rate=16000, duration_seconds=1.0)
+    return ReplayBenchmarkUseCase(
+        WavReplayRecorder(source, speed=speed),
+        WavFileRepository(),
+        transcriber,
+        InMemoryClipboard(),
+        MagicMock(),
+        SilentNotifier(),
+        ScriptedHotkeyListener(script, speed=speed),
+    )
+
+
+class TestReplayBenchmarkUseCase:
+    def test_all_cycles_complete_when_gap_is_long_enough(self):
+        script = uniform_key_script(5, hold_seconds=1.0, gap_seconds=1.0)
+        usecase = _make_usecase(script, _make_transcriber())
+
+        report = usecase.execute(PushToTalkConfig(min_recording_seconds=0.1), cycles=len(script))
+
+        assert report.cycles == 5
+        assert report.completed == 5
+        assert report.dropped == 0
+        assert 0 <= report.p50_seconds <= report.p95_seconds <= report.p99_seconds
+        assert report.throughput_cycles_per_second > 0
+
+    def test_cycles_during_processing_are_dropped(self):
+        """前のサイクルの処理中に届いたキー操作は取りこぼしとして数える。"""
+        script = uniform_key_script(4, hold_seconds=1.0, gap_seconds=0.0)
+        usecase = _make_usecase(script, _make_transcriber(delay=0.15))
+
+        report = usecase.execute(PushToTalkConfig(min_recording_seconds=0.1), cycles=len(script))
+
+        assert report.dropped > 0
+        assert report.completed + report.dropped == 4
+
+    def test_release_after_ignored_press_is_dropped(self):
+        """処理中に押下して処理後に解放したキー操作は、古い録音を文字起こしせずに取りこぼしとして数える。"""
+        script = [(0.0, 0.6), (0.7, 0.95)]
+        transcriber = _make_transcriber(delay=0.3)
+        usecase = _make_usecase(script, transcriber, speed=1.0)
+
+        report = usecase.execute(PushToTalkConfig(min_recording_seconds=0.1), cycles=len(script))
+
+        assert report.completed == 1
+        assert report.dropped == 1
+        assert transcriber.transcribe.call_count == 1
+
+    def test_latency_includes_transcription_time(self):
+        script = uniform_key_script(2, hold_seconds=1.0, gap_seconds=4.0)
+        usecase = _make_usecase(script, _make_transcriber(delay=0.05))
+
+        report = usecase.execute(PushToTalkConfig(min_recording_seconds=0.1), cycles=len(script))
+
+        assert report.p50_seconds >= 0.05
+
+
+class TestSummarize:
+    def test_pairs_each_release_with_last_copy_before_next_release(self):
+        report = _summarize([0.0, 10.0], [1.0, 2.0, 11.5], cycles=2, wall_time=20.0)
+
+        assert report.completed == 2
+        assert report.p50_seconds == 1.75
+        assert 1.99 < report.p99_seconds <= 2.0
+
+    def test_release_without_copy_is_dropped(self):
+        report = _summarize([0.0, 10.0], [11.0], cycles=3, wall_time=20.0)
+
+        assert report.completed == 1
+        assert report.dropped == 2
@@ -0,0 +1,165 @@
+"""StreamTranscriptionUseCase のテスト。"""
+
+import threading
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from voct.domain.entities import StreamConfig, TranscriptionResult, VoxConfig
+from voct.infra.voice_activity import VoiceActivityDetector
+from voct.usecase.stream_transcription import StreamTranscriptionUseCase
+
+_SAMPLE_RATE = 16000
+_BLOCK = 1024
+
+
+def _voiced(seconds: float) -> np.ndarray:
+    t = np.arange(int(seconds * _SAMPLE_RATE)) / _SAMPLE_RATE
+    return (0.1 * sum(np.sin(2 * np.pi * 200 * k * t) / k for k in range(1, 6))).astype(np.float32)
+
+
+def _silence(seconds: float) -> np.ndarray:
+    return np.zeros(int(seconds * _SAMPLE_RATE), dtype=np.float32)
+
+
+class _ArraySource:
+    """配列を block_samples ずつ返す PcmSourcePort の代わり。読んだブロック数を数える。"""
+
+    def __init__(self, samples: np.ndarray) -> None:
+        self.samples = samples
+        self.read_blocks = 0
+
+    def iter_blocks(self, block_samples: int):
+        for start in range(0, len(self.samples), block_samples):
+            self.read_blocks += 1
+            yield self.samples[start : start + block_samples]
+
+
+def _result(text: str) -> TranscriptionResult:
+    return TranscriptionResult(
+        text=text,
+        language="ja",
+        language_probability=0.9,
+        duration_seconds=1.0,
+        model_load_time_seconds=0.0,
+        transcription_time_seconds=0.1,
+    )
+
+
+def _make(samples: np.ndarray, texts=None):
+    source = _ArraySource(samples)
+    transcriber = MagicMock()
+    counter = iter(range(1000))
+    transcriber.transcribe_audio.side_effect = texts or (
+        lambda audio, model_size, language: _result(f" 区間{next(counter)} ")
+    )
+    writer = MagicMock()
+    vox = VoxConfig(block_size=_BLOCK)
+    usecase = StreamTranscriptionUseCase(source, VoiceActivityDetector(vox, _SAMPLE_RATE), transcriber, writer)
+    return usecase, source, transcriber, writer, StreamConfig(vox_config=vox, model_size="small", max_backlog=2)
+
+
+def _written(writer) -> list:
+    return [call[0][0] for call in writer.write.call_args_list]
+
+
+class TestStreamTranscriptionUseCase:
+    def test_each_utterance_becomes_one_segment(self):
+        """発話区間ごとに文字起こしし、入力の先頭からの時刻付きで書き出す。"""
+        samples = np.concatenate([_silence(1.0), _voiced(1.5), _silence(1.5), _voiced(1.0), _silence(1.5)])
+        usecase, _, transcriber, writer, config = _make(samples)
+
+        report = usecase.execute(config)
+
+        segments = _written(writer)
+        assert [segment.text for segment in segments] == ["区間0", "区間1"]
+        assert [segment.index for segment in segments] == [0, 1]
+        # 発話開始前の pre-roll を含み、無音の hangover 分だけ後ろに伸びる
+        assert 0.5 <= segments[0].start_seconds <= 1.0
+        assert 2.5 <= segments[0].end_seconds <= 3.6
+        assert 3.5 <= segments[1].start_seconds <= 4.0
+        assert all(segment.latency_seconds >= segment.transcription_seconds for segment in segments)
+        assert transcriber.transcribe_audio.call_args[0][1:] == ("small", None)
+        assert transcriber.transcribe_audio.call_args[0][0].sample_rate == _SAMPLE_RATE
+        assert (report.segments, report.failures) == (2, 0)
+        assert report.audio_seconds == pytest.approx(len(samples) / _SAMPLE_RATE, abs=0.1)
+        assert 2.5 <= report.speech_seconds <= 6.0
+
+    def test_long_utterance_is_split_at_max_segment(self):
+        usecase, _, transcriber, writer, config = _make(np.concatenate([_voiced(5.0), _silence(1.5)]))
+        config = StreamConfig(vox_config=config.vox_config, max_segment_seconds=2.0)
+
+        usecase.execute(config)
+
+        durations = [len(call[0][0].data) / _SAMPLE_RATE for call in transcriber.transcribe_audio.call_args_list]
+        assert len(durations) == 3
+        assert all(d <= 2.0 + _BLOCK / _SAMPLE_RATE for d in durations)
+        segments = _written(writer)
+        assert segments[1].start_seconds == pytest.approx(segments[0].end_seconds)
+
+    def test_utterance_cut_by_end_of_input_is_flushed(self):
+        usecase, _, _, writer, config = _make(np.concatenate([_silence(0.5), _voiced(1.0)]))
+
+        usecase.execute(config)
+
+        assert len(_written(writer)) == 1
+
+    def test_empty_text_and_failures_are_not_written(self):
+        samples = np.concatenate([_voiced(1.0), _silence(1.5), _voiced(1.0), _silence(1.5)])
+        results = iter([_result("  "), RuntimeError("decode failed")])
+
+        def transcribe(audio, model_size, language):
+            result = next(results)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        usecase, _, _, writer, config = _make(samples, texts=transcribe)
+
+        report = usecase.execute(config)
+
+        writer.write.assert_not_called()
+        assert (report.segments, report.failures) == (0, 1)
+
+    def test_full_backlog_stops_reading_input(self):
+        """文字起こし待ちが満杯の間は入力を読み進めない。"""
+        samples = np.concatenate([np.concatenate([_voiced(0.5), _silence(1.0)]) for _ in range(8)])
+        release = threading.Event()
+        usecase, source, transcriber, writer, config = _make(samples)
+
+        def blocked(audio, model_size, language):
+            release.wait(5.0)
+            return _result("x")
+
+        transcriber.transcribe_audio.side_effect = blocked
+        done = threading.Event()
+        reports = []
+
+        def run():
+            reports.append(usecase.execute(config))
+            done.set()
+
+        threading.Thread(target=run, daemon=True).start()
+        # ワーカーが 1 区間を処理中で、待ちが 2 区間、3 区間目の確定で読み込みが止まる
+        assert not done.wait(0.5)
+        stalled_at = source.read_blocks
+        assert not done.wait(0.2)
+        assert source.read_blocks == stalled_at
+        assert stalled_at < len(samples) / _BLOCK
+
+        release.set()
+        assert done.wait(5.0)
+        assert reports[0].segments == 8
+        assert reports[0].backpressure_seconds > 0.3
+
+    def test_writer_failure_stops_reading_and_is_raised(self):
+        """書き出し先が閉じられたら（head の終了など）入力を読むのをやめ、その例外を送出する。"""
+        samples = np.concatenate([np.concatenate([_voiced(0.5), _silence(1.0)]) for _ in range(20)])
+        usecase, source, _, writer, config = _make(samples)
+        writer.write.side_effect = BrokenPipeError()
+
+        with pytest.raises(BrokenPipeError):
+            usecase.execute(config)
+
+        assert source.read_blocks < len(samples) / _BLOCK
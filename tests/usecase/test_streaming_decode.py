@@ -0,0 +1,200 @@
+"""StreamingDecodeTranscriber と prefetch のテスト。"""
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from voct.domain.entities import TranscriptionResult, TranscriptionSegment
+from voct.usecase.streaming_decode import StreamingDecodeTranscriber, prefetch, quiet_cut_point
+
+
+class _ListDecoder:
+    """決まったサンプル列を block_samples ずつ返す AudioDecoderPort の代わり。"""
+
+    name = "fake"
+
+    def __init__(self, samples: np.ndarray, delay: float = 0.0) -> None:
+        self.samples = samples
+        self.delay = delay
+        self.decoded = 0
+
+    def iter_blocks(self, file_path: Path, block_samples: int):
+        for start in range(0, len(self.samples), block_samples):
+            time.sleep(self.delay)
+            self.decoded += 1
+            yield self.samples[start : start + block_samples]
+
+    def probe_seconds(self, file_path: Path) -> float | None:
+        return len(self.samples) / 16000
+
+
+def _chunk_result(audio, model_size, language, on_segment, options) -> TranscriptionResult:
+    """チャンクの長さを本文にし、チャンク全体を 1 セグメントとして返す。"""
+    seconds = len(audio.data) / 16000
+    segment = TranscriptionSegment(text=f"[{seconds:g}]", start=0.0, end=seconds, avg_logprob=-0.1)
+    on_segment(segment)
+    return TranscriptionResult(
+        text=segment.text,
+        language=language or "ja",
+        language_probability=0.9,
+        duration_seconds=seconds,
+        model_load_time_seconds=0.0,
+        transcription_time_seconds=0.1,
+        segments=(segment,),
+    )
+
+
+class TestPrefetch:
+    def test_yields_all_blocks_in_order(self):
+        blocks = [np.full(2, i, dtype=np.float32) for i in range(5)]
+
+        assert [int(block[0]) for block in prefetch(iter(blocks), 2)] == [0, 1, 2, 3, 4]
+
+    def test_reads_ahead_while_consumer_is_busy(self):
+        """読み出し側が処理している間に、次のブロックを先に読み進めておく。"""
+        decoder = _ListDecoder(np.zeros(40, dtype=np.float32))
+        blocks = prefetch(decoder.iter_blocks(Path("a"), 4), 3)
+
+        next(blocks)
+        deadline = time.perf_counter() + 2.0
+        while decoder.decoded < 5 and time.perf_counter() < deadline:
+            time.sleep(0.005)
+
+        # 渡した 1 個 + 待ち行列の 3 個 + put を待っている 1 個
+        assert decoder.decoded == 5
+        blocks.close()
+
+    def test_producer_error_is_raised_to_consumer(self):
+        def failing():
+            yield np.zeros(1, dtype=np.float32)
+            raise ValueError("corrupt frame")
+
+        blocks = prefetch(failing(), 2)
+
+        next(blocks)
+        with pytest.raises(ValueError, match="corrupt frame"):
+            next(blocks)
+
+    def test_close_stops_producer(self):
+        closed = threading.Event()
+
+        def endless():
+            try:
+                while True:
+                    yield np.zeros(1, dtype=np.float32)
+            finally:
+                closed.set()
+
+        blocks = prefetch(endless(), 2)
+        next(blocks)
+        blocks.close()
+
+        assert closed.is_set()
+
+
+class TestQuietCutPoint:
+    def test_cuts_inside_quietest_frame(self):
+        samples = np.ones(16000, dtype=np.float32)
+        samples[12000:12320] = 0.0
+
+        cut = quiet_cut_point(samples, 16000, 8000)
+
+        assert 12000 <= cut < 12320
+
+    def test_short_search_falls_back_to_limit(self):
+        assert quiet_cut_point(np.ones(100, dtype=np.float32), 100, 10) == 100
+
+
+class TestStreamingDecodeTranscriber:
+    def test_transcribes_in_chunks_and_shifts_segment_times(self):
+        """チャンクごとに文字起こしし、セグメントの時刻をファイル先頭からの秒数に直す。"""
+        decoder = _ListDecoder(np.ones(16000 * 5, dtype=np.float32))
+        inner = MagicMock()
+        inner.transcribe_audio.side_effect = _chunk_result
+        transcriber = StreamingDecodeTranscriber(decoder, inner, chunk_seconds=2.0, block_seconds=0.5)
+        received = []
+
+        result = transcriber.transcribe(Path("talk.mp3"), "small", None, received.append)
+
+        durations = [len(call[0][0].data) for call in inner.transcribe_audio.call_args_list]
+        assert sum(durations) == 16000 * 5
+        assert all(call[0][0].sample_rate == 16000 for call in inner.transcribe_audio.call_args_list)
+        starts = [segment.start for segment in result.segments]
+        assert starts == [0.0] + list(np.cumsum(durations[:-1]) / 16000)
+        assert received == list(result.segments)
+        assert result.duration_seconds == 5.0
+        assert result.text == "".join(segment.text for segment in result.segments)
+
+    def test_chunks_are_cut_at_quiet_points(self):
+        samples = np.ones(16000 * 3, dtype=np.float32)
+        samples[27000:28000] = 0.0
+        inner = MagicMock()
+        inner.transcribe_audio.side_effect = _chunk_result
+        transcriber = StreamingDecodeTranscriber(_ListDecoder(samples), inner, chunk_seconds=2.0, block_seconds=0.5)
+
+        transcriber.transcribe(Path("a.flac"))
+
+        first = inner.transcribe_audio.call_args_list[0][0][0]
+        assert 27000 <= len(first.data) < 28000
+
+    def test_detected_language_is_reused_for_later_chunks(self):
+        inner = MagicMock()
+        inner.transcribe_audio.side_effect = _chunk_result
+        transcriber = StreamingDecodeTranscriber(
+            _ListDecoder(np.ones(16000 * 3, dtype=np.float32)), inner, chunk_seconds=1.0, block_seconds=0.5
+        )
+
+        transcriber.transcribe(Path("a.opus"), "base", None)
+
+        languages = [call[0][2] for call in inner.transcribe_audio.call_args_list]
+        assert languages[0] is None
+        assert set(languages[1:]) == {"ja"}
+
+    def test_decode_overlaps_inference(self):
+        """推論にかかる時間の間に次のチャンクのデコードが進み、全体は両者の合計より短くなる。"""
+        decoder = _ListDecoder(np.ones(16000 * 4, dtype=np.float32), delay=0.03)
+
+        def slow(audio, *args):
+            time.sleep(0.25)
+            return _chunk_result(audio, *args)
+
+        inner = MagicMock()
+        inner.transcribe_audio.side_effect = slow
+        transcriber = StreamingDecodeTranscriber(decoder, inner, chunk_seconds=1.0, block_seconds=0.1)
+
+        t0 = time.perf_counter()
+        transcriber.transcribe(Path("a.mp3"))
+        elapsed = time.perf_counter() - t0
+
+        # 推論は 5 チャンク。逐次なら デコード 40 × 0.03 + 推論 5 × 0.25 = 2.45 秒、重なれば約 1.55 秒
+        assert inner.transcribe_audio.call_count == 5
+        assert elapsed < 2.1
+
+    def test_decode_stats_are_grouped_by_format(self):
+        inner = MagicMock()
+        inner.transcribe_audio.side_effect = _chunk_result
+        transcriber = StreamingDecodeTranscriber(
+            _ListDecoder(np.ones(16000, dtype=np.float32)), inner, chunk_seconds=30.0
+        )
+
+        transcriber.transcribe(Path("a.mp3"))
+        transcriber.transcribe(Path("b.MP3"))
+        transcriber.transcribe(Path("c.m4a"))
+
+        stats = {entry.format: entry for entry in transcriber.stats}
+        assert sorted(stats) == ["m4a", "mp3"]
+        assert (stats["mp3"].files, stats["mp3"].audio_seconds, stats["mp3"].backend) == (2, 2.0, "fake")
+        assert stats["mp3"].decode_seconds >= 0.0
+
+    def test_decode_failure_is_raised_and_not_counted(self):
+        decoder = MagicMock()
+        decoder.iter_blocks.side_effect = RuntimeError("unsupported codec")
+        transcriber = StreamingDecodeTranscriber(decoder, MagicMock())
+
+        with pytest.raises(RuntimeError, match="unsupported codec"):
+            transcriber.transcribe(Path("a.m4a"))
+        assert transcriber.stats == []
@@ -0,0 +1,86 @@
+"""UtteranceHistory のテスト。"""
+
+import numpy as np
+
+from voct.domain.entities import AudioData, LazyAudioData
+from voct.usecase.utterance_history import UtteranceHistory, to_int16
+
+
+def _audio(seconds: float, value: float = 0.5) -> AudioData:
+    data = np.full(int(16000 * seconds), value, dtype=np.float32)
+    return AudioData(data=data, sample_rate=16000, duration_seconds=seconds)
+
+
+class TestUtteranceHistory:
+    def test_add_keeps_audio_as_int16(self):
+        """音声は int16 で保持し、float32 に戻すと元の音声とほぼ一致する。"""
+        history = UtteranceHistory(max_utterances=5, max_bytes=1024 * 1024)
+        audio = AudioData(
+            data=np.sin(np.linspace(0, 100, 16000)).astype(np.float32) * 0.8,
+            sample_rate=16000,
+            duration_seconds=1.0,
+        )
+
+        record = history.add(audio, "こんにちは", "base", "ja")
+
+        assert record.samples.dtype == np.int16
+        assert record.nbytes == 32000
+        assert history.total_bytes == 32000
+        restored = record.to_audio()
+        assert restored.sample_rate == 16000
+        assert np.max(np.abs(restored.data - audio.data)) < 1e-4
+        assert history.latest() == record
+
+    def test_evicts_oldest_beyond_max_utterances(self):
+        history = UtteranceHistory(max_utterances=2, max_bytes=1024 * 1024)
+
+        history.add(_audio(0.1), "一", "base", None)
+        history.add(_audio(0.1), "二", "base", None)
+        history.add(_audio(0.1), "三", "base", None)
+
+        assert len(history) == 2
+        assert history.total_bytes == 2 * 3200
+        assert history.latest().text == "三"
+
+    def test_evicts_beyond_memory_cap(self):
+        """合計バイト数が上限を超えたら古いものから捨てる。"""
+        history = UtteranceHistory(max_utterances=100, max_bytes=100_000)
+
+        for i in range(5):
+            history.add(_audio(1.0), str(i), "base", None)
+
+        assert len(history) == 3
+        assert history.total_bytes == 96_000
+
+    def test_oversized_utterance_is_not_kept(self):
+        history = UtteranceHistory(max_utterances=5, max_bytes=10_000)
+
+        assert history.add(_audio(1.0), "長い", "base", None) is None
+        assert len(history) == 0
+
+    def test_update_text_replaces_result(self):
+        history = UtteranceHistory(max_utterances=5, max_bytes=1024 * 1024)
+        record = history.add(_audio(0.1), "まちがい", "base", "ja")
+
+        history.update_text(record.id, "間違い", "large-v3", None)
+
+        updated = history.latest()
+        assert (updated.text, updated.model_size, updated.language) == ("間違い", "large-v3", None)
+        assert updated.samples is record.samples
+
+
+class TestToInt16:
+    def test_converts_lazy_audio_block_by_block(self):
+        """ディスク上の録音も全体を float32 で展開せずに変換する。"""
+        source = np.linspace(-1.5, 1.5, 1_000_000).astype(np.float32)
+        reads = []
+
+        def reader(start, frames):
+            reads.append(frames)
+            return source[start : start + frames]
+
+        samples = to_int16(LazyAudioData(reader, len(source), 16000))
+
+        assert len(samples) == len(source)
+        assert samples[0] == -32767 and samples[-1] == 32767
+        assert max(reads) < len(source)
@@ -0,0 +1,169 @@
+"""WatchFolderUseCase のテスト。"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+from voct.domain.entities import AudioData, TranscriptionResult, WatchConfig
+from voct.usecase.watch_folder import WatchFolderUseCase
+
+
+def _wait_for(condition, timeout: float = 2.0) -> bool:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if condition():
+            return True
+        time.sleep(0.005)
+    return condition()
+
+
+def _result(text: str) -> TranscriptionResult:
+    return TranscriptionResult(
+        text=text,
+        language="ja",
+        language_probability=0.9,
+        duration_seconds=1.0,
+        model_load_time_seconds=0.0,
+        transcription_time_seconds=0.1,
+    )
+
+
+def _make(tmp_path, **config_kwargs):
+    watcher = MagicMock()
+    audio_file = MagicMock()
+    audio_file.load_lazy.return_value = AudioData(data=None, sample_rate=16000, duration_seconds=1.5)
+    transcriber = MagicMock()
+    transcriber.transcribe.side_effect = lambda path, model_size, language: _result(f"{path.stem}の内容")
+    transcript_file = MagicMock()
+    usecase = WatchFolderUseCase(watcher, audio_file, transcriber, transcript_file)
+    config = WatchConfig(directory=tmp_path, output_dir=tmp_path / "out", **config_kwargs)
+    return usecase, config, watcher, audio_file, transcriber, transcript_file
+
+
+def _saved_texts(transcript_file) -> list[str]:
+    return sorted(output.text for call in transcript_file.save_many.call_args_list for output in call[0][0])
+
+
+class TestWatchFolderUseCase:
+    def test_transcribes_reported_files_and_saves_results(self, tmp_path):
+        """監視から報告されたファイルを文字起こしし、出力ステージ経由で保存する。"""
+        usecase, config, watcher, audio_file, transcriber, transcript_file = _make(tmp_path)
+        (tmp_path / "a.wav").write_bytes(b"a")
+        (tmp_path / "b.flac").write_bytes(b"b")
+
+        usecase.start(config)
+        on_file = watcher.start.call_args[0][1]
+        on_file(tmp_path / "a.wav")
+        on_file(tmp_path / "b.flac")
+        stats = usecase.stop()
+
+        assert watcher.start.call_args[0][0] == tmp_path
+        watcher.stop.assert_called_once()
+        assert _saved_texts(transcript_file) == ["aの内容", "bの内容"]
+        assert transcript_file.save_many.call_args[0][1:] == (tmp_path / "out", config.filename_format)
+        assert (stats.detected, stats.processed, stats.backlog) == (2, 2, 0)
+        assert stats.audio_seconds == 3.0
+        assert stats.max_lag_seconds >= stats.mean_lag_seconds > 0
+
+    def test_duplicate_content_is_transcribed_once(self, tmp_path):
+        """内容が同じファイルは名前が違っても 1 回だけ文字起こしする。"""
+        usecase, config, watcher, audio_file, transcriber, transcript_file = _make(tmp_path, workers=1)
+        (tmp_path / "a.wav").write_bytes(b"same")
+        (tmp_path / "copy.wav").write_bytes(b"same")
+
+        usecase.start(config)
+        usecase.submit(tmp_path / "a.wav")
+        usecase.submit(tmp_path / "copy.wav")
+        usecase.submit(tmp_path / "a.wav")
+        stats = usecase.stop()
+
+        assert transcriber.transcribe.call_count == 1
+        assert (stats.processed, stats.duplicates) == (1, 2)
+
+    def test_ignores_hidden_and_non_audio_files(self, tmp_path):
+        usecase, config, watcher, audio_file, transcriber, transcript_file = _make(tmp_path)
+        for name in (".a.wav.part", "notes.txt", "a.md"):
+            (tmp_path / name).write_bytes(b"x")
+
+        usecase.start(config)
+        for name in (".a.wav.part", "notes.txt", "a.md"):
+            usecase.submit(tmp_path / name)
+        stats = usecase.stop()
+
+        transcriber.transcribe.assert_not_called()
+        assert stats.detected == 0
+
+    def test_failed_file_is_counted_and_can_be_retried(self, tmp_path):
+        """読めなかったファイルは失敗として数え、書き直されたら再び受け付ける。"""
+        usecase, config, watcher, audio_file, transcriber, transcript_file = _make(tmp_path, workers=1)
+        path = tmp_path / "a.wav"
+        path.write_bytes(b"partial")
+        audio_file.load_lazy.side_effect = [RuntimeError("truncated"), AudioData(None, 16000, 1.0)]
+
+        usecase.start(config)
+        usecase.submit(path)
+        usecase.submit(path)
+        usecase.submit(tmp_path / "missing.wav")
+        stats = usecase.stop()
+
+        assert (stats.failures, stats.processed) == (2, 1)
+
+    def test_backlog_is_bounded(self, tmp_path):
+        """待ちが上限に達すると、空くまで submit を待たせる。"""
+        usecase, config, watcher, audio_file, transcriber, transcript_file = _make(tmp_path, workers=1, max_backlog=2)
+        release = threading.Event()
+        transcriber.transcribe.side_effect = lambda *args: (release.wait(), _result("x"))[1]
+        for i in range(4):
+            (tmp_path / f"{i}.wav").write_bytes(bytes([i]))
+
+        usecase.start(config)
+        submitted = []
+
+        def feed():
+            for i in range(4):
+                usecase.submit(tmp_path / f"{i}.wav")
+                submitted.append(i)
+
+        feeder = threading.Thread(target=feed)
+        feeder.start()
+        assert _wait_for(lambda: usecase.stats.backlog == 3)
+        time.sleep(0.05)
+        assert submitted == [0, 1, 2]
+        assert usecase.stats.detected == 4
+        release.set()
+        feeder.join(2.0)
+        stats = usecase.stop()
+
+        assert submitted == [0, 1, 2, 3]
+        assert stats.processed == 4
+
+    def test_include_existing_transcribes_files_present_at_start(self, tmp_path):
+        usecase, config, watcher, audio_file, transcriber, transcript_file = _make(tmp_path, include_existing=True)
+        (tmp_path / "old.wav").write_bytes(b"old")
+
+        usecase.start(config)
+        stats = usecase.stop()
+
+        assert stats.processed == 1
+        assert _saved_texts(transcript_file) == ["oldの内容"]
+
+    def test_decoder_probes_duration(self, tmp_path):
+        """decoder を渡すと長さは decoder で調べ、分からなければ文字起こし結果の長さを使う。"""
+        watcher = MagicMock()
+        audio_file = MagicMock()
+        decoder = MagicMock()
+        decoder.probe_seconds.side_effect = lambda path: 4.0 if path.name == "a.m4a" else None
+        transcriber = MagicMock()
+        transcriber.transcribe.side_effect = lambda path, model_size, language: _result(path.stem)
+        usecase = WatchFolderUseCase(watcher, audio_file, transcriber, MagicMock(), decoder=decoder)
+        (tmp_path / "a.m4a").write_bytes(b"a")
+        (tmp_path / "b.opus").write_bytes(b"b")
+
+        usecase.start(WatchConfig(directory=tmp_path, output_dir=tmp_path / "out"))
+        usecase.submit(tmp_path / "a.m4a")
+        usecase.submit(tmp_path / "b.opus")
+        stats = usecase.stop()
+
+        audio_file.load_lazy.assert_not_called()
+        assert stats.processed == 2
+        assert stats.audio_seconds == 5.0